@@ -1,20 +1,34 @@
 """
 HR Recruitment Agents Package
 Multi-agent system for automated candidate sourcing and resume analysis
+
+Agents are imported on first access so that importing the package does not
+load selenium, the PDF/DOCX parsers or the LLM SDKs.
 """
 
-from .base_agent import BaseAgent
-from .resume_parser import ResumeParserAgent
-from .linkedin_scraper import LinkedInScraperAgent
-from .indeed_scraper import IndeedScraperAgent
-from .candidate_ranker import CandidateRankerAgent
-from .orchestrator import AgentOrchestrator
-
-__all__ = [
-    "BaseAgent",
-    "ResumeParserAgent",
-    "LinkedInScraperAgent",
-    "IndeedScraperAgent",
-    "CandidateRankerAgent",
-    "AgentOrchestrator",
-]
+import importlib
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    "BaseAgent": ".base_agent",
+    "ResumeParserAgent": ".resume_parser",
+    "LinkedInScraperAgent": ".linkedin_scraper",
+    "IndeedScraperAgent": ".indeed_scraper",
+    "CandidateRankerAgent": ".candidate_ranker",
+    "AgentOrchestrator": ".orchestrator",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -8,6 +8,14 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 from datetime import datetime
 import asyncio
+import time
+from pathlib import Path
+from ..utils.history import BoundedHistory
+from ..utils.metrics import AGENT_RUN_SECONDS
+from ..utils.tracing import span
+
+# Config keys containing any of these are never returned by get_summary()
+SECRET_CONFIG_MARKERS = ('secret', 'password', 'api_key', 'token')
 
 
 class BaseAgent(ABC):
@@ -28,11 +36,24 @@ class BaseAgent(ABC):
         self.status = "initialized"
         self.created_at = datetime.now()
         self.last_run = None
-        self.results = []
-        self.errors = []
 
-        # Setup logging
-        self.logger = logging.getLogger(f"{self.__class__.__name__}[{agent_id}]")
+        # Bounded in-memory history; evicted entries optionally spill to disk
+        spill_dir = self.config.get('history_spill_dir')
+        history_name = agent_id.replace(':', '_').replace('/', '_')
+        self.results = BoundedHistory(
+            max_items=self.config.get('history_max_items', 100),
+            max_bytes=self.config.get('history_max_bytes', 5_000_000),
+            spill_path=Path(spill_dir) / f"{history_name}-results.jsonl.gz" if spill_dir else None
+        )
+        self.errors = BoundedHistory(
+            max_items=self.config.get('history_max_errors', 200),
+            max_bytes=self.config.get('history_max_bytes', 5_000_000),
+            spill_path=Path(spill_dir) / f"{history_name}-errors.jsonl.gz" if spill_dir else None
+        )
+
+        # One logger per agent class; the agent id travels as a record field so
+        # per-run agents do not each register a logger that is never freed
+        self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.setLevel(logging.INFO)
 
     @abstractmethod
@@ -45,16 +66,21 @@ class BaseAgent(ABC):
         """
         pass
 
-    def log(self, message: str, level: str = "info"):
+    def log(self, message: str, level: str = "info", key: Optional[str] = None):
         """
         Log a message with the specified level
 
         Args:
             message: Message to log
             level: Log level (info, warning, error, debug)
+            key: Sampling key for per-item messages; records sharing a key are
+                 rate-limited by the logging pipeline (see utils.logs)
         """
         log_method = getattr(self.logger, level.lower(), self.logger.info)
-        log_method(message)
+        extra = {'agent_id': self.agent_id}
+        if key is not None:
+            extra['sample_key'] = key
+        log_method(message, extra=extra)
 
     def update_status(self, status: str):
         """
@@ -64,7 +90,7 @@ class BaseAgent(ABC):
             status: New status (running, completed, failed, idle)
         """
         self.status = status
-        self.log(f"Status updated to: {status}")
+        self.log(f"Status updated to: {status}", key=f"{self.__class__.__name__}.status")
 
     def add_result(self, result: Dict[str, Any]):
         """
@@ -92,24 +118,57 @@ class BaseAgent(ABC):
         self.errors.append(error_entry)
         self.log(error, level="error")
 
-    def get_summary(self) -> Dict[str, Any]:
+    def merge_history(self, other: "BaseAgent"):
+        """
+        Copy another agent's results and errors into this agent's history
+
+        Args:
+            other: Agent (typically a finished per-request instance) to absorb
+        """
+        for entry in other.results:
+            self.results.append(entry)
+        for entry in other.errors:
+            self.errors.append(entry)
+
+    def get_summary(self, offset: int = 0, limit: int = 0) -> Dict[str, Any]:
         """
         Get a summary of the agent's current state
 
+        Args:
+            offset: Number of newest history entries to skip
+            limit: Number of history entries to include (0 omits history)
+
         Returns:
-            Dictionary with agent summary information
+            Dictionary with agent summary information (secret config values redacted)
         """
-        return {
+        summary = {
             'agent_id': self.agent_id,
             'agent_type': self.__class__.__name__,
             'status': self.status,
             'created_at': self.created_at.isoformat(),
             'last_run': self.last_run.isoformat() if self.last_run else None,
-            'results_count': len(self.results),
-            'errors_count': len(self.errors),
-            'config': self.config
+            'results_count': self.results.total_count,
+            'errors_count': self.errors.total_count,
+            'history_stats': {
+                'results': self.results.stats(),
+                'errors': self.errors.stats()
+            },
+            'config': {
+                key: '***' if value and any(marker in key.lower() for marker in SECRET_CONFIG_MARKERS) else value
+                for key, value in self.config.items()
+            }
         }
 
+        if limit > 0:
+            summary['history'] = {
+                'offset': offset,
+                'limit': limit,
+                'results': self.results.page(offset, limit),
+                'errors': self.errors.page(offset, limit)
+            }
+
+        return summary
+
     async def run(self, **kwargs) -> Dict[str, Any]:
         """
         Run the agent with error handling and status management
@@ -117,27 +176,33 @@ class BaseAgent(ABC):
         Returns:
             Dictionary containing execution results and status
         """
-        try:
-            self.update_status("running")
-            self.last_run = datetime.now()
-
-            result = await self.execute(**kwargs)
-
-            self.update_status("completed")
-            return {
-                'success': True,
-                'agent_id': self.agent_id,
-                'data': result,
-                'timestamp': datetime.now().isoformat()
-            }
-
-        except Exception as e:
-            self.update_status("failed")
-            self.add_error(f"Execution failed: {str(e)}", e)
-
-            return {
-                'success': False,
-                'agent_id': self.agent_id,
-                'error': str(e),
-                'timestamp': datetime.now().isoformat()
-            }
+        with span(f"{self.__class__.__name__}.run", "agent", agent_id=self.agent_id) as current:
+            start = time.perf_counter()
+            try:
+                self.update_status("running")
+                self.last_run = datetime.now()
+
+                result = await self.execute(**kwargs)
+
+                self.update_status("completed")
+                AGENT_RUN_SECONDS.observe(time.perf_counter() - start, agent=self.__class__.__name__, status="completed")
+                return {
+                    'success': True,
+                    'agent_id': self.agent_id,
+                    'data': result,
+                    'timestamp': datetime.now().isoformat()
+                }
+
+            except Exception as e:
+                self.update_status("failed")
+                self.add_error(f"Execution failed: {str(e)}", e)
+                AGENT_RUN_SECONDS.observe(time.perf_counter() - start, agent=self.__class__.__name__, status="failed")
+                if current is not None:
+                    current.error = f"{type(e).__name__}: {e}"
+
+                return {
+                    'success': False,
+                    'agent_id': self.agent_id,
+                    'error': str(e),
+                    'timestamp': datetime.now().isoformat()
+                }
@@ -3,10 +3,12 @@ Candidate Ranker Agent
 Scores and ranks candidates based on job requirements using AI
 """
 
-from typing import Dict, Any, List
+from typing import Any, Callable, Dict, List, Optional
 import json
 import re
 from .base_agent import BaseAgent
+from ..utils.pools import get_llm_client
+from ..utils.metrics import observe_llm
 
 
 class CandidateRankerAgent(BaseAgent):
@@ -18,13 +20,12 @@ class CandidateRankerAgent(BaseAgent):
         super().__init__(agent_id, config)
         self.ai_provider = config.get('ai_provider', 'claude')
 
+        # Clients are shared across per-request agent instances
         if self.ai_provider == 'claude':
-            from anthropic import AsyncAnthropic
-            self.client = AsyncAnthropic(api_key=config.get('anthropic_api_key'))
+            self.client = get_llm_client('claude', config.get('anthropic_api_key'))
             self.model = config.get('claude_model', 'claude-3-5-sonnet-20241022')
         else:  # openai
-            from openai import AsyncOpenAI
-            self.client = AsyncOpenAI(api_key=config.get('openai_api_key'))
+            self.client = get_llm_client('openai', config.get('openai_api_key'))
             self.model = config.get('openai_model', 'gpt-4-turbo-preview')
 
     async def score_candidate(self, candidate: Dict[str, Any], job_requirements: Dict[str, Any]) -> Dict[str, Any]:
@@ -81,7 +82,7 @@ Analyze this candidate and provide a detailed scoring and recommendation."""
             if self.ai_provider == 'claude':
                 # Use Claude API
                 full_prompt = system_prompt + "\n\n" + user_prompt
-                response = await self.client.messages.create(
+                response = await observe_llm(self.model, self.client.messages.create(
                     model=self.model,
                     max_tokens=4096,
                     temperature=0.2,
@@ -91,7 +92,7 @@ Analyze this candidate and provide a detailed scoring and recommendation."""
                             "content": full_prompt
                         }
                     ]
-                )
+                ))
 
                 # Extract JSON from Claude response
                 response_text = response.content[0].text
@@ -105,7 +106,7 @@ Analyze this candidate and provide a detailed scoring and recommendation."""
 
             else:  # openai
                 # Use OpenAI API
-                response = await self.client.chat.completions.create(
+                response = await observe_llm(self.model, self.client.chat.completions.create(
                     model=self.model,
                     messages=[
                         {"role": "system", "content": system_prompt},
@@ -113,7 +114,7 @@ Analyze this candidate and provide a detailed scoring and recommendation."""
                     ],
                     temperature=0.2,
                     response_format={"type": "json_object"}
-                )
+                ))
 
                 scoring = json.loads(response.choices[0].message.content)
 
@@ -129,13 +130,17 @@ Analyze this candidate and provide a detailed scoring and recommendation."""
             }
 
     async def rank_candidates(self, candidates: List[Dict[str, Any]],
-                            job_requirements: Dict[str, Any]) -> List[Dict[str, Any]]:
+                            job_requirements: Dict[str, Any],
+                            on_scored: Optional[Callable[[Dict[str, Any], int, int], None]] = None
+                            ) -> List[Dict[str, Any]]:
         """
         Score and rank multiple candidates
 
         Args:
             candidates: List of candidate dictionaries
             job_requirements: Job requirements dictionary
+            on_scored: Called with (scored candidate, number scored so far, total)
+                       as soon as each candidate is scored, before ranks are assigned
 
         Returns:
             List of candidates with scores, sorted by score (highest first)
@@ -145,7 +150,8 @@ Analyze this candidate and provide a detailed scoring and recommendation."""
         scored_candidates = []
 
         for idx, candidate in enumerate(candidates):
-            self.log(f"Scoring candidate {idx + 1}/{len(candidates)}: {candidate.get('name', 'Unknown')}")
+            self.log(f"Scoring candidate {idx + 1}/{len(candidates)}: {candidate.get('name', 'Unknown')}",
+                     key="ranker.scoring")
 
             scoring = await self.score_candidate(candidate, job_requirements)
 
@@ -157,6 +163,8 @@ Analyze this candidate and provide a detailed scoring and recommendation."""
             }
 
             scored_candidates.append(scored_candidate)
+            if on_scored is not None:
+                on_scored(scored_candidate, len(scored_candidates), len(candidates))
 
         # Sort by overall score (descending)
         scored_candidates.sort(key=lambda x: x['overall_score'], reverse=True)
@@ -206,7 +214,7 @@ Provide a JSON response with:
             if self.ai_provider == 'claude':
                 # Use Claude API
                 full_prompt = "You are an expert HR recruiter providing hiring recommendations.\n\n" + summary_prompt
-                response = await self.client.messages.create(
+                response = await observe_llm(self.model, self.client.messages.create(
                     model=self.model,
                     max_tokens=2048,
                     temperature=0.3,
@@ -216,7 +224,7 @@ Provide a JSON response with:
                             "content": full_prompt
                         }
                     ]
-                )
+                ))
 
                 # Extract JSON from Claude response
                 response_text = response.content[0].text
@@ -230,7 +238,7 @@ Provide a JSON response with:
 
             else:  # openai
                 # Use OpenAI API
-                response = await self.client.chat.completions.create(
+                response = await observe_llm(self.model, self.client.chat.completions.create(
                     model=self.model,
                     messages=[
                         {"role": "system", "content": "You are an expert HR recruiter providing hiring recommendations."},
@@ -238,7 +246,7 @@ Provide a JSON response with:
                     ],
                     temperature=0.3,
                     response_format={"type": "json_object"}
-                )
+                ))
 
                 summary = json.loads(response.choices[0].message.content)
 
@@ -262,6 +270,7 @@ Provide a JSON response with:
                      job_requirements: Dict[str, Any],
                      generate_shortlist: bool = True,
                      shortlist_size: int = 10,
+                     on_scored: Optional[Callable[[Dict[str, Any], int, int], None]] = None,
                      **kwargs) -> Dict[str, Any]:
         """
         Execute candidate ranking
@@ -271,6 +280,7 @@ Provide a JSON response with:
             job_requirements: Job requirements to match against
             generate_shortlist: Whether to generate a shortlist summary
             shortlist_size: Number of candidates in shortlist
+            on_scored: Progress callback for each scored candidate (see rank_candidates)
 
         Returns:
             Ranking results
@@ -284,7 +294,7 @@ Provide a JSON response with:
             }
 
         # Rank all candidates
-        ranked_candidates = await self.rank_candidates(candidates, job_requirements)
+        ranked_candidates = await self.rank_candidates(candidates, job_requirements, on_scored)
 
         result = {
             'total_candidates': len(candidates),
@@ -4,17 +4,16 @@ Searches for candidates/job postings on Indeed using web scraping
 """
 
 import asyncio
-from typing import Dict, Any, List
-from selenium import webdriver
+from typing import Dict, Any, List, Optional
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
-import time
 from .base_agent import BaseAgent
+from ..utils.metrics import PAGE_LOAD_SECONDS
+from ..utils.rate_limiter import get_rate_limiter
+from ..utils.browser import get_driver_pool, wait_for_any
+from ..utils.http import fetch_html, make_soup
+from ..utils.replay import SnapshotStore, rewrite_url
+from ..utils.pagination import paginate
 
 
 class IndeedScraperAgent(BaseAgent):
@@ -22,47 +21,109 @@ class IndeedScraperAgent(BaseAgent):
     Agent for scraping job postings and candidate information from Indeed
     """
 
+    # Selectors shared by the HTTP (BeautifulSoup) and WebDriver extraction paths
+    RESULT_SELECTOR = ".job_seen_beacon, .jobsearch-ResultsList > li"
+    NO_RESULTS_SELECTOR = ".jobsearch-NoResult-messageContainer, .no_results"
+    DETAIL_SELECTOR = "#jobDescriptionText"
+    TITLE_SELECTOR = "h2.jobTitle span[title], .jobTitle a"
+    COMPANY_SELECTOR = "[data-testid='company-name'], .companyName"
+    LOCATION_SELECTOR = "[data-testid='text-location'], .companyLocation"
+    SALARY_SELECTOR = "[data-testid='attribute_snippet_testid'], .salary-snippet"
+    SNIPPET_SELECTOR = ".job-snippet, td.resultContent > div > div"
+    LINK_SELECTOR = "a[data-jk], h2.jobTitle a"
+    DATE_SELECTOR = ".date, [data-testid='myJobsStateDate']"
+    REQUIREMENTS_SELECTOR = ".jobsearch-JobDescriptionSection-sectionItem"
+
     def __init__(self, agent_id: str = "indeed_scraper", config: Dict[str, Any] = None):
         super().__init__(agent_id, config)
         self.headless = config.get('headless', True)
+        self.lightweight = config.get('lightweight_browser', True)
         self.scrape_delay = config.get('scrape_delay', 2)
         self.max_results = config.get('max_candidates', 50)
+        self.page_timeout = config.get('scrape_timeout', 15)
+        self.http_first = config.get('http_first', True)
+        self.detail_concurrency = config.get('detail_concurrency', 4)
+        self.detail_timeout = config.get('detail_timeout', self.page_timeout + 5)
+        self.max_pages = config.get('max_pages', 5)
+        self.page_workers = config.get('page_workers', 2)
+        # Result pages that failed to load in the last search
+        self.skipped_pages: List[int] = []
         self.driver = None
 
-    def setup_driver(self):
+        # Politeness comes from a shared per-domain limiter, not fixed sleeps.
+        # Search and detail pages draw on the same per-domain budget.
+        self.rate_limiter = get_rate_limiter(self.scrape_delay)
+
+        # Optional record/replay of fetched pages for offline benchmarks and tests
+        self.recorder = SnapshotStore(config['record_dir']) if config.get('record_dir') else None
+        self.replay_url = config.get('replay_url')
+
+        # Drivers are pooled per browser profile and shared by all agent instances
+        self.driver_pool = get_driver_pool(self.headless, self.lightweight, config.get('driver_pool_size', 2))
+
+    async def setup_driver(self):
         """
-        Setup Selenium WebDriver with Chrome
+        Check out a WebDriver from the shared driver pool (once per run)
         """
-        chrome_options = Options()
+        if self.driver is None:
+            self.driver = await self.driver_pool.acquire()
 
-        if self.headless:
-            chrome_options.add_argument("--headless")
+    async def close_driver(self, discard: bool = False):
+        """
+        Return the WebDriver to the shared driver pool
 
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+        Args:
+            discard: Quit the driver instead of reusing it (e.g. after a crash)
+        """
+        if self.driver:
+            driver, self.driver = self.driver, None
+            await self.driver_pool.release(driver, discard=discard)
 
-        # Prevent detection
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
+    def page_url(self, url: str) -> str:
+        """URL to load for a live page (redirected to the replay server when replaying)"""
+        return rewrite_url(url, self.replay_url) if self.replay_url else url
 
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    def record_page(self, url: str, html: Optional[str]):
+        """Save a fetched page as a snapshot when recording is enabled"""
+        if self.recorder is not None and html:
+            self.recorder.record(url, html)
 
-    def close_driver(self):
+    @staticmethod
+    def build_search_url(job_title: str, location: str = "", page: int = 1) -> str:
         """
-        Close the WebDriver
+        Build the Indeed job search URL
+
+        Args:
+            job_title: Job title/skills to search for
+            location: Location filter
+            page: Result page (1-based, 10 results per page)
+
+        Returns:
+            Search URL
         """
-        if self.driver:
-            self.driver.quit()
-            self.driver = None
+        base_url = "https://www.indeed.com/jobs"
+        params = f"?q={job_title.replace(' ', '+')}"
+
+        if location:
+            params += f"&l={location.replace(' ', '+')}"
+
+        if page > 1:
+            params += f"&start={(page - 1) * 10}"
+
+        return base_url + params
 
     async def search_resumes(self, job_title: str, location: str = "") -> List[Dict[str, Any]]:
         """
         Search for resumes on Indeed (requires Indeed Resume access)
 
+        Tries plain HTTP fetches first and only launches the browser when the
+        first page's HTML has no result cards (blocked, JS-only or changed
+        markup). Either way, result pages are read by a bounded set of
+        workers until max_results is reached. In the browser, later pages
+        reuse page 1's driver first and only as many workers run as the pool
+        can supply without waiting; pages that still fail are listed in
+        skipped_pages.
+
         Args:
             job_title: Job title/skills to search for
             location: Location filter
@@ -70,42 +131,109 @@ class IndeedScraperAgent(BaseAgent):
         Returns:
             List of candidate profiles from resumes
         """
-        candidates = []
-
         # Note: Indeed Resume search requires employer account
         # This is a simplified version that searches job postings to understand market
         self.log("Note: Indeed Resume search requires employer account. Searching job postings instead.")
 
         # Build search URL for job postings (to understand what candidates are looking for)
-        base_url = "https://www.indeed.com/jobs"
-        params = f"?q={job_title.replace(' ', '+')}"
-
-        if location:
-            params += f"&l={location.replace(' ', '+')}"
-
-        search_url = base_url + params
+        self.log(f"Searching Indeed: {self.build_search_url(job_title, location)}")
+
+        if self.http_first:
+            self.skipped_pages = []
+            candidates = await paginate(
+                lambda page: self.fetch_search_page(self.build_search_url(job_title, location, page)),
+                self.max_results, max_pages=self.max_pages, workers=self.page_workers, key=self.job_key,
+                skipped=self.skipped_pages
+            )
+            if candidates:
+                self.log(f"HTTP path returned {len(candidates)} job postings")
+                self.log_skipped_pages()
+                return candidates
+            self.log("HTTP path found no results, falling back to browser", "warning")
+
+        # Page 1's driver is free again once that page is read; later pages reuse it first
+        spare = []
+        workers = min(self.page_workers, self.driver_pool.available() + (self.driver is not None))
+
+        async def fetch_page(page: int) -> List[Dict[str, Any]]:
+            search_url = self.build_search_url(job_title, location, page)
+            if page == 1:
+                results = await self.search_with_driver(search_url)
+                if self.driver is not None:
+                    spare.append(self.driver)
+                return results
+            if spare:
+                driver = spare.pop()
+                try:
+                    return await self.search_with_driver(search_url, driver)
+                finally:
+                    spare.append(driver)
+            async with self.driver_pool.lease(timeout=self.page_timeout) as driver:
+                return await self.search_with_driver(search_url, driver)
+
+        self.skipped_pages = []
+        candidates = await paginate(
+            fetch_page, self.max_results, max_pages=self.max_pages, workers=max(1, workers), key=self.job_key,
+            skipped=self.skipped_pages
+        )
+        self.log_skipped_pages()
+        return candidates
 
-        self.log(f"Searching Indeed: {search_url}")
+    def log_skipped_pages(self):
+        """Warn about result pages the last search could not load"""
+        if self.skipped_pages:
+            self.log(f"Result pages {self.skipped_pages} failed to load and were skipped", "warning")
 
-        try:
-            self.driver.get(search_url)
-            await asyncio.sleep(self.scrape_delay)
+    async def fetch_search_page(self, search_url: str) -> List[Dict[str, Any]]:
+        """
+        Fetch and parse one search results page over HTTP
 
-            # Extract job postings (which can help identify potential candidates)
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, ".job_seen_beacon, .jobsearch-ResultsList > li")
+        Args:
+            search_url: Indeed search URL
 
-            for idx, card in enumerate(job_cards[:self.max_results]):
-                try:
-                    job_info = self.extract_job_info(card)
-                    if job_info:
-                        candidates.append(job_info)
-                        self.log(f"Found job posting: {job_info.get('title', 'Unknown')}")
+        Returns:
+            Job postings on the page (empty if blocked or past the last page)
+        """
+        await self.rate_limiter.wait(search_url)
+        with PAGE_LOAD_SECONDS.time(source="indeed", method="http"):
+            html = await asyncio.to_thread(fetch_html, self.page_url(search_url), self.page_timeout)
+        self.record_page(search_url, html)
+        results = await asyncio.to_thread(self.parse_search_page, html) if html else []
+        self.rate_limiter.record(search_url, ok=bool(results))
+        return results
+
+    async def search_with_driver(self, search_url: str, driver=None) -> List[Dict[str, Any]]:
+        """
+        Search Indeed by rendering the results page in Chrome
 
-                except Exception as e:
-                    self.log(f"Error extracting job {idx}: {e}", "warning")
-                    continue
+        Args:
+            search_url: Indeed search URL
+            driver: WebDriver to use (defaults to the agent's driver)
 
-                await asyncio.sleep(0.5)
+        Returns:
+            List of job postings
+        """
+        try:
+            if driver is None:
+                await self.setup_driver()
+                driver = self.driver
+            await self.rate_limiter.wait(search_url)
+            with PAGE_LOAD_SECONDS.time(source="indeed", method="driver"):
+                await asyncio.to_thread(driver.get, self.page_url(search_url))
+
+                # Wait for job cards (or the empty-results banner) instead of a fixed delay
+                found = await asyncio.to_thread(
+                    wait_for_any, driver,
+                    [self.RESULT_SELECTOR, self.NO_RESULTS_SELECTOR], self.page_timeout
+                )
+            self.rate_limiter.record(search_url, ok=found is not None)
+            if self.recorder is not None:
+                self.record_page(search_url, await asyncio.to_thread(lambda: driver.page_source))
+
+            # Extract job postings (which can help identify potential candidates),
+            # reading every card's elements in one thread call
+            job_cards = await asyncio.to_thread(driver.find_elements, By.CSS_SELECTOR, self.RESULT_SELECTOR)
+            candidates = await asyncio.to_thread(self.extract_jobs, job_cards)
 
         except Exception as e:
             self.add_error(f"Indeed search failed: {e}", e)
@@ -113,6 +241,105 @@ class IndeedScraperAgent(BaseAgent):
 
         return candidates
 
+    def extract_jobs(self, job_cards: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Extract job postings from result card elements (blocking; run in a thread)
+
+        Args:
+            job_cards: Selenium web elements
+
+        Returns:
+            Distinct job postings, at most max_results
+        """
+        jobs = []
+        seen_urls = set()
+
+        for idx, card in enumerate(job_cards):
+            if len(jobs) >= self.max_results:
+                break
+            try:
+                job_info = self.extract_job_info(card)
+                if job_info and self.job_key(job_info) not in seen_urls:
+                    seen_urls.add(self.job_key(job_info))
+                    jobs.append(job_info)
+                    self.log(f"Found job posting: {job_info.get('title', 'Unknown')}", key="indeed.found")
+
+            except Exception as e:
+                self.log(f"Error extracting job {idx}: {e}", "warning")
+                continue
+
+        return jobs
+
+    @staticmethod
+    def job_key(job_info: Dict[str, Any]) -> Any:
+        """Identity of a job posting for de-duplicating overlapping card matches"""
+        return job_info.get('url') or (job_info.get('title'), job_info.get('company'))
+
+    def parse_search_page(self, html: str) -> List[Dict[str, Any]]:
+        """
+        Extract job postings from a search results page's HTML
+
+        Args:
+            html: Search results HTML
+
+        Returns:
+            List of job postings
+        """
+        soup = make_soup(html)
+        results = []
+        seen_urls = set()
+
+        # Old and new markup selectors can both match one card (li > .job_seen_beacon)
+        for idx, card in enumerate(soup.select(self.RESULT_SELECTOR)):
+            if len(results) >= self.max_results:
+                break
+            try:
+                job_info = self.extract_job_info_from_html(card)
+                if job_info and self.job_key(job_info) not in seen_urls:
+                    seen_urls.add(self.job_key(job_info))
+                    results.append(job_info)
+            except Exception as e:
+                self.log(f"Error extracting job {idx}: {e}", "warning")
+
+        return results
+
+    def extract_job_info_from_html(self, card) -> Dict[str, Any]:
+        """
+        Extract job information from a parsed job card
+
+        Args:
+            card: BeautifulSoup tag for one result card
+
+        Returns:
+            Job information dictionary (same fields as extract_job_info)
+        """
+        def text(selector):
+            elem = card.select_one(selector)
+            return elem.get_text(" ", strip=True) if elem else None
+
+        title_elem = card.select_one(self.TITLE_SELECTOR)
+        if title_elem is None:
+            return None
+
+        job_url = None
+        link_elem = card.select_one(self.LINK_SELECTOR)
+        if link_elem is not None:
+            job_url = link_elem.get('href')
+            if job_url and not job_url.startswith('http'):
+                job_url = 'https://www.indeed.com' + job_url
+
+        return {
+            'title': title_elem.get_text(" ", strip=True) or title_elem.get('title'),
+            'company': text(self.COMPANY_SELECTOR),
+            'location': text(self.LOCATION_SELECTOR),
+            'salary': text(self.SALARY_SELECTOR),
+            'snippet': text(self.SNIPPET_SELECTOR),
+            'url': job_url,
+            'date_posted': text(self.DATE_SELECTOR),
+            'source': 'Indeed',
+            'type': 'job_posting'
+        }
+
     def extract_job_info(self, element) -> Dict[str, Any]:
         """
         Extract job information from job card element
@@ -128,42 +355,42 @@ class IndeedScraperAgent(BaseAgent):
         try:
             # Job title
             try:
-                title_elem = element.find_element(By.CSS_SELECTOR, "h2.jobTitle span[title], .jobTitle a")
+                title_elem = element.find_element(By.CSS_SELECTOR, self.TITLE_SELECTOR)
                 job_info['title'] = title_elem.text.strip() or title_elem.get_attribute('title')
             except NoSuchElementException:
                 return None
 
             # Company name
             try:
-                company_elem = element.find_element(By.CSS_SELECTOR, "[data-testid='company-name'], .companyName")
+                company_elem = element.find_element(By.CSS_SELECTOR, self.COMPANY_SELECTOR)
                 job_info['company'] = company_elem.text.strip()
             except NoSuchElementException:
                 job_info['company'] = None
 
             # Location
             try:
-                location_elem = element.find_element(By.CSS_SELECTOR, "[data-testid='text-location'], .companyLocation")
+                location_elem = element.find_element(By.CSS_SELECTOR, self.LOCATION_SELECTOR)
                 job_info['location'] = location_elem.text.strip()
             except NoSuchElementException:
                 job_info['location'] = None
 
             # Salary (if available)
             try:
-                salary_elem = element.find_element(By.CSS_SELECTOR, "[data-testid='attribute_snippet_testid'], .salary-snippet")
+                salary_elem = element.find_element(By.CSS_SELECTOR, self.SALARY_SELECTOR)
                 job_info['salary'] = salary_elem.text.strip()
             except NoSuchElementException:
                 job_info['salary'] = None
 
             # Job snippet/description
             try:
-                snippet_elem = element.find_element(By.CSS_SELECTOR, ".job-snippet, td.resultContent > div > div")
+                snippet_elem = element.find_element(By.CSS_SELECTOR, self.SNIPPET_SELECTOR)
                 job_info['snippet'] = snippet_elem.text.strip()
             except NoSuchElementException:
                 job_info['snippet'] = None
 
             # Job URL
             try:
-                link_elem = element.find_element(By.CSS_SELECTOR, "a[data-jk], h2.jobTitle a")
+                link_elem = element.find_element(By.CSS_SELECTOR, self.LINK_SELECTOR)
                 job_url = link_elem.get_attribute('href')
                 if job_url and not job_url.startswith('http'):
                     job_url = 'https://www.indeed.com' + job_url
@@ -173,7 +400,7 @@ class IndeedScraperAgent(BaseAgent):
 
             # Date posted (if available)
             try:
-                date_elem = element.find_element(By.CSS_SELECTOR, ".date, [data-testid='myJobsStateDate']")
+                date_elem = element.find_element(By.CSS_SELECTOR, self.DATE_SELECTOR)
                 job_info['date_posted'] = date_elem.text.strip()
             except NoSuchElementException:
                 job_info['date_posted'] = None
@@ -187,42 +414,128 @@ class IndeedScraperAgent(BaseAgent):
 
         return job_info
 
-    async def get_job_details(self, job_url: str) -> Dict[str, Any]:
+    def parse_job_details(self, html: str) -> Dict[str, Any]:
         """
-        Get detailed information from a job posting
+        Extract job details from a posting page's HTML
 
         Args:
-            job_url: URL of the job posting
+            html: Job posting HTML
+
+        Returns:
+            Detailed job information, or an empty dict if the description is missing
+        """
+        soup = make_soup(html)
+        desc_elem = soup.select_one(self.DETAIL_SELECTOR)
+        if desc_elem is None:
+            return {}
+
+        return {
+            'full_description': desc_elem.get_text("\n", strip=True),
+            'requirements': [
+                elem.get_text(" ", strip=True) for elem in soup.select(self.REQUIREMENTS_SELECTOR)
+            ]
+        }
+
+    def extract_job_details(self, driver) -> Dict[str, Any]:
+        """
+        Extract job details from a rendered posting page
+
+        Args:
+            driver: WebDriver showing the job posting
 
         Returns:
             Detailed job information
         """
+        details = {}
+
+        # Full job description
         try:
-            self.driver.get(job_url)
-            await asyncio.sleep(2)
+            desc_elem = driver.find_element(By.ID, "jobDescriptionText")
+            details['full_description'] = desc_elem.text.strip()
+        except NoSuchElementException:
+            details['full_description'] = None
 
-            details = {}
+        # Requirements (if separately listed)
+        try:
+            req_elems = driver.find_elements(By.CSS_SELECTOR, self.REQUIREMENTS_SELECTOR)
+            details['requirements'] = [elem.text.strip() for elem in req_elems]
+        except NoSuchElementException:
+            details['requirements'] = []
 
-            # Full job description
-            try:
-                desc_elem = self.driver.find_element(By.ID, "jobDescriptionText")
-                details['full_description'] = desc_elem.text.strip()
-            except NoSuchElementException:
-                details['full_description'] = None
+        return details
 
-            # Requirements (if separately listed)
-            try:
-                req_elems = self.driver.find_elements(By.CSS_SELECTOR, ".jobsearch-JobDescriptionSection-sectionItem")
-                details['requirements'] = [elem.text.strip() for elem in req_elems]
-            except NoSuchElementException:
-                details['requirements'] = []
+    async def get_job_details(self, job_url: str) -> Dict[str, Any]:
+        """
+        Get detailed information from a job posting
 
-            return details
+        Uses the HTTP path first; the browser fallback leases its own driver
+        from the pool so several postings can be fetched at once.
+
+        Args:
+            job_url: URL of the job posting
+
+        Returns:
+            Detailed job information
+        """
+        try:
+            if self.http_first:
+                await self.rate_limiter.wait(job_url)
+                with PAGE_LOAD_SECONDS.time(source="indeed_detail", method="http"):
+                    html = await asyncio.to_thread(fetch_html, self.page_url(job_url), self.page_timeout)
+                self.record_page(job_url, html)
+                details = await asyncio.to_thread(self.parse_job_details, html) if html else {}
+                self.rate_limiter.record(job_url, ok=bool(details))
+                if details:
+                    return details
+
+            async with self.driver_pool.lease(timeout=self.detail_timeout) as driver:
+                await self.rate_limiter.wait(job_url)
+                with PAGE_LOAD_SECONDS.time(source="indeed_detail", method="driver"):
+                    await asyncio.to_thread(driver.get, self.page_url(job_url))
+                    found = await asyncio.to_thread(
+                        wait_for_any, driver, [self.DETAIL_SELECTOR], self.page_timeout
+                    )
+                self.rate_limiter.record(job_url, ok=found is not None)
+                if self.recorder is not None:
+                    self.record_page(job_url, await asyncio.to_thread(lambda: driver.page_source))
+                return await asyncio.to_thread(self.extract_job_details, driver)
 
         except Exception as e:
             self.log(f"Error getting job details: {e}", "warning")
             return {}
 
+    async def fetch_job_details(self, jobs: List[Dict[str, Any]], limit: int = 10) -> int:
+        """
+        Enrich job postings with their details concurrently
+
+        At most ``detail_concurrency`` postings are in flight at once and each
+        one is abandoned after ``detail_timeout`` seconds.
+
+        Args:
+            jobs: Job postings to enrich in place
+            limit: Maximum number of postings to enrich
+
+        Returns:
+            Number of postings enriched
+        """
+        semaphore = asyncio.Semaphore(self.detail_concurrency)
+
+        async def enrich(job: Dict[str, Any]) -> bool:
+            async with semaphore:
+                try:
+                    details = await asyncio.wait_for(
+                        self.get_job_details(job['url']), timeout=self.detail_timeout
+                    )
+                except asyncio.TimeoutError:
+                    self.log(f"Timed out fetching job details: {job['url']}", "warning")
+                    return False
+                job.update(details)
+                return bool(details)
+
+        targets = [job for job in jobs[:limit] if job.get('url')]
+        enriched = await asyncio.gather(*(enrich(job) for job in targets))
+        return sum(enriched)
+
     async def execute(self, job_title: str, location: str = "", get_details: bool = False, **kwargs) -> Dict[str, Any]:
         """
         Execute Indeed search
@@ -237,25 +550,23 @@ class IndeedScraperAgent(BaseAgent):
         """
         self.log(f"Starting Indeed search for: {job_title}")
 
+        driver_failed = False
         try:
-            # Setup browser
-            self.setup_driver()
-
-            # Search for jobs/resumes
+            # A browser is only checked out if the HTTP path comes up empty
             results = await self.search_resumes(job_title, location)
 
-            # Optionally get full details for each job
+            # Optionally get full details for the top jobs, fetched concurrently
             if get_details and results:
                 self.log("Fetching detailed information for top results...")
-                for result in results[:10]:  # Limit to top 10 to avoid too long execution
-                    if result.get('url'):
-                        details = await self.get_job_details(result['url'])
-                        result.update(details)
+                await self.close_driver()  # free the search driver for detail workers
+                enriched = await self.fetch_job_details(results, limit=10)
+                self.log(f"Fetched details for {enriched} job postings")
 
             result = {
                 'job_title': job_title,
                 'location': location,
                 'results_found': len(results),
+                'skipped_pages': self.skipped_pages,
                 'results': results
             }
 
@@ -264,6 +575,10 @@ class IndeedScraperAgent(BaseAgent):
 
             return result
 
+        except Exception:
+            driver_failed = True
+            raise
+
         finally:
-            # Always close the driver
-            self.close_driver()
+            # Always return the driver; broken sessions are not reused
+            await self.close_driver(discard=driver_failed)
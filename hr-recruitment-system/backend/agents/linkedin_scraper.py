@@ -4,17 +4,19 @@ Searches for candidates on LinkedIn using web scraping
 """
 
 import asyncio
-from typing import Dict, Any, List
-from selenium import webdriver
+from typing import Dict, Any, List, Optional, Tuple
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
-import time
 from .base_agent import BaseAgent
+from ..utils.metrics import PAGE_LOAD_SECONDS
+from ..utils.rate_limiter import get_rate_limiter
+from ..utils.browser import (
+    get_driver_pool, wait_for_any, wait_for_url, scroll_until_stable, export_session, import_session
+)
+from ..utils.replay import SnapshotStore, rewrite_url
+from ..utils.seen import SeenStore, get_seen_store, seen_key
+from ..utils.sessions import get_session_store
+from ..utils.pagination import paginate
 
 
 class LinkedInScraperAgent(BaseAgent):
@@ -22,42 +24,158 @@ class LinkedInScraperAgent(BaseAgent):
     Agent for scraping candidate profiles from LinkedIn
     """
 
+    RESULT_SELECTOR = ".reusable-search__result-container"
+    NO_RESULTS_SELECTOR = ".search-reusable-search-no-results, .artdeco-empty-state"
+    PROFILE_LINK_SELECTOR = ".entity-result__title-text a"
+    LOGGED_IN_SELECTOR = "#global-nav, .global-nav"
+    LOGGED_OUT_SELECTOR = "#username, .authwall-join-form, .join-form, .sign-in-form"
+    HOME_URL = "https://www.linkedin.com/"
+    FEED_URL = "https://www.linkedin.com/feed/"
+
     def __init__(self, agent_id: str = "linkedin_scraper", config: Dict[str, Any] = None):
         super().__init__(agent_id, config)
         self.headless = config.get('headless', True)
+        self.lightweight = config.get('lightweight_browser', True)
         self.scrape_delay = config.get('scrape_delay', 2)
         self.max_candidates = config.get('max_candidates', 50)
+        self.page_timeout = config.get('scrape_timeout', 15)
         self.driver = None
 
-    def setup_driver(self):
+        # Politeness comes from a shared per-domain limiter, not fixed sleeps
+        self.rate_limiter = get_rate_limiter(self.scrape_delay)
+
+        # Optional record/replay of fetched pages for offline benchmarks and tests
+        self.recorder = SnapshotStore(config['record_dir']) if config.get('record_dir') else None
+        self.replay_url = config.get('replay_url')
+
+        # Profiles skipped because earlier runs of the search returned them
+        self.skipped_seen = 0
+        # Result pages that failed to load in the last search
+        self.skipped_pages: List[int] = []
+
+        # Result pages are read by a bounded set of workers until max_candidates is reached
+        self.max_pages = config.get('max_pages', 5)
+        self.page_workers = config.get('page_workers', 2)
+
+        # Encrypted per-account session state, so logins are only repeated when a session expires
+        session_dir = config.get('linkedin_session_dir')
+        self.sessions = get_session_store(
+            session_dir, config.get('session_secret'), config.get('linkedin_session_max_age_days', 30)
+        ) if session_dir else None
+        self.session_state = None
+
+        # Drivers are pooled per browser profile and shared by all agent instances
+        self.driver_pool = get_driver_pool(self.headless, self.lightweight, config.get('driver_pool_size', 2))
+
+    @property
+    def seen_profiles(self) -> SeenStore:
+        """Profiles already returned per search, opened on first incremental search"""
+        return get_seen_store(self.config.get('seen_profiles_path'), self.config.get('seen_profiles_max_age_days'))
+
+    async def setup_driver(self):
         """
-        Setup Selenium WebDriver with Chrome
+        Check out a WebDriver from the shared driver pool
         """
-        chrome_options = Options()
+        self.driver = await self.driver_pool.acquire()
 
-        if self.headless:
-            chrome_options.add_argument("--headless")
+    async def close_driver(self, discard: bool = False):
+        """
+        Return the WebDriver to the shared driver pool
 
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+        Args:
+            discard: Quit the driver instead of reusing it (e.g. after a crash)
+        """
+        if self.driver:
+            driver, self.driver = self.driver, None
+            await self.driver_pool.release(driver, discard=discard)
 
-        # Prevent detection
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
+    def page_url(self, url: str) -> str:
+        """URL to load for a live page (redirected to the replay server when replaying)"""
+        return rewrite_url(url, self.replay_url) if self.replay_url else url
 
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    def record_page(self, url: str, html: Optional[str]):
+        """Save a fetched page as a snapshot when recording is enabled"""
+        if self.recorder is not None and html:
+            self.recorder.record(url, html)
 
-    def close_driver(self):
+    @staticmethod
+    def build_search_url(job_title: str, location: str = "", keywords: List[str] = None,
+                         page: int = 1) -> str:
         """
-        Close the WebDriver
+        Build the LinkedIn people search URL (public search, no login required)
+
+        Args:
+            job_title: Job title to search for
+            location: Location filter
+            keywords: Additional keywords to search
+            page: Result page (1-based)
+
+        Returns:
+            Search URL
         """
-        if self.driver:
-            self.driver.quit()
-            self.driver = None
+        search_query = job_title
+        if keywords:
+            search_query += " " + " ".join(keywords)
+
+        base_url = "https://www.linkedin.com/search/results/people/"
+        params = f"?keywords={search_query.replace(' ', '%20')}"
+
+        if location:
+            params += f"&location={location.replace(' ', '%20')}"
+
+        if page > 1:
+            params += f"&page={page}"
+
+        return base_url + params
+
+    async def ensure_logged_in(self, email: str, password: str) -> bool:
+        """
+        Restore a saved session for the account, logging in only if it is invalid
+
+        Args:
+            email: LinkedIn email
+            password: LinkedIn password
+
+        Returns:
+            True if the driver ends up authenticated
+        """
+        # Session files are sealed with a slow key derivation; keep it off the event loop
+        if self.sessions is not None:
+            state = await asyncio.to_thread(self.sessions.load, "linkedin", email, password)
+            if state:
+                await asyncio.to_thread(import_session, self.driver, state, self.page_url(self.HOME_URL))
+                if await self.session_valid():
+                    self.log("Restored saved LinkedIn session")
+                    self.session_state = state
+                    return True
+                self.log("Saved LinkedIn session expired, logging in again")
+                await asyncio.to_thread(self.sessions.delete, "linkedin", email)
+
+        logged_in = await self.login_to_linkedin(email, password)
+
+        if logged_in:
+            # Kept for page workers' drivers, and saved for later runs
+            self.session_state = await asyncio.to_thread(export_session, self.driver)
+            if self.sessions is not None:
+                await asyncio.to_thread(self.sessions.save, "linkedin", email, password, self.session_state)
+
+        return logged_in
+
+    async def session_valid(self) -> bool:
+        """
+        Check whether the driver's cookies give an authenticated session
+
+        Returns:
+            True if the feed loads with the signed-in navigation bar
+        """
+        await self.rate_limiter.wait(self.FEED_URL)
+        await asyncio.to_thread(self.driver.get, self.page_url(self.FEED_URL))
+        found = await asyncio.to_thread(
+            wait_for_any, self.driver,
+            [self.LOGGED_IN_SELECTOR, self.LOGGED_OUT_SELECTOR], self.page_timeout
+        )
+        self.rate_limiter.record(self.FEED_URL, ok=found is not None)
+        return found == self.LOGGED_IN_SELECTOR
 
     async def login_to_linkedin(self, email: str, password: str) -> bool:
         """
@@ -71,24 +189,22 @@ class LinkedInScraperAgent(BaseAgent):
             True if login successful, False otherwise
         """
         try:
-            self.driver.get("https://www.linkedin.com/login")
-            await asyncio.sleep(2)
+            login_url = "https://www.linkedin.com/login"
+            await self.rate_limiter.wait(login_url)
+            await asyncio.to_thread(self.driver.get, login_url)
+            await asyncio.to_thread(wait_for_any, self.driver, ["#username"], self.page_timeout)
 
-            # Enter credentials
-            email_field = self.driver.find_element(By.ID, "username")
-            email_field.send_keys(email)
+            # Enter credentials and submit
+            await asyncio.to_thread(self.submit_login_form, email, password)
 
-            password_field = self.driver.find_element(By.ID, "password")
-            password_field.send_keys(password)
-
-            # Click login button
-            login_button = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-            login_button.click()
-
-            await asyncio.sleep(3)
+            # Wait for the redirect instead of a fixed delay
+            await asyncio.to_thread(
+                wait_for_url, self.driver, ["feed", "mynetwork", "checkpoint"], self.page_timeout
+            )
 
             # Check if login was successful
-            if "feed" in self.driver.current_url or "mynetwork" in self.driver.current_url:
+            current_url = await asyncio.to_thread(lambda: self.driver.current_url)
+            if "feed" in current_url or "mynetwork" in current_url:
                 self.log("LinkedIn login successful")
                 return True
             else:
@@ -99,67 +215,192 @@ class LinkedInScraperAgent(BaseAgent):
             self.add_error(f"LinkedIn login failed: {e}", e)
             return False
 
-    async def search_candidates(self, job_title: str, location: str = "", keywords: List[str] = None) -> List[Dict[str, Any]]:
+    def submit_login_form(self, email: str, password: str):
         """
-        Search for candidates on LinkedIn
+        Fill in and submit the login form (blocking; run in a thread)
 
         Args:
-            job_title: Job title to search for
-            location: Location filter
-            keywords: Additional keywords to search
+            email: LinkedIn email
+            password: LinkedIn password
+        """
+        self.driver.find_element(By.ID, "username").send_keys(email)
+        self.driver.find_element(By.ID, "password").send_keys(password)
+        self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+
+    async def load_results_page(self, search_url: str, driver=None) -> List[Any]:
+        """
+        Load a search results page and return its result elements
+
+        Args:
+            search_url: LinkedIn search URL
+            driver: WebDriver to use (defaults to the agent's driver)
 
         Returns:
-            List of candidate profiles
+            Result container elements (empty if the page has no results)
         """
-        candidates = []
+        driver = driver or self.driver
+        await self.rate_limiter.wait(search_url)
+        with PAGE_LOAD_SECONDS.time(source="linkedin", method="driver"):
+            await asyncio.to_thread(driver.get, self.page_url(search_url))
+
+            # Wait for results (or an explicit empty state) instead of a fixed delay
+            found = await asyncio.to_thread(
+                wait_for_any, driver,
+                [self.RESULT_SELECTOR, self.NO_RESULTS_SELECTOR], self.page_timeout
+            )
+        self.rate_limiter.record(search_url, ok=found is not None)
+
+        if found == self.RESULT_SELECTOR:
+            # Scroll only while each scroll actually loads new results
+            await asyncio.to_thread(
+                scroll_until_stable, driver, self.RESULT_SELECTOR,
+                3, self.page_timeout / 3, self.max_candidates
+            )
+
+        if self.recorder is not None:
+            self.record_page(search_url, await asyncio.to_thread(lambda: driver.page_source))
+
+        return await asyncio.to_thread(driver.find_elements, By.CSS_SELECTOR, self.RESULT_SELECTOR)
+
+    async def search_page(self, search_url: str, driver=None,
+                          seen_query: Optional[str] = None) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Load one results page and extract its candidates
 
-        # Build search query
-        search_query = job_title
-        if keywords:
-            search_query += " " + " ".join(keywords)
+        Args:
+            search_url: LinkedIn search URL for the page
+            driver: WebDriver to use (defaults to the agent's driver)
+            seen_query: Seen-set key; profiles already in it are skipped before extraction
 
-        # Construct LinkedIn search URL (public search, no login required)
-        base_url = "https://www.linkedin.com/search/results/people/"
-        params = f"?keywords={search_query.replace(' ', '%20')}"
+        Returns:
+            Candidates on the page, and the number of results on it before
+            seen profiles were skipped (0 past the last page)
+        """
+        result_items = await self.load_results_page(search_url, driver)
+        found = len(result_items)
 
-        if location:
-            params += f"&location={location.replace(' ', '%20')}"
+        # Reading elements is a WebDriver round trip per field: one thread call per page
+        if seen_query is not None and result_items:
+            urls = await asyncio.to_thread(lambda: [self.profile_url_of(item) for item in result_items])
+            new_urls = await asyncio.to_thread(self.seen_profiles.unseen, seen_query, urls)
+            kept = [item for item, url in zip(result_items, urls) if url is None or url in new_urls]
+            self.skipped_seen += len(result_items) - len(kept)
+            result_items = kept
 
-        search_url = base_url + params
+        return await asyncio.to_thread(self.extract_candidates, result_items[:self.max_candidates]), found
 
-        self.log(f"Searching LinkedIn: {search_url}")
+    def extract_candidates(self, result_items: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Extract candidates from a page's result elements (blocking; run in a thread)
 
-        try:
-            self.driver.get(search_url)
-            await asyncio.sleep(self.scrape_delay)
+        Args:
+            result_items: Selenium web elements
 
-            # Scroll to load more results
-            for _ in range(3):
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                await asyncio.sleep(1)
+        Returns:
+            Candidates that could be read
+        """
+        candidates = []
+        for idx, item in enumerate(result_items):
+            try:
+                candidate = self.extract_candidate_info(item)
+                if candidate:
+                    candidates.append(candidate)
+                    self.log(f"Found candidate: {candidate.get('name', 'Unknown')}", key="linkedin.found")
 
-            # Extract candidate information from search results
-            result_items = self.driver.find_elements(By.CSS_SELECTOR, ".reusable-search__result-container")
+            except Exception as e:
+                self.log(f"Error extracting candidate {idx}: {e}", "warning")
+                continue
 
-            for idx, item in enumerate(result_items[:self.max_candidates]):
-                try:
-                    candidate = self.extract_candidate_info(item)
-                    if candidate:
-                        candidates.append(candidate)
-                        self.log(f"Found candidate: {candidate.get('name', 'Unknown')}")
+        return candidates
 
-                except Exception as e:
-                    self.log(f"Error extracting candidate {idx}: {e}", "warning")
-                    continue
+    async def search_candidates(self, job_title: str, location: str = "", keywords: List[str] = None,
+                                skip_seen: bool = False) -> List[Dict[str, Any]]:
+        """
+        Search for candidates on LinkedIn
 
-                await asyncio.sleep(0.5)  # Small delay between extractions
+        Reads result pages until max_candidates is reached. Page 1 uses the
+        agent's driver; further pages (up to max_pages) are spread over at
+        most page_workers drivers: the agent's own, then drivers leased from
+        the pool carrying over the logged-in session if there is one. Only
+        as many workers run as the pool can supply without waiting, and
+        pages that still fail are listed in skipped_pages.
+
+        Args:
+            job_title: Job title to search for
+            location: Location filter
+            keywords: Additional keywords to search
+            skip_seen: Skip profiles returned by earlier runs of this search
 
+        Returns:
+            List of candidate profiles
+        """
+        seen_query = seen_key(job_title, location, keywords) if skip_seen else None
+        self.skipped_seen = 0
+        self.skipped_pages = []
+
+        # Page 1's driver is free again once that page is read; later pages reuse it first
+        spare = [self.driver] if self.driver is not None else []
+        workers = min(self.page_workers, len(spare) + self.driver_pool.available())
+        # Results per page before seen profiles are skipped: a page of only seen
+        # profiles is not the end of the results
+        found: Dict[int, int] = {}
+
+        async def load_page(page: int, search_url: str) -> List[Dict[str, Any]]:
+            if page == 1:
+                return await self.search_page(search_url, seen_query=seen_query)
+
+            if spare:
+                driver = spare.pop()
+                try:
+                    return await self.search_page(search_url, driver, seen_query)
+                finally:
+                    spare.append(driver)
+
+            async with self.driver_pool.lease(timeout=self.page_timeout) as driver:
+                if self.session_state:
+                    await asyncio.to_thread(
+                        import_session, driver, self.session_state, self.page_url(self.HOME_URL)
+                    )
+                return await self.search_page(search_url, driver, seen_query)
+
+        async def fetch_page(page: int) -> List[Dict[str, Any]]:
+            search_url = self.build_search_url(job_title, location, keywords, page=page)
+            self.log(f"Searching LinkedIn: {search_url}")
+            candidates, found[page] = await load_page(page, search_url)
+            return candidates
+
+        try:
+            candidates = await paginate(
+                fetch_page, self.max_candidates, max_pages=self.max_pages, workers=max(1, workers),
+                key=lambda c: c.get('profile_url') or c.get('name'), skipped=self.skipped_pages,
+                is_end=lambda page, items: not found.get(page)
+            )
         except Exception as e:
             self.add_error(f"LinkedIn search failed: {e}", e)
             raise
 
+        if self.skipped_seen:
+            self.log(f"Skipped {self.skipped_seen} previously seen profiles")
+        if self.skipped_pages:
+            self.log(f"Result pages {self.skipped_pages} failed to load and were skipped", "warning")
+
         return candidates
 
+    def profile_url_of(self, element) -> Optional[str]:
+        """
+        Read just the profile URL of a search result element
+
+        Args:
+            element: Selenium web element
+
+        Returns:
+            Profile URL, or None if the element has no profile link
+        """
+        try:
+            return element.find_element(By.CSS_SELECTOR, self.PROFILE_LINK_SELECTOR).get_attribute('href')
+        except NoSuchElementException:
+            return None
+
     def extract_candidate_info(self, element) -> Dict[str, Any]:
         """
         Extract candidate information from search result element
@@ -193,7 +434,7 @@ class LinkedInScraperAgent(BaseAgent):
 
             # Profile URL
             try:
-                profile_link = element.find_element(By.CSS_SELECTOR, ".entity-result__title-text a")
+                profile_link = element.find_element(By.CSS_SELECTOR, self.PROFILE_LINK_SELECTOR)
                 candidate['profile_url'] = profile_link.get_attribute('href')
             except NoSuchElementException:
                 candidate['profile_url'] = None
@@ -214,7 +455,8 @@ class LinkedInScraperAgent(BaseAgent):
         return candidate
 
     async def execute(self, job_title: str, location: str = "", keywords: List[str] = None,
-                     linkedin_email: str = None, linkedin_password: str = None, **kwargs) -> Dict[str, Any]:
+                     linkedin_email: str = None, linkedin_password: str = None,
+                     skip_seen: bool = False, **kwargs) -> Dict[str, Any]:
         """
         Execute LinkedIn candidate search
 
@@ -224,28 +466,32 @@ class LinkedInScraperAgent(BaseAgent):
             keywords: Additional keywords
             linkedin_email: LinkedIn email for login (optional)
             linkedin_password: LinkedIn password for login (optional)
+            skip_seen: Skip profiles returned by earlier runs of this search
 
         Returns:
             Search results with candidate list
         """
         self.log(f"Starting LinkedIn search for: {job_title}")
 
+        driver_failed = False
         try:
-            # Setup browser
-            self.setup_driver()
+            # Check out a browser
+            await self.setup_driver()
 
-            # Login if credentials provided
+            # Login if credentials provided (reusing a saved session when possible)
             if linkedin_email and linkedin_password:
-                await self.login_to_linkedin(linkedin_email, linkedin_password)
+                await self.ensure_logged_in(linkedin_email, linkedin_password)
 
             # Search for candidates
-            candidates = await self.search_candidates(job_title, location, keywords)
+            candidates = await self.search_candidates(job_title, location, keywords, skip_seen=skip_seen)
 
             result = {
                 'job_title': job_title,
                 'location': location,
                 'keywords': keywords,
                 'candidates_found': len(candidates),
+                'previously_seen': self.skipped_seen,
+                'skipped_pages': self.skipped_pages,
                 'candidates': candidates
             }
 
@@ -254,6 +500,10 @@ class LinkedInScraperAgent(BaseAgent):
 
             return result
 
+        except Exception:
+            driver_failed = True
+            raise
+
         finally:
-            # Always close the driver
-            self.close_driver()
+            # Always return the driver; broken sessions are not reused
+            await self.close_driver(discard=driver_failed)
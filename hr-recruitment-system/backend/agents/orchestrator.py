@@ -4,12 +4,48 @@ Coordinates multiple agents to complete the full recruitment workflow
 """
 
 import asyncio
-from typing import Dict, Any, List, Optional
+import importlib
+import uuid
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Set, Tuple
 from .base_agent import BaseAgent
-from .resume_parser import ResumeParserAgent
-from .linkedin_scraper import LinkedInScraperAgent
-from .indeed_scraper import IndeedScraperAgent
-from .candidate_ranker import CandidateRankerAgent
+from ..utils.pools import pool_stats
+from ..utils.candidates import deduplicate_candidates
+from ..utils.scrape_cache import get_scrape_cache, scrape_key
+from ..utils.seen import SeenStore, get_seen_store, seen_key
+from ..utils.metrics import STAGE_SECONDS
+from ..utils.tracing import span, start_trace
+
+
+class LazyAgent:
+    """
+    Sub-agent created on first access
+
+    The agent's module is imported at the same time, so selenium, the
+    PDF/DOCX parsers and the LLM SDK clients only load once a workflow
+    actually needs that agent.
+    """
+
+    def __init__(self, module: str, class_name: str, agent_id: str):
+        self.module = module
+        self.class_name = class_name
+        self.agent_id = agent_id
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def load(self) -> type:
+        """Import and return the agent class"""
+        return getattr(importlib.import_module(self.module, __package__), self.class_name)
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        agent = self.load()(agent_id=self.agent_id, config=instance.config)
+        # Cached on the instance; later lookups skip the descriptor
+        instance.__dict__[self.name] = agent
+        return agent
 
 
 class AgentOrchestrator(BaseAgent):
@@ -17,29 +53,88 @@ class AgentOrchestrator(BaseAgent):
     Orchestrator that coordinates multiple recruitment agents
     """
 
+    AGENT_NAMES = ('resume_parser', 'linkedin_scraper', 'indeed_scraper', 'candidate_ranker')
+    # Per-agent fields worker processes publish so status can be combined
+    STATUS_FIELDS = ('status', 'created_at', 'last_run', 'results_count', 'errors_count')
+
+    resume_parser = LazyAgent(".resume_parser", "ResumeParserAgent", "resume_parser_1")
+    linkedin_scraper = LazyAgent(".linkedin_scraper", "LinkedInScraperAgent", "linkedin_scraper_1")
+    indeed_scraper = LazyAgent(".indeed_scraper", "IndeedScraperAgent", "indeed_scraper_1")
+    candidate_ranker = LazyAgent(".candidate_ranker", "CandidateRankerAgent", "candidate_ranker_1")
+
     def __init__(self, agent_id: str = "orchestrator", config: Dict[str, Any] = None):
         super().__init__(agent_id, config)
 
-        # Initialize all agents
-        self.resume_parser = ResumeParserAgent(
-            agent_id="resume_parser_1",
-            config=config
+        # Scrape results are shared across requests; stale entries refresh in the background
+        self.scrape_cache = get_scrape_cache(
+            ttl=self.config.get('scrape_cache_ttl', 21600),
+            stale_ttl=self.config.get('scrape_cache_stale_ttl', 86400),
+            shared_path=self.config.get('shared_state_path')
         )
 
-        self.linkedin_scraper = LinkedInScraperAgent(
-            agent_id="linkedin_scraper_1",
-            config=config
-        )
+        # Per-request orchestrators currently executing, keyed by run id
+        self.active_runs: Dict[str, "AgentOrchestrator"] = {}
+        self.completed_runs = 0
 
-        self.indeed_scraper = IndeedScraperAgent(
-            agent_id="indeed_scraper_1",
-            config=config
-        )
+    @property
+    def seen_profiles(self) -> SeenStore:
+        """Profiles already returned per search, opened on first incremental search"""
+        return get_seen_store(self.config.get('seen_profiles_path'), self.config.get('seen_profiles_max_age_days'))
 
-        self.candidate_ranker = CandidateRankerAgent(
-            agent_id="candidate_ranker_1",
-            config=config
-        )
+    def spawn(self) -> "AgentOrchestrator":
+        """
+        Create a per-request orchestrator with its own agent instances
+
+        Agent instances only hold per-run state (status, results, current
+        driver); LLM clients and WebDrivers come from the shared pools, so
+        spawning is cheap and concurrent runs never share mutable state.
+
+        Returns:
+            New orchestrator using the same configuration
+        """
+        run_id = uuid.uuid4().hex[:8]
+        return AgentOrchestrator(agent_id=f"{self.agent_id}:{run_id}", config=self.config)
+
+    async def run_isolated(self, agent: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        """
+        Run a workflow (or a single sub-agent) in a fresh execution context
+
+        With the ``tracing`` config option set, the run is recorded as a span
+        tree and attached to the result under ``trace`` (see utils.tracing).
+
+        Args:
+            agent: Optional sub-agent attribute name (e.g. "candidate_ranker");
+                   runs the whole orchestrator when omitted
+            **kwargs: Arguments forwarded to the agent's run()
+
+        Returns:
+            The agent's run() result
+        """
+        context = self.spawn()
+        target = getattr(context, agent) if agent else context
+
+        self.active_runs[context.agent_id] = context
+        self.last_run = datetime.now()
+        self.update_status("running")
+
+        try:
+            if not self.config.get('tracing', False):
+                return await target.run(**kwargs)
+
+            with start_trace(context.agent_id, max_spans=self.config.get('trace_max_spans', 10000)) as trace:
+                result = await target.run(**kwargs)
+            result['trace'] = trace.to_dict()
+            return result
+        finally:
+            self.active_runs.pop(context.agent_id, None)
+            self.completed_runs += 1
+
+            # Keep the run's history on the long-lived template agents
+            self.merge_history(context)
+            for name, sub_agent in context.loaded_agents().items():
+                getattr(self, name).merge_history(sub_agent)
+            if not self.active_runs:
+                self.update_status("idle")
 
     async def parse_resumes(self, resume_files: List[str]) -> List[Dict[str, Any]]:
         """
@@ -76,7 +171,8 @@ class AgentOrchestrator(BaseAgent):
                                keywords: List[str] = None,
                                search_linkedin: bool = True,
                                search_indeed: bool = True,
-                               linkedin_credentials: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+                               linkedin_credentials: Optional[Dict[str, str]] = None,
+                               skip_seen: bool = False) -> List[Dict[str, Any]]:
         """
         Search for candidates across multiple platforms
 
@@ -87,48 +183,84 @@ class AgentOrchestrator(BaseAgent):
             search_linkedin: Whether to search LinkedIn
             search_indeed: Whether to search Indeed
             linkedin_credentials: Optional LinkedIn credentials
+            skip_seen: Let scrapers skip profiles returned by earlier runs of this search
 
         Returns:
             Combined list of candidates from all sources
         """
         self.log(f"Searching for candidates: {job_title}")
 
-        tasks = []
+        async def scrape(agent: BaseAgent, **params) -> List[Dict[str, Any]]:
+            result = await agent.run(**params)
+            if not result.get('success'):
+                raise RuntimeError(result.get('error') or "search failed")
+            return result['data'].get('candidates', result['data'].get('results', []))
+
+        searches = []
 
-        # LinkedIn search
+        # LinkedIn search. Logged-in results belong to one account: they are
+        # never cached (or shared with other workers) and never refreshed later
+        # with that account's password. Incremental searches skip the cache too,
+        # so a repeat reads past the profiles already seen instead of the same pages.
         if search_linkedin:
-            linkedin_task = self.linkedin_scraper.run(
+            bypass = linkedin_credentials or skip_seen
+            key = None if bypass else scrape_key('linkedin', job_title, location, keywords)
+            searches.append(('linkedin', key, lambda: scrape(
+                self.linkedin_scraper,
                 job_title=job_title,
                 location=location,
                 keywords=keywords,
                 linkedin_email=linkedin_credentials.get('email') if linkedin_credentials else None,
-                linkedin_password=linkedin_credentials.get('password') if linkedin_credentials else None
-            )
-            tasks.append(('linkedin', linkedin_task))
+                linkedin_password=linkedin_credentials.get('password') if linkedin_credentials else None,
+                skip_seen=skip_seen
+            )))
 
         # Indeed search
         if search_indeed:
-            indeed_task = self.indeed_scraper.run(
+            key = scrape_key('indeed', job_title, location)
+            searches.append(('indeed', key, lambda: scrape(
+                self.indeed_scraper,
                 job_title=job_title,
                 location=location
-            )
-            tasks.append(('indeed', indeed_task))
+            )))
 
-        # Execute searches in parallel
         all_candidates = []
 
-        for source, task in tasks:
+        for source, key, fetch in searches:
             try:
-                result = await task
-                if result.get('success'):
-                    candidates = result['data'].get('candidates', result['data'].get('results', []))
-                    all_candidates.extend(candidates)
-                    self.log(f"Found {len(candidates)} candidates from {source}")
+                with STAGE_SECONDS.time(stage=f"scrape_{source}"), span(f"scrape_{source}", "stage"):
+                    if key is None:
+                        candidates, state = await fetch(), "bypass"
+                    else:
+                        candidates, state = await self.scrape_cache.get_or_fetch(key, fetch)
+                all_candidates.extend(candidates)
+                self.log(f"Found {len(candidates)} candidates from {source} (cache {state})")
             except Exception as e:
                 self.log(f"Search failed for {source}: {e}", "error")
 
         return all_candidates
 
+    async def filter_seen(self, query: str,
+                          candidates: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Set[str]]:
+        """
+        Keep only candidates not returned by earlier runs of a search
+
+        Nothing is recorded here; the caller marks the new URLs seen once
+        the run has succeeded, so a failed run does not hide its candidates.
+
+        Args:
+            query: Search key (see seen_key)
+            candidates: Scraped candidates
+
+        Returns:
+            Tuple of (new candidates, their profile URLs)
+        """
+        urls = [c.get('profile_url') or c.get('url') for c in candidates]
+        new_urls = await asyncio.to_thread(self.seen_profiles.unseen, query, urls)
+
+        fresh = [c for c, url in zip(candidates, urls) if url is None or url in new_urls]
+        return fresh, new_urls
+
     async def execute(self,
                      mode: str = "full_search",
                      job_requirements: Optional[Dict[str, Any]] = None,
@@ -141,6 +273,7 @@ class AgentOrchestrator(BaseAgent):
                      linkedin_credentials: Optional[Dict[str, str]] = None,
                      rank_candidates: bool = True,
                      shortlist_size: int = 10,
+                     only_new: Optional[bool] = None,
                      **kwargs) -> Dict[str, Any]:
         """
         Execute the full recruitment workflow
@@ -157,6 +290,8 @@ class AgentOrchestrator(BaseAgent):
             linkedin_credentials: LinkedIn login credentials
             rank_candidates: Whether to rank candidates
             shortlist_size: Size of shortlist
+            only_new: Pass on only candidates not found by earlier runs of this
+                      search (defaults to the incremental_search setting)
 
         Returns:
             Complete recruitment results
@@ -164,42 +299,73 @@ class AgentOrchestrator(BaseAgent):
         self.log(f"Starting orchestrator in mode: {mode}")
 
         all_candidates = []
+        previously_seen = 0
+        seen_query, new_urls = None, set()
+        if only_new is None:
+            only_new = self.config.get('incremental_search', False)
 
         # Mode: Parse uploaded resumes
         if mode in ["full_search", "parse_only"] and resume_files:
             self.log("Parsing uploaded resumes...")
-            parsed_resumes = await self.parse_resumes(resume_files)
+            with STAGE_SECONDS.time(stage="parse_resumes"), span("parse_resumes", "stage"):
+                parsed_resumes = await self.parse_resumes(resume_files)
             all_candidates.extend(parsed_resumes)
             self.log(f"Parsed {len(parsed_resumes)} resumes")
 
         # Mode: Search for candidates
         if mode in ["full_search", "search_only"] and job_title:
             self.log("Searching for candidates online...")
-            search_results = await self.search_candidates(
-                job_title=job_title,
-                location=location,
-                keywords=keywords,
-                search_linkedin=search_linkedin,
-                search_indeed=search_indeed,
-                linkedin_credentials=linkedin_credentials
-            )
+            with STAGE_SECONDS.time(stage="search"), span("search", "stage"):
+                search_results = await self.search_candidates(
+                    job_title=job_title,
+                    location=location,
+                    keywords=keywords,
+                    search_linkedin=search_linkedin,
+                    search_indeed=search_indeed,
+                    linkedin_credentials=linkedin_credentials,
+                    skip_seen=only_new
+                )
+            if only_new:
+                seen_query = seen_key(job_title, location, keywords)
+                found = len(search_results)
+                search_results, new_urls = await self.filter_seen(seen_query, search_results)
+                previously_seen = found - len(search_results)
+                self.log(f"Dropped {previously_seen} candidates seen in earlier searches")
             all_candidates.extend(search_results)
             self.log(f"Found {len(search_results)} candidates from searches")
 
+        # Merge the same person found in several sources before paying to score them twice
+        duplicates_merged = 0
+        if self.config.get('deduplicate', True) and len(all_candidates) > 1:
+            with STAGE_SECONDS.time(stage="deduplicate"), span("deduplicate", "stage"):
+                all_candidates, duplicates_merged = deduplicate_candidates(
+                    all_candidates,
+                    threshold=self.config.get('dedup_threshold', 0.88)
+                )
+            if duplicates_merged:
+                self.log(f"Merged {duplicates_merged} duplicate candidate records")
+
         # Mode: Rank candidates
         ranked_results = None
         if rank_candidates and job_requirements and all_candidates:
             self.log("Ranking candidates...")
-            ranking_result = await self.candidate_ranker.run(
-                candidates=all_candidates,
-                job_requirements=job_requirements,
-                generate_shortlist=True,
-                shortlist_size=shortlist_size
-            )
+            with STAGE_SECONDS.time(stage="rank"), span("rank", "stage"):
+                ranking_result = await self.candidate_ranker.run(
+                    candidates=all_candidates,
+                    job_requirements=job_requirements,
+                    generate_shortlist=True,
+                    shortlist_size=shortlist_size
+                )
 
             if ranking_result.get('success'):
                 ranked_results = ranking_result['data']
                 self.log(f"Ranking completed. Top score: {ranked_results.get('top_score', 0)}")
+            else:
+                # Leave the candidates unseen so the next run ranks them again
+                seen_query = None
+
+        if seen_query is not None and new_urls:
+            await asyncio.to_thread(self.seen_profiles.add, seen_query, new_urls)
 
         # Compile final results
         result = {
@@ -207,6 +373,8 @@ class AgentOrchestrator(BaseAgent):
             'total_candidates_found': len(all_candidates),
             'candidates': all_candidates,
             'ranked_results': ranked_results,
+            'duplicates_merged': duplicates_merged,
+            'previously_seen': previously_seen,
             'sources': {
                 'uploaded_resumes': len([c for c in all_candidates if c.get('source') == 'uploaded_resume']),
                 'linkedin': len([c for c in all_candidates if c.get('source') == 'LinkedIn']),
@@ -219,17 +387,119 @@ class AgentOrchestrator(BaseAgent):
 
         return result
 
+    def get_summary(self, offset: int = 0, limit: int = 0) -> Dict[str, Any]:
+        """
+        Get orchestrator summary including in-flight per-request runs
+
+        Args:
+            offset: Number of newest history entries to skip
+            limit: Number of history entries to include (0 omits history)
+
+        Returns:
+            Dictionary with orchestrator summary information
+        """
+        summary = super().get_summary(offset, limit)
+        summary['active_runs'] = {
+            run_id: context.get_agents_status()
+            for run_id, context in list(self.active_runs.items())
+        }
+        summary['completed_runs'] = self.completed_runs
+        summary['pools'] = pool_stats()
+        summary['scrape_cache'] = self.scrape_cache.stats()
+        return summary
+
+    def loaded_agents(self) -> Dict[str, BaseAgent]:
+        """Sub-agents created so far, by attribute name"""
+        return {name: self.__dict__[name] for name in self.AGENT_NAMES if name in self.__dict__}
+
+    def warm_up(self, names: Optional[List[str]] = None) -> List[str]:
+        """
+        Create sub-agents ahead of the first request
+
+        Blocking (module imports, SDK client setup); call from a worker thread.
+
+        Args:
+            names: Agent attribute names (all agents when omitted)
+
+        Returns:
+            Names of the agents that were created
+        """
+        warmed = []
+        for name in names or self.AGENT_NAMES:
+            if name not in self.AGENT_NAMES:
+                raise ValueError(f"Unknown agent: {name}")
+            getattr(self, name)
+            warmed.append(name)
+        return warmed
+
     def get_agents_status(self) -> Dict[str, Any]:
         """
         Get status of all managed agents
 
+        Agents that have not been used yet are reported without loading them.
+
         Returns:
             Status dictionary for all agents
         """
+        loaded = self.loaded_agents()
+        status = {'orchestrator': self.get_summary()}
+        for name in self.AGENT_NAMES:
+            if name in loaded:
+                status[name] = loaded[name].get_summary()
+                continue
+            lazy = type(self).__dict__[name]
+            status[name] = {
+                'agent_id': lazy.agent_id,
+                'agent_type': lazy.class_name,
+                'status': 'initialized',
+                'created_at': None,
+                'last_run': None,
+                'results_count': 0,
+                'errors_count': 0,
+                'loaded': False
+            }
+        return status
+
+    def status_report(self) -> Dict[str, Dict[str, Any]]:
+        """Compact agent status for publishing to shared state (no config or history)"""
         return {
-            'orchestrator': self.get_summary(),
-            'resume_parser': self.resume_parser.get_summary(),
-            'linkedin_scraper': self.linkedin_scraper.get_summary(),
-            'indeed_scraper': self.indeed_scraper.get_summary(),
-            'candidate_ranker': self.candidate_ranker.get_summary()
+            name: {field: summary.get(field) for field in self.STATUS_FIELDS}
+            for name, summary in self.get_agents_status().items()
         }
+
+    @classmethod
+    def merge_agents_status(cls, status: Dict[str, Any], reports: List[Dict[str, Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Combine this process's agent status with reports from every worker process
+
+        Counts are summed, ``last_run`` is the latest and ``created_at`` the
+        earliest across workers. An agent is "running" if it runs in any
+        worker, otherwise it takes the status of its most recent run.
+
+        Args:
+            status: get_agents_status() of this process
+            reports: status_report() of each worker, including this one
+
+        Returns:
+            The status dictionary with combined fields; the orchestrator entry
+            gains a ``workers`` count
+        """
+        for name, summary in status.items():
+            entries = [report[name] for report in reports if name in report]
+            if not entries:
+                continue
+            summary['results_count'] = sum(entry.get('results_count') or 0 for entry in entries)
+            summary['errors_count'] = sum(entry.get('errors_count') or 0 for entry in entries)
+            created = [entry['created_at'] for entry in entries if entry.get('created_at')]
+            if created:
+                summary['created_at'] = min(created)
+            ran = [entry for entry in entries if entry.get('last_run')]
+            if ran:
+                latest = max(ran, key=lambda entry: entry['last_run'])
+                summary['last_run'] = latest['last_run']
+                summary['status'] = latest['status']
+            if any(entry.get('status') == 'running' for entry in entries):
+                summary['status'] = 'running'
+        if 'orchestrator' in status:
+            status['orchestrator']['workers'] = max(len(reports), 1)
+        return status
@@ -3,6 +3,7 @@ Resume Parser Agent
 Extracts key information from resumes using AI
 """
 
+import asyncio
 import os
 import json
 from typing import Dict, Any, List
@@ -10,6 +11,9 @@ import PyPDF2
 import docx
 import pdfplumber
 from .base_agent import BaseAgent
+from ..utils.pools import get_llm_client
+from ..utils.metrics import observe_llm
+from ..utils.tracing import span
 
 
 class ResumeParserAgent(BaseAgent):
@@ -21,13 +25,12 @@ class ResumeParserAgent(BaseAgent):
         super().__init__(agent_id, config)
         self.ai_provider = config.get('ai_provider', 'claude')
 
+        # Clients are shared across per-request agent instances
         if self.ai_provider == 'claude':
-            from anthropic import AsyncAnthropic
-            self.client = AsyncAnthropic(api_key=config.get('anthropic_api_key'))
+            self.client = get_llm_client('claude', config.get('anthropic_api_key'))
             self.model = config.get('claude_model', 'claude-3-5-sonnet-20241022')
         else:  # openai
-            from openai import AsyncOpenAI
-            self.client = AsyncOpenAI(api_key=config.get('openai_api_key'))
+            self.client = get_llm_client('openai', config.get('openai_api_key'))
             self.model = config.get('openai_model', 'gpt-4-turbo-preview')
 
     def extract_text_from_pdf(self, file_path: str) -> str:
@@ -92,15 +95,16 @@ class ResumeParserAgent(BaseAgent):
         """
         file_extension = os.path.splitext(file_path)[1].lower()
 
-        if file_extension == '.pdf':
-            return self.extract_text_from_pdf(file_path)
-        elif file_extension in ['.docx', '.doc']:
-            return self.extract_text_from_docx(file_path)
-        elif file_extension == '.txt':
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        else:
-            raise ValueError(f"Unsupported file format: {file_extension}")
+        with span("extract_text", "file", file=os.path.basename(file_path), format=file_extension.lstrip('.')):
+            if file_extension == '.pdf':
+                return self.extract_text_from_pdf(file_path)
+            elif file_extension in ['.docx', '.doc']:
+                return self.extract_text_from_docx(file_path)
+            elif file_extension == '.txt':
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    return f.read()
+            else:
+                raise ValueError(f"Unsupported file format: {file_extension}")
 
     async def parse_resume_with_ai(self, resume_text: str) -> Dict[str, Any]:
         """
@@ -152,7 +156,7 @@ Resume to parse:
         try:
             if self.ai_provider == 'claude':
                 # Use Claude API
-                response = await self.client.messages.create(
+                response = await observe_llm(self.model, self.client.messages.create(
                     model=self.model,
                     max_tokens=4096,
                     temperature=0.1,
@@ -162,7 +166,7 @@ Resume to parse:
                             "content": prompt_content.format(resume_text=resume_text)
                         }
                     ]
-                )
+                ))
 
                 # Extract JSON from Claude response
                 response_text = response.content[0].text
@@ -177,7 +181,7 @@ Resume to parse:
 
             else:  # openai
                 # Use OpenAI API
-                response = await self.client.chat.completions.create(
+                response = await observe_llm(self.model, self.client.chat.completions.create(
                     model=self.model,
                     messages=[
                         {"role": "system", "content": "You are an expert HR assistant. Return valid JSON only."},
@@ -185,7 +189,7 @@ Resume to parse:
                     ],
                     temperature=0.1,
                     response_format={"type": "json_object"}
-                )
+                ))
 
                 parsed_data = json.loads(response.choices[0].message.content)
 
@@ -206,14 +210,15 @@ Resume to parse:
         Returns:
             Parsed resume data
         """
-        self.log(f"Starting resume parsing for: {file_path or 'text input'}")
+        self.log(f"Starting resume parsing for: {file_path or 'text input'}", key="resume.start")
 
         # Extract text from file if file_path is provided
         if file_path:
             if not os.path.exists(file_path):
                 raise FileNotFoundError(f"Resume file not found: {file_path}")
-            resume_text = self.extract_text_from_file(file_path)
-            self.log(f"Extracted {len(resume_text)} characters from resume")
+            # pdfplumber and python-docx are CPU-bound; keep them off the event loop
+            resume_text = await asyncio.to_thread(self.extract_text_from_file, file_path)
+            self.log(f"Extracted {len(resume_text)} characters from resume", key="resume.extracted")
 
         if not resume_text:
             raise ValueError("Either file_path or resume_text must be provided")
@@ -230,6 +235,6 @@ Resume to parse:
         }
 
         self.add_result(result)
-        self.log("Resume parsing completed successfully")
+        self.log("Resume parsing completed successfully", key="resume.completed")
 
         return result
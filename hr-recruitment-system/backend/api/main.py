@@ -3,13 +3,16 @@ FastAPI Main Application
 REST API for HR Recruitment Agent System
 """
 
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form
+from fastapi import FastAPI, HTTPException, Request, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, JSONResponse
-from typing import List, Optional, Dict, Any
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
+from typing import TYPE_CHECKING, List, Optional, Dict, Any
 import os
+import asyncio
 import shutil
+from contextlib import nullcontext
 import logging
 from pathlib import Path
 
@@ -23,11 +26,35 @@ from backend.models.schemas import (
     AgentStatusResponse
 )
 from backend.utils.config import get_settings
+from backend.utils.pools import close_pools, pool_stats
+from backend.utils.history import flush_histories
+from backend.utils.singleflight import SingleFlight, request_key
+from backend.utils.shared_state import SharedState, get_shared_state
+from backend.utils.views import candidate_id, compact_result, decode_cursor, encode_cursor, parse_fields, shape_result
+from backend.utils.responses import CompressionMiddleware, FastJSONResponse, with_defaults
+from backend.utils.streaming import SSE_KEEPALIVE, RunningTopN, sse_event
+from backend.utils.tracing import span_totals, to_chrome_trace
+from backend.utils.watchdog import LoopWatchdog
+from backend.utils import metrics
+from backend.utils.logs import setup_logging
+from backend.utils.admission import (
+    BULK, INTERACTIVE, AdmissionController, AdmissionRejected, Ticket, worker_slots
+)
+
+if TYPE_CHECKING:
+    # SQLAlchemy is imported on first use of the run store and task queue
+    from backend.utils.storage import RunStore
+    from backend.utils.task_queue import TaskQueue
+
+# Get settings
+settings = get_settings()
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# Setup logging (a no-op when run.py already did)
+setup_logging(
+    settings.log_level,
+    json_file=settings.log_json,
+    sample_rate=settings.log_sample_rate,
+    queue_size=settings.log_queue_size
 )
 logger = logging.getLogger(__name__)
 
@@ -35,7 +62,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="HR Recruitment Agent System",
     description="Multi-agent system for automated candidate sourcing and resume analysis",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse
 )
 
 # CORS middleware for frontend
@@ -47,8 +75,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Get settings
-settings = get_settings()
+# Compress large responses (brotli when installed, else gzip)
+if settings.response_compression:
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.compression_min_size)
 
 # Create data directories
 UPLOAD_DIR = Path("backend/data/resumes")
@@ -59,9 +88,64 @@ RESULTS_DIR.mkdir(parents=True, exist_ok=True)
 # Global orchestrator instance
 orchestrator: Optional[AgentOrchestrator] = None
 
+# Global run store instance
+store: Optional["RunStore"] = None
+
+# Durable work queue (used when TASK_QUEUE is set)
+task_queue: Optional["TaskQueue"] = None
+
+# State shared by API worker processes (only needed with more than one)
+SHARED_STATE_PATH = settings.shared_state_path if settings.workers > 1 else None
+shared_state: Optional[SharedState] = get_shared_state(SHARED_STATE_PATH) if SHARED_STATE_PATH else None
+WORKER_ID = str(os.getpid())
+
+# Identical concurrent workflow requests share one execution
+coalescer = SingleFlight(ttl=settings.coalesce_ttl, shared=shared_state)
+
+def admission_pressure() -> Optional[str]:
+    """Reason new bulk work should wait, or None when downstream resources have headroom"""
+    if settings.llm_max_in_flight and metrics.LLM_IN_FLIGHT.get() >= settings.llm_max_in_flight:
+        return "LLM concurrency limit reached"
+    if any(stats['waiting'] >= settings.admission_max_pool_waiting for stats in pool_stats().values()):
+        return "browser pool saturated"
+    return None
+
+
+# Bounds concurrent expensive workflows; small rankings get a priority lane.
+# MAX_CONCURRENT_AGENTS is split between the worker processes.
+admission = AdmissionController(
+    max_active=worker_slots(settings.max_concurrent_agents, settings.workers, settings.admission_interactive_reserve),
+    max_queue=settings.admission_max_queue,
+    per_client=settings.admission_per_client,
+    interactive_reserve=settings.admission_interactive_reserve,
+    queue_timeout=settings.admission_queue_timeout,
+    retry_after=settings.admission_retry_after,
+    pressure=admission_pressure
+)
+
+# Reverse proxies allowed to name the client with X-Client-ID
+trusted_proxies = {host.strip() for host in settings.trusted_proxies.split(',') if host.strip()}
+
+# Event-loop lag sampler (started on startup when metrics are enabled)
+loop_monitor: Optional[asyncio.Task] = None
+
+# Blocking-call detector (started on startup when LOOP_WATCHDOG is set)
+loop_watchdog: Optional[LoopWatchdog] = None
+
+# Background agent loading (started on startup when WARMUP_AGENTS is set)
+warmup_task: Optional[asyncio.Task] = None
+
+# Agent status publisher (started on startup with more than one worker)
+state_publisher: Optional[asyncio.Task] = None
+
 
 def get_orchestrator() -> AgentOrchestrator:
-    """Get or create orchestrator instance"""
+    """
+    Get or create the orchestrator template
+
+    Requests do not run on this instance directly; they call
+    ``run_isolated`` so each workflow gets its own agent instances.
+    """
     global orchestrator
     if orchestrator is None:
         config = {
@@ -72,13 +156,437 @@ def get_orchestrator() -> AgentOrchestrator:
             'openai_model': settings.openai_model,
             'headless': settings.headless_browser,
             'scrape_delay': settings.scrape_delay,
-            'max_candidates': settings.max_candidates_per_search
+            'scrape_timeout': settings.scrape_timeout,
+            'http_first': settings.scrape_http_first,
+            'max_pages': settings.search_max_pages,
+            'page_workers': settings.search_page_workers,
+            'lightweight_browser': settings.lightweight_browser,
+            'record_dir': settings.scrape_record_dir,
+            'replay_url': settings.scrape_replay_url,
+            'incremental_search': settings.incremental_search,
+            'seen_profiles_path': settings.seen_profiles_path,
+            'seen_profiles_max_age_days': settings.seen_profiles_max_age_days,
+            'linkedin_session_dir': settings.linkedin_session_dir,
+            'linkedin_session_max_age_days': settings.linkedin_session_max_age_days,
+            'session_secret': settings.session_secret,
+            'detail_concurrency': settings.scrape_detail_concurrency,
+            'scrape_cache_ttl': settings.scrape_cache_ttl,
+            'scrape_cache_stale_ttl': settings.scrape_cache_stale_ttl,
+            'max_candidates': settings.max_candidates_per_search,
+            'driver_pool_size': settings.driver_pool_size,
+            'deduplicate': settings.deduplicate_candidates,
+            'dedup_threshold': settings.dedup_threshold,
+            'history_max_items': settings.result_history_size,
+            'history_max_bytes': settings.result_history_max_bytes,
+            'history_spill_dir': str(RESULTS_DIR) if settings.result_history_spill else None,
+            'tracing': settings.tracing_enabled,
+            'trace_max_spans': settings.trace_max_spans,
+            'shared_state_path': SHARED_STATE_PATH
         }
         orchestrator = AgentOrchestrator(config=config)
         logger.info(f"Orchestrator initialized with AI provider: {settings.ai_provider}")
     return orchestrator
 
 
+def get_store() -> "RunStore":
+    """Get or create the run store for the configured database"""
+    global store
+    if store is None:
+        from backend.utils.storage import RunStore
+        store = RunStore(settings.database_url)
+        logger.info(f"Run store initialized: {settings.database_url}")
+    return store
+
+
+def get_task_queue() -> "TaskQueue":
+    """Get or create the task queue in the configured database"""
+    global task_queue
+    if task_queue is None:
+        from backend.utils.task_queue import TaskQueue
+        task_queue = TaskQueue(
+            settings.database_url,
+            visibility_timeout=settings.task_visibility_timeout,
+            max_attempts=settings.task_max_attempts,
+            retry_delay=settings.task_retry_delay,
+            retention=settings.task_retention_hours * 3600 if settings.task_retention_hours else None
+        )
+    return task_queue
+
+
+async def persist_result(result: Any, request: Dict[str, Any],
+                         trace: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """
+    Persist a workflow result without blocking the event loop
+
+    Storage failures are logged and never fail the request.
+
+    Args:
+        result: Workflow result dictionary
+        request: Request parameters that produced it
+        trace: Span tree recorded for the run, if tracing is enabled
+
+    Returns:
+        Run id, or None if persistence is disabled or failed
+    """
+    if not settings.persist_results or not isinstance(result, dict):
+        return None
+    try:
+        return await asyncio.to_thread(get_store().save_run, result, request, None, trace)
+    except Exception as e:
+        logger.error(f"Failed to persist run: {e}")
+        return None
+
+
+def trace_summary(trace: Dict[str, Any]) -> Dict[str, Any]:
+    """Small per-run trace overview returned with results (the full tree is stored)"""
+    return {
+        'span_count': trace.get('span_count', 0),
+        'dropped': trace.get('dropped', 0),
+        'duration_ms': trace.get('duration_ms'),
+        'totals_ms': {k: round(v, 3) for k, v in span_totals(trace).items()}
+    }
+
+
+def client_id(http_request: Request) -> str:
+    """
+    Client identity for fair-share admission
+
+    The X-Client-ID header is only honored on requests from a proxy listed in
+    TRUSTED_PROXIES; anyone else could pick a fresh id per request to dodge
+    their share, so they are identified by peer address.
+    """
+    peer = http_request.client.host if http_request.client else 'unknown'
+    if peer in trusted_proxies:
+        return http_request.headers.get('x-client-id') or peer
+    return peer
+
+
+def ranking_lane(candidates: List[Any]) -> str:
+    """Small rankings someone is waiting on run in the interactive lane"""
+    return INTERACTIVE if len(candidates) <= settings.admission_interactive_size else BULK
+
+
+def admission_error(client: str, lane: str, error: AdmissionRejected) -> HTTPException:
+    """HTTP error (with Retry-After) for a rejected request"""
+    logger.warning(f"Rejected {lane} request from {client}: {error.reason}")
+    return HTTPException(status_code=error.status_code, detail=error.reason,
+                         headers={'Retry-After': str(error.retry_after)})
+
+
+def check_admission(client: str, lane: str):
+    """
+    Turn a caller away before it joins or starts a workflow
+
+    Raises:
+        HTTPException: 429 over the client's share, 503 when the queue is full (with Retry-After)
+    """
+    if not settings.admission_control:
+        return
+    try:
+        admission.check(client, lane)
+    except AdmissionRejected as e:
+        raise admission_error(client, lane, e)
+
+
+async def admit(client: str, lane: str, check_share: bool = True) -> Optional[Ticket]:
+    """
+    Take an admission slot for an expensive workflow
+
+    Args:
+        client: Client identity
+        lane: Admission lane
+        check_share: Enforce the client's share (off when check_admission already did)
+
+    Returns:
+        Ticket to release, or None when admission control is disabled
+
+    Raises:
+        HTTPException: 429 over the client's share, 503 when saturated (with Retry-After)
+    """
+    if not settings.admission_control:
+        return None
+    try:
+        return await admission.acquire(client, lane, check_share=check_share)
+    except AdmissionRejected as e:
+        raise admission_error(client, lane, e)
+
+
+def file_fingerprints(file_paths: List[str]) -> List[Any]:
+    """Path, mtime and size per file so re-uploaded resumes are not served from cache"""
+    fingerprints = []
+    for path in file_paths or []:
+        try:
+            stat = os.stat(path)
+            fingerprints.append([path, stat.st_mtime_ns, stat.st_size])
+        except OSError:
+            fingerprints.append([path, None, None])
+    return fingerprints
+
+
+async def execute_workflow(run_kwargs: Dict[str, Any], request_record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run a workflow in this process and persist its result
+
+    Used by the API and by task workers.
+
+    Args:
+        run_kwargs: Arguments for AgentOrchestrator.run_isolated
+        request_record: Request parameters stored with the persisted run
+
+    Returns:
+        Workflow result data, with ``run_id`` and ``trace_summary`` when available
+
+    Raises:
+        RuntimeError: The workflow reported a failure
+    """
+    result = await get_orchestrator().run_isolated(**run_kwargs)
+    if not result.get('success'):
+        raise RuntimeError(result.get('error', 'Unknown error'))
+
+    data = result['data']
+    trace = result.pop('trace', None)
+    if trace is not None:
+        data['trace_summary'] = trace_summary(trace)
+    run_id = await persist_result(data, request_record, trace)
+    if run_id:
+        data['run_id'] = run_id
+    return data
+
+
+async def execute_task(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Task worker handler: run a queued workflow"""
+    payload = task['payload']
+    return await execute_workflow(payload['run_kwargs'], payload['request'])
+
+
+def without_passwords(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of request parameters without password fields"""
+    return {k: v for k, v in params.items() if 'password' not in k}
+
+
+async def run_queued(kind: str, key: str, run_kwargs: Dict[str, Any], request_record: Dict[str, Any],
+                     lane: str) -> Dict[str, Any]:
+    """
+    Enqueue a workflow for the task workers and wait for its result
+
+    Interactive requests get a higher priority. A request that is already
+    queued or running (same key) is joined instead of enqueued again.
+    Password fields are dropped from the stored request.
+
+    Raises:
+        RuntimeError: The task failed on its last attempt
+        HTTPException: 503 with TASK_MAX_QUEUED tasks waiting, 504 when the
+                       task is not done within TASK_WAIT_TIMEOUT
+    """
+    queue = get_task_queue()
+    if settings.admission_control and await asyncio.to_thread(queue.depth) >= settings.task_max_queued:
+        raise HTTPException(status_code=503, detail="Task queue is full",
+                            headers={'Retry-After': str(settings.admission_retry_after)})
+
+    payload = {'run_kwargs': without_passwords(run_kwargs), 'request': without_passwords(request_record)}
+    task_id = await asyncio.to_thread(queue.enqueue, kind, payload, 1 if lane == INTERACTIVE else 0, key)
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.task_wait_timeout
+    while True:
+        task = await asyncio.to_thread(queue.get, task_id)
+        if task['status'] == 'done':
+            return task['result']
+        if task['status'] == 'failed':
+            raise RuntimeError(task['error'] or 'Task failed')
+        if loop.time() >= deadline:
+            raise HTTPException(status_code=504,
+                                detail=f"Task {task_id} is still {task['status']}; poll /api/tasks/{task_id}")
+        await asyncio.sleep(settings.task_poll_interval)
+
+
+async def run_workflow(kind: str, key_params: Dict[str, Any], request_record: Dict[str, Any],
+                       client: str, lane: str, **run_kwargs) -> Any:
+    """
+    Run a workflow once per distinct request and persist its result
+
+    Concurrent identical requests (same normalized key parameters) join the
+    in-flight execution, and recent results are served from a short TTL cache.
+    Every caller is checked against its own client's share before joining;
+    only executions that actually start take an admission slot. Requests
+    carrying LinkedIn credentials are never coalesced or cached: their
+    results depend on the login, which the key does not capture.
+
+    With TASK_QUEUE set the workflow is handed to the task workers instead,
+    except for requests carrying LinkedIn credentials, which run here so
+    passwords are never written to the queue.
+
+    Args:
+        kind: Workflow name used in the coalescing key
+        key_params: Parameters that identify the request
+        request_record: Request parameters stored with the persisted run
+        client: Client identity for admission control
+        lane: Admission lane (interactive or bulk)
+        **run_kwargs: Arguments for AgentOrchestrator.run_isolated
+
+    Returns:
+        Workflow result data (shared between callers; do not mutate)
+    """
+    key = request_key(kind, **key_params)
+    check_admission(client, lane)
+
+    async def execute():
+        if settings.task_queue and not run_kwargs.get('linkedin_credentials'):
+            # Queued work runs on the task workers but still counts toward the client's share
+            with admission.hold(client) if settings.admission_control else nullcontext():
+                return await run_queued(kind, key, run_kwargs, request_record, lane)
+
+        ticket = await admit(client, lane, check_share=False)
+        try:
+            return await execute_workflow(run_kwargs, request_record)
+        finally:
+            if ticket is not None:
+                admission.release(ticket)
+
+    if run_kwargs.get('linkedin_credentials'):
+        return await execute()
+    return await coalescer.do(key, execute)
+
+
+def shape_response(data: Any, view: str, fields: Optional[str], limit: Optional[int],
+                   cursor: Optional[str] = None, model: Optional[type] = None) -> Any:
+    """
+    Apply view, projection and paging options to a workflow result
+
+    The result is returned as a FastJSONResponse, skipping FastAPI's
+    encoder pass and response-model validation: workflow results are built
+    by the server and already JSON-shaped, so only the model's defaults are
+    filled in.
+
+    Raises:
+        HTTPException: 400 for an unknown view or invalid cursor
+    """
+    if not isinstance(data, dict):
+        return data
+    try:
+        data = shape_result(data, view=view, fields=fields,
+                            limit=min(max(limit, 1), 500) if limit is not None else None, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return FastJSONResponse(with_defaults(model, data) if model else data)
+
+
+def publish_agent_status():
+    """
+    Write this worker's agent status to shared state and drop expired entries
+    (blocking; run in a thread)
+    """
+    shared_state.put('agent_status', WORKER_ID, get_orchestrator().status_report(),
+                     ttl=settings.shared_state_interval * 3)
+    shared_state.purge_expired()
+
+
+async def publish_agent_status_loop():
+    """Keep this worker's status fresh in shared state; entries of stopped workers expire"""
+    while True:
+        try:
+            await asyncio.to_thread(publish_agent_status)
+        except Exception as e:
+            logger.warning(f"Failed to publish agent status: {e}")
+        await asyncio.sleep(settings.shared_state_interval)
+
+
+def collect_app_metrics():
+    """Copy coalescer, run and scrape cache state into metrics before each scrape"""
+    stats = coalescer.stats()
+    metrics.COALESCER_REQUESTS.set(stats['hits'], result="hit")
+    metrics.COALESCER_REQUESTS.set(stats['misses'], result="miss")
+    metrics.COALESCER_REQUESTS.set(stats['coalesced'], result="coalesced")
+    metrics.QUEUE_DEPTH.set(stats['in_flight'], queue="workflows_in_flight")
+
+    admitted = admission.stats()
+    for lane in (INTERACTIVE, BULK):
+        metrics.QUEUE_DEPTH.set(admitted['queued'][lane], queue=f"admission_{lane}_queued")
+        metrics.QUEUE_DEPTH.set(admitted['active'][lane], queue=f"admission_{lane}_active")
+    for status, count in admitted['rejected'].items():
+        metrics.ADMISSION_REJECTED.set(count, status=str(status))
+
+    if orchestrator is not None:
+        metrics.QUEUE_DEPTH.set(len(orchestrator.active_runs), queue="agent_runs")
+        cache = orchestrator.scrape_cache.stats()
+        metrics.SCRAPE_CACHE_REQUESTS.set(cache['hits'], result="hit")
+        metrics.SCRAPE_CACHE_REQUESTS.set(cache['stale_hits'], result="stale")
+        metrics.SCRAPE_CACHE_REQUESTS.set(cache['misses'], result="miss")
+        metrics.QUEUE_DEPTH.set(cache['refreshing'], queue="scrape_cache_refreshes")
+
+
+metrics.REGISTRY.add_collector("app", collect_app_metrics)
+
+
+@app.on_event("startup")
+async def start_loop_monitor():
+    """Start sampling event-loop lag and, if enabled, the blocking-call watchdog"""
+    global loop_monitor, loop_watchdog
+    if settings.metrics_enabled and loop_monitor is None:
+        loop_monitor = asyncio.create_task(metrics.monitor_event_loop(settings.loop_lag_interval))
+    if settings.loop_watchdog and loop_watchdog is None:
+        loop_watchdog = LoopWatchdog(settings.loop_block_threshold)
+        loop_watchdog.start()
+
+
+@app.on_event("startup")
+async def warm_up_agents():
+    """Load the agents listed in WARMUP_AGENTS without delaying startup"""
+    global warmup_task
+    names = [name.strip() for name in settings.warmup_agents.split(',') if name.strip()]
+    if not names or warmup_task is not None:
+        return
+
+    async def warm_up():
+        try:
+            orch = get_orchestrator()
+            loaded = await asyncio.to_thread(orch.warm_up, None if names == ['all'] else names)
+            logger.info(f"Warmed up agents: {', '.join(loaded)}")
+        except Exception as e:
+            logger.warning(f"Agent warm-up failed: {e}")
+
+    warmup_task = asyncio.create_task(warm_up())
+
+
+@app.on_event("startup")
+async def start_state_publisher():
+    """Publish agent status for the other worker processes"""
+    global state_publisher
+    if shared_state is not None and state_publisher is None:
+        state_publisher = asyncio.create_task(publish_agent_status_loop())
+
+
+@app.on_event("shutdown")
+async def shutdown_pools():
+    """Quit pooled WebDrivers and write buffered agent history on shutdown"""
+    global loop_monitor, loop_watchdog, state_publisher
+    if state_publisher is not None:
+        state_publisher.cancel()
+        state_publisher = None
+        await asyncio.to_thread(shared_state.delete, 'agent_status', WORKER_ID)
+    if loop_monitor is not None:
+        loop_monitor.cancel()
+        loop_monitor = None
+    if loop_watchdog is not None:
+        await loop_watchdog.stop()
+        loop_watchdog = None
+    await close_pools()
+    await asyncio.to_thread(flush_histories)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """
+    Prometheus metrics
+
+    Returns:
+        Metrics in the Prometheus text exposition format
+    """
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return Response(metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
+
+
 @app.get("/")
 async def root():
     """Root endpoint - serves the web dashboard"""
@@ -95,6 +603,12 @@ async def health_check():
     }
 
 
+def save_upload(source, file_path: Path):
+    """Copy an uploaded file to disk (run in a worker thread)"""
+    with open(file_path, "wb") as buffer:
+        shutil.copyfileobj(source, buffer)
+
+
 @app.post("/api/upload-resumes")
 async def upload_resumes(files: List[UploadFile] = File(...)):
     """
@@ -116,8 +630,7 @@ async def upload_resumes(files: List[UploadFile] = File(...)):
 
             # Save file
             file_path = UPLOAD_DIR / file.filename
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
+            await asyncio.to_thread(save_upload, file.file, file_path)
 
             uploaded_files.append(str(file_path))
             logger.info(f"Uploaded file: {file.filename}")
@@ -134,7 +647,7 @@ async def upload_resumes(files: List[UploadFile] = File(...)):
 
 
 @app.post("/api/parse-resumes")
-async def parse_resumes(file_paths: List[str]):
+async def parse_resumes(file_paths: List[str], http_request: Request):
     """
     Parse uploaded resumes
 
@@ -145,37 +658,39 @@ async def parse_resumes(file_paths: List[str]):
         Parsed resume data
     """
     try:
-        orch = get_orchestrator()
-
-        result = await orch.run(
+        return await run_workflow(
+            "parse",
+            {'files': file_fingerprints(file_paths)},
+            {'mode': 'parse_only', 'resume_files': file_paths},
+            client_id(http_request),
+            BULK,
             mode="parse_only",
             resume_files=file_paths
         )
 
-        if not result.get('success'):
-            raise HTTPException(status_code=500, detail=result.get('error', 'Unknown error'))
-
-        return result['data']
-
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Resume parsing failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/search-candidates")
-async def search_candidates(request: SearchRequest):
+async def search_candidates(request: SearchRequest, http_request: Request, view: str = "full",
+                            fields: Optional[str] = None, limit: Optional[int] = None):
     """
     Search for candidates on LinkedIn and Indeed
 
     Args:
         request: Search parameters
+        view: "full" or "compact" (candidates once, ranked results as references)
+        fields: Comma-separated candidate fields to return (implies compact)
+        limit: Page size (implies compact; further pages via /api/runs/{run_id}/candidates)
 
     Returns:
         List of found candidates
     """
     try:
-        orch = get_orchestrator()
-
         linkedin_creds = None
         if request.linkedin_email and request.linkedin_password:
             linkedin_creds = {
@@ -183,30 +698,36 @@ async def search_candidates(request: SearchRequest):
                 'password': request.linkedin_password
             }
 
-        result = await orch.run(
+        data = await run_workflow(
+            "search",
+            request.dict(),
+            request.dict(),
+            client_id(http_request),
+            BULK,
             mode="search_only",
             job_title=request.job_title,
             location=request.location,
             keywords=request.keywords,
             search_linkedin=request.search_linkedin,
             search_indeed=request.search_indeed,
-            linkedin_credentials=linkedin_creds
+            linkedin_credentials=linkedin_creds,
+            only_new=request.only_new
         )
 
-        if not result.get('success'):
-            raise HTTPException(status_code=500, detail=result.get('error', 'Unknown error'))
-
-        return result['data']
-
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Candidate search failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+    return shape_response(data, view, fields, limit)
+
 
 @app.post("/api/rank-candidates")
 async def rank_candidates(
     candidates: List[Dict[str, Any]],
     job_requirements: JobRequirements,
+    http_request: Request,
     shortlist_size: int = 10
 ):
     """
@@ -221,39 +742,159 @@ async def rank_candidates(
         Ranked candidates with scores
     """
     try:
-        orch = get_orchestrator()
-
-        result = await orch.candidate_ranker.run(
+        job_reqs = job_requirements.dict()
+
+        data = await run_workflow(
+            "rank",
+            {'candidates': candidates, 'job_requirements': job_reqs, 'shortlist_size': shortlist_size},
+            {'mode': 'rank_only', 'job_requirements': job_reqs},
+            client_id(http_request),
+            ranking_lane(candidates),
+            agent="candidate_ranker",
             candidates=candidates,
-            job_requirements=job_requirements.dict(),
+            job_requirements=job_reqs,
             generate_shortlist=True,
             shortlist_size=shortlist_size
         )
 
-        if not result.get('success'):
-            raise HTTPException(status_code=500, detail=result.get('error', 'Unknown error'))
-
-        return result['data']
-
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Candidate ranking failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+    return FastJSONResponse(data)
+
+
+@app.post("/api/rank-candidates/stream")
+async def rank_candidates_stream(
+    candidates: List[Dict[str, Any]],
+    job_requirements: JobRequirements,
+    http_request: Request,
+    shortlist_size: int = 10,
+    top_n: int = 10
+):
+    """
+    Rank candidates and stream progress as Server-Sent Events
+
+    Events:
+        candidate: {candidate, scored, total, top} after each candidate is
+                   scored, where top is the running top_n as references
+        shortlist: Shortlist summary once every candidate is scored
+        done:      {run_id, total_candidates, top_score, average_score}
+        error:     {detail} if ranking fails
+
+    Args:
+        candidates: List of candidates to rank
+        job_requirements: Job requirements
+        shortlist_size: Size of shortlist
+        top_n: Size of the running top list
+
+    Returns:
+        text/event-stream response
+    """
+    job_reqs = job_requirements.dict()
+    queue: asyncio.Queue = asyncio.Queue()
+    # Admit before the response starts so saturation is still a 429/503
+    ticket = await admit(client_id(http_request), ranking_lane(candidates))
+
+    def release_ticket():
+        if ticket is not None:
+            admission.release(ticket)
+
+    def on_scored(candidate: Dict[str, Any], scored: int, total: int):
+        # Copy now: ranks are assigned to the same dicts once scoring finishes
+        queue.put_nowait(('candidate', {**candidate}, scored, total))
+
+    async def events():
+        task = asyncio.create_task(get_orchestrator().run_isolated(
+            agent="candidate_ranker",
+            candidates=candidates,
+            job_requirements=job_reqs,
+            generate_shortlist=True,
+            shortlist_size=shortlist_size,
+            on_scored=on_scored
+        ))
+        task.add_done_callback(lambda _: queue.put_nowait(('finished',)))
+        top = RunningTopN(min(max(top_n, 1), 100))
+        metrics.ACTIVE_STREAMS.inc()
+
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=settings.stream_keepalive)
+                except asyncio.TimeoutError:
+                    yield SSE_KEEPALIVE
+                    continue
+
+                if item[0] == 'candidate':
+                    _, candidate, scored, total = item
+                    top.add(candidate)
+                    yield sse_event('candidate', {
+                        'candidate': candidate, 'scored': scored, 'total': total, 'top': top.items()
+                    }, event_id=str(scored))
+                    continue
+
+                try:
+                    result = task.result()
+                except Exception as e:
+                    result = {'success': False, 'error': str(e)}
+
+                if not result.get('success'):
+                    logger.error(f"Streaming ranking failed: {result.get('error')}")
+                    yield sse_event('error', {'detail': result.get('error', 'Unknown error')})
+                    return
+
+                data = result['data']
+                shortlist = data.get('shortlist')
+                if shortlist is not None:
+                    # Candidates were already sent; reference them by id
+                    yield sse_event('shortlist', {**shortlist, 'shortlist': [
+                        {'candidate_id': candidate_id(c), 'rank': c.get('rank')}
+                        for c in shortlist.get('shortlist') or []
+                    ]})
+
+                run_id = await persist_result(data, {'mode': 'rank_only', 'job_requirements': job_reqs},
+                                              result.get('trace'))
+                yield sse_event('done', {
+                    'run_id': run_id,
+                    'total_candidates': data.get('total_candidates', 0),
+                    'top_score': data.get('top_score', 0),
+                    'average_score': data.get('average_score', 0)
+                })
+                return
+        finally:
+            metrics.ACTIVE_STREAMS.dec()
+            release_ticket()
+            # Client went away: stop scoring on its behalf
+            if not task.done():
+                task.cancel()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+        # Also frees the slot if the stream never starts
+        background=BackgroundTask(release_ticket)
+    )
+
 
 @app.post("/api/orchestrate", response_model=OrchestrationResponse)
-async def orchestrate_workflow(request: OrchestrationRequest):
+async def orchestrate_workflow(request: OrchestrationRequest, http_request: Request, view: str = "full",
+                               fields: Optional[str] = None, limit: Optional[int] = None):
     """
     Execute full recruitment workflow with orchestrator
 
     Args:
         request: Orchestration parameters
+        view: "full" or "compact" (candidates once, ranked results as references)
+        fields: Comma-separated candidate fields to return (implies compact)
+        limit: Page size (implies compact; further pages via /api/runs/{run_id}/candidates)
 
     Returns:
         Complete workflow results
     """
     try:
-        orch = get_orchestrator()
-
         # Prepare LinkedIn credentials
         linkedin_creds = None
         if request.linkedin_email and request.linkedin_password:
@@ -267,7 +908,12 @@ async def orchestrate_workflow(request: OrchestrationRequest):
         if request.job_requirements:
             job_reqs = request.job_requirements.dict()
 
-        result = await orch.run(
+        data = await run_workflow(
+            "orchestrate",
+            {**request.dict(), 'resume_files': file_fingerprints(request.resume_files)},
+            request.dict(),
+            client_id(http_request),
+            BULK,
             mode=request.mode,
             job_requirements=job_reqs,
             resume_files=request.resume_files,
@@ -278,36 +924,231 @@ async def orchestrate_workflow(request: OrchestrationRequest):
             search_indeed=request.search_indeed,
             linkedin_credentials=linkedin_creds,
             rank_candidates=request.rank_candidates,
-            shortlist_size=request.shortlist_size
+            shortlist_size=request.shortlist_size,
+            only_new=request.only_new
         )
 
-        if not result.get('success'):
-            raise HTTPException(status_code=500, detail=result.get('error', 'Unknown error'))
-
-        return result['data']
-
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Orchestration failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+    return shape_response(data, view, fields, limit, model=OrchestrationResponse)
+
 
 @app.get("/api/agents/status")
 async def get_agents_status():
     """
-    Get status of all agents
+    Get status of all agents, combined across worker processes
 
     Returns:
         Status information for all agents
     """
     try:
         orch = get_orchestrator()
-        return orch.get_agents_status()
+        if shared_state is None:
+            return orch.get_agents_status()
+
+        # Combine the status of every worker process
+        await asyncio.to_thread(publish_agent_status)
+        reports = await asyncio.to_thread(shared_state.items, 'agent_status')
+        return orch.merge_agents_status(orch.get_agents_status(), list(reports.values()))
 
     except Exception as e:
         logger.error(f"Failed to get agent status: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/agents/{agent_name}/history")
+async def get_agent_history(agent_name: str, offset: int = 0, limit: int = 20):
+    """
+    Get a page of an agent's recent results and errors (kept per worker process)
+
+    Args:
+        agent_name: orchestrator, resume_parser, linkedin_scraper, indeed_scraper or candidate_ranker
+        offset: Number of newest entries to skip
+        limit: Page size
+
+    Returns:
+        Agent summary with a history page
+    """
+    orch = get_orchestrator()
+    agents = {
+        'orchestrator': orch,
+        'resume_parser': orch.resume_parser,
+        'linkedin_scraper': orch.linkedin_scraper,
+        'indeed_scraper': orch.indeed_scraper,
+        'candidate_ranker': orch.candidate_ranker
+    }
+
+    if agent_name not in agents:
+        raise HTTPException(status_code=404, detail=f"Unknown agent: {agent_name}")
+
+    return agents[agent_name].get_summary(offset=max(offset, 0), limit=min(max(limit, 1), 100))
+
+
+@app.get("/api/runs")
+async def list_runs(job_title: Optional[str] = None, limit: int = 20, offset: int = 0):
+    """
+    List persisted orchestration runs, newest first
+
+    Args:
+        job_title: Optional job title filter
+        limit: Page size
+        offset: Rows to skip
+
+    Returns:
+        Page of run summaries
+    """
+    try:
+        runs = await asyncio.to_thread(
+            get_store().list_runs, job_title, min(max(limit, 1), 100), max(offset, 0)
+        )
+        return {"success": True, "count": len(runs), "runs": runs}
+
+    except Exception as e:
+        logger.error(f"Failed to list runs: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/runs/{run_id}")
+async def get_run(run_id: str):
+    """
+    Get a persisted run without recomputing it
+
+    Args:
+        run_id: Run id returned by a workflow endpoint
+
+    Returns:
+        Stored workflow results
+    """
+    run = await asyncio.to_thread(get_store().get_run, run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Run not found")
+    return FastJSONResponse(run)
+
+
+@app.get("/api/runs/{run_id}/candidates")
+async def get_run_candidates(run_id: str, cursor: Optional[str] = None, limit: int = 50,
+                             fields: Optional[str] = None):
+    """
+    Page through a persisted run's candidates in the compact view
+
+    Ranked runs are paged in rank order. Only the requested page is read
+    from the database.
+
+    Args:
+        run_id: Run id returned by a workflow endpoint
+        cursor: next_cursor from the previous page (omit for the first page)
+        limit: Page size
+        fields: Comma-separated candidate fields to return
+
+    Returns:
+        One compact page with next_cursor (None on the last page)
+    """
+    try:
+        after = decode_cursor(cursor, run_id) if cursor else 0
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    page = await asyncio.to_thread(get_store().get_run_page, run_id, after, min(max(limit, 1), 500))
+    if page is None:
+        raise HTTPException(status_code=404, detail="Run not found")
+
+    run, next_key = page
+    compact = compact_result(run, parse_fields(fields))
+    compact['next_cursor'] = encode_cursor(run_id, next_key) if next_key is not None else None
+    return FastJSONResponse(compact)
+
+
+@app.get("/api/runs/{run_id}/trace")
+async def get_run_trace(run_id: str, format: str = "json"):
+    """
+    Get the span tree recorded for a run
+
+    Args:
+        run_id: Run id returned by a workflow endpoint
+        format: "json" (nested span tree) or "chrome" (trace event format for
+                chrome://tracing, Perfetto or speedscope)
+
+    Returns:
+        Trace in the requested format
+    """
+    if format not in ('json', 'chrome'):
+        raise HTTPException(status_code=400, detail=f"Unknown trace format: {format}")
+
+    trace = await asyncio.to_thread(get_store().get_trace, run_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail="No trace recorded for this run")
+    return FastJSONResponse(to_chrome_trace(trace) if format == 'chrome' else trace)
+
+
+@app.get("/api/tasks")
+async def get_task_stats():
+    """
+    Count queued, leased, done and failed tasks
+
+    Returns:
+        Task counts by status
+    """
+    if not settings.task_queue:
+        raise HTTPException(status_code=404, detail="Task queue is disabled")
+    return await asyncio.to_thread(get_task_queue().stats)
+
+
+@app.get("/api/tasks/{task_id}")
+async def get_task(task_id: str):
+    """
+    Get a queued task's status and, once done, its result
+
+    Args:
+        task_id: Task id from a 504 response
+
+    Returns:
+        Task status, attempts, error and result
+    """
+    if not settings.task_queue:
+        raise HTTPException(status_code=404, detail="Task queue is disabled")
+    task = await asyncio.to_thread(get_task_queue().get, task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return FastJSONResponse({
+        field: task[field]
+        for field in ('id', 'kind', 'status', 'priority', 'attempts', 'max_attempts', 'error', 'result')
+    })
+
+
+@app.get("/api/candidates/scored")
+async def get_scored_candidates(
+    job_title: Optional[str] = None,
+    source: Optional[str] = None,
+    min_score: Optional[float] = None,
+    limit: int = 50
+):
+    """
+    Query scored candidates across all persisted runs
+
+    Args:
+        job_title: Optional job title filter
+        source: Optional source filter
+        min_score: Optional minimum overall score
+        limit: Maximum results
+
+    Returns:
+        Candidates ordered by score
+    """
+    try:
+        rows = await asyncio.to_thread(
+            get_store().top_candidates, job_title, source, min_score, min(max(limit, 1), 500)
+        )
+        return FastJSONResponse({"success": True, "count": len(rows), "candidates": rows})
+
+    except Exception as e:
+        logger.error(f"Failed to query candidates: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.delete("/api/resumes/{filename}")
 async def delete_resume(filename: str):
     """
@@ -321,8 +1162,8 @@ async def delete_resume(filename: str):
     """
     try:
         file_path = UPLOAD_DIR / filename
-        if file_path.exists():
-            file_path.unlink()
+        if await asyncio.to_thread(file_path.exists):
+            await asyncio.to_thread(file_path.unlink)
             return {"success": True, "message": f"Deleted {filename}"}
         else:
             raise HTTPException(status_code=404, detail="File not found")
@@ -341,7 +1182,7 @@ async def list_resumes():
         List of resume filenames
     """
     try:
-        files = [f.name for f in UPLOAD_DIR.iterdir() if f.is_file()]
+        files = await asyncio.to_thread(lambda: [f.name for f in UPLOAD_DIR.iterdir() if f.is_file()])
         return {
             "success": True,
             "count": len(files),
@@ -0,0 +1,114 @@
+"""
+Database Tables
+SQLAlchemy Core schema for persisted orchestration runs and queued tasks
+"""
+
+from sqlalchemy import (
+    MetaData, Table, Column, Integer, String, Float, DateTime, JSON, Text, ForeignKey, Index
+)
+
+metadata = MetaData()
+
+
+runs = Table(
+    "runs",
+    metadata,
+    Column("id", String(32), primary_key=True),
+    Column("mode", String(32), nullable=False),
+    Column("job_title", String(255), index=True),
+    Column("location", String(255)),
+    Column("status", String(32), nullable=False, default="completed"),
+    Column("total_candidates", Integer, nullable=False, default=0),
+    Column("top_score", Float),
+    Column("average_score", Float),
+    Column("sources", JSON),
+    Column("request", JSON),
+    Column("shortlist", JSON),
+    Column("created_at", DateTime, nullable=False, index=True),
+)
+
+
+candidates = Table(
+    "candidates",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("run_id", String(32), ForeignKey("runs.id", ondelete="CASCADE"), nullable=False, index=True),
+    Column("candidate_key", String(40), nullable=False),
+    Column("position", Integer, nullable=False),
+    Column("name", String(255)),
+    Column("email", String(255), index=True),
+    Column("location", String(255)),
+    Column("source", String(64), index=True),
+    Column("profile_url", String(1024)),
+    Column("data", JSON, nullable=False),
+    Index("ix_candidates_run_key", "run_id", "candidate_key"),
+    Index("ix_candidates_run_position", "run_id", "position"),
+)
+
+
+parsed_resumes = Table(
+    "parsed_resumes",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("run_id", String(32), ForeignKey("runs.id", ondelete="CASCADE"), nullable=False, index=True),
+    Column("candidate_key", String(40), nullable=False),
+    Column("source_file", String(1024), index=True),
+    Column("name", String(255)),
+    Column("email", String(255)),
+    Column("data", JSON, nullable=False),
+    Column("created_at", DateTime, nullable=False),
+)
+
+
+scores = Table(
+    "scores",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("run_id", String(32), ForeignKey("runs.id", ondelete="CASCADE"), nullable=False, index=True),
+    Column("candidate_key", String(40), nullable=False),
+    Column("job_title", String(255)),
+    Column("source", String(64)),
+    Column("overall_score", Float, index=True),
+    Column("rank", Integer),
+    Column("match_quality", String(32)),
+    Column("scoring", JSON),
+    Column("created_at", DateTime, nullable=False),
+    Index("ix_scores_job_score", "job_title", "overall_score"),
+    Index("ix_scores_source_score", "source", "overall_score"),
+    Index("ix_scores_run_rank", "run_id", "rank"),
+)
+
+
+traces = Table(
+    "traces",
+    metadata,
+    Column("run_id", String(32), ForeignKey("runs.id", ondelete="CASCADE"), primary_key=True),
+    Column("span_count", Integer, nullable=False, default=0),
+    Column("duration_ms", Float),
+    Column("data", JSON, nullable=False),
+    Column("created_at", DateTime, nullable=False),
+)
+
+
+tasks = Table(
+    "tasks",
+    metadata,
+    Column("id", String(32), primary_key=True),
+    Column("kind", String(32), nullable=False),
+    Column("key", String(64), index=True),
+    Column("priority", Integer, nullable=False, default=0),
+    Column("status", String(16), nullable=False),
+    Column("payload", JSON, nullable=False),
+    Column("result", JSON),
+    Column("error", Text),
+    Column("attempts", Integer, nullable=False, default=0),
+    Column("max_attempts", Integer, nullable=False),
+    Column("lease_id", String(32), index=True),
+    Column("lease_owner", String(64)),
+    # Epoch seconds, compared against time.time() by every worker process
+    Column("lease_expires", Float),
+    Column("available_at", Float, nullable=False),
+    Column("created_at", DateTime, nullable=False),
+    Column("finished_at", DateTime),
+    Index("ix_tasks_ready", "status", "priority", "available_at"),
+)
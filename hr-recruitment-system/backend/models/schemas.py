@@ -28,6 +28,7 @@ class SearchRequest(BaseModel):
     search_linkedin: bool = Field(True, description="Search LinkedIn")
     search_indeed: bool = Field(True, description="Search Indeed")
     max_candidates: int = Field(50, description="Maximum number of candidates per source")
+    only_new: Optional[bool] = Field(None, description="Only return candidates not found by earlier runs of this search")
     linkedin_email: Optional[str] = Field(None, description="LinkedIn email for authenticated search")
     linkedin_password: Optional[str] = Field(None, description="LinkedIn password for authenticated search")
 
@@ -52,6 +53,7 @@ class OrchestrationRequest(BaseModel):
     linkedin_password: Optional[str] = Field(None, description="LinkedIn credentials")
     rank_candidates: bool = Field(True, description="Rank candidates")
     shortlist_size: int = Field(10, description="Shortlist size")
+    only_new: Optional[bool] = Field(None, description="Only pass on candidates not found by earlier runs of this search")
 
 
 class CandidateResponse(BaseModel):
@@ -95,11 +97,17 @@ class AgentStatusResponse(BaseModel):
 
 class OrchestrationResponse(BaseModel):
     """Response from orchestration workflow"""
+    run_id: Optional[str] = None
     mode: str
     total_candidates_found: int
     candidates: List[Dict[str, Any]]
     ranked_results: Optional[Dict[str, Any]] = None
+    duplicates_merged: int = 0
+    previously_seen: int = 0
     sources: Dict[str, int]
+    view: Optional[str] = Field(None, description="'compact' when candidates are listed once and ranked results are references")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page at /api/runs/{run_id}/candidates")
+    trace_summary: Optional[Dict[str, Any]] = Field(None, description="Span count and time per category; full trace at /api/runs/{run_id}/trace")
     timestamp: str = Field(default_factory=lambda: datetime.now().isoformat())
 
 
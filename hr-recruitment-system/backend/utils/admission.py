@@ -0,0 +1,295 @@
+"""
+Admission Control
+Bounds how many expensive workflows run at once, with priority lanes,
+per-client fair share and load-based rejection (429/503 with a retry hint)
+"""
+
+import asyncio
+import itertools
+import math
+from contextlib import asynccontextmanager, contextmanager
+from typing import Callable, Dict, List, Optional
+
+# Small ranking requests a user is waiting on
+INTERACTIVE = "interactive"
+# Searches, resume parsing, full orchestration and large rankings
+BULK = "bulk"
+LANES = (INTERACTIVE, BULK)
+
+
+def worker_slots(max_active: int, workers: int, interactive_reserve: int = 1) -> int:
+    """
+    Slots each worker process gets so that together they stay within max_active
+
+    Every process runs its own controller, so the total is split evenly
+    (rounding down). With several workers each share must still hold the
+    interactive reserve plus one bulk slot, or the priority lane is lost.
+
+    Args:
+        max_active: Requests allowed to run at once across all workers
+        workers: Worker processes
+        interactive_reserve: Slots per worker the bulk lane may not use
+
+    Returns:
+        max_active for one worker process
+
+    Raises:
+        ValueError: If there are too many workers for the slots
+    """
+    workers = max(workers, 1)
+    slots = max_active // workers
+    if workers > 1 and slots < interactive_reserve + 1:
+        raise ValueError(
+            f"MAX_CONCURRENT_AGENTS={max_active} is too few for {workers} workers: each worker needs "
+            f"{interactive_reserve + 1} slots (ADMISSION_INTERACTIVE_RESERVE={interactive_reserve} plus one bulk "
+            f"slot), so raise it to at least {workers * (interactive_reserve + 1)} or run fewer workers"
+        )
+    return max(slots, 1)
+
+
+class AdmissionRejected(Exception):
+    """Request not admitted; maps to an HTTP error with Retry-After"""
+
+    def __init__(self, status_code: int, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.status_code = status_code
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class Ticket:
+    """One admitted request; release it when the work is done"""
+
+    __slots__ = ('client', 'lane', 'released')
+
+    def __init__(self, client: str, lane: str):
+        self.client = client
+        self.lane = lane
+        self.released = False
+
+
+class _Waiter:
+    __slots__ = ('seq', 'client', 'lane', 'future')
+
+    def __init__(self, seq: int, client: str, lane: str, future: asyncio.Future):
+        self.seq = seq
+        self.client = client
+        self.lane = lane
+        self.future = future
+
+
+class AdmissionController:
+    """
+    Admits expensive requests into a bounded number of active slots
+
+    - At most ``max_active`` requests run at once. The bulk lane may use all
+      but ``interactive_reserve`` of them, so small interactive requests
+      always find a slot free of bulk work.
+    - Bulk requests also wait while ``pressure()`` reports a saturated
+      downstream resource (LLM concurrency, browser pool).
+    - Requests that cannot start wait in a queue. Interactive waiters go
+      first, then the waiter whose client has the fewest running requests,
+      then arrival order.
+    - A client with ``per_client`` requests running or queued is rejected
+      with 429. A full queue, or a wait longer than ``queue_timeout``, is
+      rejected with 503. Both carry a Retry-After estimate.
+    """
+
+    def __init__(self, max_active: int = 3, max_queue: int = 20, per_client: int = 2,
+                 interactive_reserve: int = 1, queue_timeout: float = 30.0, retry_after: int = 5,
+                 pressure: Optional[Callable[[], Optional[str]]] = None, poll_interval: float = 0.5):
+        """
+        Initialize the controller
+
+        Args:
+            max_active: Requests running at once
+            max_queue: Requests waiting for a slot before new ones are rejected
+            per_client: Requests one client may have running or queued
+            interactive_reserve: Slots the bulk lane may not use
+            queue_timeout: Seconds a request waits for a slot
+            retry_after: Base Retry-After hint in seconds
+            pressure: Callable returning a reason when downstream resources are
+                      saturated (None when bulk work may start)
+            poll_interval: Seconds between pressure re-checks while requests wait
+        """
+        self.max_active = max(1, max_active)
+        self.max_queue = max_queue
+        self.per_client = per_client
+        self.interactive_reserve = min(max(interactive_reserve, 0), self.max_active - 1)
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self.pressure = pressure
+        self.poll_interval = poll_interval
+
+        self._active = {lane: 0 for lane in LANES}
+        self._active_by_client: Dict[str, int] = {}
+        self._client_load: Dict[str, int] = {}
+        self._waiters: List[_Waiter] = []
+        self._seq = itertools.count()
+        self.rejected = {429: 0, 503: 0}
+
+    # ── Admission ───────────────────────────────────────────────────────────
+
+    def check(self, client: str, lane: str = BULK):
+        """
+        Reject a request that could not be admitted now, without taking a slot
+
+        Used per caller before joining shared work, so every caller is held
+        to its own client's share rather than the one that started the work.
+
+        Args:
+            client: Client identity used for fair share
+            lane: INTERACTIVE or BULK
+
+        Raises:
+            AdmissionRejected: 429 over the client's share, 503 when the queue is full
+        """
+        if lane not in LANES:
+            raise ValueError(f"Unknown admission lane: {lane}")
+
+        if self.per_client and self._client_load.get(client, 0) >= self.per_client:
+            raise self._reject(429, f"Too many concurrent requests from this client (limit {self.per_client})")
+
+        if len(self._waiters) >= self.max_queue and not self._can_start(lane):
+            raise self._reject(503, "Server is at capacity")
+
+    async def acquire(self, client: str, lane: str = BULK, check_share: bool = True) -> Ticket:
+        """
+        Wait for a slot
+
+        Args:
+            client: Client identity used for fair share
+            lane: INTERACTIVE or BULK
+            check_share: Reject with 429 over the client's share (off when the
+                         caller already passed check())
+
+        Returns:
+            Ticket to pass to release()
+
+        Raises:
+            AdmissionRejected: 429 over the client's share, 503 when saturated
+        """
+        if lane not in LANES:
+            raise ValueError(f"Unknown admission lane: {lane}")
+
+        if check_share and self.per_client and self._client_load.get(client, 0) >= self.per_client:
+            raise self._reject(429, f"Too many concurrent requests from this client (limit {self.per_client})")
+
+        if not any(w.lane == lane or w.lane == INTERACTIVE for w in self._waiters) and self._can_start(lane):
+            self._client_load[client] = self._client_load.get(client, 0) + 1
+            return self._start(client, lane)
+
+        if len(self._waiters) >= self.max_queue:
+            raise self._reject(503, "Server is at capacity")
+
+        waiter = _Waiter(next(self._seq), client, lane, asyncio.get_running_loop().create_future())
+        self._waiters.append(waiter)
+        self._client_load[client] = self._client_load.get(client, 0) + 1
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.queue_timeout
+        try:
+            while not waiter.future.done():
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    self._abandon(waiter)
+                    raise self._reject(503, self._busy_reason(lane))
+                try:
+                    await asyncio.wait_for(asyncio.shield(waiter.future), min(remaining, self.poll_interval))
+                except asyncio.TimeoutError:
+                    # Downstream pressure may have eased without a release
+                    self._dispatch()
+        except asyncio.CancelledError:
+            if waiter.future.done():
+                self.release(waiter.future.result())
+            else:
+                self._abandon(waiter)
+            raise
+        return waiter.future.result()
+
+    def release(self, ticket: Ticket):
+        """Free a ticket's slot and admit waiting requests (idempotent)"""
+        if ticket.released:
+            return
+        ticket.released = True
+        self._active[ticket.lane] -= 1
+        self._decrement(self._active_by_client, ticket.client)
+        self._decrement(self._client_load, ticket.client)
+        self._dispatch()
+
+    @contextmanager
+    def hold(self, client: str):
+        """
+        Count a request against its client's share for the duration of the
+        block without taking a slot (for work that runs elsewhere, such as on
+        task workers); pair it with check()
+        """
+        self._client_load[client] = self._client_load.get(client, 0) + 1
+        try:
+            yield
+        finally:
+            self._decrement(self._client_load, client)
+
+    @asynccontextmanager
+    async def admit(self, client: str, lane: str = BULK):
+        """Hold a slot for the duration of the block"""
+        ticket = await self.acquire(client, lane)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    def stats(self) -> Dict[str, Dict]:
+        """Running and queued requests per lane, and rejections by status"""
+        queued = {lane: 0 for lane in LANES}
+        for waiter in self._waiters:
+            queued[waiter.lane] += 1
+        return {'active': dict(self._active), 'queued': queued, 'rejected': dict(self.rejected)}
+
+    # ── Internals ───────────────────────────────────────────────────────────
+
+    def _can_start(self, lane: str) -> bool:
+        if sum(self._active.values()) >= self.max_active:
+            return False
+        if lane == INTERACTIVE:
+            return True
+        if self._active[BULK] >= self.max_active - self.interactive_reserve:
+            return False
+        return self.pressure is None or self.pressure() is None
+
+    def _start(self, client: str, lane: str) -> Ticket:
+        self._active[lane] += 1
+        self._active_by_client[client] = self._active_by_client.get(client, 0) + 1
+        return Ticket(client, lane)
+
+    def _dispatch(self):
+        for lane in LANES:
+            while self._can_start(lane):
+                waiters = [w for w in self._waiters if w.lane == lane and not w.future.done()]
+                if not waiters:
+                    break
+                waiter = min(waiters, key=lambda w: (self._active_by_client.get(w.client, 0), w.seq))
+                self._waiters.remove(waiter)
+                waiter.future.set_result(self._start(waiter.client, lane))
+
+    def _abandon(self, waiter: _Waiter):
+        if waiter in self._waiters:
+            self._waiters.remove(waiter)
+            self._decrement(self._client_load, waiter.client)
+
+    def _busy_reason(self, lane: str) -> str:
+        reason = self.pressure() if lane == BULK and self.pressure is not None else None
+        return f"Server is at capacity: {reason}" if reason else "Server is at capacity"
+
+    def _reject(self, status_code: int, reason: str) -> AdmissionRejected:
+        self.rejected[status_code] += 1
+        # Scale the hint with the queue ahead of a retry
+        retry_after = math.ceil(self.retry_after * (1 + len(self._waiters) / self.max_active))
+        return AdmissionRejected(status_code, reason, retry_after)
+
+    @staticmethod
+    def _decrement(counts: Dict[str, int], client: str):
+        if counts.get(client, 0) <= 1:
+            counts.pop(client, None)
+        else:
+            counts[client] -= 1
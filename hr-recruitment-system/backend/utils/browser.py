@@ -0,0 +1,379 @@
+"""
+Browser helpers
+Chrome profile setup and condition-based waits shared by the Selenium
+scraper agents
+
+These functions block while talking to the browser, so agents call them
+through asyncio.to_thread.
+"""
+
+import time
+from functools import partial
+from typing import Any, Dict, Iterable, Optional
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from webdriver_manager.chrome import ChromeDriverManager
+
+from .pools import ResourcePool, get_pool
+from .tracing import trace_driver
+
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# Requests the scrapers never need: we only read text from the DOM
+BLOCKED_URL_PATTERNS = [
+    # Images
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.avif",
+    # Fonts
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    # Media
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3", "*.ogg",
+    # Third-party trackers and ads
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*hotjar.com*", "*bat.bing.com*", "*px.ads.linkedin.com*",
+    "*snap.licdn.com*", "*scorecardresearch.com*",
+]
+
+LIGHTWEIGHT_ARGUMENTS = [
+    "--blink-settings=imagesEnabled=false",
+    "--mute-audio",
+    "--autoplay-policy=user-gesture-required",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-notifications",
+    "--no-first-run",
+    "--disable-features=Translate,MediaRouter,OptimizationHints,InterestFeedContentSuggestions",
+]
+
+LIGHTWEIGHT_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.media_stream": 2,
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.default_content_setting_values.geolocation": 2,
+    "profile.default_content_setting_values.automatic_downloads": 2,
+}
+
+
+def build_chrome_options(headless: bool = True, lightweight: bool = True) -> Options:
+    """
+    Build Chrome options for a scraping session
+
+    The lightweight profile turns off images, media and background
+    features and uses the eager page load strategy, so navigation returns
+    at DOMContentLoaded instead of waiting for every subresource.
+
+    Args:
+        headless: Run without a visible window
+        lightweight: Apply the text-only scraping profile
+
+    Returns:
+        Chrome options
+    """
+    chrome_options = Options()
+
+    if headless:
+        chrome_options.add_argument("--headless")
+
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_argument(f"user-agent={USER_AGENT}")
+
+    # Prevent detection
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+
+    if lightweight:
+        for argument in LIGHTWEIGHT_ARGUMENTS:
+            chrome_options.add_argument(argument)
+        chrome_options.add_experimental_option("prefs", LIGHTWEIGHT_PREFS)
+        chrome_options.page_load_strategy = "eager"
+
+    return chrome_options
+
+
+def block_requests(driver, patterns: Iterable[str] = BLOCKED_URL_PATTERNS) -> bool:
+    """
+    Block matching requests through the DevTools protocol
+
+    Args:
+        driver: Chrome WebDriver
+        patterns: URL patterns (wildcards allowed)
+
+    Returns:
+        True if blocking was enabled
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+        return True
+    except (AttributeError, WebDriverException):
+        return False
+
+
+def create_chrome_driver(headless: bool = True, lightweight: bool = True) -> webdriver.Chrome:
+    """
+    Launch Chrome for scraping
+
+    Args:
+        headless: Run without a visible window
+        lightweight: Apply the text-only profile and block fonts, media and trackers
+
+    Returns:
+        Configured Chrome WebDriver
+    """
+    service = Service(ChromeDriverManager().install())
+    driver = trace_driver(webdriver.Chrome(service=service, options=build_chrome_options(headless, lightweight)))
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+
+    if lightweight:
+        block_requests(driver)
+
+    return driver
+
+
+def get_driver_pool(headless: bool = True, lightweight: bool = True, max_size: int = 2) -> ResourcePool:
+    """
+    Get the shared Chrome driver pool for a browser profile
+
+    The pool name covers every create_chrome_driver argument and the pool's
+    factory depends on nothing else, so agents with the same profile share
+    drivers and agents with different profiles never get each other's. The
+    first caller's max_size is kept for the life of the pool.
+
+    Args:
+        headless: Run without a visible window
+        lightweight: Apply the text-only profile and block fonts, media and trackers
+        max_size: Maximum drivers open at once
+
+    Returns:
+        The shared ResourcePool; drivers are cleared with clear_session() on release
+    """
+    return get_pool(
+        f"chrome[headless={headless},lightweight={lightweight}]",
+        factory=partial(create_chrome_driver, headless, lightweight=lightweight),
+        max_size=max_size,
+        reset=clear_session,
+        dispose=lambda driver: driver.quit()
+    )
+
+
+def wait_for_document_ready(driver, timeout: float = 15) -> bool:
+    """
+    Wait until the document has finished parsing
+
+    Args:
+        driver: Selenium WebDriver
+        timeout: Maximum seconds to wait
+
+    Returns:
+        True if the document became ready in time
+    """
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script("return document.readyState") in ("interactive", "complete")
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
+def wait_for_any(driver, selectors: Iterable[str], timeout: float = 15) -> Optional[str]:
+    """
+    Wait until any of the CSS selectors is present
+
+    Args:
+        driver: Selenium WebDriver
+        selectors: CSS selectors (e.g. result cards and the "no results" banner)
+        timeout: Maximum seconds to wait
+
+    Returns:
+        The first selector found, or None on timeout
+    """
+    selectors = list(selectors)
+    conditions = [EC.presence_of_element_located((By.CSS_SELECTOR, s)) for s in selectors]
+
+    try:
+        WebDriverWait(driver, timeout).until(EC.any_of(*conditions))
+    except TimeoutException:
+        return None
+
+    for selector in selectors:
+        if driver.find_elements(By.CSS_SELECTOR, selector):
+            return selector
+    return None
+
+
+def wait_for_network_idle(driver, idle_time: float = 0.5, timeout: float = 10,
+                          poll_interval: float = 0.1) -> bool:
+    """
+    Wait until no new network resources have loaded for idle_time seconds
+
+    Uses the Resource Timing API, so it needs no proxy or DevTools session.
+
+    Args:
+        driver: Selenium WebDriver
+        idle_time: Quiet period that counts as idle
+        timeout: Maximum seconds to wait
+        poll_interval: Seconds between checks
+
+    Returns:
+        True if the page went idle in time
+    """
+    deadline = time.monotonic() + timeout
+    last_count = -1
+    quiet_since = time.monotonic()
+
+    while time.monotonic() < deadline:
+        count = driver.execute_script("return performance.getEntriesByType('resource').length")
+        now = time.monotonic()
+        if count != last_count:
+            last_count = count
+            quiet_since = now
+        elif now - quiet_since >= idle_time:
+            return True
+        time.sleep(poll_interval)
+
+    return False
+
+
+def scroll_until_stable(driver, selector: str, max_scrolls: int = 3, timeout: float = 5,
+                        target_count: Optional[int] = None) -> int:
+    """
+    Scroll to load lazy results until the result count stops growing
+
+    Each scroll waits for the count of matching elements to increase rather
+    than sleeping a fixed time, and stops as soon as a scroll adds nothing
+    or enough results are present.
+
+    Args:
+        driver: Selenium WebDriver
+        selector: CSS selector of a result item
+        max_scrolls: Maximum number of scrolls
+        timeout: Maximum seconds to wait for new results after each scroll
+        target_count: Stop once at least this many results are loaded
+
+    Returns:
+        Number of matching elements after scrolling
+    """
+    count = len(driver.find_elements(By.CSS_SELECTOR, selector))
+
+    for _ in range(max_scrolls):
+        if target_count is not None and count >= target_count:
+            break
+
+        previous = count
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        try:
+            WebDriverWait(driver, timeout).until(
+                lambda d: len(d.find_elements(By.CSS_SELECTOR, selector)) > previous
+            )
+        except TimeoutException:
+            break
+        count = len(driver.find_elements(By.CSS_SELECTOR, selector))
+
+    return count
+
+
+def wait_for_url(driver, fragments: Iterable[str], timeout: float = 15) -> bool:
+    """
+    Wait until the current URL contains any of the fragments
+
+    Args:
+        driver: Selenium WebDriver
+        fragments: Substrings to look for
+        timeout: Maximum seconds to wait
+
+    Returns:
+        True if a fragment appeared in time
+    """
+    fragments = list(fragments)
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda d: any(fragment in d.current_url for fragment in fragments)
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
+def export_session(driver) -> Dict[str, Any]:
+    """
+    Capture the current site's session state
+
+    Args:
+        driver: WebDriver on a page of the site
+
+    Returns:
+        Dictionary with cookies and local storage
+    """
+    return {
+        'cookies': driver.get_cookies(),
+        'local_storage': driver.execute_script("return Object.assign({}, window.localStorage);") or {}
+    }
+
+
+def import_session(driver, state: Dict[str, Any], origin_url: str):
+    """
+    Restore session state captured by export_session
+
+    Cookies and local storage can only be set for the page that is loaded,
+    so the site's origin is opened first.
+
+    Args:
+        driver: WebDriver
+        state: Session state
+        origin_url: Any URL on the site (e.g. its home page)
+    """
+    driver.get(origin_url)
+
+    for cookie in state.get('cookies', []):
+        cookie = dict(cookie)
+        if 'expiry' in cookie:
+            cookie['expiry'] = int(cookie['expiry'])
+        if cookie.get('sameSite') not in (None, 'Strict', 'Lax', 'None'):
+            cookie.pop('sameSite')
+        try:
+            driver.add_cookie(cookie)
+        except WebDriverException:
+            # Cookies for other subdomains cannot be set from this origin
+            continue
+
+    local_storage = state.get('local_storage') or {}
+    if local_storage:
+        driver.execute_script(
+            "for (const [k, v] of Object.entries(arguments[0])) { window.localStorage.setItem(k, v); }",
+            local_storage
+        )
+
+
+def clear_session(driver):
+    """
+    Remove the loaded site's cookies and stored data, leaving a blank page
+
+    Storage is cleared through the DevTools protocol (local and session
+    storage, IndexedDB, caches); without DevTools only web storage is
+    cleared from the page.
+
+    Args:
+        driver: WebDriver
+    """
+    origin = driver.execute_script("return window.location.origin;")
+    if origin and origin != "null":
+        try:
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        except (AttributeError, WebDriverException):
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+
+    driver.delete_all_cookies()
+    driver.get("about:blank")
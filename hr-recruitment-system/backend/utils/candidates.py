@@ -0,0 +1,248 @@
+"""
+Candidate helpers
+Stable identifiers and cross-source deduplication for candidate records
+"""
+
+import hashlib
+import re
+import unicodedata
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, Any, List, Optional, Tuple
+
+
+def candidate_key(candidate: Dict[str, Any]) -> str:
+    """
+    Compute a stable identifier for a candidate record
+
+    The strongest available identity wins: email, then profile URL, then
+    uploaded file, then name + location + source.
+
+    Args:
+        candidate: Candidate dictionary from any source
+
+    Returns:
+        40-character hex key
+    """
+    if candidate.get('email'):
+        basis = f"email:{str(candidate['email']).strip().lower()}"
+    elif candidate.get('profile_url'):
+        basis = f"url:{str(candidate['profile_url']).split('?')[0].rstrip('/').lower()}"
+    elif candidate.get('source_file'):
+        basis = f"file:{candidate['source_file']}"
+    elif candidate.get('url'):
+        basis = f"url:{str(candidate['url']).lower()}"
+    else:
+        basis = "|".join(
+            str(candidate.get(field) or '').strip().lower()
+            for field in ('name', 'title', 'location', 'company', 'source')
+        )
+    return hashlib.sha1(basis.encode('utf-8')).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Cross-source deduplication
+# ---------------------------------------------------------------------------
+
+_LIST_FIELDS = ('skills', 'experience', 'education', 'certifications', 'languages')
+
+# Richer sources win when two records disagree on a scalar field
+_SOURCE_PRIORITY = {'uploaded_resume': 0, 'LinkedIn': 1, 'Indeed': 2}
+
+
+def normalize_email(value: Any) -> Optional[str]:
+    """Lowercased, trimmed email or None"""
+    if not value or '@' not in str(value):
+        return None
+    return str(value).strip().lower()
+
+
+def normalize_phone(value: Any) -> Optional[str]:
+    """Last 10 digits of a phone number, or None if too short to be useful"""
+    digits = re.sub(r'\D', '', str(value or ''))
+    return digits[-10:] if len(digits) >= 7 else None
+
+
+def normalize_name(value: Any) -> str:
+    """Lowercase ASCII name with punctuation removed and whitespace collapsed"""
+    text = unicodedata.normalize('NFKD', str(value or ''))
+    text = text.encode('ascii', 'ignore').decode('ascii').lower()
+    text = re.sub(r'[^a-z\s]', ' ', text)
+    return ' '.join(text.split())
+
+
+def normalize_location(value: Any) -> str:
+    """City part of a location string, normalized like a name"""
+    return normalize_name(str(value or '').split(',')[0])
+
+
+def normalize_url(value: Any) -> Optional[str]:
+    """Profile URL without scheme, www, query string or trailing slash"""
+    if not value:
+        return None
+    url = str(value).strip().lower().split('?')[0].split('#')[0].rstrip('/')
+    url = re.sub(r'^https?://', '', url)
+    url = re.sub(r'^www\.', '', url)
+    return url or None
+
+
+def blocking_keys(candidate: Dict[str, Any]) -> Tuple[List[str], Optional[str]]:
+    """
+    Build blocking keys for a candidate
+
+    Args:
+        candidate: Candidate dictionary
+
+    Returns:
+        (exact identity keys, fuzzy name+location key or None)
+    """
+    exact = []
+
+    email = normalize_email(candidate.get('email'))
+    if email:
+        exact.append(f"email:{email}")
+
+    phone = normalize_phone(candidate.get('phone'))
+    if phone:
+        exact.append(f"phone:{phone}")
+
+    url = normalize_url(candidate.get('profile_url') or candidate.get('url'))
+    if url:
+        exact.append(f"url:{url}")
+
+    fuzzy = None
+    name = normalize_name(candidate.get('name'))
+    location = normalize_location(candidate.get('location'))
+    if name and location:
+        parts = name.split()
+        # Surname + first initial tolerates middle names and nickname spellings
+        fuzzy = f"name:{parts[-1]}|{parts[0][0]}|{location}"
+
+    return exact, fuzzy
+
+
+def names_match(a: Dict[str, Any], b: Dict[str, Any], threshold: float = 0.88) -> bool:
+    """
+    Fuzzy comparison of two candidates' full names
+
+    Args:
+        a: First candidate
+        b: Second candidate
+        threshold: Minimum similarity ratio (0-1)
+
+    Returns:
+        True if the names are similar enough to be the same person
+    """
+    name_a = normalize_name(a.get('name'))
+    name_b = normalize_name(b.get('name'))
+    if not name_a or not name_b:
+        return False
+    if name_a == name_b:
+        return True
+    return SequenceMatcher(None, name_a, name_b).ratio() >= threshold
+
+
+def merge_candidates(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge duplicate records of one person into a single candidate
+
+    Scalar fields come from the richest source that has them; list fields
+    are unioned in order.
+
+    Args:
+        records: Candidate dictionaries believed to be the same person
+
+    Returns:
+        Merged candidate dictionary
+    """
+    if len(records) == 1:
+        return records[0]
+
+    ordered = sorted(records, key=lambda r: _SOURCE_PRIORITY.get(r.get('source'), 99))
+    merged: Dict[str, Any] = {}
+
+    for record in ordered:
+        for field, value in record.items():
+            if field in _LIST_FIELDS and isinstance(value, list):
+                existing = merged.setdefault(field, [])
+                for item in value:
+                    if item not in existing:
+                        existing.append(item)
+            elif merged.get(field) in (None, '', []) and value not in (None, '', []):
+                merged[field] = value
+
+    merged['source'] = ordered[0].get('source')
+    merged['sources'] = sorted({r.get('source') for r in records if r.get('source')},
+                               key=lambda s: _SOURCE_PRIORITY.get(s, 99))
+    merged['merged_records'] = len(records)
+    return merged
+
+
+def deduplicate_candidates(candidates: List[Dict[str, Any]], threshold: float = 0.88,
+                           max_block_size: int = 50) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Merge duplicate candidates across sources
+
+    Records sharing an exact key (email, phone, profile URL) are linked
+    directly. Records sharing a name+location block are compared with fuzzy
+    name matching. Only pairs within a block are compared, so the cost stays
+    close to linear in the number of candidates; oversized fuzzy blocks are
+    skipped rather than compared quadratically.
+
+    Args:
+        candidates: Candidates from all sources
+        threshold: Name similarity threshold for fuzzy blocks
+        max_block_size: Largest fuzzy block that is compared pairwise
+
+    Returns:
+        (deduplicated candidates in first-seen order, number of records merged away)
+    """
+    count = len(candidates)
+    parent = list(range(count))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i: int, j: int):
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            # Keep the earliest record as root so output order is stable
+            if root_j < root_i:
+                root_i, root_j = root_j, root_i
+            parent[root_j] = root_i
+
+    exact_index: Dict[str, int] = {}
+    fuzzy_blocks: Dict[str, List[int]] = defaultdict(list)
+
+    for idx, candidate in enumerate(candidates):
+        exact, fuzzy = blocking_keys(candidate)
+        for key in exact:
+            if key in exact_index:
+                union(exact_index[key], idx)
+            else:
+                exact_index[key] = idx
+        if fuzzy:
+            fuzzy_blocks[fuzzy].append(idx)
+
+    for members in fuzzy_blocks.values():
+        if len(members) < 2 or len(members) > max_block_size:
+            continue
+        for pos, i in enumerate(members):
+            for j in members[pos + 1:]:
+                if find(i) != find(j) and names_match(candidates[i], candidates[j], threshold):
+                    union(i, j)
+
+    groups: Dict[int, List[Dict[str, Any]]] = {}
+    for idx, candidate in enumerate(candidates):
+        groups.setdefault(find(idx), []).append(candidate)
+
+    deduplicated = []
+    for records in groups.values():
+        merged = merge_candidates(records)
+        merged.setdefault('candidate_id', candidate_key(merged))
+        deduplicated.append(merged)
+
+    return deduplicated, count - len(deduplicated)
@@ -26,6 +26,9 @@ class Settings(BaseSettings):
     # LinkedIn Credentials (optional)
     linkedin_email: Optional[str] = None
     linkedin_password: Optional[str] = None
+    linkedin_session_dir: Optional[str] = "./backend/data/sessions"  # Encrypted saved logins (unset disables)
+    linkedin_session_max_age_days: int = 30
+    session_secret: Optional[str] = None  # Encryption secret for saved sessions (generated if unset)
 
     # Indeed Configuration
     indeed_api_key: Optional[str] = None
@@ -33,19 +36,93 @@ class Settings(BaseSettings):
     # Application Settings
     app_host: str = "0.0.0.0"
     app_port: int = 8000
+    workers: int = 1  # API worker processes (run.py --workers overrides)
+    shared_state_path: str = "./backend/data/shared_state.db"  # SQLite file for state shared by workers (WORKERS > 1)
+    shared_state_interval: float = 5.0  # Seconds between agent status publishes to shared state
     debug_mode: bool = True
+    response_compression: bool = True  # gzip/brotli for large responses when the client accepts it
+    compression_min_size: int = 1024  # Smallest response body compressed, in bytes
+    stream_keepalive: float = 15  # Seconds between keep-alive comments on idle event streams
+
+    # Logging (records are queued and written by a background thread)
+    log_level: str = "INFO"
+    log_file: Optional[str] = "hr_recruitment.log"  # Written when started with run.py
+    log_json: bool = True  # JSON lines in the log file; the console stays plain text
+    log_sample_rate: int = 20  # Per-item messages kept per message key each second (0 keeps all)
+    log_queue_size: int = 10000  # Records buffered for the writer before new ones are dropped
+
+    # Admission Control (429/503 with Retry-After when saturated)
+    admission_control: bool = True
+    admission_interactive_reserve: int = 1  # Slots only interactive (small ranking) requests may use
+    admission_interactive_size: int = 25  # Rankings up to this many candidates are interactive
+    admission_per_client: int = 2  # Requests one client may have running or queued
+    admission_max_queue: int = 20  # Requests waiting for a slot before new ones get 503
+    admission_queue_timeout: float = 30  # Seconds a request waits for a slot
+    admission_retry_after: int = 5  # Base Retry-After hint in seconds
+    admission_max_pool_waiting: int = 2  # Bulk work waits while this many tasks queue for a browser
+    trusted_proxies: str = ""  # Comma-separated proxy addresses whose X-Client-ID header is trusted
+    llm_max_in_flight: int = 8  # Bulk work waits while this many LLM calls are in flight (0 ignores)
+
+    # Metrics (Prometheus text format at /metrics)
+    metrics_enabled: bool = True
+    loop_lag_interval: float = 0.5  # Seconds between event-loop lag samples
+    loop_watchdog: bool = False  # Log the stack of code blocking the event loop
+    loop_block_threshold: float = 0.25  # Seconds the event loop may stall before the watchdog reports it
+
+    # Tracing (per-run span trees at /api/runs/{run_id}/trace)
+    tracing_enabled: bool = True
+    trace_max_spans: int = 10000  # Spans kept per run; later spans are only counted
 
     # Database
     database_url: str = "sqlite:///./hr_recruitment.db"
+    persist_results: bool = True
 
     # Scraping Settings
     headless_browser: bool = True
-    scrape_delay: int = 2
+    scrape_delay: int = 2  # Minimum seconds between requests to the same domain
+    scrape_timeout: int = 15  # Maximum seconds to wait for page content
+    scrape_http_first: bool = True  # Try plain HTTP + HTML parsing before launching Chrome
+    lightweight_browser: bool = True  # Block images, fonts, media and trackers in Chrome
+    scrape_detail_concurrency: int = 4  # Job detail pages fetched at once
+    scrape_cache_ttl: int = 21600  # Seconds scrape results stay fresh (0 disables the cache)
+    scrape_cache_stale_ttl: int = 86400  # Extra seconds stale results are served while refreshing
+    scrape_record_dir: Optional[str] = None  # Save fetched pages as HTML snapshots here
+    scrape_replay_url: Optional[str] = None  # Load pages from a replay server instead of the live sites
     max_candidates_per_search: int = 50
+    search_max_pages: int = 5  # Result pages read per search until max candidates is reached
+    search_page_workers: int = 2  # Result pages loaded at once
+    driver_pool_size: int = 2
+
+    # Incremental Search (skip profiles returned by earlier runs of the same search)
+    incremental_search: bool = False
+    seen_profiles_path: str = "./backend/data/seen_profiles.db"
+    seen_profiles_max_age_days: Optional[int] = 90  # Known profiles resurface after this
+
+    # Candidate Deduplication
+    deduplicate_candidates: bool = True
+    dedup_threshold: float = 0.88
 
     # Agent Settings
-    max_concurrent_agents: int = 3
+    max_concurrent_agents: int = 3  # Searches, parses and rankings running at once (admission control)
     agent_timeout: int = 300
+    coalesce_ttl: int = 60
+    warmup_agents: str = ""  # Comma-separated agents to load in the background on startup ("all" for every agent)
+
+    # Result History
+    result_history_size: int = 100
+    result_history_max_bytes: int = 5_000_000
+    result_history_spill: bool = False
+
+    # Task Queue
+    task_queue: bool = False  # API enqueues parse/search/rank work for `python run.py worker` processes
+    task_visibility_timeout: int = 300  # Seconds a leased task stays hidden from other workers without a heartbeat
+    task_max_attempts: int = 3
+    task_retry_delay: float = 5.0  # Seconds before the first retry (doubles per attempt)
+    task_poll_interval: float = 0.5  # Seconds between queue polls (idle workers and waiting requests)
+    task_wait_timeout: int = 300  # Seconds a request waits for its task before answering 504
+    task_worker_concurrency: int = 1  # Tasks one worker process runs at once
+    task_max_queued: int = 200  # Queued tasks before new requests get 503
+    task_retention_hours: float = 24  # Finished tasks and their results are deleted after this (0 keeps them)
 
     class Config:
         env_file = ".env"
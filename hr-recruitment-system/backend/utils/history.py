@@ -0,0 +1,193 @@
+"""
+Bounded History
+Ring buffer for agent results and errors with an item and byte budget
+"""
+
+import gzip
+import json
+import threading
+import weakref
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+# One writer thread for every history: spill batches are written in the order they were handed off
+_spill_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="history-spill")
+# Histories with a spill file, by id (BoundedHistory compares by content, so it is not hashable)
+_spilling: "weakref.WeakValueDictionary[int, BoundedHistory]" = weakref.WeakValueDictionary()
+
+
+class BoundedHistory:
+    """
+    Keeps the most recent entries within an item count and approximate byte
+    budget; evicted entries are optionally spilled to compressed JSONL
+
+    Full spill batches are written on a background thread so append() never
+    does disk I/O; flush() (or flush_histories() at shutdown) writes the rest.
+    """
+
+    def __init__(self, max_items: int = 100, max_bytes: int = 5_000_000,
+                 spill_path: Optional[Union[str, Path]] = None, spill_batch: int = 20):
+        """
+        Initialize the history
+
+        Args:
+            max_items: Maximum number of entries kept in memory
+            max_bytes: Approximate maximum JSON size of entries kept in memory
+            spill_path: Optional .jsonl.gz file that receives evicted entries
+            spill_batch: Number of evicted entries buffered before writing
+        """
+        self.max_items = max(1, max_items)
+        self.max_bytes = max_bytes
+        self.spill_path = Path(spill_path) if spill_path else None
+        self.spill_batch = max(1, spill_batch)
+
+        self._entries: deque = deque()
+        self._sizes: deque = deque()
+        self._bytes = 0
+        self._pending_spill: List[str] = []
+        self._writes: List[Future] = []
+        self._lock = threading.Lock()
+
+        self.total_count = 0
+        self.evicted_count = 0
+        self.spilled_count = 0
+
+        if self.spill_path:
+            _spilling[id(self)] = self
+
+    def append(self, entry: Dict[str, Any]):
+        """
+        Add an entry, evicting the oldest ones if a budget is exceeded
+
+        Args:
+            entry: JSON-serializable dictionary
+        """
+        size = len(json.dumps(entry, default=str))
+
+        with self._lock:
+            self._entries.append(entry)
+            self._sizes.append(size)
+            self._bytes += size
+            self.total_count += 1
+
+            # Always keep the newest entry, even if it alone exceeds the budget
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_items or self._bytes > self.max_bytes
+            ):
+                evicted = self._entries.popleft()
+                self._bytes -= self._sizes.popleft()
+                self.evicted_count += 1
+                if self.spill_path:
+                    self._pending_spill.append(json.dumps(evicted, default=str))
+
+            if len(self._pending_spill) >= self.spill_batch:
+                batch = self._take_pending_locked()
+                self._writes = [w for w in self._writes if not w.done()]
+                self._writes.append(_spill_writer.submit(self._write, batch))
+
+    def flush(self):
+        """
+        Write any buffered evicted entries to the spill file (blocking)
+
+        Waits for batches already handed to the background writer first, so
+        the file keeps eviction order.
+        """
+        with self._lock:
+            writes, self._writes = self._writes, []
+            batch = self._take_pending_locked()
+        wait(writes)
+        if batch:
+            self._write(batch)
+
+    def _take_pending_locked(self) -> List[str]:
+        batch, self._pending_spill = self._pending_spill, []
+        self.spilled_count += len(batch)
+        return batch
+
+    def _write(self, batch: List[str]):
+        self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(self.spill_path, 'at', encoding='utf-8') as f:
+            f.write("\n".join(batch) + "\n")
+
+    def page(self, offset: int = 0, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Get a page of in-memory entries, newest first
+
+        Args:
+            offset: Number of newest entries to skip
+            limit: Maximum number of entries to return
+
+        Returns:
+            List of entries
+        """
+        with self._lock:
+            entries = list(reversed(self._entries))
+        return entries[offset:offset + limit]
+
+    def read_spilled(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over spilled entries, oldest first
+
+        Yields:
+            Entries previously evicted to disk
+        """
+        self.flush()
+        if not self.spill_path or not self.spill_path.exists():
+            return
+        with gzip.open(self.spill_path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate JSON size of the in-memory entries"""
+        return self._bytes
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get history counters
+
+        Returns:
+            Dictionary with retained, total, evicted and spilled counts
+        """
+        return {
+            'retained': len(self._entries),
+            'total': self.total_count,
+            'evicted': self.evicted_count,
+            'spilled': self.spilled_count + len(self._pending_spill),
+            'bytes': self._bytes
+        }
+
+    # List-like access so callers can keep treating history as a list
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        with self._lock:
+            entries = list(self._entries)
+        return iter(entries)
+
+    def __getitem__(self, index):
+        with self._lock:
+            if isinstance(index, slice):
+                return list(self._entries)[index]
+            return self._entries[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, BoundedHistory):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"BoundedHistory(retained={len(self._entries)}, total={self.total_count})"
+
+
+def flush_histories():
+    """Write the buffered evicted entries of every spilling history (call at shutdown; blocking)"""
+    for history in list(_spilling.values()):
+        history.flush()
@@ -0,0 +1,91 @@
+"""
+HTTP helpers
+Pooled requests session and fast HTML parsing for the HTTP-first scraping path
+"""
+
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup
+
+from .tracing import span
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_http_session(pool_size: int = 10) -> requests.Session:
+    """
+    Get the shared HTTP session
+
+    One session keeps keep-alive connections pooled per host across all
+    scraper agents.
+
+    Args:
+        pool_size: Connections kept per host
+
+    Returns:
+        Shared requests.Session
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=1)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update(DEFAULT_HEADERS)
+            _session = session
+        return _session
+
+
+def fetch_html(url: str, timeout: float = 10) -> Optional[str]:
+    """
+    Fetch a page over HTTP (blocking; call through asyncio.to_thread)
+
+    Args:
+        url: Page URL
+        timeout: Request timeout in seconds
+
+    Returns:
+        Response body, or None for non-200 responses and network errors
+    """
+    with span("GET", "http", url=url) as current:
+        try:
+            response = get_http_session().get(url, timeout=timeout)
+        except requests.RequestException:
+            return None
+        if current is not None:
+            current.set(status=response.status_code, bytes=len(response.content))
+        if response.status_code != 200:
+            return None
+        return response.text
+
+
+def make_soup(html: str) -> BeautifulSoup:
+    """
+    Parse HTML with the fastest available parser
+
+    Args:
+        html: HTML document
+
+    Returns:
+        BeautifulSoup tree
+    """
+    return BeautifulSoup(html, HTML_PARSER)
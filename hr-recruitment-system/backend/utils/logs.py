@@ -0,0 +1,210 @@
+"""
+Logging Pipeline
+Queue-based logging: callers only enqueue records, a background listener
+formats and writes them (console text, JSON lines to file), and per-item
+messages are rate-sampled by key
+"""
+
+import atexit
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional, Tuple
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Record attributes set by logging itself; anything else came from ``extra``
+_RESERVED = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime'}
+
+_listener: Optional[QueueListener] = None
+_lock = threading.Lock()
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per record with ``extra`` fields as top-level keys"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class TextFormatter(logging.Formatter):
+    """Plain-text format that shows the agent id after the logger name"""
+
+    def __init__(self):
+        super().__init__(TEXT_FORMAT)
+
+    def format(self, record: logging.LogRecord) -> str:
+        agent_id = getattr(record, 'agent_id', None)
+        if agent_id is not None:
+            record = logging.makeLogRecord(record.__dict__)
+            record.name = f"{record.name}[{agent_id}]"
+        return super().format(record)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Rate-limit records that carry a ``sample_key``
+
+    Per-item messages ("Scoring candidate 3/500") pass ``extra={'sample_key':
+    ...}``; at most ``rate`` records per key are kept each second. The next
+    record kept for a key reports how many were dropped in ``suppressed``.
+    Warnings and errors, and records without a key, always pass.
+    """
+
+    def __init__(self, rate: int = 20, window: float = 1.0):
+        """
+        Initialize the filter
+
+        Args:
+            rate: Records kept per key and window (0 disables sampling)
+            window: Window length in seconds
+        """
+        super().__init__()
+        self.rate = rate
+        self.window = window
+        # key -> (window start, kept in window, suppressed since last kept)
+        self._state: Dict[str, Tuple[float, int, int]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = getattr(record, 'sample_key', None)
+        if key is None or self.rate <= 0 or record.levelno >= logging.WARNING:
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            start, kept, suppressed = self._state.get(key, (now, 0, 0))
+            if now - start >= self.window:
+                start, kept = now, 0
+            if kept >= self.rate:
+                self._state[key] = (start, kept, suppressed + 1)
+                return False
+            self._state[key] = (start, kept + 1, 0)
+
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class ConsoleHandler(logging.StreamHandler):
+    """Stream handler that writes to the current sys.stdout (which may be swapped after setup)"""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    QueueHandler that never blocks the caller
+
+    Records are reduced to their rendered message (and traceback text) before
+    they are queued, so nothing mutable is shared with the writer thread.
+    When the queue is full the record is dropped and counted instead of
+    blocking the event loop.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def setup_logging(level: str = "INFO", log_file: Optional[str] = None, json_file: bool = True,
+                  json_console: bool = False, sample_rate: int = 20,
+                  queue_size: int = 10000) -> QueueListener:
+    """
+    Route all logging through a queue and a background writer
+
+    Adds a non-blocking queue handler to the root logger; the console and
+    file handlers run on the listener's thread. Calling it again returns the
+    running listener unchanged, so both run.py and the API module can call
+    it.
+
+    Args:
+        level: Root log level
+        log_file: Optional file for log records
+        json_file: Write JSON lines to the file (plain text otherwise)
+        json_console: Write JSON lines to stdout (plain text otherwise)
+        sample_rate: Records kept per sample_key per second (0 keeps all)
+        queue_size: Records buffered before new ones are dropped
+
+    Returns:
+        The running QueueListener
+    """
+    global _listener
+    with _lock:
+        if _listener is not None:
+            return _listener
+
+        console = ConsoleHandler()
+        console.setFormatter(JSONFormatter() if json_console else TextFormatter())
+        handlers: List[logging.Handler] = [console]
+        if log_file:
+            file_handler = logging.FileHandler(log_file, encoding='utf-8')
+            file_handler.setFormatter(JSONFormatter() if json_file else TextFormatter())
+            handlers.append(file_handler)
+
+        queue_handler = NonBlockingQueueHandler(queue.Queue(maxsize=queue_size))
+        queue_handler.addFilter(SamplingFilter(sample_rate))
+
+        root = logging.getLogger()
+        root.addHandler(queue_handler)
+        root.setLevel(level.upper())
+
+        _listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+        return _listener
+
+
+def shutdown_logging():
+    """Flush queued records and stop the background writer"""
+    global _listener
+    with _lock:
+        if _listener is None:
+            return
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            if isinstance(handler, NonBlockingQueueHandler):
+                root.removeHandler(handler)
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
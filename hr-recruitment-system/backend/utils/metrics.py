@@ -0,0 +1,405 @@
+"""
+Metrics
+In-process counters, gauges and histograms rendered in the Prometheus text
+exposition format, plus the metrics the agents, LLM calls and scrapers report
+"""
+
+import asyncio
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Sequence, Tuple
+
+from .tracing import span
+
+# Latency buckets in seconds, from fast cache hits to multi-minute workflows
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels_text(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+class _Metric:
+    """Base class: a named metric family with fixed label names"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> List[Tuple[str, LabelValues, Sequence[str], float]]:
+        """(sample name, label values, label names, value) tuples"""
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for sample_name, values, names, value in self.samples():
+            lines.append(f"{sample_name}{_labels_text(names, values)} {_format_value(value)}")
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        """Add to the count"""
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def set(self, value: float, **labels):
+        """Mirror a monotonic count kept elsewhere (used by collectors)"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def get(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        with self._lock:
+            return [(self.name, key, self.labelnames, value) for key, value in sorted(self._values.items())]
+
+
+class Gauge(_Metric):
+    """Value that goes up and down"""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    def get(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def clear(self):
+        """Drop every label set (for collectors whose label sets come and go)"""
+        with self._lock:
+            self._values.clear()
+
+    def samples(self):
+        with self._lock:
+            return [(self.name, key, self.labelnames, value) for key, value in sorted(self._values.items())]
+
+
+class Histogram(_Metric):
+    """Distribution of observations over cumulative buckets"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [bucket counts..., +Inf count], sum
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._series.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[index] += 1
+            total[0] += value
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        """Observe the duration of a block (also around awaits)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            series = self._series.get(self._key(labels))
+            return sum(series[0]) if series else 0
+
+    def samples(self):
+        names = self.labelnames + ('le',)
+        out = []
+        with self._lock:
+            for key, (counts, total) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + (math.inf,), counts):
+                    cumulative += count
+                    out.append((f"{self.name}_bucket", key + (_format_value(bound),), names, cumulative))
+                out.append((f"{self.name}_sum", key, self.labelnames, total[0]))
+                out.append((f"{self.name}_count", key, self.labelnames, cumulative))
+        return out
+
+
+class MetricsRegistry:
+    """
+    Set of metric families plus collectors refreshed on every scrape
+
+    Collectors read state owned by other components (pool sizes, cache
+    counters) into gauges right before rendering, so that state is not
+    duplicated on the hot path.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: Dict[str, Callable[[], None]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, name: str, collect: Callable[[], None]):
+        """
+        Register (or replace) a function run before each render
+
+        Args:
+            name: Collector name
+            collect: Function that sets gauges/counters from live state
+        """
+        with self._lock:
+            self._collectors[name] = collect
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text format (version 0.0.4)
+
+        Returns:
+            Exposition text
+        """
+        with self._lock:
+            collectors = list(self._collectors.values())
+            metrics = list(self._metrics.values())
+        for collect in collectors:
+            collect()
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# ---------------------------------------------------------------------------
+# Application metrics
+# ---------------------------------------------------------------------------
+
+AGENT_RUN_SECONDS = REGISTRY.histogram(
+    "hr_agent_run_seconds", "Agent run latency by agent type and outcome", ["agent", "status"]
+)
+STAGE_SECONDS = REGISTRY.histogram(
+    "hr_stage_seconds", "Orchestrator workflow stage latency", ["stage"]
+)
+
+LLM_REQUESTS = REGISTRY.counter(
+    "hr_llm_requests_total", "LLM API requests by model and outcome (ok, error, rate_limited)",
+    ["model", "outcome"]
+)
+LLM_TOKENS = REGISTRY.counter(
+    "hr_llm_tokens_total", "LLM tokens by model and direction (input, output)", ["model", "direction"]
+)
+LLM_SECONDS = REGISTRY.histogram(
+    "hr_llm_request_seconds", "LLM API request latency by model", ["model"]
+)
+LLM_IN_FLIGHT = REGISTRY.gauge(
+    "hr_llm_requests_in_flight", "LLM API requests awaiting a response"
+)
+
+PAGE_LOAD_SECONDS = REGISTRY.histogram(
+    "hr_scrape_page_load_seconds", "Scraper page load time by source and method (http, driver)",
+    ["source", "method"]
+)
+
+POOL_RESOURCES = REGISTRY.gauge(
+    "hr_pool_resources", "Shared pool resources by state (in_use, idle, max)", ["pool", "state"]
+)
+POOL_WAITING = REGISTRY.gauge(
+    "hr_pool_waiting", "Tasks waiting to lease from a shared pool", ["pool"]
+)
+POOL_CREATED = REGISTRY.counter(
+    "hr_pool_created_total", "Resources created by a shared pool", ["pool"]
+)
+
+EVENT_LOOP_LAG = REGISTRY.histogram(
+    "hr_event_loop_lag_seconds", "Delay of a scheduled event-loop wakeup past its due time",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+)
+EVENT_LOOP_LAG_LAST = REGISTRY.gauge(
+    "hr_event_loop_lag_last_seconds", "Most recent event-loop lag sample"
+)
+EVENT_LOOP_BLOCKS = REGISTRY.counter(
+    "hr_event_loop_blocks_total", "Event-loop stalls over the watchdog threshold by blocking code location",
+    ["location"]
+)
+EVENT_LOOP_BLOCK_SECONDS = REGISTRY.histogram(
+    "hr_event_loop_block_seconds", "Duration of event-loop stalls caught by the watchdog",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+)
+
+QUEUE_DEPTH = REGISTRY.gauge(
+    "hr_queue_depth", "Work waiting or in flight by queue", ["queue"]
+)
+COALESCER_REQUESTS = REGISTRY.counter(
+    "hr_coalescer_requests_total", "Workflow requests by coalescing result (hit, miss, coalesced)", ["result"]
+)
+ADMISSION_REJECTED = REGISTRY.counter(
+    "hr_admission_rejected_total", "Requests turned away by admission control by HTTP status", ["status"]
+)
+SCRAPE_CACHE_REQUESTS = REGISTRY.counter(
+    "hr_scrape_cache_requests_total", "Scrape cache lookups by result (hit, stale, miss)", ["result"]
+)
+ACTIVE_STREAMS = REGISTRY.gauge("hr_active_streams", "Open ranking event streams")
+
+
+def collect_pools():
+    """Copy shared pool utilisation into the pool gauges"""
+    from .pools import pool_stats
+
+    POOL_RESOURCES.clear()
+    POOL_WAITING.clear()
+    for name, stats in pool_stats().items():
+        POOL_RESOURCES.set(stats['in_use'], pool=name, state="in_use")
+        POOL_RESOURCES.set(stats['idle'], pool=name, state="idle")
+        POOL_RESOURCES.set(stats['max_size'], pool=name, state="max")
+        POOL_WAITING.set(stats['waiting'], pool=name)
+        POOL_CREATED.set(stats['created'], pool=name)
+
+
+REGISTRY.add_collector("pools", collect_pools)
+
+
+def _is_rate_limit(error: Exception) -> bool:
+    status = getattr(error, 'status_code', None) or getattr(getattr(error, 'response', None), 'status_code', None)
+    return status == 429 or type(error).__name__ == 'RateLimitError'
+
+
+def _usage_tokens(response: Any) -> Tuple[int, int]:
+    """Input and output tokens from an Anthropic or OpenAI response"""
+    usage = getattr(response, 'usage', None)
+    if usage is None:
+        return 0, 0
+    input_tokens = getattr(usage, 'input_tokens', None)
+    if not isinstance(input_tokens, int):
+        input_tokens = getattr(usage, 'prompt_tokens', None)
+    output_tokens = getattr(usage, 'output_tokens', None)
+    if not isinstance(output_tokens, int):
+        output_tokens = getattr(usage, 'completion_tokens', None)
+    return (input_tokens if isinstance(input_tokens, int) else 0,
+            output_tokens if isinstance(output_tokens, int) else 0)
+
+
+async def observe_llm(model: str, request: Awaitable[Any]) -> Any:
+    """
+    Await an LLM API request and record its latency, outcome and tokens
+
+    Args:
+        model: Model name
+        request: Pending SDK call (e.g. client.messages.create(...))
+
+    Returns:
+        The SDK response
+    """
+    with span("llm.request", "llm", model=model) as current:
+        start = time.perf_counter()
+        LLM_IN_FLIGHT.inc()
+        try:
+            response = await request
+        except Exception as e:
+            LLM_REQUESTS.inc(model=model, outcome="rate_limited" if _is_rate_limit(e) else "error")
+            raise
+        finally:
+            LLM_IN_FLIGHT.dec()
+            LLM_SECONDS.observe(time.perf_counter() - start, model=model)
+
+        LLM_REQUESTS.inc(model=model, outcome="ok")
+        input_tokens, output_tokens = _usage_tokens(response)
+        if input_tokens:
+            LLM_TOKENS.inc(input_tokens, model=model, direction="input")
+        if output_tokens:
+            LLM_TOKENS.inc(output_tokens, model=model, direction="output")
+        if current is not None:
+            current.set(input_tokens=input_tokens, output_tokens=output_tokens)
+        return response
+
+
+async def monitor_event_loop(interval: float = 0.5):
+    """
+    Sample event-loop lag until cancelled
+
+    Sleeps for ``interval`` and records how late the wakeup was; a blocked
+    loop shows up as lag roughly equal to the blocking time.
+
+    Args:
+        interval: Seconds between samples
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        due = loop.time() + interval
+        await asyncio.sleep(interval)
+        lag = max(loop.time() - due, 0.0)
+        EVENT_LOOP_LAG.observe(lag)
+        EVENT_LOOP_LAG_LAST.set(lag)
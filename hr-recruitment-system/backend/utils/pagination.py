@@ -0,0 +1,94 @@
+"""
+Paginated scraping
+Distributes result pages across a bounded pool of workers and stops as
+soon as enough items have been collected
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+async def paginate(fetch_page: Callable[[int], Awaitable[List[Any]]], max_items: int,
+                   max_pages: int = 5, workers: int = 2,
+                   key: Optional[Callable[[Any], Hashable]] = None,
+                   skipped: Optional[List[int]] = None,
+                   is_end: Optional[Callable[[int, List[Any]], bool]] = None) -> List[Any]:
+    """
+    Fetch numbered result pages until max_items are collected
+
+    Page 1 is fetched on its own. Further pages are only requested if it
+    came up short, and are then handed out in order to at most ``workers``
+    concurrent fetches (rate limiting is left to fetch_page). An empty page
+    marks the end of the results unless ``is_end`` decides otherwise (for
+    pages whose items were all filtered out). A failed page after the first is logged,
+    skipped and recorded in ``skipped``. A failure on page 1 is raised.
+
+    Args:
+        fetch_page: Coroutine function returning the items on a 1-based page
+        max_items: Stop once this many distinct items are collected
+        max_pages: Highest page number to request
+        workers: Maximum pages fetched at once
+        key: Identity used to drop items repeated across pages
+        skipped: Optional list that receives the numbers of failed pages
+        is_end: Called with a page number and its items; True when the page is
+                past the last page of results (defaults to an empty page)
+
+    Returns:
+        Items in page order, de-duplicated and capped at max_items
+    """
+    key = key or id
+    is_end = is_end or (lambda page, items: not items)
+    pages: Dict[int, List[Any]] = {1: await fetch_page(1)}
+    seen = {key(item) for item in pages[1]}
+
+    if is_end(1, pages[1]) or len(seen) >= max_items or max_pages <= 1:
+        return _merge(pages, max_items, key)
+
+    next_page = 2
+    last_page = max_pages
+    enough = asyncio.Event()
+
+    async def worker():
+        nonlocal next_page, last_page
+        while not enough.is_set() and next_page <= last_page:
+            page = next_page
+            next_page += 1
+
+            try:
+                items = await fetch_page(page)
+            except Exception as e:
+                logger.warning(f"Skipping result page {page}: {e}")
+                if skipped is not None:
+                    skipped.append(page)
+                continue
+
+            pages[page] = items
+            if is_end(page, items):
+                # Past the last page of results; stop handing out later pages
+                last_page = min(last_page, page - 1)
+                continue
+
+            seen.update(key(item) for item in items)
+            if len(seen) >= max_items:
+                enough.set()
+
+    await asyncio.gather(*(worker() for _ in range(max(1, min(workers, max_pages - 1)))))
+    return _merge(pages, max_items, key)
+
+
+def _merge(pages: Dict[int, List[Any]], max_items: int, key: Callable[[Any], Hashable]) -> List[Any]:
+    merged = []
+    seen = set()
+    for page in sorted(pages):
+        for item in pages[page]:
+            identity = key(item)
+            if identity in seen:
+                continue
+            seen.add(identity)
+            merged.append(item)
+            if len(merged) >= max_items:
+                return merged
+    return merged
@@ -0,0 +1,262 @@
+"""
+Shared resource pools
+Heavy resources (WebDrivers, LLM SDK clients) are created once and checked out
+by per-request agents instead of being owned by a single global agent
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class ResourcePool:
+    """
+    Bounded pool of reusable resources shared across concurrent requests
+    """
+
+    def __init__(self, name: str, factory: Callable[[], Any], max_size: int = 2,
+                 reset: Optional[Callable[[Any], None]] = None,
+                 dispose: Optional[Callable[[Any], None]] = None,
+                 poll_interval: float = 0.05):
+        """
+        Initialize the pool
+
+        Args:
+            name: Pool name (used in stats and error messages)
+            factory: Blocking callable that creates a new resource
+            max_size: Maximum number of resources alive at once
+            reset: Optional callable that cleans a resource before reuse
+            dispose: Optional callable that destroys a resource
+            poll_interval: Seconds between checks while waiting for a free slot
+        """
+        self.name = name
+        self.factory = factory
+        self.max_size = max(1, max_size)
+        self.reset = reset
+        self.dispose = dispose
+        self.poll_interval = poll_interval
+
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self._lock = threading.Lock()
+        self._idle: List[Any] = []
+        self._in_use = 0
+        self._waiting = 0
+        self._created = 0
+
+    async def acquire(self, timeout: Optional[float] = None) -> Any:
+        """
+        Check out a resource, creating one if no idle resource is available
+
+        Args:
+            timeout: Maximum seconds to wait for a free slot (None waits forever)
+
+        Returns:
+            The checked-out resource
+        """
+        if not self._slots.acquire(blocking=False):
+            # Poll instead of blocking a thread so cancellation never leaks a slot
+            deadline = time.monotonic() + timeout if timeout is not None else None
+            with self._lock:
+                self._waiting += 1
+            try:
+                while not self._slots.acquire(blocking=False):
+                    if deadline is not None and time.monotonic() >= deadline:
+                        raise TimeoutError(f"Timed out waiting for a resource from pool '{self.name}'")
+                    await asyncio.sleep(self.poll_interval)
+            finally:
+                with self._lock:
+                    self._waiting -= 1
+
+        with self._lock:
+            resource = self._idle.pop() if self._idle else None
+            self._in_use += 1
+
+        if resource is None:
+            try:
+                resource = await asyncio.to_thread(self.factory)
+            except BaseException:
+                with self._lock:
+                    self._in_use -= 1
+                self._slots.release()
+                raise
+            with self._lock:
+                self._created += 1
+
+        return resource
+
+    def available(self) -> int:
+        """
+        Number of resources that can be checked out right now without waiting
+
+        Returns:
+            Free slots (idle resources plus room to create new ones)
+        """
+        with self._lock:
+            return self.max_size - self._in_use
+
+    async def release(self, resource: Any, discard: bool = False):
+        """
+        Return a resource to the pool
+
+        Args:
+            resource: Resource previously returned by acquire()
+            discard: Destroy the resource instead of keeping it for reuse
+        """
+        try:
+            if not discard and self.reset:
+                try:
+                    await asyncio.to_thread(self.reset, resource)
+                except Exception:
+                    discard = True
+
+            if discard:
+                await self._dispose(resource)
+            else:
+                with self._lock:
+                    self._idle.append(resource)
+        finally:
+            with self._lock:
+                self._in_use -= 1
+            self._slots.release()
+
+    @asynccontextmanager
+    async def lease(self, timeout: Optional[float] = None):
+        """
+        Context manager that checks a resource out and always returns it
+
+        Args:
+            timeout: Maximum seconds to wait for a free slot
+        """
+        resource = await self.acquire(timeout=timeout)
+        discard = False
+        try:
+            yield resource
+        except BaseException:
+            discard = True
+            raise
+        finally:
+            await self.release(resource, discard=discard)
+
+    async def _dispose(self, resource: Any):
+        if self.dispose:
+            try:
+                await asyncio.to_thread(self.dispose, resource)
+            except Exception:
+                pass
+
+    async def close(self):
+        """
+        Dispose every idle resource
+        """
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for resource in idle:
+            await self._dispose(resource)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get current pool utilisation
+
+        Returns:
+            Dictionary with pool counters
+        """
+        with self._lock:
+            return {
+                'name': self.name,
+                'max_size': self.max_size,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'waiting': self._waiting,
+                'created': self._created
+            }
+
+
+# Process-wide registries
+_pools: Dict[str, ResourcePool] = {}
+_pools_lock = threading.Lock()
+_llm_clients: Dict[Tuple[str, Optional[str]], Any] = {}
+
+
+def get_pool(name: str, factory: Callable[[], Any], **kwargs) -> ResourcePool:
+    """
+    Get or create a named shared pool
+
+    The pool keeps the factory and settings of the call that created it, so
+    the name must cover everything the factory depends on, and the factory
+    must not close over a particular caller (see browser.get_driver_pool).
+
+    Args:
+        name: Pool name; agents with identical resource settings share a name
+        factory: Resource factory used if the pool does not exist yet
+        **kwargs: Extra ResourcePool arguments
+
+    Returns:
+        The shared ResourcePool
+    """
+    with _pools_lock:
+        pool = _pools.get(name)
+        if pool is None:
+            pool = ResourcePool(name, factory, **kwargs)
+            _pools[name] = pool
+        return pool
+
+
+def pool_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Get utilisation for every registered pool
+
+    Returns:
+        Mapping of pool name to stats
+    """
+    with _pools_lock:
+        pools = list(_pools.values())
+    return {pool.name: pool.stats() for pool in pools}
+
+
+async def close_pools():
+    """
+    Dispose idle resources in every registered pool
+    """
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        await pool.close()
+
+
+def get_llm_client(provider: str, api_key: Optional[str]) -> Any:
+    """
+    Get a shared async LLM client for a provider and key
+
+    SDK clients keep their own HTTP connection pool and are safe to use
+    from concurrent tasks, so one instance is shared by every agent.
+
+    Args:
+        provider: "claude" or "openai"
+        api_key: API key for the provider
+
+    Returns:
+        AsyncAnthropic or AsyncOpenAI client
+    """
+    key = (provider, api_key)
+    with _pools_lock:
+        client = _llm_clients.get(key)
+        if client is None:
+            if provider == 'claude':
+                from anthropic import AsyncAnthropic
+                client = AsyncAnthropic(api_key=api_key)
+            else:
+                from openai import AsyncOpenAI
+                client = AsyncOpenAI(api_key=api_key)
+            _llm_clients[key] = client
+        return client
+
+
+def clear_llm_clients():
+    """
+    Drop all cached LLM clients
+    """
+    with _pools_lock:
+        _llm_clients.clear()
@@ -0,0 +1,124 @@
+"""
+Per-domain rate limiter
+Spaces out requests to the same host instead of sleeping blindly, and
+backs off adaptively when a site starts throttling
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from .tracing import span
+
+
+class DomainRateLimiter:
+    """
+    Adaptive minimum-interval limiter keyed by host name
+    """
+
+    def __init__(self, min_interval: float = 2.0, max_interval: float = 60.0,
+                 backoff_factor: float = 2.0, recovery_factor: float = 0.8):
+        """
+        Initialize the limiter
+
+        Args:
+            min_interval: Politeness floor between requests to one domain (seconds)
+            max_interval: Upper bound for the interval after repeated back-offs
+            backoff_factor: Multiplier applied when a request is throttled or fails
+            recovery_factor: Multiplier applied after each successful request
+        """
+        self.min_interval = max(0.0, min_interval)
+        self.max_interval = max(self.min_interval, max_interval)
+        self.backoff_factor = backoff_factor
+        self.recovery_factor = recovery_factor
+
+        self._intervals: Dict[str, float] = {}
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def domain(url: str) -> str:
+        """Host name used as the limiter key"""
+        host = urlparse(url).netloc.lower()
+        return host[4:] if host.startswith("www.") else host
+
+    def interval(self, url: str) -> float:
+        """Current interval for a URL's domain"""
+        with self._lock:
+            return self._intervals.get(self.domain(url), self.min_interval)
+
+    def reserve(self, url: str) -> float:
+        """
+        Reserve the next request slot for a URL's domain
+
+        Args:
+            url: URL about to be requested
+
+        Returns:
+            Seconds the caller must wait before issuing the request
+        """
+        key = self.domain(url)
+        now = time.monotonic()
+        with self._lock:
+            interval = self._intervals.get(key, self.min_interval)
+            slot = max(now, self._next_slot.get(key, now))
+            self._next_slot[key] = slot + interval
+        return slot - now
+
+    async def wait(self, url: str):
+        """
+        Wait until a request to the URL's domain is allowed
+
+        Args:
+            url: URL about to be requested
+        """
+        delay = self.reserve(url)
+        if delay > 0:
+            with span("rate_limit_wait", "sleep", domain=self.domain(url), delay=round(delay, 3)):
+                await asyncio.sleep(delay)
+
+    def record(self, url: str, ok: bool = True):
+        """
+        Adapt the domain's interval to the outcome of a request
+
+        Args:
+            url: URL that was requested
+            ok: False if the site throttled, blocked or timed out
+        """
+        key = self.domain(url)
+        with self._lock:
+            current = self._intervals.get(key, self.min_interval)
+            if ok:
+                updated = max(self.min_interval, current * self.recovery_factor)
+            else:
+                updated = min(self.max_interval, max(current, 0.5) * self.backoff_factor)
+            self._intervals[key] = updated
+
+
+# Process-wide limiters keyed by politeness floor, shared by all agent instances
+_limiters: Dict[float, DomainRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(min_interval: float = 2.0, max_interval: Optional[float] = None) -> DomainRateLimiter:
+    """
+    Get the shared rate limiter for a politeness floor
+
+    Args:
+        min_interval: Minimum seconds between requests to one domain
+        max_interval: Optional cap on adaptive back-off
+
+    Returns:
+        Shared DomainRateLimiter
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(min_interval)
+        if limiter is None:
+            limiter = DomainRateLimiter(
+                min_interval=min_interval,
+                max_interval=max_interval if max_interval is not None else max(60.0, min_interval)
+            )
+            _limiters[min_interval] = limiter
+        return limiter
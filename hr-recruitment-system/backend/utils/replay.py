@@ -0,0 +1,211 @@
+"""
+Record and replay
+Saves pages fetched by the scrapers as HTML snapshots and serves them back
+from a local HTTP server, so scraping can be benchmarked and regression
+tested without touching the live sites
+"""
+
+import hashlib
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+
+def snapshot_key(url: str) -> str:
+    """
+    Normalize a URL for snapshot lookup
+
+    Scheme and fragment are dropped and query parameters are decoded and
+    sorted, so "%20" vs "+" encodings and parameter order do not matter.
+
+    Args:
+        url: Page URL
+
+    Returns:
+        Normalized "host/path?query" key
+    """
+    parts = urlsplit(url)
+    key = parts.netloc.lower() + (parts.path or "/")
+    query = sorted(parse_qsl(parts.query, keep_blank_values=True))
+    if query:
+        key += "?" + urlencode(query)
+    return key
+
+
+def rewrite_url(url: str, replay_url: str) -> str:
+    """
+    Point a live URL at the replay server
+
+    "https://www.indeed.com/jobs?q=x" becomes "<replay_url>/www.indeed.com/jobs?q=x".
+
+    Args:
+        url: Live page URL
+        replay_url: Base URL of a running ReplayServer
+
+    Returns:
+        URL on the replay server
+    """
+    parts = urlsplit(url)
+    rewritten = f"{replay_url.rstrip('/')}/{parts.netloc}{parts.path or '/'}"
+    return f"{rewritten}?{parts.query}" if parts.query else rewritten
+
+
+class SnapshotStore:
+    """
+    Directory of HTML snapshots with a URL index
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        """
+        Initialize the store
+
+        Args:
+            directory: Snapshot directory (created if missing)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.directory / "index.json"
+        self._lock = threading.Lock()
+        self._index: Dict[str, Dict[str, str]] = {}
+
+        if self.index_path.exists():
+            self._index = json.loads(self.index_path.read_text(encoding="utf-8"))
+
+    @staticmethod
+    def file_name(url: str) -> str:
+        """Readable, collision-free snapshot file name for a URL"""
+        parts = urlsplit(url)
+        slug = re.sub(r"[^a-zA-Z0-9]+", "-", f"{parts.netloc}{parts.path}").strip("-")[:60]
+        digest = hashlib.sha1(snapshot_key(url).encode("utf-8")).hexdigest()[:10]
+        return f"{slug}-{digest}.html"
+
+    def record(self, url: str, html: str) -> Path:
+        """
+        Save a page snapshot (overwrites an earlier snapshot of the same URL)
+
+        Args:
+            url: Live page URL
+            html: Page HTML
+
+        Returns:
+            Path of the snapshot file
+        """
+        name = self.file_name(url)
+        path = self.directory / name
+
+        with self._lock:
+            path.write_text(html, encoding="utf-8")
+            self._index[snapshot_key(url)] = {'url': url, 'file': name}
+            self.index_path.write_text(json.dumps(self._index, indent=2, sort_keys=True), encoding="utf-8")
+
+        return path
+
+    def load(self, url: str) -> Optional[str]:
+        """
+        Load the snapshot for a URL
+
+        Args:
+            url: Live page URL (any encoding of the same query)
+
+        Returns:
+            Snapshot HTML, or None if the URL was never recorded
+        """
+        entry = self._index.get(snapshot_key(url))
+        if entry is None:
+            return None
+        return (self.directory / entry['file']).read_text(encoding="utf-8")
+
+    def urls(self) -> List[str]:
+        """
+        List recorded URLs
+
+        Returns:
+            Original URLs of all snapshots
+        """
+        return [entry['url'] for entry in self._index.values()]
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+class ReplayServer:
+    """
+    Local HTTP server that answers with recorded snapshots
+
+    Requests are expected in the form produced by rewrite_url, i.e. the
+    live host name is the first path segment.
+    """
+
+    def __init__(self, store: Union[SnapshotStore, str, Path], host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize the server (call start() or use it as a context manager)
+
+        Args:
+            store: Snapshot store or snapshot directory
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+        """
+        self.store = store if isinstance(store, SnapshotStore) else SnapshotStore(store)
+        self.host = host
+        self.port = port
+        self.hits = 0
+        self.misses = 0
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to pass to rewrite_url (or the agents' replay_url setting)"""
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> str:
+        """
+        Start serving in a background thread
+
+        Returns:
+            Base URL of the server
+        """
+        replay = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                html = replay.store.load("https:/" + self.path)
+                if html is None:
+                    replay.misses += 1
+                    self.send_error(404, "No snapshot recorded for this URL")
+                    return
+
+                replay.hits += 1
+                body = html.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self):
+        """Stop the server"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "ReplayServer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,262 @@
+"""
+Fast API responses
+JSON encoding with orjson (standard library fallback), response-model
+defaults without re-validation, and gzip/brotli compression negotiation
+"""
+
+import gzip
+import json
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def _default(value: Any) -> Any:
+    """Encode types the JSON encoders do not handle natively"""
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, bytes):
+        return value.decode('utf-8', 'replace')
+    if hasattr(value, 'tolist'):
+        # numpy arrays and scalars
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize content to compact UTF-8 JSON
+
+    Args:
+        content: JSON-compatible data (plus models, dates, sets, paths)
+
+    Returns:
+        Encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson when it is installed
+
+    Returning an instance from an endpoint also bypasses FastAPI's
+    jsonable_encoder pass and response-model validation.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def with_defaults(model: Type[BaseModel], data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Fill a model's default fields into data without validating it
+
+    For results the server built itself, this gives the response model's
+    shape without walking every nested candidate through pydantic.
+
+    Args:
+        model: Response model class
+        data: Result dictionary
+
+    Returns:
+        New dictionary with missing optional fields set to their defaults
+    """
+    filled = {}
+    for name, field in model.model_fields.items():
+        if name not in data and not field.is_required():
+            filled[name] = field.get_default(call_default_factory=True)
+    filled.update(data)
+    return filled
+
+
+# ---------------------------------------------------------------------------
+# Compression
+# ---------------------------------------------------------------------------
+
+# Only compress text-like payloads; event streams are passed through so
+# events are not held back in a buffer
+COMPRESSIBLE_TYPES = ('application/json', 'text/html', 'text/plain', 'text/css', 'application/javascript',
+                      'text/javascript')
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """
+    Parse an Accept-Encoding header into codings and q-values
+
+    Args:
+        header: e.g. "gzip, br;q=0.9, *;q=0"
+
+    Returns:
+        Mapping of coding to q-value
+    """
+    codings = {}
+    for part in header.split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        codings[coding] = q
+    return codings
+
+
+def choose_encoding(header: str, available: Optional[List[str]] = None) -> Optional[str]:
+    """
+    Pick the best supported content coding for a request
+
+    Brotli is preferred over gzip at equal q-values; "br" is only offered
+    when the brotli package is installed.
+
+    Args:
+        header: Accept-Encoding header value
+        available: Codings to consider, in order of preference
+
+    Returns:
+        "br", "gzip" or None for identity
+    """
+    if available is None:
+        available = ['br', 'gzip'] if brotli is not None else ['gzip']
+    accepted = parse_accept_encoding(header or '')
+    wildcard = accepted.get('*', 0.0)
+
+    best, best_q = None, 0.0
+    for coding in available:
+        q = accepted.get(coding, wildcard)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def compress(body: bytes, encoding: str, gzip_level: int = 6, brotli_quality: int = 4) -> bytes:
+    """
+    Compress a response body
+
+    Args:
+        body: Raw body
+        encoding: "br" or "gzip"
+        gzip_level: gzip compression level
+        brotli_quality: Brotli quality (4-5 is a good speed/size trade-off for JSON)
+
+    Returns:
+        Compressed body
+    """
+    if encoding == 'br':
+        return brotli.compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing complete responses with brotli or gzip
+
+    Responses smaller than minimum_size, already encoded, not text-like, or
+    streamed in several chunks are sent unchanged.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        """
+        Initialize the middleware
+
+        Args:
+            app: ASGI application
+            minimum_size: Smallest body worth compressing, in bytes
+            gzip_level: gzip compression level
+            brotli_quality: Brotli quality
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get('headers') or [])
+        encoding = choose_encoding(headers.get(b'accept-encoding', b'').decode('latin-1'))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Dict[str, Any]] = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start, passthrough
+
+            if message['type'] == 'http.response.start':
+                start = message
+                return
+
+            if message['type'] != 'http.response.body' or passthrough or start is None:
+                await send(message)
+                return
+
+            body = message.get('body', b'')
+            if message.get('more_body', False) or not self._should_compress(start, body):
+                # Streamed or not worth compressing: release the held start message unchanged
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            compressed = compress(body, encoding, self.gzip_level, self.brotli_quality)
+            response_headers = [
+                (name, value) for name, value in start['headers']
+                if name.lower() not in (b'content-length', b'vary')
+            ]
+            vary = [value for name, value in start['headers'] if name.lower() == b'vary']
+            response_headers += [
+                (b'content-encoding', encoding.encode('ascii')),
+                (b'content-length', str(len(compressed)).encode('ascii')),
+                (b'vary', b', '.join(vary + [b'Accept-Encoding']))
+            ]
+            await send({**start, 'headers': response_headers})
+            await send({'type': 'http.response.body', 'body': compressed})
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _should_compress(self, start: Dict[str, Any], body: bytes) -> bool:
+        if len(body) < self.minimum_size:
+            return False
+        headers: List[Tuple[bytes, bytes]] = start.get('headers') or []
+        content_type = b''
+        for name, value in headers:
+            name = name.lower()
+            if name == b'content-encoding':
+                return False
+            if name == b'content-type':
+                content_type = value.lower()
+        return content_type.decode('latin-1').split(';')[0].strip() in COMPRESSIBLE_TYPES
@@ -0,0 +1,237 @@
+"""
+Scrape Cache
+TTL cache for scraper results with stale-while-revalidate refresh
+"""
+
+import asyncio
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .shared_state import SharedState, get_shared_state
+from .singleflight import request_key
+
+logger = logging.getLogger(__name__)
+
+
+def scrape_key(source: str, job_title: str, location: str = "",
+               keywords: Optional[List[str]] = None, **extra) -> str:
+    """
+    Build a cache key for a scrape
+
+    Args:
+        source: Source name (e.g. "linkedin", "indeed")
+        job_title: Search query
+        location: Location filter
+        keywords: Additional keywords (order and case do not matter)
+        **extra: Other parameters that change the results (e.g. authenticated)
+
+    Returns:
+        Hex digest identifying the scrape
+    """
+    return request_key(f"scrape:{source}", job_title=job_title, location=location or "",
+                       keywords=keywords or [], **extra)
+
+
+class ScrapeCache:
+    """
+    Caches scrape results per query
+
+    Entries younger than ``ttl`` are served as-is. Entries older than that
+    but younger than ``ttl + stale_ttl`` are still served immediately, and
+    a single background refresh replaces them. Older entries are refetched
+    before answering.
+
+    With a shared state store, fetched results are also written there and
+    local misses are looked up there first, so worker processes share
+    scrapes.
+    """
+
+    def __init__(self, ttl: float = 21600, stale_ttl: float = 86400, max_entries: int = 512,
+                 shared: Optional[SharedState] = None):
+        """
+        Initialize the cache
+
+        Args:
+            ttl: Seconds an entry is fresh (0 disables caching)
+            stale_ttl: Extra seconds a stale entry may be served while refreshing
+            max_entries: Maximum cached queries kept
+            shared: Optional store shared with other processes
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.shared = shared
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._fetching: Dict[str, asyncio.Future] = {}
+        self._refreshing: Dict[str, asyncio.Task] = {}
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    async def get_or_fetch(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Tuple[Any, str]:
+        """
+        Return a cached result or fetch a new one
+
+        Results are copied on the way in and out, so callers may mutate them.
+        Empty and failed fetches are not cached, so a blocked page does not
+        hide results for a whole TTL.
+
+        Args:
+            key: Cache key (see scrape_key)
+            fetch: Zero-argument coroutine function performing the scrape
+
+        Returns:
+            Tuple of (result, state) where state is "hit", "stale" or "miss"
+        """
+        if self.ttl <= 0:
+            return await fetch(), "miss"
+
+        entry = self._entries.get(key)
+        if entry is None and self.shared is not None:
+            entry = await self._load_shared(key)
+        if entry is not None:
+            age = time.monotonic() - entry[0]
+            if age < self.ttl:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return copy.deepcopy(entry[1]), "hit"
+            if age < self.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                self._entries.move_to_end(key)
+                self._schedule_refresh(key, fetch)
+                return copy.deepcopy(entry[1]), "stale"
+
+        self.misses += 1
+        return copy.deepcopy(await self._fetch(key, fetch)), "miss"
+
+    async def _fetch(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        # Concurrent misses for the same query share one scrape
+        task = self._fetching.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_share(key, fetch))
+            self._fetching[key] = task
+            task.add_done_callback(lambda t: self._store(key, t))
+        return await asyncio.shield(task)
+
+    async def _fetch_and_share(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        result = await fetch()
+        if result and self.shared is not None:
+            try:
+                await asyncio.to_thread(self.shared.put, 'scrape', key,
+                                        {'fetched_at': time.time(), 'result': result}, self.ttl + self.stale_ttl)
+            except Exception as e:
+                logger.warning(f"Failed to share scrape result: {e}")
+        return result
+
+    async def _load_shared(self, key: str) -> Optional[Tuple[float, Any]]:
+        # Entry written by another process; its age is carried over to the monotonic clock
+        stored = await asyncio.to_thread(self.shared.get, 'scrape', key)
+        if stored is None:
+            return None
+        entry = (time.monotonic() - max(time.time() - stored['fetched_at'], 0), stored['result'])
+        self._entries[key] = entry
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def _store(self, key: str, task: asyncio.Future):
+        if self._fetching.get(key) is task:
+            del self._fetching[key]
+
+        if task.cancelled() or task.exception() is not None:
+            return
+
+        result = task.result()
+        if not result:
+            return
+
+        self._entries[key] = (time.monotonic(), copy.deepcopy(result))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _schedule_refresh(self, key: str, fetch: Callable[[], Awaitable[Any]]):
+        if key in self._refreshing or key in self._fetching:
+            return
+
+        async def refresh():
+            try:
+                await self._fetch(key, fetch)
+            except Exception as e:
+                logger.warning(f"Background scrape refresh failed: {e}")
+            finally:
+                self._refreshing.pop(key, None)
+
+        self.refreshes += 1
+        self._refreshing[key] = asyncio.ensure_future(refresh())
+
+    def invalidate(self, key: str = None):
+        """
+        Drop one cached result, or all of them
+
+        Args:
+            key: Key to drop (None clears the whole cache)
+        """
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+        if self.shared is not None:
+            self.shared.delete('scrape', key)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters
+
+        Returns:
+            Dictionary with hit, stale, miss and refresh counts
+        """
+        return {
+            'ttl': self.ttl,
+            'stale_ttl': self.stale_ttl,
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses,
+            'refreshes': self.refreshes,
+            'refreshing': len(self._refreshing)
+        }
+
+
+# Process-wide caches keyed by (ttl, stale_ttl, shared_path), shared by all orchestrator contexts
+_caches: Dict[Tuple[float, float, Optional[str]], ScrapeCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_scrape_cache(ttl: float = 21600, stale_ttl: float = 86400,
+                     shared_path: Optional[str] = None) -> ScrapeCache:
+    """
+    Get the shared scrape cache for a TTL configuration
+
+    Args:
+        ttl: Seconds an entry is fresh
+        stale_ttl: Extra seconds a stale entry may be served while refreshing
+        shared_path: SQLite file shared with other worker processes (None keeps the cache in this process)
+
+    Returns:
+        Shared ScrapeCache
+    """
+    with _caches_lock:
+        cache = _caches.get((ttl, stale_ttl, shared_path))
+        if cache is None:
+            shared = get_shared_state(shared_path) if shared_path else None
+            cache = ScrapeCache(ttl=ttl, stale_ttl=stale_ttl, shared=shared)
+            _caches[(ttl, stale_ttl, shared_path)] = cache
+        return cache
+
+
+def clear_scrape_caches():
+    """Drop all shared scrape caches"""
+    with _caches_lock:
+        _caches.clear()
@@ -0,0 +1,199 @@
+"""
+Seen-Profile Store
+Persistent per-query set of profile URLs already returned by earlier
+searches, so recurring searches only surface new candidates
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from .singleflight import request_key
+
+
+def seen_key(job_title: str, location: str = "", keywords: Optional[List[str]] = None) -> str:
+    """
+    Identify a search for the seen-set
+
+    Args:
+        job_title: Search query
+        location: Location filter
+        keywords: Additional keywords (order and case do not matter)
+
+    Returns:
+        Hex digest identifying the search
+    """
+    return request_key("seen", job_title=job_title, location=location or "", keywords=keywords or [])
+
+
+def profile_hash(url: str) -> bytes:
+    """
+    Compact fingerprint of a profile URL
+
+    Query strings, fragments and trailing slashes are ignored so tracking
+    parameters do not make a known profile look new.
+
+    Args:
+        url: Profile or posting URL
+
+    Returns:
+        16-byte digest
+    """
+    canonical = url.split('#', 1)[0].split('?', 1)[0].rstrip('/').lower()
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).digest()
+
+
+class SeenStore:
+    """
+    On-disk hash set of (query, profile) pairs backed by SQLite
+    """
+
+    def __init__(self, path: str = ":memory:", max_age_days: Optional[float] = None):
+        """
+        Initialize the store
+
+        Args:
+            path: SQLite file (":memory:" keeps the set for this process only)
+            max_age_days: Forget profiles seen longer ago than this (None keeps them forever)
+        """
+        self.path = path
+        self.max_age = max_age_days * 86400 if max_age_days else None
+
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL" if path != ":memory:" else "PRAGMA journal_mode=MEMORY")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen ("
+            " query TEXT NOT NULL, profile BLOB NOT NULL, seen_at REAL NOT NULL,"
+            " PRIMARY KEY (query, profile)) WITHOUT ROWID"
+        )
+        self._conn.commit()
+
+    def unseen(self, query: str, urls: Iterable[str]) -> Set[str]:
+        """
+        Return the URLs not yet seen for a query
+
+        Args:
+            query: Search key (see seen_key)
+            urls: Candidate profile URLs
+
+        Returns:
+            Subset of urls that are new
+        """
+        by_hash: Dict[bytes, List[str]] = {}
+        for url in urls:
+            if url:
+                by_hash.setdefault(profile_hash(url), []).append(url)
+        if not by_hash:
+            return set()
+
+        hashes = list(by_hash)
+        known = set()
+        cutoff = time.time() - self.max_age if self.max_age else 0
+
+        with self._lock:
+            # Stay below SQLite's bound-parameter limit
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT profile FROM seen WHERE query = ? AND seen_at >= ? AND profile IN ({placeholders})",
+                    [query, cutoff, *chunk]
+                )
+                known.update(row[0] for row in rows)
+
+        return {url for digest, group in by_hash.items() if digest not in known for url in group}
+
+    def add(self, query: str, urls: Iterable[str]) -> int:
+        """
+        Mark URLs as seen for a query
+
+        Args:
+            query: Search key (see seen_key)
+            urls: Profile URLs
+
+        Returns:
+            Number of URLs written
+        """
+        now = time.time()
+        rows = [(query, profile_hash(url), now) for url in set(urls) if url]
+        if not rows:
+            return 0
+
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO seen (query, profile, seen_at) VALUES (?, ?, ?)", rows)
+            self._conn.commit()
+        return len(rows)
+
+    def count(self, query: Optional[str] = None) -> int:
+        """
+        Count seen profiles
+
+        Args:
+            query: Optional search key (None counts all searches)
+
+        Returns:
+            Number of stored profiles
+        """
+        with self._lock:
+            if query is None:
+                return self._conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+            return self._conn.execute("SELECT COUNT(*) FROM seen WHERE query = ?", (query,)).fetchone()[0]
+
+    def clear(self, query: Optional[str] = None):
+        """
+        Forget seen profiles
+
+        Args:
+            query: Optional search key (None clears every search)
+        """
+        with self._lock:
+            if query is None:
+                self._conn.execute("DELETE FROM seen")
+            else:
+                self._conn.execute("DELETE FROM seen WHERE query = ?", (query,))
+            self._conn.commit()
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+# Process-wide stores keyed by path, shared by all agent instances
+_stores: Dict[str, SeenStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_seen_store(path: Optional[str] = None, max_age_days: Optional[float] = None) -> SeenStore:
+    """
+    Get the shared seen-profile store for a path
+
+    Args:
+        path: SQLite file (None keeps the set in memory)
+        max_age_days: Forget profiles seen longer ago than this
+
+    Returns:
+        Shared SeenStore
+    """
+    path = path or ":memory:"
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = SeenStore(path, max_age_days=max_age_days)
+            _stores[path] = store
+        return store
+
+
+def close_seen_stores():
+    """Close and drop all shared seen-profile stores"""
+    with _stores_lock:
+        for store in _stores.values():
+            store.close()
+        _stores.clear()
@@ -0,0 +1,157 @@
+"""
+Browser Session Store
+Encrypted on-disk browser session state (cookies and local storage) per
+credential, so authenticated scrapers can skip the login form
+"""
+
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+
+class SessionStore:
+    """
+    Stores one encrypted session file per (site, account)
+
+    Each file is encrypted with a key derived from the store secret and the
+    account password, so a saved session is only restored for the same
+    credentials and is unreadable without the secret.
+    """
+
+    KDF_ITERATIONS = 200_000
+
+    def __init__(self, directory: str, secret: Optional[str] = None, max_age_days: Optional[float] = 30):
+        """
+        Initialize the store
+
+        Args:
+            directory: Directory for session files (created with owner-only permissions)
+            secret: Encryption secret; a random one is generated and kept in
+                    <directory>/.secret when omitted
+            max_age_days: Sessions older than this are discarded (None keeps them)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        os.chmod(self.directory, 0o700)
+
+        self.secret = (secret or self._load_or_create_secret()).encode('utf-8')
+        self.max_age = max_age_days * 86400 if max_age_days else None
+
+    def _load_or_create_secret(self) -> str:
+        secret_path = self.directory / ".secret"
+        if secret_path.exists():
+            return secret_path.read_text(encoding="utf-8").strip()
+
+        secret = base64.urlsafe_b64encode(os.urandom(32)).decode('ascii')
+        fd = os.open(secret_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(secret)
+        return secret
+
+    def _path(self, site: str, account: str) -> Path:
+        # Keyed hash, so file names do not reveal which accounts have sessions
+        digest = hashlib.sha256(self.secret + f"{site}:{account.strip().lower()}".encode('utf-8')).hexdigest()
+        return self.directory / f"{site}-{digest[:32]}.session"
+
+    def _fernet(self, site: str, account: str, password: str) -> Fernet:
+        kdf = PBKDF2HMAC(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=hashlib.sha256(f"{site}:{account.strip().lower()}".encode('utf-8')).digest(),
+            iterations=self.KDF_ITERATIONS
+        )
+        return Fernet(base64.urlsafe_b64encode(kdf.derive(self.secret + password.encode('utf-8'))))
+
+    def save(self, site: str, account: str, password: str, state: Dict[str, Any]):
+        """
+        Encrypt and save session state
+
+        Args:
+            site: Site name (e.g. "linkedin")
+            account: Account identifier (e.g. login email)
+            password: Account password (part of the encryption key)
+            state: Session state (see browser.export_session)
+        """
+        payload = json.dumps({'saved_at': time.time(), 'state': state}).encode('utf-8')
+        token = self._fernet(site, account, password).encrypt(payload)
+
+        path = self._path(site, account)
+        tmp_path = path.with_suffix(".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(token)
+        os.replace(tmp_path, path)
+
+    def load(self, site: str, account: str, password: str) -> Optional[Dict[str, Any]]:
+        """
+        Load and decrypt session state
+
+        Args:
+            site: Site name
+            account: Account identifier
+            password: Account password
+
+        Returns:
+            Session state, or None if missing, expired or not decryptable
+            with these credentials
+        """
+        path = self._path(site, account)
+        if not path.exists():
+            return None
+
+        try:
+            payload = json.loads(self._fernet(site, account, password).decrypt(path.read_bytes()))
+        except (InvalidToken, ValueError):
+            return None
+
+        if self.max_age and time.time() - payload.get('saved_at', 0) > self.max_age:
+            self.delete(site, account)
+            return None
+
+        return payload.get('state')
+
+    def delete(self, site: str, account: str):
+        """
+        Remove a saved session
+
+        Args:
+            site: Site name
+            account: Account identifier
+        """
+        self._path(site, account).unlink(missing_ok=True)
+
+
+# Process-wide stores keyed by configuration, shared by all agent instances
+_stores: Dict[Tuple[str, Optional[str], Optional[float]], SessionStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_session_store(directory: str, secret: Optional[str] = None,
+                      max_age_days: Optional[float] = 30) -> SessionStore:
+    """
+    Get the shared session store for a directory
+
+    Args:
+        directory: Directory for session files
+        secret: Encryption secret (generated when omitted)
+        max_age_days: Sessions older than this are discarded
+
+    Returns:
+        Shared SessionStore
+    """
+    key = (str(directory), secret, max_age_days)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = SessionStore(directory, secret=secret, max_age_days=max_age_days)
+            _stores[key] = store
+        return store
@@ -0,0 +1,165 @@
+"""
+Shared State
+Expiring key-value store in a SQLite file (WAL mode) so several API worker
+processes see each other's cached results and agent status
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class SharedState:
+    """
+    JSON values grouped by namespace, with optional expiry, in one SQLite file
+
+    Every worker process opens its own connection to the same file. WAL mode
+    lets readers proceed while another process writes; writers wait up to
+    ``timeout`` seconds for the lock.
+    """
+
+    def __init__(self, path: str = ":memory:", timeout: float = 5.0):
+        """
+        Initialize the store
+
+        Args:
+            path: SQLite file (":memory:" keeps the state for this process only)
+            timeout: Seconds a write waits for another process's lock
+        """
+        self.path = path
+
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL" if path != ":memory:" else "PRAGMA journal_mode=MEMORY")
+        # WAL is durable up to the last checkpoint; cached state does not need fsync per write
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS state ("
+            " namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, expires_at REAL,"
+            " PRIMARY KEY (namespace, key)) WITHOUT ROWID"
+        )
+        self._conn.commit()
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """
+        Read a value
+
+        Args:
+            namespace: Value group (e.g. "coalesce", "scrape")
+            key: Key within the namespace
+
+        Returns:
+            The stored value, or None if missing or expired
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM state WHERE namespace = ? AND key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (namespace, key, time.time())
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None):
+        """
+        Write a value (JSON-encoded; non-JSON types are stored as strings)
+
+        Args:
+            namespace: Value group
+            key: Key within the namespace
+            value: JSON-serializable value
+            ttl: Seconds until the value expires (None keeps it until deleted)
+        """
+        encoded = json.dumps(value, default=str, ensure_ascii=False)
+        expires_at = time.time() + ttl if ttl else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO state (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                (namespace, key, encoded, expires_at)
+            )
+            self._conn.commit()
+
+    def items(self, namespace: str) -> Dict[str, Any]:
+        """
+        Read every live value in a namespace
+
+        Args:
+            namespace: Value group
+
+        Returns:
+            Dictionary of key to value
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, value FROM state WHERE namespace = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (namespace, time.time())
+            ).fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def delete(self, namespace: str, key: Optional[str] = None):
+        """
+        Drop one value, or a whole namespace
+
+        Args:
+            namespace: Value group
+            key: Key to drop (None clears the namespace)
+        """
+        with self._lock:
+            if key is None:
+                self._conn.execute("DELETE FROM state WHERE namespace = ?", (namespace,))
+            else:
+                self._conn.execute("DELETE FROM state WHERE namespace = ? AND key = ?", (namespace, key))
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired values
+
+        Returns:
+            Number of values removed
+        """
+        with self._lock:
+            removed = self._conn.execute("DELETE FROM state WHERE expires_at <= ?", (time.time(),)).rowcount
+            self._conn.commit()
+        return removed
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+# Process-wide stores keyed by path, shared by every cache in the process
+_stores: Dict[str, SharedState] = {}
+_stores_lock = threading.Lock()
+
+
+def get_shared_state(path: Optional[str] = None) -> SharedState:
+    """
+    Get the shared state store for a path
+
+    Args:
+        path: SQLite file (None keeps the state in memory)
+
+    Returns:
+        Shared SharedState
+    """
+    path = path or ":memory:"
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = SharedState(path)
+            _stores[path] = store
+        return store
+
+
+def close_shared_states():
+    """Close and drop all shared state stores"""
+    with _stores_lock:
+        for store in _stores.values():
+            store.close()
+        _stores.clear()
@@ -0,0 +1,170 @@
+"""
+Single-flight request coalescing
+Concurrent identical calls share one execution, and successful results are
+kept in a short TTL cache
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .shared_state import SharedState
+
+logger = logging.getLogger(__name__)
+
+
+def request_key(kind: str, **params) -> str:
+    """
+    Build a coalescing key from normalized request parameters
+
+    Strings are trimmed and lowercased, lists of strings are sorted, and
+    any parameter containing "password" is dropped.
+
+    Args:
+        kind: Operation name (e.g. "search", "rank")
+        **params: Request parameters
+
+    Returns:
+        Hex digest identifying the request
+    """
+    def normalize(value):
+        if isinstance(value, str):
+            return ' '.join(value.split()).lower()
+        if isinstance(value, dict):
+            return {k: normalize(v) for k, v in value.items() if 'password' not in k}
+        if isinstance(value, (list, tuple)):
+            items = [normalize(v) for v in value]
+            if all(isinstance(v, str) for v in items):
+                return sorted(items)
+            return items
+        return value
+
+    normalized = {k: normalize(v) for k, v in params.items() if 'password' not in k}
+    encoded = json.dumps([kind, normalized], sort_keys=True, default=str)
+    return hashlib.sha1(encoded.encode('utf-8')).hexdigest()
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into one execution
+
+    With a shared state store, cached results are also written there, so
+    other worker processes serve them instead of repeating the work.
+    Coalescing of in-flight calls stays within one process.
+    """
+
+    def __init__(self, ttl: float = 0, max_entries: int = 256, shared: Optional["SharedState"] = None):
+        """
+        Initialize the coalescer
+
+        Args:
+            ttl: Seconds a successful result is served from cache (0 disables caching)
+            max_entries: Maximum cached results kept
+            shared: Optional store shared with other processes (results must be JSON-serializable)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.shared = shared
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return a cached result, join an in-flight call, or start a new one
+
+        The shared execution runs as its own task, so a caller that
+        disconnects does not cancel the work for the others. Results are
+        shared between callers and must be treated as read-only.
+
+        Args:
+            key: Coalescing key (see request_key)
+            fn: Zero-argument coroutine function performing the work
+
+        Returns:
+            Result of fn()
+        """
+        entry = self._cache.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self.hits += 1
+                self._cache.move_to_end(key)
+                return entry[1]
+            del self._cache[key]
+
+        if self.shared is not None and self.ttl > 0 and key not in self._inflight:
+            value = await asyncio.to_thread(self.shared.get, 'coalesce', key)
+            if value is not None:
+                self.hits += 1
+                return value
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(self._execute(key, fn))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._complete(key, t))
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    async def _execute(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        result = await fn()
+        if self.shared is not None and self.ttl > 0:
+            try:
+                await asyncio.to_thread(self.shared.put, 'coalesce', key, result, self.ttl)
+            except Exception as e:
+                logger.warning(f"Failed to share cached result: {e}")
+        return result
+
+    def _complete(self, key: str, task: asyncio.Future):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+        # Failures are never cached; reading exception() also marks it retrieved
+        if task.cancelled() or task.exception() is not None:
+            return
+
+        if self.ttl > 0:
+            self._cache[key] = (time.monotonic() + self.ttl, task.result())
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def invalidate(self, key: str = None):
+        """
+        Drop one cached result, or all of them
+
+        Args:
+            key: Key to drop (None clears the whole cache)
+        """
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+        if self.shared is not None:
+            self.shared.delete('coalesce', key)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get coalescing counters
+
+        Returns:
+            Dictionary with hits, misses, coalesced, in-flight and cached counts
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'coalesced': self.coalesced,
+            'in_flight': len(self._inflight),
+            'cached': len(self._cache)
+        }
@@ -0,0 +1,397 @@
+"""
+Run Storage
+Persists orchestration runs, candidates, parsed resumes and scores in the
+configured SQL database
+"""
+
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import create_engine, event, select, func, desc
+from sqlalchemy.exc import OperationalError
+
+from ..models.database import metadata, runs, candidates, parsed_resumes, scores, traces
+from .candidates import candidate_key
+
+
+def make_engine(database_url: str):
+    """
+    Create an engine for the configured database and create tables if needed
+
+    SQLite databases get foreign keys and, for files, WAL mode so several
+    processes (API workers, task workers) can read while one writes.
+
+    Args:
+        database_url: SQLAlchemy database URL
+
+    Returns:
+        SQLAlchemy Engine
+    """
+    engine = create_engine(database_url, future=True,
+                           json_serializer=lambda value: json.dumps(value, default=str))
+
+    if engine.dialect.name == "sqlite":
+        in_memory = engine.url.database in (None, "", ":memory:")
+
+        @event.listens_for(engine, "connect")
+        def _configure_sqlite(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA foreign_keys=ON")
+            if not in_memory:
+                cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.close()
+
+    try:
+        metadata.create_all(engine)
+    except OperationalError:
+        # Another process created the tables between the check and the CREATE
+        metadata.create_all(engine)
+    return engine
+
+
+class RunStore:
+    """
+    Storage layer for orchestration results
+    """
+
+    def __init__(self, database_url: str):
+        """
+        Initialize the store and create tables if needed
+
+        Args:
+            database_url: SQLAlchemy database URL
+        """
+        self.database_url = database_url
+        self.engine = make_engine(database_url)
+
+    def save_run(self, result: Dict[str, Any], request: Optional[Dict[str, Any]] = None,
+                 run_id: Optional[str] = None, trace: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Persist a workflow result in a single transaction
+
+        Candidate, resume and score rows are written with one executemany
+        per table.
+
+        Args:
+            result: Orchestrator result (mode, candidates, ranked_results, ...)
+                    or ranker result (ranked_candidates, shortlist, ...)
+            request: Request parameters that produced the result
+            run_id: Optional run id (generated if omitted)
+            trace: Optional span tree of the run (see utils.tracing)
+
+        Returns:
+            The run id
+        """
+        run_id = run_id or uuid.uuid4().hex
+        request = request or {}
+        now = datetime.now()
+
+        ranked = result.get('ranked_results') or {}
+        if 'ranked_candidates' in result:
+            ranked = result
+        ranked_candidates = ranked.get('ranked_candidates') or []
+        all_candidates = result.get('candidates') or ranked_candidates
+
+        job_title = request.get('job_title') or (request.get('job_requirements') or {}).get('title')
+
+        candidate_rows = []
+        resume_rows = []
+        for position, candidate in enumerate(all_candidates):
+            key = candidate_key(candidate)
+            candidate_rows.append({
+                'run_id': run_id,
+                'candidate_key': key,
+                'position': position,
+                'name': candidate.get('name'),
+                'email': candidate.get('email'),
+                'location': candidate.get('location'),
+                'source': candidate.get('source'),
+                'profile_url': candidate.get('profile_url') or candidate.get('url'),
+                'data': {k: v for k, v in candidate.items() if k not in ('scoring', 'overall_score', 'rank')}
+            })
+            if candidate.get('source') == 'uploaded_resume':
+                resume_rows.append({
+                    'run_id': run_id,
+                    'candidate_key': key,
+                    'source_file': candidate.get('source_file'),
+                    'name': candidate.get('name'),
+                    'email': candidate.get('email'),
+                    'data': candidate,
+                    'created_at': now
+                })
+
+        score_rows = [
+            {
+                'run_id': run_id,
+                'candidate_key': candidate_key(candidate),
+                'job_title': job_title,
+                'source': candidate.get('source'),
+                'overall_score': candidate.get('overall_score'),
+                'rank': candidate.get('rank'),
+                'match_quality': (candidate.get('scoring') or {}).get('match_quality'),
+                'scoring': candidate.get('scoring'),
+                'created_at': now
+            }
+            for candidate in ranked_candidates
+        ]
+
+        run_row = {
+            'id': run_id,
+            'mode': result.get('mode') or request.get('mode') or 'rank_only',
+            'job_title': job_title,
+            'location': request.get('location'),
+            'status': 'completed',
+            'total_candidates': len(all_candidates),
+            'top_score': ranked.get('top_score'),
+            'average_score': ranked.get('average_score'),
+            'sources': result.get('sources'),
+            'request': {k: v for k, v in request.items() if 'password' not in k},
+            'shortlist': ranked.get('shortlist'),
+            'created_at': now
+        }
+
+        with self.engine.begin() as conn:
+            conn.execute(runs.insert(), run_row)
+            if candidate_rows:
+                conn.execute(candidates.insert(), candidate_rows)
+            if resume_rows:
+                conn.execute(parsed_resumes.insert(), resume_rows)
+            if score_rows:
+                conn.execute(scores.insert(), score_rows)
+            if trace is not None:
+                conn.execute(traces.insert(), {
+                    'run_id': run_id,
+                    'span_count': trace.get('span_count', 0),
+                    'duration_ms': trace.get('duration_ms'),
+                    'data': trace,
+                    'created_at': now
+                })
+
+        return run_id
+
+    def list_runs(self, job_title: Optional[str] = None, limit: int = 20,
+                  offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        List stored runs, newest first
+
+        Args:
+            job_title: Optional exact job title filter
+            limit: Page size
+            offset: Rows to skip
+
+        Returns:
+            List of run rows (without candidates)
+        """
+        query = select(
+            runs.c.id, runs.c.mode, runs.c.job_title, runs.c.location, runs.c.status,
+            runs.c.total_candidates, runs.c.top_score, runs.c.average_score,
+            runs.c.sources, runs.c.created_at
+        ).order_by(desc(runs.c.created_at)).limit(limit).offset(offset)
+
+        if job_title:
+            query = query.where(runs.c.job_title == job_title)
+
+        with self.engine.connect() as conn:
+            return [self._row(row) for row in conn.execute(query)]
+
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a stored run in the same shape the orchestrator returns
+
+        Args:
+            run_id: Run id
+
+        Returns:
+            Run result dictionary, or None if not found
+        """
+        with self.engine.connect() as conn:
+            run = conn.execute(select(runs).where(runs.c.id == run_id)).first()
+            if run is None:
+                return None
+
+            candidate_rows = conn.execute(
+                select(candidates.c.candidate_key, candidates.c.data)
+                .where(candidates.c.run_id == run_id)
+                .order_by(candidates.c.position)
+            ).all()
+
+            score_rows = conn.execute(
+                select(scores.c.candidate_key, scores.c.overall_score, scores.c.rank, scores.c.scoring)
+                .where(scores.c.run_id == run_id)
+                .order_by(scores.c.rank)
+            ).all()
+
+        candidates_by_key = {row.candidate_key: row.data for row in candidate_rows}
+        ranked_candidates = [
+            {
+                **candidates_by_key.get(row.candidate_key, {}),
+                'scoring': row.scoring,
+                'overall_score': row.overall_score,
+                'rank': row.rank
+            }
+            for row in score_rows
+        ]
+
+        return self._result(run, [row.data for row in candidate_rows], ranked_candidates, len(ranked_candidates))
+
+    def get_run_page(self, run_id: str, after: int = 0,
+                     limit: int = 50) -> Optional[Tuple[Dict[str, Any], Optional[int]]]:
+        """
+        Load one page of a stored run's candidates
+
+        Pages are read with a keyset on the run's (run_id, rank) or
+        (run_id, position) index, so a page costs the same however deep it
+        is. Ranked runs page their ranked candidates (with just the candidate
+        records those need); unranked runs page the candidate list.
+
+        Args:
+            run_id: Run id
+            after: Page key: the last rank already returned, or the position
+                   of the first unranked candidate to return
+            limit: Page size
+
+        Returns:
+            Tuple of (run result holding only this page, key of the next page
+            or None on the last page), or None if the run is not found
+        """
+        with self.engine.connect() as conn:
+            run = conn.execute(select(runs).where(runs.c.id == run_id)).first()
+            if run is None:
+                return None
+
+            ranked_total = conn.execute(
+                select(func.count()).select_from(scores).where(scores.c.run_id == run_id)
+            ).scalar_one()
+
+            if ranked_total:
+                rows = conn.execute(
+                    select(scores.c.overall_score, scores.c.rank, scores.c.scoring, candidates.c.data)
+                    .select_from(scores)
+                    .join(candidates, (candidates.c.run_id == scores.c.run_id)
+                          & (candidates.c.candidate_key == scores.c.candidate_key), isouter=True)
+                    .where(scores.c.run_id == run_id, scores.c.rank > after)
+                    .order_by(scores.c.rank)
+                    .limit(limit + 1)
+                ).all()
+                window = rows[:limit]
+                next_key = window[-1].rank if len(rows) > limit else None
+                page_candidates = [row.data or {} for row in window]
+                ranked_candidates = [
+                    {**(row.data or {}), 'scoring': row.scoring, 'overall_score': row.overall_score, 'rank': row.rank}
+                    for row in window
+                ]
+            else:
+                rows = conn.execute(
+                    select(candidates.c.position, candidates.c.data)
+                    .where(candidates.c.run_id == run_id, candidates.c.position >= after)
+                    .order_by(candidates.c.position)
+                    .limit(limit + 1)
+                ).all()
+                next_key = rows[limit].position if len(rows) > limit else None
+                page_candidates = [row.data for row in rows[:limit]]
+                ranked_candidates = []
+
+        return self._result(run, page_candidates, ranked_candidates, ranked_total), next_key
+
+    def get_trace(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the span tree recorded for a run
+
+        Args:
+            run_id: Run id
+
+        Returns:
+            Trace dictionary, or None if the run was not traced
+        """
+        with self.engine.connect() as conn:
+            return conn.execute(select(traces.c.data).where(traces.c.run_id == run_id)).scalar_one_or_none()
+
+    def top_candidates(self, job_title: Optional[str] = None, source: Optional[str] = None,
+                       min_score: Optional[float] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Query scored candidates across runs, highest score first
+
+        Args:
+            job_title: Optional job title filter
+            source: Optional source filter (LinkedIn, Indeed, uploaded_resume)
+            min_score: Optional minimum overall score
+            limit: Maximum rows
+
+        Returns:
+            List of candidate dictionaries with score fields
+        """
+        query = (
+            select(
+                scores.c.run_id, scores.c.job_title, scores.c.source, scores.c.overall_score,
+                scores.c.rank, scores.c.match_quality, candidates.c.data, scores.c.created_at
+            )
+            .join(candidates, (candidates.c.run_id == scores.c.run_id)
+                  & (candidates.c.candidate_key == scores.c.candidate_key))
+            .order_by(desc(scores.c.overall_score))
+            .limit(limit)
+        )
+
+        if job_title:
+            query = query.where(scores.c.job_title == job_title)
+        if source:
+            query = query.where(scores.c.source == source)
+        if min_score is not None:
+            query = query.where(scores.c.overall_score >= min_score)
+
+        with self.engine.connect() as conn:
+            return [
+                {
+                    **row.data,
+                    'run_id': row.run_id,
+                    'job_title': row.job_title,
+                    'overall_score': row.overall_score,
+                    'rank': row.rank,
+                    'match_quality': row.match_quality,
+                    'scored_at': row.created_at.isoformat()
+                }
+                for row in conn.execute(query)
+            ]
+
+    def count_runs(self) -> int:
+        """
+        Count stored runs
+
+        Returns:
+            Number of runs
+        """
+        with self.engine.connect() as conn:
+            return conn.execute(select(func.count()).select_from(runs)).scalar_one()
+
+    @staticmethod
+    def _result(run, run_candidates: List[Dict[str, Any]], ranked_candidates: List[Dict[str, Any]],
+                ranked_total: int) -> Dict[str, Any]:
+        # Same shape the orchestrator returns
+        ranked_results = None
+        if ranked_candidates or ranked_total:
+            ranked_results = {
+                'total_candidates': ranked_total,
+                'ranked_candidates': ranked_candidates,
+                'top_score': run.top_score,
+                'average_score': run.average_score,
+            }
+            if run.shortlist is not None:
+                ranked_results['shortlist'] = run.shortlist
+
+        return {
+            'run_id': run.id,
+            'mode': run.mode,
+            'total_candidates_found': run.total_candidates,
+            'candidates': run_candidates,
+            'ranked_results': ranked_results,
+            'sources': run.sources or {},
+            'timestamp': run.created_at.isoformat()
+        }
+
+    @staticmethod
+    def _row(row) -> Dict[str, Any]:
+        data = dict(row._mapping)
+        if isinstance(data.get('created_at'), datetime):
+            data['created_at'] = data['created_at'].isoformat()
+        return data
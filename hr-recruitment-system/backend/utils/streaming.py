@@ -0,0 +1,96 @@
+"""
+Streaming helpers
+Server-Sent Events encoding and a running top-N for progressive results
+"""
+
+import heapq
+import itertools
+from typing import Any, Dict, List, Optional
+
+from .responses import dumps
+from .views import candidate_id
+
+
+def sse_event(event: str, data: Any, event_id: Optional[str] = None) -> bytes:
+    """
+    Encode one Server-Sent Event
+
+    Args:
+        event: Event name
+        data: JSON-serializable payload
+        event_id: Optional event id (lets clients resume with Last-Event-ID)
+
+    Returns:
+        Encoded event, terminated by a blank line
+    """
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    # dumps never emits raw newlines, so the payload fits on one data line
+    lines.append(f"data: {dumps(data).decode('utf-8')}")
+    return ("\n".join(lines) + "\n\n").encode('utf-8')
+
+
+# Comment line that keeps idle connections (and proxies) from timing out
+SSE_KEEPALIVE = b": keep-alive\n\n"
+
+
+class RunningTopN:
+    """
+    Highest-scoring candidates seen so far
+
+    Keeps a min-heap of size n, so each insert costs O(log n) regardless of
+    how many candidates have been scored.
+    """
+
+    def __init__(self, n: int = 10, score_field: str = 'overall_score'):
+        """
+        Initialize the tracker
+
+        Args:
+            n: Number of candidates to keep
+            score_field: Candidate field holding the score
+        """
+        self.n = max(n, 1)
+        self.score_field = score_field
+        self._heap: List[Any] = []
+        # Earlier candidates win ties, matching the ranker's stable sort
+        self._order = itertools.count()
+
+    def add(self, candidate: Dict[str, Any]) -> bool:
+        """
+        Offer a scored candidate
+
+        Args:
+            candidate: Scored candidate
+
+        Returns:
+            True if it entered the top N
+        """
+        entry = (candidate.get(self.score_field) or 0, -next(self._order), candidate)
+        if len(self._heap) < self.n:
+            heapq.heappush(self._heap, entry)
+            return True
+        if entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+            return True
+        return False
+
+    def items(self) -> List[Dict[str, Any]]:
+        """
+        Current top N as references, best first
+
+        Returns:
+            List of {candidate_id, name, overall_score, position}
+        """
+        ranked = sorted(self._heap, key=lambda entry: entry[:2], reverse=True)
+        return [
+            {
+                'candidate_id': candidate_id(candidate),
+                'name': candidate.get('name') or candidate.get('title'),
+                self.score_field: score,
+                'position': position
+            }
+            for position, (score, _, candidate) in enumerate(ranked, start=1)
+        ]
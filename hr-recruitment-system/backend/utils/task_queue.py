@@ -0,0 +1,347 @@
+"""
+Task Queue
+Durable work queue in the configured database: tasks are leased by worker
+processes, leases that are not renewed expire and the task runs again,
+failures are retried with backoff, and higher priorities run first
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import delete, func, select, update
+
+from ..models.database import tasks
+from .storage import make_engine
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+
+class TaskQueue:
+    """
+    Priority queue of tasks with leases
+
+    A worker leases the highest-priority ready task; the task stays invisible
+    to other workers for ``visibility_timeout`` seconds, which the worker
+    extends with heartbeat() while it runs. If the worker dies the lease
+    expires and the task is handed out again, so no work is lost. Every
+    lease counts as an attempt; a task that fails (or whose lease expires)
+    ``max_attempts`` times is marked failed.
+
+    Each state change is a single conditional UPDATE, so any number of
+    processes can share the queue.
+    """
+
+    def __init__(self, database_url: str, visibility_timeout: float = 300, max_attempts: int = 3,
+                 retry_delay: float = 5.0, retention: Optional[float] = None, prune_interval: float = 60):
+        """
+        Initialize the queue and create its table if needed
+
+        Args:
+            database_url: SQLAlchemy database URL
+            visibility_timeout: Seconds a lease lasts without a heartbeat
+            max_attempts: Default attempts per task before it is marked failed
+            retry_delay: Seconds before the first retry (doubles per attempt)
+            retention: Seconds finished tasks (and their results) are kept
+                       (None keeps them forever)
+            prune_interval: Seconds between prunes done while leasing
+        """
+        self.engine = make_engine(database_url)
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.retention = retention
+        self.prune_interval = prune_interval
+        self._last_prune = 0.0
+
+    def enqueue(self, kind: str, payload: Dict[str, Any], priority: int = 0, key: Optional[str] = None,
+                max_attempts: Optional[int] = None) -> str:
+        """
+        Add a task
+
+        Args:
+            kind: Task type workers dispatch on (e.g. "parse", "rank")
+            payload: JSON-serializable task arguments
+            priority: Higher runs first
+            key: Optional identity; while a task with the same key is queued
+                 or running, its id is returned instead of adding another
+            max_attempts: Attempts before the task is marked failed
+
+        Returns:
+            The task id
+        """
+        with self.engine.begin() as conn:
+            if key is not None:
+                existing = conn.execute(
+                    select(tasks.c.id).where(tasks.c.key == key, tasks.c.status.in_((QUEUED, LEASED)))
+                ).scalar()
+                if existing:
+                    return existing
+
+            task_id = uuid.uuid4().hex
+            conn.execute(tasks.insert().values(
+                id=task_id,
+                kind=kind,
+                key=key,
+                priority=priority,
+                status=QUEUED,
+                payload=payload,
+                attempts=0,
+                max_attempts=max_attempts or self.max_attempts,
+                available_at=time.time(),
+                created_at=datetime.now()
+            ))
+        return task_id
+
+    def lease(self, worker_id: str, kinds: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Take the next ready task
+
+        Args:
+            worker_id: Name of the leasing worker (for inspection)
+            kinds: Only lease these task kinds (None leases any)
+
+        Returns:
+            The task (with its ``lease_id``), or None when nothing is ready
+        """
+        now = time.time()
+        self._expire_leases(now)
+        if self.retention is not None and now - self._last_prune >= self.prune_interval:
+            self._last_prune = now
+            self.prune()
+
+        ready = select(tasks.c.id).where(tasks.c.status == QUEUED, tasks.c.available_at <= now)
+        if kinds:
+            ready = ready.where(tasks.c.kind.in_(kinds))
+        ready = ready.order_by(tasks.c.priority.desc(), tasks.c.available_at, tasks.c.created_at).limit(1)
+
+        lease_id = uuid.uuid4().hex
+        with self.engine.begin() as conn:
+            claimed = conn.execute(
+                update(tasks)
+                .where(tasks.c.id == ready.scalar_subquery(), tasks.c.status == QUEUED)
+                .values(status=LEASED, lease_id=lease_id, lease_owner=worker_id,
+                        lease_expires=now + self.visibility_timeout, attempts=tasks.c.attempts + 1)
+            ).rowcount
+            if not claimed:
+                return None
+            row = conn.execute(select(tasks).where(tasks.c.lease_id == lease_id)).mappings().first()
+        return dict(row)
+
+    def heartbeat(self, task: Dict[str, Any]) -> bool:
+        """
+        Extend a lease while the task runs
+
+        Returns:
+            False if the lease was lost (expired and taken by another worker)
+        """
+        return self._update_leased(task, lease_expires=time.time() + self.visibility_timeout)
+
+    def complete(self, task: Dict[str, Any], result: Any = None) -> bool:
+        """
+        Mark a leased task done and store its result
+
+        Returns:
+            False if the lease was lost; the result is discarded
+        """
+        return self._update_leased(task, status=DONE, result=result, error=None, lease_id=None,
+                                   lease_expires=None, finished_at=datetime.now())
+
+    def fail(self, task: Dict[str, Any], error: str) -> Optional[str]:
+        """
+        Record a failed attempt; the task is retried after a backoff or, out of
+        attempts, marked failed
+
+        Returns:
+            The task's new status, or None if the lease was lost
+        """
+        if task['attempts'] >= task['max_attempts']:
+            updated = self._update_leased(task, status=FAILED, error=error, lease_id=None,
+                                          lease_expires=None, finished_at=datetime.now())
+            return FAILED if updated else None
+
+        delay = self.retry_delay * 2 ** (task['attempts'] - 1)
+        updated = self._update_leased(task, status=QUEUED, error=error, lease_id=None, lease_expires=None,
+                                      available_at=time.time() + delay)
+        return QUEUED if updated else None
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a task
+
+        Returns:
+            The task row, or None if unknown
+        """
+        with self.engine.connect() as conn:
+            row = conn.execute(select(tasks).where(tasks.c.id == task_id)).mappings().first()
+        return dict(row) if row else None
+
+    def depth(self) -> int:
+        """
+        Count tasks waiting to be leased
+
+        Returns:
+            Number of queued tasks
+        """
+        with self.engine.connect() as conn:
+            return conn.execute(select(func.count()).select_from(tasks).where(tasks.c.status == QUEUED)).scalar_one()
+
+    def prune(self, older_than: Optional[float] = None) -> int:
+        """
+        Delete finished (done or failed) tasks
+
+        Args:
+            older_than: Seconds since the task finished (defaults to ``retention``)
+
+        Returns:
+            Number of tasks removed
+        """
+        older_than = self.retention if older_than is None else older_than
+        if older_than is None:
+            return 0
+        cutoff = datetime.now() - timedelta(seconds=older_than)
+        with self.engine.begin() as conn:
+            return conn.execute(
+                delete(tasks).where(tasks.c.status.in_((DONE, FAILED)), tasks.c.finished_at < cutoff)
+            ).rowcount
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Count tasks by status
+
+        Returns:
+            Dictionary of status to count (every status present)
+        """
+        counts = {QUEUED: 0, LEASED: 0, DONE: 0, FAILED: 0}
+        with self.engine.connect() as conn:
+            for status, count in conn.execute(select(tasks.c.status, func.count()).group_by(tasks.c.status)):
+                counts[status] = count
+        return counts
+
+    def _update_leased(self, task: Dict[str, Any], **values) -> bool:
+        with self.engine.begin() as conn:
+            return conn.execute(
+                update(tasks)
+                .where(tasks.c.id == task['id'], tasks.c.lease_id == task['lease_id'], tasks.c.status == LEASED)
+                .values(**values)
+            ).rowcount == 1
+
+    def _expire_leases(self, now: float):
+        # Leases of dead or stuck workers: out of attempts -> failed, else back in the queue
+        expired = (tasks.c.status == LEASED, tasks.c.lease_expires < now)
+        with self.engine.begin() as conn:
+            conn.execute(
+                update(tasks)
+                .where(*expired, tasks.c.attempts >= tasks.c.max_attempts)
+                .values(status=FAILED, error="Lease expired on the last attempt", lease_id=None,
+                        lease_expires=None, finished_at=datetime.now())
+            )
+            conn.execute(
+                update(tasks)
+                .where(*expired)
+                .values(status=QUEUED, lease_id=None, lease_expires=None, available_at=now)
+            )
+
+
+class TaskWorker:
+    """
+    Leases tasks from a TaskQueue and runs them with a handler
+
+    Runs up to ``concurrency`` tasks at once and renews each lease while its
+    handler runs. Handler exceptions are recorded as failed attempts. When
+    stopped, the worker takes no new tasks and finishes the ones it holds;
+    if the process is killed instead, their leases expire and other workers
+    pick them up.
+    """
+
+    def __init__(self, queue: TaskQueue, handler: Callable[[Dict[str, Any]], Awaitable[Any]],
+                 worker_id: Optional[str] = None, kinds: Optional[List[str]] = None,
+                 concurrency: int = 1, poll_interval: float = 0.5):
+        """
+        Initialize the worker
+
+        Args:
+            queue: Queue to consume
+            handler: Coroutine function called with the leased task; its return
+                     value is stored as the task result
+            worker_id: Name recorded on leases (defaults to host:pid)
+            kinds: Only run these task kinds (None runs any)
+            concurrency: Tasks run at once
+            poll_interval: Seconds between polls of an empty queue
+        """
+        self.queue = queue
+        self.handler = handler
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.kinds = kinds
+        self.concurrency = max(1, concurrency)
+        self.poll_interval = poll_interval
+
+        self.completed = 0
+        self.failed = 0
+
+    async def run(self, stop: Optional[asyncio.Event] = None):
+        """
+        Process tasks until ``stop`` is set
+
+        Args:
+            stop: Event that ends the loop (runs forever when omitted)
+        """
+        stop = stop or asyncio.Event()
+        running = set()
+        logger.info(f"Task worker {self.worker_id} started (kinds: {', '.join(self.kinds or ['all'])})")
+
+        while not stop.is_set():
+            if len(running) >= self.concurrency:
+                await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                continue
+
+            task = await asyncio.to_thread(self.queue.lease, self.worker_id, self.kinds)
+            if task is None:
+                try:
+                    await asyncio.wait_for(stop.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            job = asyncio.create_task(self.process(task))
+            running.add(job)
+            job.add_done_callback(running.discard)
+
+        if running:
+            logger.info(f"Task worker {self.worker_id} finishing {len(running)} running task(s)")
+            await asyncio.gather(*running, return_exceptions=True)
+
+    async def process(self, task: Dict[str, Any]):
+        """Run one leased task and record its outcome"""
+        heartbeat = asyncio.create_task(self._heartbeat(task))
+        try:
+            result = await self.handler(task)
+        except Exception as e:
+            status = await asyncio.to_thread(self.queue.fail, task, str(e) or type(e).__name__)
+            self.failed += 1
+            logger.warning(f"Task {task['id']} ({task['kind']}) attempt {task['attempts']} failed: {e}; now {status}")
+        else:
+            if await asyncio.to_thread(self.queue.complete, task, result):
+                self.completed += 1
+                logger.info(f"Task {task['id']} ({task['kind']}) done")
+            else:
+                logger.warning(f"Task {task['id']} finished after its lease was lost; result discarded")
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat(self, task: Dict[str, Any]):
+        while True:
+            await asyncio.sleep(self.queue.visibility_timeout / 3)
+            if not await asyncio.to_thread(self.queue.heartbeat, task):
+                logger.warning(f"Lost the lease on task {task['id']}")
+                return
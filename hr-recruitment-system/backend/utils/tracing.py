@@ -0,0 +1,319 @@
+"""
+Tracing
+Per-run span trees with parent/child links across agents, LLM calls,
+WebDriver commands, HTTP fetches and file extraction, exportable as JSON or
+the Chrome trace event format (chrome://tracing, Perfetto, speedscope)
+"""
+
+import asyncio
+import functools
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+_current_trace: ContextVar[Optional["Trace"]] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+class Span:
+    """One timed operation inside a trace"""
+
+    __slots__ = ('span_id', 'parent_id', 'name', 'category', 'attributes', 'start', 'end', 'lane', 'error')
+
+    def __init__(self, span_id: int, parent_id: Optional[int], name: str, category: str,
+                 attributes: Dict[str, Any], lane: str):
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.name = name
+        self.category = category
+        self.attributes = attributes
+        self.lane = lane
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.error: Optional[str] = None
+
+    def set(self, **attributes):
+        """Add attributes (e.g. token counts known only after the call)"""
+        self.attributes.update(attributes)
+
+    @property
+    def duration(self) -> float:
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+
+class Trace:
+    """
+    Spans recorded for one run
+
+    Spans are appended from any task or worker thread that inherited the
+    trace's context, so ``asyncio.gather`` children and ``asyncio.to_thread``
+    calls nest under the span that started them.
+    """
+
+    def __init__(self, name: str, max_spans: int = 10000):
+        """
+        Initialize the trace
+
+        Args:
+            name: Trace name (usually the run id)
+            max_spans: Spans kept; later spans are counted in ``dropped``
+        """
+        self.name = name
+        self.max_spans = max_spans
+        self.spans: List[Span] = []
+        self.dropped = 0
+        self.started_at = time.time()
+        self._origin = time.perf_counter()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def _open(self, name: str, category: str, attributes: Dict[str, Any]) -> Optional[Span]:
+        parent = _current_span.get()
+        with self._lock:
+            if len(self.spans) >= self.max_spans:
+                self.dropped += 1
+                return None
+            span = Span(next(self._ids), parent.span_id if parent else None, name, category, attributes, _lane())
+            self.spans.append(span)
+        return span
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Export the span tree
+
+        Returns:
+            {name, started_at, duration_ms, dropped, spans: [root spans with nested children]}
+        """
+        with self._lock:
+            spans = list(self.spans)
+
+        nodes = {}
+        roots = []
+        for span in spans:
+            node = {
+                'id': span.span_id,
+                'name': span.name,
+                'category': span.category,
+                'start_ms': round((span.start - self._origin) * 1000, 3),
+                'duration_ms': round(span.duration * 1000, 3),
+                'attributes': span.attributes,
+                'children': []
+            }
+            if span.error:
+                node['error'] = span.error
+            nodes[span.span_id] = node
+            parent = nodes.get(span.parent_id)
+            (parent['children'] if parent else roots).append(node)
+
+        end = max((s.start + s.duration for s in spans), default=self._origin)
+        return {
+            'name': self.name,
+            'started_at': self.started_at,
+            'duration_ms': round((end - self._origin) * 1000, 3),
+            'span_count': len(spans),
+            'dropped': self.dropped,
+            'spans': roots
+        }
+
+
+def span_totals(tree: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Sum span time per category in an exported trace
+
+    Nested spans of the same category are only counted once, so e.g.
+    "webdriver" is wall time spent in WebDriver commands.
+
+    Args:
+        tree: Result of Trace.to_dict()
+
+    Returns:
+        Milliseconds per category
+    """
+    totals: Dict[str, float] = {}
+
+    def walk(node, inside):
+        category = node['category']
+        if category not in inside:
+            totals[category] = totals.get(category, 0.0) + node['duration_ms']
+        for child in node['children']:
+            walk(child, inside | {category})
+
+    for root in tree.get('spans', []):
+        walk(root, frozenset())
+    return totals
+
+
+def to_chrome_trace(tree: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert an exported trace to the Chrome trace event format
+
+    Each span becomes a complete ("X") event. Concurrent tasks and worker
+    threads get their own track so overlapping spans stay readable.
+
+    Args:
+        tree: Result of Trace.to_dict()
+
+    Returns:
+        {"traceEvents": [...], "displayTimeUnit": "ms"}
+    """
+    events = []
+    lanes: Dict[str, int] = {}
+
+    def walk(node, lane):
+        lane = node['attributes'].get('lane', lane)
+        tid = lanes.setdefault(lane, len(lanes) + 1)
+        args = {k: v for k, v in node['attributes'].items() if k != 'lane'}
+        if 'error' in node:
+            args['error'] = node['error']
+        events.append({
+            'name': node['name'],
+            'cat': node['category'],
+            'ph': 'X',
+            'ts': round(node['start_ms'] * 1000, 1),
+            'dur': round(node['duration_ms'] * 1000, 1),
+            'pid': 1,
+            'tid': tid,
+            'args': args
+        })
+        for child in node['children']:
+            walk(child, lane)
+
+    for root in tree.get('spans', []):
+        walk(root, 'main')
+
+    events.extend(
+        {'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': tid, 'args': {'name': lane}}
+        for lane, tid in lanes.items()
+    )
+    return {'traceEvents': events, 'displayTimeUnit': 'ms', 'otherData': {'trace': tree.get('name')}}
+
+
+def _lane() -> str:
+    """Track name for the current task or thread"""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    if task is not None:
+        return task.get_name()
+    return threading.current_thread().name
+
+
+@contextmanager
+def start_trace(name: str, max_spans: int = 10000) -> Iterator[Trace]:
+    """
+    Record spans opened in this context into a new trace
+
+    Args:
+        name: Trace name
+        max_spans: Maximum spans kept
+
+    Yields:
+        The Trace
+    """
+    trace = Trace(name, max_spans=max_spans)
+    trace_token = _current_trace.set(trace)
+    span_token = _current_span.set(None)
+    try:
+        yield trace
+    finally:
+        _current_span.reset(span_token)
+        _current_trace.reset(trace_token)
+
+
+def current_trace() -> Optional[Trace]:
+    """The trace being recorded in this context, if any"""
+    return _current_trace.get()
+
+
+@contextmanager
+def span(name: str, category: str = "internal", **attributes) -> Iterator[Optional[Span]]:
+    """
+    Time a block as a child of the current span
+
+    Outside a trace this is a no-op yielding None, so instrumented code
+    pays almost nothing when tracing is off.
+
+    Args:
+        name: Span name
+        category: Grouping for totals and trace viewers (agent, llm, webdriver, http, file, sleep, ...)
+        **attributes: Extra span attributes
+
+    Yields:
+        The Span, or None when no trace is active
+    """
+    trace = _current_trace.get()
+    parent = _current_span.get()
+    current = trace._open(name, category, attributes) if trace is not None else None
+    if current is None:
+        yield None
+        return
+
+    token = _current_span.set(current)
+    # Record track changes so exporters can put concurrent work on its own row
+    if parent is None or current.lane != parent.lane:
+        current.attributes['lane'] = current.lane
+    try:
+        yield current
+    except BaseException as e:
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        current.end = time.perf_counter()
+        _current_span.reset(token)
+
+
+def traced(name: Optional[str] = None, category: str = "internal"):
+    """
+    Decorator wrapping a sync or async function in a span
+
+    Args:
+        name: Span name (defaults to the function's qualified name)
+        category: Span category
+    """
+    def decorate(fn: Callable) -> Callable:
+        span_name = name or fn.__qualname__
+
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with span(span_name, category):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(span_name, category):
+                return fn(*args, **kwargs)
+        return wrapper
+
+    return decorate
+
+
+def trace_driver(driver: Any) -> Any:
+    """
+    Record every WebDriver command sent by a driver as a span
+
+    Element lookups and property reads on the driver's elements go through
+    the same ``execute`` method, so they are covered too.
+
+    Args:
+        driver: Selenium WebDriver
+
+    Returns:
+        The same driver
+    """
+    original = driver.execute
+
+    def execute(command, params=None):
+        if _current_trace.get() is None:
+            return original(command, params)
+        attributes = {'url': params['url']} if params and 'url' in params else {}
+        with span(command, "webdriver", **attributes):
+            return original(command, params)
+
+    driver.execute = execute
+    return driver
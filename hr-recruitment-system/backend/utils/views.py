@@ -0,0 +1,243 @@
+"""
+Response views
+Compact, projected and paginated forms of workflow results for large
+candidate sets
+"""
+
+import base64
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .candidates import candidate_key
+
+# Per-ranking fields that stay on ranked references instead of candidate records
+SCORE_FIELDS = ('scoring', 'overall_score', 'rank')
+
+
+def parse_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """
+    Parse a comma-separated ``fields=`` parameter
+
+    Args:
+        fields: e.g. "name,skills,profile_url" (None or empty keeps every field)
+
+    Returns:
+        Field names, or None for no projection
+    """
+    if not fields:
+        return None
+    names = tuple(dict.fromkeys(name.strip() for name in fields.split(',') if name.strip()))
+    return names or None
+
+
+def candidate_id(candidate: Dict[str, Any]) -> str:
+    """Id assigned during deduplication, or the candidate's stable key"""
+    return candidate.get('candidate_id') or candidate_key(candidate)
+
+
+def project(candidate: Dict[str, Any], fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    Copy a candidate record without ranking fields, limited to ``fields``
+
+    Args:
+        candidate: Candidate dictionary
+        fields: Fields to keep (candidate_id is always kept)
+
+    Returns:
+        New candidate dictionary
+    """
+    record = {'candidate_id': candidate_id(candidate)}
+    if fields is None:
+        record.update((k, v) for k, v in candidate.items() if k not in SCORE_FIELDS and k != 'candidate_id')
+    else:
+        record.update((k, candidate[k]) for k in fields if k in candidate and k not in SCORE_FIELDS)
+    return record
+
+
+def ranked_ref(candidate: Dict[str, Any], fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    Reference to a ranked candidate with its per-ranking fields
+
+    Scoring details are kept unless a projection leaves them out.
+    """
+    ref = {
+        'candidate_id': candidate_id(candidate),
+        'rank': candidate.get('rank'),
+        'overall_score': candidate.get('overall_score')
+    }
+    if candidate.get('scoring') is not None and (fields is None or 'scoring' in fields):
+        ref['scoring'] = candidate['scoring']
+    return ref
+
+
+def compact_result(data: Dict[str, Any], fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    Build the compact view of a workflow result
+
+    Every candidate appears once in ``candidates``, keyed by candidate_id.
+    ``ranked_results.ranked_candidates`` and the shortlist hold references
+    (candidate_id, rank, score) into it instead of full copies. The input is
+    not modified, so cached results can be shared.
+
+    Args:
+        data: Orchestrator result (candidates, ranked_results, ...)
+        fields: Candidate fields to include (None includes all)
+
+    Returns:
+        Compact result with ``view`` set to "compact"
+    """
+    fields = tuple(fields) if fields is not None else None
+    ranked = (data.get('ranked_results') or {}).get('ranked_candidates') or []
+
+    records: Dict[str, Dict[str, Any]] = {}
+    for candidate in list(data.get('candidates') or []) + list(ranked):
+        cid = candidate_id(candidate)
+        if cid not in records:
+            records[cid] = project(candidate, fields)
+
+    compact = {k: v for k, v in data.items() if k not in ('candidates', 'ranked_results')}
+    compact['view'] = 'compact'
+    compact['candidates'] = list(records.values())
+    compact['ranked_results'] = None
+
+    if data.get('ranked_results'):
+        ranked_results = {k: v for k, v in data['ranked_results'].items() if k not in ('ranked_candidates', 'shortlist')}
+        ranked_results['ranked_candidates'] = [ranked_ref(c, fields) for c in ranked]
+
+        shortlist = data['ranked_results'].get('shortlist')
+        if shortlist is not None:
+            ranked_results['shortlist'] = {
+                **{k: v for k, v in shortlist.items() if k != 'shortlist'},
+                'shortlist': [
+                    {'candidate_id': candidate_id(c), 'rank': c.get('rank')}
+                    for c in shortlist.get('shortlist') or []
+                ]
+            }
+        compact['ranked_results'] = ranked_results
+
+    return compact
+
+
+# ---------------------------------------------------------------------------
+# Cursor pagination
+# ---------------------------------------------------------------------------
+
+def encode_cursor(run_id: Optional[str], offset: int) -> str:
+    """Opaque cursor for the page starting at ``offset`` of a run"""
+    raw = json.dumps({'r': run_id, 'o': offset}, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str, run_id: Optional[str] = None) -> int:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Args:
+        cursor: Cursor string
+        run_id: Run the cursor must belong to
+
+    Returns:
+        Offset of the page
+
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another run
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        offset = int(payload['o'])
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if offset < 0 or (run_id is not None and payload.get('r') != run_id):
+        raise ValueError("Cursor does not belong to this run")
+    return offset
+
+
+def page_result(compact: Dict[str, Any], limit: int, cursor: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Slice a compact result to one page
+
+    Ranked results are paged in rank order and carry only the candidate
+    records their references need; unranked results page the candidate
+    list. ``next_cursor`` is None on the last page.
+
+    Args:
+        compact: Result from compact_result
+        limit: Page size
+        cursor: Cursor from a previous page (None for the first page)
+
+    Returns:
+        Paged compact result
+
+    Raises:
+        ValueError: If the cursor is invalid for this result
+    """
+    run_id = compact.get('run_id')
+    offset = decode_cursor(cursor, run_id) if cursor else 0
+    end = offset + max(limit, 1)
+
+    page = dict(compact)
+    ranked_results = compact.get('ranked_results')
+
+    if ranked_results and ranked_results.get('ranked_candidates'):
+        refs = ranked_results['ranked_candidates']
+        window = refs[offset:end]
+        wanted = {ref['candidate_id'] for ref in window}
+        page['candidates'] = [c for c in compact['candidates'] if c['candidate_id'] in wanted]
+        page['ranked_results'] = {**ranked_results, 'ranked_candidates': window}
+        total = len(refs)
+    else:
+        page['candidates'] = compact['candidates'][offset:end]
+        total = len(compact['candidates'])
+
+    page['next_cursor'] = encode_cursor(run_id, end) if end < total else None
+    return page
+
+
+def shape_result(data: Dict[str, Any], view: str = "full", fields: Optional[str] = None,
+                 limit: Optional[int] = None, cursor: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Apply the response options of a workflow endpoint
+
+    A projection, page size or cursor implies the compact view.
+
+    Args:
+        data: Orchestrator result
+        view: "full" (default, unchanged result) or "compact"
+        fields: Comma-separated candidate fields
+        limit: Page size
+        cursor: Cursor from a previous page
+
+    Returns:
+        Result in the requested shape
+
+    Raises:
+        ValueError: If view or cursor is invalid
+    """
+    if view not in ('full', 'compact'):
+        raise ValueError(f"Unknown view: {view}")
+
+    projection = parse_fields(fields)
+    if view == 'full' and projection is None and limit is None and cursor is None:
+        return data
+
+    compact = compact_result(data, projection)
+    if limit is None and cursor is None:
+        return compact
+    return page_result(compact, limit or 50, cursor)
+
+
+def resolve_ranked(compact: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Join ranked references with their candidate records
+
+    Args:
+        compact: Compact (possibly paged) result
+
+    Returns:
+        Ranked candidates in the full-view shape
+    """
+    records = {c['candidate_id']: c for c in compact.get('candidates') or []}
+    refs = (compact.get('ranked_results') or {}).get('ranked_candidates') or []
+    return [{**records.get(ref['candidate_id'], {}), **ref} for ref in refs]
@@ -0,0 +1,155 @@
+"""
+Event-Loop Watchdog
+Catches code that blocks the asyncio event loop and records where it was
+blocked, with the loop thread's stack, in the logs and metrics
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+from .metrics import EVENT_LOOP_BLOCKS, EVENT_LOOP_BLOCK_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# Frames under this directory are preferred when naming the blocking location
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+_THIS_FILE = str(Path(__file__).resolve())
+
+
+def blocking_location(frames: List[traceback.FrameSummary], root: Path = PROJECT_ROOT) -> str:
+    """
+    Name the innermost project frame of a stack
+
+    A stall inside pdfplumber or Selenium is reported at the project code
+    that called it, which is the line to move off the loop.
+
+    Args:
+        frames: Stack, outermost first
+        root: Project directory
+
+    Returns:
+        "relative/path.py:function", or the innermost frame if no frame is in the project
+    """
+    root_prefix = str(root) + '/'
+    for frame in reversed(frames):
+        filename = frame.filename
+        if filename.startswith(root_prefix) and 'site-packages' not in filename and filename != _THIS_FILE:
+            return f"{filename[len(root_prefix):]}:{frame.name}"
+    if not frames:
+        return "unknown"
+    return f"{Path(frames[-1].filename).name}:{frames[-1].name}"
+
+
+class LoopWatchdog:
+    """
+    Detects event-loop stalls from a background thread
+
+    A heartbeat task on the loop stamps the time every ``interval``; a
+    watcher thread checks the stamp, and once the heartbeat is overdue by
+    ``threshold`` it captures the loop thread's current stack, which is the
+    code holding the loop. The stall is logged with that stack immediately
+    (so a loop that never recovers is still diagnosed) and counted in
+    metrics with its full duration once the loop runs again.
+    """
+
+    def __init__(self, threshold: float = 0.25, interval: Optional[float] = None, history_size: int = 50):
+        """
+        Initialize the watchdog
+
+        Args:
+            threshold: Seconds the loop may stall before it is reported
+            interval: Seconds between heartbeats (defaults to threshold / 2)
+            history_size: Recent stalls kept in ``blocks``
+        """
+        self.threshold = threshold
+        self.interval = interval or threshold / 2
+        self.blocks: Deque[Dict[str, Any]] = deque(maxlen=history_size)
+
+        self._beat = time.monotonic()
+        self._pending: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._loop_thread: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """Start watching the running event loop"""
+        if self.running:
+            return
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.get_running_loop().create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    async def stop(self):
+        """Stop the heartbeat and watcher thread"""
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._thread is not None:
+            await asyncio.to_thread(self._thread.join, self.interval * 2)
+            self._thread = None
+
+    async def _heartbeat(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            with self._lock:
+                self._beat = now
+                block, self._pending = self._pending, None
+            if block is not None:
+                self._finish(block, now)
+
+    def _watch(self):
+        while not self._stop.wait(self.interval / 2):
+            with self._lock:
+                beat = self._beat
+                due = beat + self.interval
+                if self._pending is not None or time.monotonic() - due < self.threshold:
+                    continue
+
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None:
+                continue
+            frames = traceback.extract_stack(frame)
+            del frame
+
+            block = {
+                'location': blocking_location(frames),
+                'stack': ''.join(traceback.format_list(frames)),
+                'started': due
+            }
+            with self._lock:
+                if self._beat != beat:
+                    # The loop recovered while the stack was being captured
+                    continue
+                self._pending = block
+
+            logger.warning(
+                f"Event loop blocked for over {self.threshold:.2f}s at {block['location']}\n{block['stack']}"
+            )
+
+    def _finish(self, block: Dict[str, Any], now: float):
+        duration = now - block.pop('started')
+        block['duration'] = round(duration, 3)
+        block['timestamp'] = time.time()
+        self.blocks.append(block)
+        EVENT_LOOP_BLOCKS.inc(location=block['location'])
+        EVENT_LOOP_BLOCK_SECONDS.observe(duration)
+        logger.info(f"Event loop resumed after {duration:.2f}s blocked at {block['location']}")
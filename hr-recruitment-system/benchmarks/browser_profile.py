@@ -0,0 +1,176 @@
+"""
+Browser profile benchmark
+Compares the default and lightweight Chrome profiles on saved pages
+
+Each saved page is served from a local HTTP server with page weight added
+back in (profile photos, logos, a web font, a video and a tracker script),
+since saved copies no longer reference the original CDN assets. Pass
+--no-assets to load the pages exactly as saved.
+
+Usage:
+    python -m benchmarks.browser_profile [--pages DIR] [--repeat N] [--no-assets]
+"""
+
+import argparse
+import functools
+import os
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from backend.utils.browser import create_chrome_driver, wait_for_document_ready
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+DEFAULT_PAGES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+
+ASSET_MARKUP = """
+<link rel="stylesheet" href="/assets/font.css">
+{images}
+<video src="/assets/intro.mp4" autoplay muted></video>
+<script src="/assets/googletagmanager.com-gtm.js"></script>
+"""
+
+
+def build_site(pages_dir: Path, site_dir: Path, with_assets: bool = True, images: int = 25) -> list:
+    """
+    Copy saved pages into a servable directory
+
+    Args:
+        pages_dir: Directory of saved .html pages
+        site_dir: Output directory
+        with_assets: Inject heavy local assets into every page
+        images: Number of images injected per page
+
+    Returns:
+        List of page file names
+    """
+    pages = sorted(p for p in pages_dir.glob("*.html"))
+    assets = site_dir / "assets"
+    assets.mkdir(parents=True, exist_ok=True)
+
+    if with_assets:
+        for i in range(images):
+            (assets / f"photo{i}.jpg").write_bytes(os.urandom(60_000))
+        (assets / "font.woff2").write_bytes(os.urandom(120_000))
+        (assets / "font.css").write_text(
+            "@font-face{font-family:Bench;src:url(/assets/font.woff2)}body{font-family:Bench}"
+        )
+        (assets / "intro.mp4").write_bytes(os.urandom(1_500_000))
+        (assets / "googletagmanager.com-gtm.js").write_text("var x=" + "1+" * 20000 + "1;")
+
+    names = []
+    for page in pages:
+        html = page.read_text(encoding="utf-8")
+        if with_assets:
+            markup = ASSET_MARKUP.format(images="".join(
+                f'<img src="/assets/photo{i}.jpg?p={page.stem}">' for i in range(images)
+            ))
+            html = html.replace("</body>", markup + "</body>") if "</body>" in html else html + markup
+        (site_dir / page.name).write_text(html, encoding="utf-8")
+        names.append(page.name)
+    return names
+
+
+def browser_rss(driver) -> float:
+    """Resident memory of the chromedriver process tree in MB (0 without psutil)"""
+    if psutil is None:
+        return 0.0
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+        return sum(p.memory_info().rss for p in processes) / 1_048_576
+    except (psutil.Error, AttributeError):
+        return 0.0
+
+
+def measure(lightweight: bool, base_url: str, pages: list, repeat: int) -> dict:
+    """
+    Load every page with one profile
+
+    Args:
+        lightweight: Use the lightweight profile
+        base_url: Local server URL
+        pages: Page file names
+        repeat: Loads per page
+
+    Returns:
+        Timing, transfer and memory figures
+    """
+    driver = create_chrome_driver(headless=True, lightweight=lightweight)
+    load_times = []
+    transferred = []
+
+    try:
+        for _ in range(repeat):
+            for page in pages:
+                # Defeat the HTTP cache so every load pays for its assets
+                driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+                start = time.perf_counter()
+                driver.get(f"{base_url}/{page}")
+                wait_for_document_ready(driver)
+                load_times.append(time.perf_counter() - start)
+                transferred.append(driver.execute_script(
+                    "return performance.getEntriesByType('resource')"
+                    ".reduce((total, r) => total + (r.transferSize || 0), 0)"
+                ))
+
+        heap = driver.execute_script(
+            "return performance.memory ? performance.memory.usedJSHeapSize : 0"
+        )
+        rss = browser_rss(driver)
+    finally:
+        driver.quit()
+
+    return {
+        'median_load_ms': statistics.median(load_times) * 1000,
+        'p95_load_ms': sorted(load_times)[int(len(load_times) * 0.95) - 1] * 1000,
+        'kb_per_page': statistics.mean(transferred) / 1024,
+        'js_heap_mb': heap / 1_048_576,
+        'rss_mb': rss
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=Path, default=DEFAULT_PAGES, help="Directory of saved .html pages")
+    parser.add_argument("--repeat", type=int, default=5, help="Loads per page and profile")
+    parser.add_argument("--no-assets", action="store_true", help="Serve the pages exactly as saved")
+    args = parser.parse_args()
+
+    site_dir = Path(tempfile.mkdtemp(prefix="browser-bench-"))
+    try:
+        pages = build_site(args.pages, site_dir, with_assets=not args.no_assets)
+        handler = functools.partial(SimpleHTTPRequestHandler, directory=str(site_dir))
+        handler.log_message = lambda *a: None
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+        results = {
+            'default': measure(False, base_url, pages, args.repeat),
+            'lightweight': measure(True, base_url, pages, args.repeat)
+        }
+        server.shutdown()
+    finally:
+        shutil.rmtree(site_dir, ignore_errors=True)
+
+    print(f"{len(pages)} pages x {args.repeat} loads per profile")
+    print(f"{'metric':<16}{'default':>12}{'lightweight':>14}{'change':>10}")
+    for metric in results['default']:
+        before = results['default'][metric]
+        after = results['lightweight'][metric]
+        change = f"{(after - before) / before * 100:+.0f}%" if before else "n/a"
+        print(f"{metric:<16}{before:>12.1f}{after:>14.1f}{change:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+API response benchmark
+Measures encode time and payload size of a large orchestration response
+
+A synthetic result with N ranked candidates (full scoring blobs, as the
+ranker returns them) is encoded the way FastAPI does by default and through
+the fast path used by the workflow endpoints, in the full and compact views.
+
+Reported per path:
+    encode_ms     mean time to turn the result into response bytes
+    bytes         uncompressed body size
+    gzip / br     compressed body size (br only with the brotli package)
+
+Usage:
+    python -m benchmarks.responses [--candidates N] [--repeat N]
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+from fastapi.encoders import jsonable_encoder
+
+from backend.models.schemas import OrchestrationResponse
+from backend.utils.responses import brotli, compress, dumps, orjson, with_defaults
+from backend.utils.views import compact_result
+
+
+def build_result(n: int) -> dict:
+    """Orchestration result with n ranked candidates and a 10-candidate shortlist"""
+    candidates = [
+        {
+            'candidate_id': f"{i:040x}",
+            'name': f"Candidate {i}",
+            'email': f"candidate{i}@example.com",
+            'location': "New York, NY",
+            'headline': "Senior Python Developer at Example Corp",
+            'summary': "Backend engineer with a decade of experience building data platforms. " * 4,
+            'skills': ["Python", "FastAPI", "PostgreSQL", "AWS", "Docker", "Kubernetes", "Kafka", "Redis"],
+            'experience': [
+                {'title': "Senior Engineer", 'company': f"Company {j}", 'duration': "3 years",
+                 'description': "Built and operated services handling millions of requests a day."}
+                for j in range(3)
+            ],
+            'education': [{'degree': "BSc Computer Science", 'school': "State University", 'year': 2012}],
+            'source': "LinkedIn",
+            'profile_url': f"https://www.linkedin.com/in/candidate-{i}"
+        }
+        for i in range(n)
+    ]
+    ranked = [
+        {
+            **candidate,
+            'scoring': {
+                'overall_score': 95 - (i % 60),
+                'skills_match': 80, 'experience_match': 75, 'education_match': 70, 'location_match': 90,
+                'strengths': ["Deep Python expertise", "Production AWS experience", "Led a platform team"],
+                'weaknesses': ["Limited frontend work", "No Go experience"],
+                'recommendation': "Strong candidate; schedule a technical interview.",
+                'match_quality': "Excellent"
+            },
+            'overall_score': 95 - (i % 60),
+            'rank': i + 1
+        }
+        for i, candidate in enumerate(candidates)
+    ]
+    return {
+        'run_id': "bench",
+        'mode': "full_search",
+        'total_candidates_found': n,
+        'candidates': candidates,
+        'ranked_results': {
+            'total_candidates': n,
+            'ranked_candidates': ranked,
+            'top_score': 95,
+            'average_score': 70.0,
+            'shortlist': {'shortlist': ranked[:10], 'summary': {'summary': "Strong pool"}, 'shortlist_size': 10}
+        },
+        'duplicates_merged': 0,
+        'previously_seen': 0,
+        'sources': {'linkedin': n, 'indeed': 0, 'uploaded_resumes': 0}
+    }
+
+
+def fastapi_default(result: dict) -> bytes:
+    """Response-model validation, jsonable_encoder and json.dumps (FastAPI's default path)"""
+    validated = OrchestrationResponse(**result)
+    content = jsonable_encoder(validated)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode()
+
+
+def fast_path(result: dict) -> bytes:
+    """Model defaults without validation, encoded by FastJSONResponse"""
+    return dumps(with_defaults(OrchestrationResponse, result))
+
+
+def fast_path_compact(result: dict) -> bytes:
+    """Compact view (candidates once, ranked results as references) on the fast path"""
+    return dumps(with_defaults(OrchestrationResponse, compact_result(result)))
+
+
+def measure(name: str, encode, result: dict, repeat: int) -> dict:
+    samples = []
+    body = b''
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = encode(result)
+        samples.append(time.perf_counter() - start)
+
+    row = {
+        'path': name,
+        'encode_ms': statistics.mean(samples) * 1000,
+        'bytes': len(body),
+        'gzip': len(compress(body, 'gzip'))
+    }
+    if brotli is not None:
+        row['br'] = len(compress(body, 'br'))
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candidates", type=int, default=1000, help="Ranked candidates in the response")
+    parser.add_argument("--repeat", type=int, default=10, help="Encodes per path")
+    args = parser.parse_args()
+
+    result = build_result(args.candidates)
+    rows = [
+        measure("fastapi default", fastapi_default, result, args.repeat),
+        measure("fast path", fast_path, result, args.repeat),
+        measure("fast path compact", fast_path_compact, result, args.repeat)
+    ]
+
+    print(f"{args.candidates} candidates, encoder: {'orjson' if orjson else 'json'}, "
+          f"brotli: {'yes' if brotli else 'not installed'}")
+    columns = ['path', 'encode_ms', 'bytes', 'gzip', 'br']
+    print("".join(f"{c:>20}" for c in columns))
+    for row in rows:
+        print("".join(
+            f"{row[c]:>20.2f}" if isinstance(row.get(c), float) else f"{str(row.get(c, '-')):>20}"
+            for c in columns
+        ))
+
+
+if __name__ == "__main__":
+    main()
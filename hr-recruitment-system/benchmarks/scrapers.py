@@ -0,0 +1,226 @@
+"""
+Scraper benchmark suite
+Measures scraper throughput offline against recorded HTML snapshots
+
+Snapshots come from a directory recorded with SCRAPE_RECORD_DIR, or are
+built from the saved pages in tests/fixtures when --snapshots is omitted.
+They are served by a local ReplayServer and loaded through the agents'
+normal code paths.
+
+Reported per path:
+    pages/sec          search pages loaded and extracted per second
+    card_ms            mean extraction time per result card
+    round_trips/page   WebDriver commands sent per search page (driver path)
+    round_trips/card   WebDriver commands sent per result card (driver path)
+
+Usage:
+    python -m benchmarks.scrapers [--snapshots DIR] [--repeat N] [--driver]
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from backend.agents.indeed_scraper import IndeedScraperAgent
+from backend.agents.linkedin_scraper import LinkedInScraperAgent
+from backend.utils.pools import close_pools
+from backend.utils.replay import ReplayServer, SnapshotStore
+
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+
+AGENT_CONFIG = {
+    'scrape_delay': 0,
+    'max_candidates': 100,
+    'max_pages': 1,
+    'scrape_timeout': 10,
+    'headless': True
+}
+
+
+def fixture_store(directory: Path) -> SnapshotStore:
+    """
+    Build a snapshot store from the saved pages in tests/fixtures
+
+    Args:
+        directory: Output directory
+
+    Returns:
+        Snapshot store with Indeed and LinkedIn search pages
+    """
+    store = SnapshotStore(directory)
+    store.record(
+        IndeedScraperAgent.build_search_url("Python Developer", "New York, NY"),
+        (FIXTURES / "indeed_search.html").read_text(encoding="utf-8")
+    )
+    store.record(
+        LinkedInScraperAgent.build_search_url("Python Developer", "New York, NY"),
+        (FIXTURES / "linkedin_search.html").read_text(encoding="utf-8")
+    )
+    return store
+
+
+def search_pages(store: SnapshotStore, host: str, path: str) -> list:
+    """Recorded search URLs for one site"""
+    return [url for url in store.urls() if host in urlsplit(url).netloc and urlsplit(url).path.startswith(path)]
+
+
+class RoundTripCounter:
+    """
+    Counts WebDriver commands sent by a driver and its elements
+
+    Every command, including element lookups and property reads, is one
+    HTTP round trip to chromedriver.
+    """
+
+    def __init__(self, driver):
+        self.count = 0
+        original = driver.execute
+
+        def execute(*args, **kwargs):
+            self.count += 1
+            return original(*args, **kwargs)
+
+        driver.execute = execute
+
+
+def timed(method, samples: list, counter: RoundTripCounter = None, trips: list = None):
+    """Wrap an extraction method to record its duration (and round trips) per call"""
+    def wrapper(*args, **kwargs):
+        before = counter.count if counter else 0
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            samples.append(time.perf_counter() - start)
+            if counter is not None:
+                trips.append(counter.count - before)
+    return wrapper
+
+
+def report(name: str, pages: int, elapsed: float, card_times: list,
+           page_trips: list = None, card_trips: list = None) -> dict:
+    """Summarize one benchmark path"""
+    row = {
+        'path': name,
+        'pages/sec': pages / elapsed if elapsed else 0.0,
+        'card_ms': statistics.mean(card_times) * 1000 if card_times else 0.0,
+        'cards': len(card_times)
+    }
+    if page_trips is not None:
+        row['round_trips/page'] = statistics.mean(page_trips) if page_trips else 0.0
+        row['round_trips/card'] = statistics.mean(card_trips) if card_trips else 0.0
+    return row
+
+
+async def bench_indeed_http(server: ReplayServer, urls: list, repeat: int) -> dict:
+    """Indeed HTTP path: fetch from the replay server and parse with BeautifulSoup"""
+    agent = IndeedScraperAgent(agent_id="bench-indeed-http", config={**AGENT_CONFIG, 'replay_url': server.url})
+    card_times = []
+    agent.extract_job_info_from_html = timed(agent.extract_job_info_from_html, card_times)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for url in urls:
+            query = parse_qs(urlsplit(url).query)
+            await agent.search_resumes(query.get('q', [''])[0], query.get('l', [''])[0])
+    return report("indeed/http", repeat * len(urls), time.perf_counter() - start, card_times)
+
+
+async def bench_indeed_driver(server: ReplayServer, urls: list, repeat: int) -> dict:
+    """Indeed browser path: render in Chrome and extract through WebElements"""
+    agent = IndeedScraperAgent(agent_id="bench-indeed-driver", config={
+        **AGENT_CONFIG, 'replay_url': server.url, 'http_first': False
+    })
+    card_times, card_trips, page_trips = [], [], []
+
+    await agent.setup_driver()
+    try:
+        counter = RoundTripCounter(agent.driver)
+        agent.extract_job_info = timed(agent.extract_job_info, card_times, counter, card_trips)
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for url in urls:
+                before = counter.count
+                await agent.search_with_driver(url)
+                page_trips.append(counter.count - before)
+        elapsed = time.perf_counter() - start
+    finally:
+        await agent.close_driver()
+
+    return report("indeed/driver", repeat * len(urls), elapsed, card_times, page_trips, card_trips)
+
+
+async def bench_linkedin_driver(server: ReplayServer, urls: list, repeat: int) -> dict:
+    """LinkedIn search: render in Chrome and extract through WebElements"""
+    agent = LinkedInScraperAgent(agent_id="bench-linkedin", config={**AGENT_CONFIG, 'replay_url': server.url})
+    card_times, card_trips, page_trips = [], [], []
+
+    await agent.setup_driver()
+    try:
+        counter = RoundTripCounter(agent.driver)
+        agent.extract_candidate_info = timed(agent.extract_candidate_info, card_times, counter, card_trips)
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for url in urls:
+                query = parse_qs(urlsplit(url).query)
+                before = counter.count
+                await agent.search_candidates(query.get('keywords', [''])[0], query.get('location', [''])[0])
+                page_trips.append(counter.count - before)
+        elapsed = time.perf_counter() - start
+    finally:
+        await agent.close_driver()
+
+    return report("linkedin/driver", repeat * len(urls), elapsed, card_times, page_trips, card_trips)
+
+
+async def run(store: SnapshotStore, repeat: int, driver: bool) -> list:
+    indeed_urls = search_pages(store, "indeed.com", "/jobs")
+    linkedin_urls = search_pages(store, "linkedin.com", "/search/results/people")
+    rows = []
+
+    with ReplayServer(store) as server:
+        if indeed_urls:
+            rows.append(await bench_indeed_http(server, indeed_urls, repeat))
+        if driver:
+            try:
+                if indeed_urls:
+                    rows.append(await bench_indeed_driver(server, indeed_urls, repeat))
+                if linkedin_urls:
+                    rows.append(await bench_linkedin_driver(server, linkedin_urls, repeat))
+            finally:
+                await close_pools()
+        if server.misses:
+            print(f"warning: {server.misses} requests had no recorded snapshot")
+
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--snapshots", type=Path, help="Snapshot directory recorded with SCRAPE_RECORD_DIR")
+    parser.add_argument("--repeat", type=int, default=20, help="Passes over every search page")
+    parser.add_argument("--driver", action="store_true", help="Also benchmark the Chrome paths (needs Chrome)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="scraper-bench-") as tmp:
+        store = SnapshotStore(args.snapshots) if args.snapshots else fixture_store(Path(tmp))
+        rows = asyncio.run(run(store, args.repeat, args.driver))
+
+    columns = ['path', 'pages/sec', 'card_ms', 'cards', 'round_trips/page', 'round_trips/card']
+    print("".join(f"{c:>18}" for c in columns))
+    for row in rows:
+        print("".join(
+            f"{row[c]:>18.2f}" if isinstance(row.get(c), float) else f"{str(row.get(c, '-')):>18}"
+            for c in columns
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Cold start benchmark
+Measures how long a fresh API process takes to import the app and to get
+each agent ready
+
+Every sample runs in a new interpreter so nothing is cached in sys.modules.
+
+Reported per step:
+    import_ms       import backend.api.main
+    orchestrator_ms build the orchestrator template (get_orchestrator)
+    <agent>_ms      first access of one agent (its module imports and setup);
+                    agents are loaded in order, so a dependency they share
+                    (e.g. the LLM SDK) is charged to the first one
+
+The heavy dependencies loaded by the import alone are listed, followed by
+the modules with the most self time in ``python -X importtime``.
+
+Usage:
+    python -m benchmarks.startup [--repeat N] [--top N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ('selenium', 'webdriver_manager', 'pdfplumber', 'PyPDF2', 'docx', 'anthropic', 'openai',
+                 'sqlalchemy', 'bs4', 'requests', 'cryptography')
+
+AGENTS = ('resume_parser', 'linkedin_scraper', 'indeed_scraper', 'candidate_ranker')
+
+# Runs in the child interpreter; prints one JSON line of timings
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import backend.api.main as main
+timings = {'import_ms': (time.perf_counter() - start) * 1000}
+loaded = [m for m in %(heavy)r if m in sys.modules]
+
+start = time.perf_counter()
+orchestrator = main.get_orchestrator()
+timings['orchestrator_ms'] = (time.perf_counter() - start) * 1000
+
+for name in %(agents)r:
+    start = time.perf_counter()
+    getattr(orchestrator, name)
+    timings[name + '_ms'] = (time.perf_counter() - start) * 1000
+
+print(json.dumps({'timings': timings, 'loaded': loaded}))
+"""
+
+
+def child_env() -> dict:
+    # Placeholder key so agents can build their SDK client without a real one
+    env = dict(os.environ)
+    env.setdefault('ANTHROPIC_API_KEY', 'benchmark')
+    return env
+
+
+def sample() -> dict:
+    code = PROBE % {'heavy': HEAVY_MODULES, 'agents': AGENTS}
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True, env=child_env())
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def slowest_imports(top: int) -> list:
+    """(self_ms, module) for the modules that take longest to execute when importing the app"""
+    out = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import backend.api.main'],
+                         capture_output=True, text=True, check=True, env=child_env())
+    rows = []
+    for line in out.stderr.splitlines():
+        try:
+            self_us, _, name = line[len('import time:'):].split('|')
+            rows.append((int(self_us) / 1000, name.strip()))
+        except ValueError:
+            # Header line
+            continue
+    return sorted(rows, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh processes to sample")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to list")
+    args = parser.parse_args()
+
+    samples = [sample() for _ in range(args.repeat)]
+    steps = list(samples[0]['timings'])
+
+    print(f"{args.repeat} fresh processes, median (min-max) in ms")
+    for step in steps:
+        values = [s['timings'][step] for s in samples]
+        print(f"{step:>24} {statistics.median(values):>10.1f}  ({min(values):.1f}-{max(values):.1f})")
+
+    loaded = samples[0]['loaded']
+    print(f"\nHeavy modules loaded by the import: {', '.join(loaded) if loaded else 'none'}")
+
+    print("\nSlowest imports (self ms):")
+    for ms, name in slowest_imports(args.top):
+        print(f"{ms:>10.1f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -100,7 +100,8 @@ async function handleSearch(e) {
         keywords: keywords,
         search_linkedin: searchLinkedIn,
         search_indeed: searchIndeed,
-        rank_candidates: jobDescription ? true : false,
+        // Ranking is streamed separately so results render as they are scored
+        rank_candidates: false,
         shortlist_size: 10
     };
 
@@ -128,7 +129,7 @@ async function handleSearch(e) {
         spinner.style.display = 'inline';
 
         // Make API call
-        const response = await fetch(`${API_BASE}/orchestrate`, {
+        const response = await fetch(`${API_BASE}/orchestrate?view=compact`, {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json'
@@ -149,6 +150,11 @@ async function handleSearch(e) {
         // Switch to results tab
         switchTab('results');
 
+        // Rank progressively against the job description
+        if (request.job_requirements && data.candidates.length > 0) {
+            await rankProgressively(data, request.job_requirements, request.shortlist_size);
+        }
+
         showToast('Search completed successfully!', 'success');
 
     } catch (error) {
@@ -358,15 +364,153 @@ function displayResults(data) {
     `;
 
     // Ranked candidates or raw candidates
-    const candidates = data.ranked_results?.ranked_candidates || data.candidates;
+    const candidates = data.ranked_results?.ranked_candidates?.length
+        ? resolveRanked(data)
+        : data.candidates;
 
-    candidates.forEach(candidate => {
-        html += renderCandidateCard(candidate);
-    });
+    html += '<div id="ranking-progress"></div>';
+    html += `<div id="candidate-list">${candidates.map(renderCandidateCard).join('')}</div>`;
 
     container.innerHTML = html;
 }
 
+// Stream ranking events and re-render the list as candidates are scored
+async function rankProgressively(data, jobRequirements, shortlistSize) {
+    const ranked = [];
+    let renderPending = false;
+
+    const renderList = () => {
+        renderPending = false;
+        const list = document.getElementById('candidate-list');
+        if (list) {
+            list.innerHTML = ranked.map(renderCandidateCard).join('');
+        }
+    };
+
+    await streamRanking(data.candidates, jobRequirements, shortlistSize, (event, payload) => {
+        if (event === 'candidate') {
+            ranked.push(payload.candidate);
+            ranked.sort((a, b) => (b.overall_score || 0) - (a.overall_score || 0));
+            renderRankingProgress(payload.scored, payload.total, payload.top);
+
+            // Coalesce bursts of events into one render per frame
+            if (!renderPending) {
+                renderPending = true;
+                requestAnimationFrame(renderList);
+            }
+        } else if (event === 'shortlist') {
+            renderShortlistSummary(payload);
+        } else if (event === 'done') {
+            ranked.forEach((candidate, index) => { candidate.rank = index + 1; });
+            currentResults = {
+                ...data,
+                view: 'full',
+                run_id: payload.run_id || data.run_id,
+                ranked_results: { ...payload, ranked_candidates: ranked }
+            };
+        } else if (event === 'error') {
+            throw new Error(payload.detail);
+        }
+    });
+}
+
+// POST to an event-stream endpoint and dispatch each Server-Sent Event
+async function streamRanking(candidates, jobRequirements, shortlistSize, onEvent) {
+    const response = await fetch(`${API_BASE}/rank-candidates/stream?shortlist_size=${shortlistSize}`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            'Accept': 'text/event-stream'
+        },
+        body: JSON.stringify({ candidates: candidates, job_requirements: jobRequirements })
+    });
+
+    if (!response.ok) {
+        throw new Error(`HTTP error! status: ${response.status}`);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) {
+            break;
+        }
+        buffer += decoder.decode(value, { stream: true });
+
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const block = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+
+            let event = 'message';
+            let payload = '';
+            block.split('\n').forEach(line => {
+                if (line.startsWith('event: ')) {
+                    event = line.slice(7);
+                } else if (line.startsWith('data: ')) {
+                    payload += line.slice(6);
+                }
+            });
+
+            // Lines starting with ':' are keep-alive comments
+            if (payload) {
+                onEvent(event, JSON.parse(payload));
+            }
+        }
+    }
+}
+
+// Progress bar and running top list while ranking streams in
+function renderRankingProgress(scored, total, top) {
+    const progress = document.getElementById('ranking-progress');
+    if (!progress) {
+        return;
+    }
+
+    progress.innerHTML = `
+        <div class="results-summary">
+            <h3>🤖 Ranking ${scored}/${total} candidates</h3>
+            <ol>
+                ${top.map(c => `<li>${c.name || 'Unknown'} — ${(c.overall_score || 0).toFixed(0)}/100</li>`).join('')}
+            </ol>
+        </div>
+    `;
+}
+
+// Shortlist summary once every candidate is scored
+function renderShortlistSummary(shortlist) {
+    const progress = document.getElementById('ranking-progress');
+    if (!progress) {
+        return;
+    }
+
+    const summary = shortlist.summary || {};
+    progress.innerHTML = `
+        <div class="results-summary">
+            <h3>⭐ Shortlist (${shortlist.shortlist_size || 0} of ${shortlist.total_candidates_reviewed || 0})</h3>
+            ${summary.summary ? `<p>${summary.summary}</p>` : ''}
+            ${summary.top_recommendations && summary.top_recommendations.length > 0 ? `
+                <ol>
+                    ${summary.top_recommendations.map(r => `<li><strong>${r.name}</strong> — ${r.key_reason}</li>`).join('')}
+                </ol>
+            ` : ''}
+        </div>
+    `;
+}
+
+// Join ranked references with candidate records (compact view)
+function resolveRanked(data) {
+    const ranked = data.ranked_results.ranked_candidates;
+    if (data.view !== 'compact') {
+        return ranked;
+    }
+    const records = new Map(data.candidates.map(c => [c.candidate_id, c]));
+    return ranked.map(ref => ({ ...records.get(ref.candidate_id), ...ref }));
+}
+
 // Render individual candidate card
 function renderCandidateCard(candidate) {
     const score = candidate.overall_score;
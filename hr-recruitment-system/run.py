@@ -4,7 +4,10 @@ HR Recruitment Agent System
 Main entry point for running the application
 """
 
+import argparse
+import asyncio
 import os
+import signal
 import sys
 import logging
 from pathlib import Path
@@ -12,14 +15,17 @@ from pathlib import Path
 # Add backend to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('hr_recruitment.log')
-    ]
+from backend.utils.config import get_settings
+from backend.utils.logs import setup_logging
+
+# Setup logging: handlers run on a background thread fed by a queue
+_settings = get_settings()
+setup_logging(
+    _settings.log_level,
+    log_file=_settings.log_file,
+    json_file=_settings.log_json,
+    sample_rate=_settings.log_sample_rate,
+    queue_size=_settings.log_queue_size
 )
 
 logger = logging.getLogger(__name__)
@@ -82,10 +88,61 @@ def check_environment():
     return True
 
 
+def parse_args():
+    """
+    Parse command line options
+    """
+    parser = argparse.ArgumentParser(description="HR Recruitment Agent System")
+    parser.add_argument("command", nargs="?", choices=["serve", "worker"], default="serve",
+                        help="serve: run the API (default); worker: run queued tasks")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="API worker processes (default: WORKERS from .env)")
+    parser.add_argument("--concurrency", type=int, default=None,
+                        help="Tasks a worker runs at once (default: TASK_WORKER_CONCURRENCY from .env)")
+    parser.add_argument("--kinds", default=None,
+                        help="Comma-separated task kinds a worker runs: parse, search, rank, orchestrate (default: all)")
+    return parser.parse_args()
+
+
+def run_worker(args):
+    """
+    Consume the task queue until SIGINT/SIGTERM
+
+    Tasks already running are finished before the process exits; if it is
+    killed instead, their leases expire and another worker runs them again.
+    """
+    from backend.api.main import execute_task, get_task_queue, settings
+    from backend.utils.history import flush_histories
+    from backend.utils.task_queue import TaskWorker
+
+    kinds = [kind.strip() for kind in args.kinds.split(",") if kind.strip()] if args.kinds else None
+    worker = TaskWorker(
+        get_task_queue(),
+        execute_task,
+        kinds=kinds,
+        concurrency=args.concurrency or settings.task_worker_concurrency,
+        poll_interval=settings.task_poll_interval
+    )
+
+    async def serve():
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+        await worker.run(stop)
+        await asyncio.to_thread(flush_histories)
+
+    logger.info(f"Task worker consuming {settings.database_url} (concurrency {worker.concurrency})")
+    asyncio.run(serve())
+    logger.info(f"Task worker stopped: {worker.completed} done, {worker.failed} failed attempts")
+
+
 def main():
     """
     Main function to run the application
     """
+    args = parse_args()
+
     logger.info("=" * 60)
     logger.info("HR Recruitment Agent System")
     logger.info("=" * 60)
@@ -95,6 +152,10 @@ def main():
         logger.error("Environment check failed. Please fix the issues above and try again.")
         sys.exit(1)
 
+    if args.command == "worker":
+        run_worker(args)
+        return
+
     logger.info("Starting application server...")
 
     # Import and run the FastAPI application
@@ -103,8 +164,24 @@ def main():
         from backend.utils.config import get_settings
 
         settings = get_settings()
+        workers = max(args.workers or settings.workers, 1)
+        if workers > 1 and settings.debug_mode:
+            logger.warning("DEBUG_MODE auto-reload runs a single worker; set DEBUG_MODE=False for --workers")
+            workers = 1
+        if workers > 1 and settings.admission_control:
+            from backend.utils.admission import worker_slots
+            try:
+                worker_slots(settings.max_concurrent_agents, workers, settings.admission_interactive_reserve)
+            except ValueError as e:
+                logger.error(str(e))
+                sys.exit(1)
+
+        # Worker processes read their settings from the environment
+        os.environ["WORKERS"] = str(workers)
 
         logger.info(f"Server will start at: http://{settings.app_host}:{settings.app_port}")
+        if workers > 1:
+            logger.info(f"Workers: {workers} (shared state: {settings.shared_state_path})")
         logger.info("Press Ctrl+C to stop the server")
         logger.info("")
         logger.info("📊 Web Dashboard: http://localhost:8000")
@@ -117,6 +194,7 @@ def main():
             host=settings.app_host,
             port=settings.app_port,
             reload=settings.debug_mode,
+            workers=workers,
             log_level="info"
         )
 
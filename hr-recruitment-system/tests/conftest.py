@@ -29,6 +29,15 @@ def event_loop():
 @pytest.fixture(autouse=True)
 def _mock_ai_clients(monkeypatch):
     """Prevent real Anthropic / OpenAI client instantiation in every test."""
+    from backend.utils.pools import clear_llm_clients
+    from backend.utils.scrape_cache import clear_scrape_caches
+    from backend.utils.seen import close_seen_stores
+
+    # Shared clients, scrape results and seen profiles are process-wide; start every test from scratch
+    clear_llm_clients()
+    clear_scrape_caches()
+    close_seen_stores()
+
     mock_anthropic_cls = MagicMock()
     mock_openai_cls = MagicMock()
 
@@ -181,8 +190,17 @@ def api_client(tmp_data_dir, monkeypatch):
     main_module.RESULTS_DIR = tmp_data_dir / "results"
     main_module.orchestrator = None  # reset global
 
+    from backend.utils.storage import RunStore
+    from backend.utils.singleflight import SingleFlight
+    main_module.store = RunStore(f"sqlite:///{tmp_data_dir / 'test.db'}")
+    main_module.coalescer = SingleFlight(ttl=60)
+    monkeypatch.setattr(main_module.settings, "seen_profiles_path", str(tmp_data_dir / "seen.db"))
+    monkeypatch.setattr(main_module.settings, "linkedin_session_dir", str(tmp_data_dir / "sessions"))
+
     client = TestClient(main_module.app)
     yield client
 
     # cleanup
     main_module.orchestrator = None
+    main_module.store.engine.dispose()
+    main_module.store = None
@@ -0,0 +1,183 @@
+"""
+Tests for admission control (backend/utils/admission.py)
+"""
+
+import asyncio
+import pytest
+
+from backend.utils.admission import BULK, INTERACTIVE, AdmissionController, AdmissionRejected, worker_slots
+
+
+async def _settle():
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+# ── Slots and lanes ─────────────────────────────────────────────────────────
+
+class TestLanes:
+
+    @pytest.mark.asyncio
+    async def test_bulk_leaves_reserved_slot_for_interactive(self):
+        admission = AdmissionController(max_active=2, interactive_reserve=1, per_client=0, queue_timeout=5)
+        bulk = await admission.acquire("a", BULK)
+
+        queued_bulk = asyncio.create_task(admission.acquire("b", BULK))
+        await _settle()
+        assert not queued_bulk.done()
+
+        interactive = await admission.acquire("c", INTERACTIVE)
+        assert admission.stats()["active"] == {INTERACTIVE: 1, BULK: 1}
+
+        admission.release(bulk)
+        assert (await queued_bulk).lane == BULK
+        admission.release(interactive)
+
+    @pytest.mark.asyncio
+    async def test_interactive_waiters_go_first(self):
+        admission = AdmissionController(max_active=1, interactive_reserve=0, per_client=0, queue_timeout=5)
+        running = await admission.acquire("a", BULK)
+
+        bulk = asyncio.create_task(admission.acquire("b", BULK))
+        await _settle()
+        interactive = asyncio.create_task(admission.acquire("c", INTERACTIVE))
+        await _settle()
+
+        admission.release(running)
+        ticket = await interactive
+        assert not bulk.done()
+        admission.release(ticket)
+        admission.release(await bulk)
+
+    @pytest.mark.asyncio
+    async def test_waiters_from_idle_clients_go_first(self):
+        admission = AdmissionController(max_active=3, interactive_reserve=0, per_client=0, queue_timeout=5)
+        first = await admission.acquire("busy", BULK)
+        await admission.acquire("busy", BULK)
+        await admission.acquire("other", BULK)
+
+        busy_again = asyncio.create_task(admission.acquire("busy", BULK))
+        await _settle()
+        fresh = asyncio.create_task(admission.acquire("fresh", BULK))
+        await _settle()
+
+        admission.release(first)
+        assert (await fresh).client == "fresh"
+        assert not busy_again.done()
+        busy_again.cancel()
+
+    @pytest.mark.asyncio
+    async def test_pressure_holds_bulk_only(self):
+        reason = ["LLM concurrency limit reached"]
+        admission = AdmissionController(max_active=3, interactive_reserve=0, per_client=0,
+                                        queue_timeout=5, pressure=lambda: reason[0], poll_interval=0.01)
+
+        bulk = asyncio.create_task(admission.acquire("a", BULK))
+        ticket = await admission.acquire("b", INTERACTIVE)
+        await _settle()
+        assert not bulk.done()
+
+        reason[0] = None
+        assert (await asyncio.wait_for(bulk, 1)).lane == BULK
+        admission.release(ticket)
+
+
+# ── Rejection ───────────────────────────────────────────────────────────────
+
+class TestRejection:
+
+    @pytest.mark.asyncio
+    async def test_client_over_share_gets_429(self):
+        admission = AdmissionController(max_active=4, per_client=2)
+        await admission.acquire("a", BULK)
+        await admission.acquire("a", BULK)
+        with pytest.raises(AdmissionRejected) as excinfo:
+            await admission.acquire("a", BULK)
+        assert excinfo.value.status_code == 429
+        assert excinfo.value.retry_after >= 5
+        # Other clients are unaffected
+        await admission.acquire("b", BULK)
+
+    @pytest.mark.asyncio
+    async def test_full_queue_gets_503(self):
+        admission = AdmissionController(max_active=1, interactive_reserve=0, max_queue=1, per_client=0)
+        await admission.acquire("a", BULK)
+        waiting = asyncio.create_task(admission.acquire("b", BULK))
+        await _settle()
+        with pytest.raises(AdmissionRejected) as excinfo:
+            await admission.acquire("c", BULK)
+        assert excinfo.value.status_code == 503
+        assert admission.stats()["rejected"][503] == 1
+        waiting.cancel()
+
+    @pytest.mark.asyncio
+    async def test_check_rejects_without_taking_a_slot(self):
+        admission = AdmissionController(max_active=1, interactive_reserve=0, max_queue=1, per_client=1)
+        ticket = await admission.acquire("a", BULK)
+        with pytest.raises(AdmissionRejected) as excinfo:
+            admission.check("a", BULK)
+        assert excinfo.value.status_code == 429
+
+        waiting = asyncio.create_task(admission.acquire("b", BULK))
+        await _settle()
+        with pytest.raises(AdmissionRejected) as excinfo:
+            admission.check("c", BULK)
+        assert excinfo.value.status_code == 503
+
+        admission.release(ticket)
+        admission.release(await waiting)
+        admission.check("c", BULK)
+        assert admission.stats()["active"] == {INTERACTIVE: 0, BULK: 0}
+
+    def test_hold_counts_toward_share_without_a_slot(self):
+        admission = AdmissionController(max_active=1, interactive_reserve=0, per_client=1)
+        with admission.hold("a"):
+            with pytest.raises(AdmissionRejected) as excinfo:
+                admission.check("a", BULK)
+            assert excinfo.value.status_code == 429
+            admission.check("b", BULK)
+        admission.check("a", BULK)
+        assert admission.stats()["active"] == {INTERACTIVE: 0, BULK: 0}
+
+    @pytest.mark.asyncio
+    async def test_wait_timeout_gets_503_with_reason(self):
+        admission = AdmissionController(max_active=2, interactive_reserve=0, per_client=0, queue_timeout=0.05,
+                                        pressure=lambda: "browser pool saturated", poll_interval=0.01)
+        with pytest.raises(AdmissionRejected) as excinfo:
+            await admission.acquire("a", BULK)
+        assert excinfo.value.status_code == 503
+        assert "browser pool saturated" in excinfo.value.reason
+        assert admission.stats()["queued"][BULK] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_frees_its_place(self):
+        admission = AdmissionController(max_active=1, interactive_reserve=0, per_client=1)
+        running = await admission.acquire("a", BULK)
+        waiting = asyncio.create_task(admission.acquire("b", BULK))
+        await _settle()
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+
+        admission.release(running)
+        admission.release(running)  # idempotent
+        assert admission.stats()["active"] == {INTERACTIVE: 0, BULK: 0}
+        # Client b's quota was returned
+        async with admission.admit("b", BULK):
+            pass
+
+
+# ── Worker split ────────────────────────────────────────────────────────────
+
+class TestWorkerSlots:
+
+    def test_split_stays_within_total(self):
+        assert worker_slots(3, 1) == 3
+        assert worker_slots(8, 3, interactive_reserve=1) == 2
+        assert worker_slots(1, 1, interactive_reserve=1) == 1
+
+    def test_too_many_workers_rejected(self):
+        # Two workers with one slot each would lose the interactive lane
+        with pytest.raises(ValueError, match="at least 4"):
+            worker_slots(3, 2, interactive_reserve=1)
+        with pytest.raises(ValueError):
+            worker_slots(3, 4, interactive_reserve=0)
@@ -2,7 +2,9 @@
 Tests for FastAPI endpoints (backend/api/main.py)
 """
 
+import asyncio
 import io
+import json
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from pathlib import Path
@@ -105,7 +107,7 @@ class TestSearchCandidates:
         import backend.api.main as main_module
 
         mock_orch = MagicMock()
-        mock_orch.run = AsyncMock(
+        mock_orch.run_isolated = AsyncMock(
             return_value={
                 "success": True,
                 "data": [{"name": "Found Candidate"}],
@@ -138,3 +140,533 @@ class TestAgentsStatus:
         assert resp.status_code == 200
         data = resp.json()
         assert "orchestrator" in data
+
+    def test_status_does_not_expose_secrets(self, api_client, monkeypatch):
+        import backend.api.main as main_module
+
+        monkeypatch.setattr(main_module.settings, "session_secret", "session-key-do-not-leak")
+        monkeypatch.setattr(main_module.settings, "anthropic_api_key", "sk-do-not-leak")
+        main_module.orchestrator = None
+
+        resp = api_client.get("/api/agents/status")
+        assert resp.status_code == 200
+        assert "do-not-leak" not in resp.text
+        assert resp.json()["orchestrator"]["config"]["session_secret"] == "***"
+
+    def test_publishing_status_purges_expired_state(self, api_client, monkeypatch):
+        import time
+        import backend.api.main as main_module
+        from backend.utils.shared_state import SharedState
+
+        state = SharedState()
+        state.put("agent_status", "gone-worker", {"status": "idle"}, ttl=0.01)
+        monkeypatch.setattr(main_module, "shared_state", state)
+        main_module.orchestrator = MagicMock(**{"status_report.return_value": {"orchestrator": {}}})
+        time.sleep(0.02)
+
+        main_module.publish_agent_status()
+
+        assert state.purge_expired() == 0
+        assert list(state.items("agent_status")) == [main_module.WORKER_ID]
+        state.close()
+
+
+# ── Agent history ───────────────────────────────────────────────────────────
+
+class TestAgentHistory:
+
+    def test_history_page(self, api_client):
+        import backend.api.main as main_module
+
+        orch = main_module.get_orchestrator()
+        for i in range(3):
+            orch.candidate_ranker.add_result({"run": i})
+
+        resp = api_client.get("/api/agents/candidate_ranker/history?offset=0&limit=2")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [r["run"] for r in data["history"]["results"]] == [2, 1]
+        assert data["results_count"] == 3
+
+    def test_unknown_agent(self, api_client):
+        resp = api_client.get("/api/agents/nope/history")
+        assert resp.status_code == 404
+
+
+# ── Persisted runs ──────────────────────────────────────────────────────────
+
+class TestPersistedRuns:
+
+    def test_orchestrate_persists_and_serves_run(self, api_client):
+        import backend.api.main as main_module
+
+        mock_orch = MagicMock()
+        mock_orch.run_isolated = AsyncMock(
+            return_value={
+                "success": True,
+                "data": {
+                    "mode": "search_only",
+                    "total_candidates_found": 1,
+                    "candidates": [{"name": "Dana", "source": "LinkedIn"}],
+                    "ranked_results": None,
+                    "sources": {"linkedin": 1},
+                },
+            }
+        )
+        main_module.orchestrator = mock_orch
+
+        resp = api_client.post(
+            "/api/orchestrate",
+            json={"mode": "search_only", "job_title": "Data Engineer"},
+        )
+        assert resp.status_code == 200
+        run_id = resp.json()["run_id"]
+        assert run_id
+
+        listed = api_client.get("/api/runs?job_title=Data Engineer").json()
+        assert listed["count"] == 1
+
+        stored = api_client.get(f"/api/runs/{run_id}").json()
+        assert stored["candidates"][0]["name"] == "Dana"
+
+    def test_missing_run_404(self, api_client):
+        resp = api_client.get("/api/runs/does-not-exist")
+        assert resp.status_code == 404
+
+
+# ── Response views ──────────────────────────────────────────────────────────
+
+class TestResponseViews:
+
+    def _mock_ranked_run(self):
+        import backend.api.main as main_module
+
+        candidates = [{"candidate_id": f"c{i}", "name": f"C{i}", "source": "LinkedIn"} for i in range(3)]
+        ranked = [{**c, "scoring": {"overall_score": 80 - i}, "overall_score": 80 - i, "rank": i + 1}
+                  for i, c in enumerate(candidates)]
+        mock_orch = MagicMock()
+        mock_orch.run_isolated = AsyncMock(
+            return_value={
+                "success": True,
+                "data": {
+                    "mode": "full_search",
+                    "total_candidates_found": 3,
+                    "candidates": candidates,
+                    "ranked_results": {"total_candidates": 3, "ranked_candidates": ranked,
+                                       "top_score": 80, "average_score": 79},
+                    "sources": {"linkedin": 3},
+                },
+            }
+        )
+        main_module.orchestrator = mock_orch
+
+    def test_compact_projection_and_cursor_pages(self, api_client):
+        self._mock_ranked_run()
+
+        resp = api_client.post("/api/orchestrate?fields=name&limit=2", json={"job_title": "Data Engineer"})
+        assert resp.status_code == 200
+        first = resp.json()
+        assert first["view"] == "compact"
+        assert first["candidates"] == [{"candidate_id": "c0", "name": "C0"}, {"candidate_id": "c1", "name": "C1"}]
+        assert [r["rank"] for r in first["ranked_results"]["ranked_candidates"]] == [1, 2]
+
+        second = api_client.get(
+            f"/api/runs/{first['run_id']}/candidates",
+            params={"cursor": first["next_cursor"], "limit": 2, "fields": "name"},
+        ).json()
+        assert [r["rank"] for r in second["ranked_results"]["ranked_candidates"]] == [3]
+        assert second["next_cursor"] is None
+
+    def test_full_view_unchanged_by_default(self, api_client):
+        self._mock_ranked_run()
+
+        body = api_client.post("/api/orchestrate", json={"job_title": "Data Engineer"}).json()
+        assert body["ranked_results"]["ranked_candidates"][0]["name"] == "C0"
+        assert body["next_cursor"] is None
+        assert "timestamp" in body
+
+    def test_bad_cursor_400(self, api_client):
+        self._mock_ranked_run()
+
+        run_id = api_client.post("/api/orchestrate", json={"job_title": "Data Engineer"}).json()["run_id"]
+        resp = api_client.get(f"/api/runs/{run_id}/candidates", params={"cursor": "garbage"})
+        assert resp.status_code == 400
+
+
+# ── Streaming ranking ───────────────────────────────────────────────────────
+
+def _parse_sse(text):
+    events = []
+    for block in text.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.split("\n") if not line.startswith(":"))
+        if "event" in fields:
+            events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+class TestRankStream:
+
+    def test_streams_candidates_then_shortlist(self, api_client):
+        import backend.api.main as main_module
+
+        async def fake_run(agent=None, candidates=None, on_scored=None, **kwargs):
+            ranked = []
+            for i, candidate in enumerate(candidates):
+                scored = {**candidate, "overall_score": [60, 90, 75][i], "rank": None}
+                ranked.append(scored)
+                on_scored(scored, i + 1, len(candidates))
+            ranked.sort(key=lambda c: c["overall_score"], reverse=True)
+            for rank, c in enumerate(ranked, start=1):
+                c["rank"] = rank
+            return {"success": True, "data": {
+                "total_candidates": 3, "ranked_candidates": ranked, "top_score": 90, "average_score": 75,
+                "shortlist": {"shortlist": ranked[:2], "summary": {"summary": "good"}, "shortlist_size": 2},
+            }}
+
+        mock_orch = MagicMock()
+        mock_orch.run_isolated = AsyncMock(side_effect=fake_run)
+        main_module.orchestrator = mock_orch
+
+        resp = api_client.post(
+            "/api/rank-candidates/stream?top_n=2",
+            json={
+                "candidates": [{"candidate_id": f"c{i}", "name": f"C{i}"} for i in range(3)],
+                "job_requirements": {"title": "SWE", "description": "Python"},
+            },
+        )
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+
+        events = _parse_sse(resp.text)
+        assert [name for name, _ in events] == ["candidate", "candidate", "candidate", "shortlist", "done"]
+
+        last = events[2][1]
+        assert last["scored"] == 3 and last["total"] == 3
+        assert [t["candidate_id"] for t in last["top"]] == ["c1", "c2"]
+        # Ranks assigned after scoring do not leak into earlier events
+        assert last["candidate"]["rank"] is None
+
+        assert events[3][1]["shortlist"] == [{"candidate_id": "c1", "rank": 1}, {"candidate_id": "c2", "rank": 2}]
+        assert events[4][1]["run_id"]
+
+    def test_failure_emits_error_event(self, api_client):
+        import backend.api.main as main_module
+
+        mock_orch = MagicMock()
+        mock_orch.run_isolated = AsyncMock(return_value={"success": False, "error": "LLM down"})
+        main_module.orchestrator = mock_orch
+
+        resp = api_client.post(
+            "/api/rank-candidates/stream",
+            json={"candidates": [{"name": "A"}], "job_requirements": {"title": "SWE", "description": "x"}},
+        )
+        assert _parse_sse(resp.text) == [("error", {"detail": "LLM down"})]
+
+
+# ── Metrics ─────────────────────────────────────────────────────────────────
+
+class TestMetricsEndpoint:
+
+    def test_exposes_run_and_queue_metrics(self, api_client):
+        import backend.api.main as main_module
+
+        mock_orch = MagicMock()
+        mock_orch.active_runs = {}
+        mock_orch.scrape_cache.stats.return_value = {"hits": 2, "stale_hits": 0, "misses": 1, "refreshing": 0}
+        mock_orch.run_isolated = AsyncMock(return_value={"success": True, "data": {"candidates": []}})
+        main_module.orchestrator = mock_orch
+        api_client.post("/api/search-candidates", json={"job_title": "Metrics"})
+
+        resp = api_client.get("/metrics")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'hr_queue_depth{queue="workflows_in_flight"} 0' in resp.text
+        assert 'hr_scrape_cache_requests_total{result="hit"} 2' in resp.text
+        assert 'hr_coalescer_requests_total{result="miss"}' in resp.text
+
+
+# ── Admission control ───────────────────────────────────────────────────────
+
+class TestAdmission:
+
+    def test_client_over_share_gets_429_with_retry_after(self, api_client, monkeypatch):
+        import backend.api.main as main_module
+        from backend.utils.admission import BULK, AdmissionController
+
+        admission = AdmissionController(max_active=4, per_client=1, retry_after=7)
+        monkeypatch.setattr(main_module, "admission", admission)
+        monkeypatch.setattr(main_module, "trusted_proxies", {"testclient"})
+        mock_orch = MagicMock()
+        mock_orch.run_isolated = AsyncMock(return_value={"success": True, "data": {"candidates": []}})
+        main_module.orchestrator = mock_orch
+
+        # Client u1 already has a search running
+        asyncio.run(admission.acquire("u1", BULK))
+
+        resp = api_client.post("/api/search-candidates", json={"job_title": "Busy"}, headers={"X-Client-ID": "u1"})
+        assert resp.status_code == 429
+        assert int(resp.headers["retry-after"]) >= 7
+        mock_orch.run_isolated.assert_not_awaited()
+
+        other = api_client.post("/api/search-candidates", json={"job_title": "Busy"}, headers={"X-Client-ID": "u2"})
+        assert other.status_code == 200
+        assert admission.stats()["active"][BULK] == 1
+
+    def test_client_id_header_needs_trusted_proxy(self, api_client, monkeypatch):
+        import backend.api.main as main_module
+        from backend.utils.admission import BULK, AdmissionController
+
+        admission = AdmissionController(max_active=4, per_client=1)
+        monkeypatch.setattr(main_module, "admission", admission)
+        mock_orch = MagicMock()
+        mock_orch.run_isolated = AsyncMock(return_value={"success": True, "data": {"candidates": []}})
+        main_module.orchestrator = mock_orch
+
+        # Without a trusted proxy the peer address is the client, whatever the header says
+        asyncio.run(admission.acquire("testclient", BULK))
+        resp = api_client.post("/api/search-candidates", json={"job_title": "Busy"}, headers={"X-Client-ID": "fresh"})
+        assert resp.status_code == 429
+
+    def test_joiner_held_to_its_own_share(self, api_client, monkeypatch):
+        import backend.api.main as main_module
+        from fastapi import HTTPException
+        from backend.utils.admission import BULK, AdmissionController
+
+        admission = AdmissionController(max_active=4, per_client=1)
+        monkeypatch.setattr(main_module, "admission", admission)
+
+        async def scenario():
+            finish = asyncio.Event()
+
+            async def slow_run(**kwargs):
+                await finish.wait()
+                return {"success": True, "data": {"candidates": []}}
+
+            mock_orch = MagicMock()
+            mock_orch.run_isolated = AsyncMock(side_effect=slow_run)
+            main_module.orchestrator = mock_orch
+
+            def search(client):
+                return main_module.run_workflow("search", {"job_title": "Shared"}, {"job_title": "Shared"},
+                                                client, BULK, mode="search_only", job_title="Shared")
+
+            leader = asyncio.create_task(search("u1"))
+            await asyncio.sleep(0.05)
+            # u1 is at its share; u2 joins the same search instead of inheriting a 429
+            joiner = asyncio.create_task(search("u2"))
+            with pytest.raises(HTTPException) as rejected:
+                await search("u1")
+            finish.set()
+            await asyncio.gather(leader, joiner)
+            return rejected.value.status_code, mock_orch.run_isolated.await_count
+
+        assert asyncio.run(scenario()) == (429, 1)
+
+    def test_small_ranking_uses_interactive_lane(self, api_client, monkeypatch):
+        import backend.api.main as main_module
+        from backend.utils.admission import BULK, INTERACTIVE, AdmissionController
+
+        admission = AdmissionController(max_active=2, interactive_reserve=1, per_client=0, queue_timeout=0.05)
+        monkeypatch.setattr(main_module, "admission", admission)
+        lanes = []
+        original_acquire = admission.acquire
+
+        async def recording_acquire(client, lane, **kwargs):
+            lanes.append(lane)
+            return await original_acquire(client, lane, **kwargs)
+
+        monkeypatch.setattr(admission, "acquire", recording_acquire)
+        mock_orch = MagicMock()
+        mock_orch.run_isolated = AsyncMock(return_value={"success": True, "data": {"ranked_candidates": []}})
+        main_module.orchestrator = mock_orch
+
+        # The only bulk slot is taken
+        asyncio.run(original_acquire("bulk-user", BULK))
+
+        resp = api_client.post("/api/rank-candidates", json={
+            "candidates": [{"name": "A"}],
+            "job_requirements": {"title": "SWE", "description": "Python"},
+        })
+        assert resp.status_code == 200
+        assert lanes == [INTERACTIVE]
+
+
+# ── Task queue ──────────────────────────────────────────────────────────────
+
+class TestTaskQueueMode:
+
+    @pytest.fixture
+    def queued(self, api_client, monkeypatch, tmp_data_dir):
+        import backend.api.main as main_module
+        from backend.utils.task_queue import TaskQueue
+
+        monkeypatch.setattr(main_module.settings, "task_queue", True)
+        monkeypatch.setattr(main_module.settings, "task_poll_interval", 0.01)
+        monkeypatch.setattr(main_module, "task_queue", TaskQueue(f"sqlite:///{tmp_data_dir / 'test.db'}"))
+        mock_orch = MagicMock()
+        mock_orch.run_isolated = AsyncMock(return_value={"success": True, "data": {"ranked_candidates": []}})
+        main_module.orchestrator = mock_orch
+        return main_module
+
+    def test_api_enqueues_and_worker_runs(self, api_client, queued):
+        import threading
+        from backend.utils.task_queue import TaskWorker
+
+        # A worker process, here on its own thread and event loop
+        stop = threading.Event()
+
+        async def work():
+            worker = TaskWorker(queued.get_task_queue(), queued.execute_task, poll_interval=0.01)
+            stop_event = asyncio.Event()
+            runner = asyncio.create_task(worker.run(stop_event))
+            while not stop.is_set():
+                await asyncio.sleep(0.01)
+            stop_event.set()
+            await runner
+
+        thread = threading.Thread(target=asyncio.run, args=(work(),))
+        thread.start()
+        try:
+            resp = api_client.post("/api/rank-candidates", json={
+                "candidates": [{"name": "A"}], "job_requirements": {"title": "SWE", "description": "x"}
+            })
+        finally:
+            stop.set()
+            thread.join(5)
+
+        assert resp.status_code == 200
+        assert resp.json()["ranked_candidates"] == []
+        assert queued.orchestrator.run_isolated.await_args.kwargs["agent"] == "candidate_ranker"
+        assert api_client.get("/api/tasks").json()["done"] == 1
+
+    def test_unfinished_task_returns_504_with_task_id(self, api_client, queued, monkeypatch):
+        monkeypatch.setattr(queued.settings, "task_wait_timeout", 0)
+
+        resp = api_client.post("/api/search-candidates", json={"job_title": "Nobody consumes"})
+        assert resp.status_code == 504
+        task_id = resp.json()["detail"].split()[1]
+
+        task = api_client.get(f"/api/tasks/{task_id}").json()
+        assert (task["kind"], task["status"]) == ("search", "queued")
+        queued.orchestrator.run_isolated.assert_not_awaited()
+
+    def test_passwords_not_enqueued(self, api_client, queued, monkeypatch):
+        monkeypatch.setattr(queued.settings, "task_wait_timeout", 0)
+
+        # A password without an email is not a login, so the search is queued
+        resp = api_client.post("/api/search-candidates", json={"job_title": "Secret", "linkedin_password": "hunter2"})
+        assert resp.status_code == 504
+        task = queued.get_task_queue().get(resp.json()["detail"].split()[1])
+        assert "linkedin_password" not in task["payload"]["request"]
+        assert "hunter2" not in json.dumps(task["payload"])
+
+    def test_full_queue_gets_503(self, api_client, queued, monkeypatch):
+        monkeypatch.setattr(queued.settings, "task_wait_timeout", 0)
+        monkeypatch.setattr(queued.settings, "task_max_queued", 1)
+
+        assert api_client.post("/api/search-candidates", json={"job_title": "First"}).status_code == 504
+        resp = api_client.post("/api/search-candidates", json={"job_title": "Second"})
+        assert resp.status_code == 503
+        assert "retry-after" in resp.headers
+        assert queued.get_task_queue().depth() == 1
+
+    def test_queued_request_counts_toward_client_share(self, api_client, queued, monkeypatch):
+        from backend.utils.admission import AdmissionController
+
+        admission = AdmissionController(max_active=4, per_client=1)
+        monkeypatch.setattr(queued, "admission", admission)
+        monkeypatch.setattr(queued, "trusted_proxies", {"testclient"})
+
+        # u1 is waiting on a queued search
+        with admission.hold("u1"):
+            resp = api_client.post("/api/search-candidates", json={"job_title": "More"}, headers={"X-Client-ID": "u1"})
+        assert resp.status_code == 429
+        assert queued.get_task_queue().depth() == 0
+
+    def test_task_endpoints_disabled_without_queue(self, api_client):
+        assert api_client.get("/api/tasks").status_code == 404
+
+
+# ── Run traces ──────────────────────────────────────────────────────────────
+
+class TestRunTrace:
+
+    def test_trace_persisted_and_exported(self, api_client):
+        import backend.api.main as main_module
+
+        trace = {
+            "name": "run", "span_count": 1, "dropped": 0, "duration_ms": 12.0,
+            "spans": [{"id": 1, "name": "AgentOrchestrator.run", "category": "agent", "start_ms": 0.0,
+                       "duration_ms": 12.0, "attributes": {"lane": "main"}, "children": []}]
+        }
+        mock_orch = MagicMock()
+        mock_orch.run_isolated = AsyncMock(
+            return_value={"success": True, "data": {"candidates": []}, "trace": trace}
+        )
+        main_module.orchestrator = mock_orch
+
+        data = api_client.post("/api/search-candidates", json={"job_title": "Traced"}).json()
+        assert data["trace_summary"] == {
+            "span_count": 1, "dropped": 0, "duration_ms": 12.0, "totals_ms": {"agent": 12.0}
+        }
+
+        resp = api_client.get(f"/api/runs/{data['run_id']}/trace")
+        assert resp.status_code == 200
+        assert resp.json() == trace
+
+        chrome = api_client.get(f"/api/runs/{data['run_id']}/trace?format=chrome").json()
+        assert chrome["traceEvents"][0]["name"] == "AgentOrchestrator.run"
+
+        assert api_client.get(f"/api/runs/{data['run_id']}/trace?format=xml").status_code == 400
+
+    def test_missing_trace(self, api_client):
+        assert api_client.get("/api/runs/nope/trace").status_code == 404
+
+
+# ── Request coalescing ──────────────────────────────────────────────────────
+
+class TestCoalescing:
+
+    def test_identical_searches_share_one_run(self, api_client):
+        import backend.api.main as main_module
+
+        mock_orch = MagicMock()
+        mock_orch.run_isolated = AsyncMock(
+            return_value={"success": True, "data": {"candidates": [], "mode": "search_only"}}
+        )
+        main_module.orchestrator = mock_orch
+
+        first = api_client.post("/api/search-candidates", json={"job_title": "Python Developer"})
+        second = api_client.post("/api/search-candidates", json={"job_title": "python  developer"})
+
+        assert first.status_code == second.status_code == 200
+        assert first.json()["run_id"] == second.json()["run_id"]
+        assert mock_orch.run_isolated.await_count == 1
+
+    def test_different_searches_run_separately(self, api_client):
+        import backend.api.main as main_module
+
+        mock_orch = MagicMock()
+        mock_orch.run_isolated = AsyncMock(
+            return_value={"success": True, "data": {"candidates": []}}
+        )
+        main_module.orchestrator = mock_orch
+
+        api_client.post("/api/search-candidates", json={"job_title": "A"})
+        api_client.post("/api/search-candidates", json={"job_title": "B"})
+        assert mock_orch.run_isolated.await_count == 2
+
+    def test_logged_in_searches_not_shared(self, api_client):
+        import backend.api.main as main_module
+
+        mock_orch = MagicMock()
+        mock_orch.run_isolated = AsyncMock(
+            return_value={"success": True, "data": {"candidates": []}}
+        )
+        main_module.orchestrator = mock_orch
+
+        search = {"job_title": "Logged in", "linkedin_email": "jane@example.com"}
+        api_client.post("/api/search-candidates", json={**search, "linkedin_password": "right"})
+        # Same email with a wrong password must not be served the logged-in results
+        api_client.post("/api/search-candidates", json={**search, "linkedin_password": "wrong"})
+        assert mock_orch.run_isolated.await_count == 2
@@ -84,6 +84,34 @@ class TestResultsAndErrors:
         assert "bad value" in agent.errors[0]["exception"]
 
 
+    def test_results_bounded_by_config(self):
+        agent = DummyAgent(agent_id="r2", config={"history_max_items": 2})
+        for i in range(5):
+            agent.add_result({"data": i})
+        assert len(agent.results) == 2
+        assert agent.results[0]["data"] == 3
+        assert agent.get_summary()["results_count"] == 5
+
+    def test_results_spill_to_disk(self, tmp_path):
+        agent = DummyAgent(
+            agent_id="r3",
+            config={"history_max_items": 1, "history_spill_dir": str(tmp_path)},
+        )
+        agent.add_result({"data": 1})
+        agent.add_result({"data": 2})
+        agent.results.flush()
+        assert (tmp_path / "r3-results.jsonl.gz").exists()
+
+    def test_merge_history(self):
+        a = DummyAgent(agent_id="m1")
+        b = DummyAgent(agent_id="m2")
+        b.add_result({"data": 1})
+        b.add_error("oops")
+        a.merge_history(b)
+        assert len(a.results) == 1
+        assert len(a.errors) == 1
+
+
 # ── get_summary ──────────────────────────────────────────────────────────────
 
 class TestGetSummary:
@@ -98,6 +126,24 @@ class TestGetSummary:
         assert summary["errors_count"] == 0
         assert summary["config"] == {"x": 1}
         assert summary["last_run"] is None
+        assert "history" not in summary
+
+    def test_summary_redacts_secrets(self):
+        agent = DummyAgent(agent_id="sum-secret", config={
+            "session_secret": "s3cret", "anthropic_api_key": "sk-1", "openai_api_key": None, "headless": True
+        })
+        assert agent.get_summary()["config"] == {
+            "session_secret": "***", "anthropic_api_key": "***", "openai_api_key": None, "headless": True
+        }
+        assert agent.config["session_secret"] == "s3cret"
+
+    def test_summary_history_page(self):
+        agent = DummyAgent(agent_id="sum2")
+        for i in range(5):
+            agent.add_result({"data": i})
+        summary = agent.get_summary(offset=1, limit=2)
+        assert [r["data"] for r in summary["history"]["results"]] == [3, 2]
+        assert summary["history"]["errors"] == []
 
 
 # ── run() wrapper ────────────────────────────────────────────────────────────
@@ -125,6 +171,20 @@ class TestRunWrapper:
         assert len(agent.errors) == 1
 
 
+    @pytest.mark.asyncio
+    async def test_run_latency_recorded(self):
+        from backend.utils.metrics import AGENT_RUN_SECONDS
+
+        before_ok = AGENT_RUN_SECONDS.count(agent="DummyAgent", status="completed")
+        before_failed = AGENT_RUN_SECONDS.count(agent="FailingAgent", status="failed")
+
+        await DummyAgent(agent_id="metrics-ok").run()
+        await FailingAgent(agent_id="metrics-fail").run()
+
+        assert AGENT_RUN_SECONDS.count(agent="DummyAgent", status="completed") == before_ok + 1
+        assert AGENT_RUN_SECONDS.count(agent="FailingAgent", status="failed") == before_failed + 1
+
+
 # ── Logging ──────────────────────────────────────────────────────────────────
 
 class TestLogging:
@@ -0,0 +1,167 @@
+"""
+Tests for condition-based browser waits (backend/utils/browser.py)
+"""
+
+import pytest
+from backend.utils.browser import scroll_until_stable, wait_for_any, wait_for_network_idle
+
+
+class FakeDriver:
+    """Minimal WebDriver stand-in whose result list grows on scroll."""
+
+    def __init__(self, counts, resources=None):
+        self.counts = list(counts)
+        self.scrolls = 0
+        self.resources = list(resources or [])
+
+    def find_elements(self, by, selector):
+        if selector == "missing":
+            return []
+        return [object()] * self.counts[min(self.scrolls, len(self.counts) - 1)]
+
+    def find_element(self, by, selector):
+        elements = self.find_elements(by, selector)
+        if not elements:
+            from selenium.common.exceptions import NoSuchElementException
+            raise NoSuchElementException(selector)
+        return elements[0]
+
+    def execute_script(self, script, *args):
+        if "scrollTo" in script:
+            self.scrolls += 1
+            return None
+        if "getEntriesByType" in script:
+            return self.resources.pop(0) if len(self.resources) > 1 else self.resources[0]
+        return "complete"
+
+
+# ── scroll_until_stable ─────────────────────────────────────────────────────
+
+class TestScrollUntilStable:
+
+    def test_stops_when_count_stops_growing(self):
+        driver = FakeDriver([10, 20, 20, 20])
+        count = scroll_until_stable(driver, ".card", max_scrolls=5, timeout=0.2)
+        assert count == 20
+        assert driver.scrolls == 2
+
+    def test_stops_at_target(self):
+        driver = FakeDriver([10, 20, 30])
+        count = scroll_until_stable(driver, ".card", max_scrolls=5, timeout=0.2, target_count=15)
+        assert count == 20
+        assert driver.scrolls == 1
+
+
+# ── wait_for_any / network idle ─────────────────────────────────────────────
+
+class TestWaits:
+
+    def test_wait_for_any_returns_present_selector(self):
+        driver = FakeDriver([3])
+        assert wait_for_any(driver, ["missing", ".card"], timeout=0.2) == ".card"
+
+    def test_wait_for_any_times_out(self):
+        driver = FakeDriver([0])
+        assert wait_for_any(driver, ["missing"], timeout=0.1) is None
+
+    def test_network_idle(self):
+        driver = FakeDriver([0], resources=[1, 2, 3, 3])
+        assert wait_for_network_idle(driver, idle_time=0.05, timeout=1, poll_interval=0.01)
+
+
+# ── Chrome profile ──────────────────────────────────────────────────────────
+
+class TestChromeProfile:
+
+    def test_lightweight_profile(self):
+        from backend.utils.browser import build_chrome_options
+
+        options = build_chrome_options(headless=True, lightweight=True)
+
+        assert options.page_load_strategy == "eager"
+        assert "--blink-settings=imagesEnabled=false" in options.arguments
+        assert options.experimental_options["prefs"]["profile.managed_default_content_settings.images"] == 2
+
+    def test_default_profile_unchanged(self):
+        from backend.utils.browser import build_chrome_options
+
+        options = build_chrome_options(headless=False, lightweight=False)
+
+        assert options.page_load_strategy == "normal"
+        assert "--headless" not in options.arguments
+        assert "prefs" not in options.experimental_options
+
+    def test_block_requests_uses_devtools(self):
+        from unittest.mock import MagicMock
+        from backend.utils.browser import block_requests
+
+        driver = MagicMock()
+        assert block_requests(driver, ["*.png"]) is True
+        driver.execute_cdp_cmd.assert_called_with("Network.setBlockedURLs", {"urls": ["*.png"]})
+
+    def test_block_requests_without_devtools(self):
+        from backend.utils.browser import block_requests
+
+        assert block_requests(FakeDriver([0])) is False
+
+    def test_driver_pool_per_profile_independent_of_agents(self):
+        from backend.agents.indeed_scraper import IndeedScraperAgent
+        from backend.agents.linkedin_scraper import LinkedInScraperAgent
+        from backend.utils.browser import clear_session, create_chrome_driver
+
+        windowed = LinkedInScraperAgent(agent_id="windowed", config={"headless": False})
+        headless = LinkedInScraperAgent(agent_id="headless", config={"headless": True})
+        indeed = IndeedScraperAgent(agent_id="indeed", config={"headless": False})
+
+        assert windowed.driver_pool is not headless.driver_pool
+        assert indeed.driver_pool is windowed.driver_pool
+        # The factory builds the pool's profile, not whichever agent created the pool
+        factory = windowed.driver_pool.factory
+        assert (factory.func, factory.args, factory.keywords) == (create_chrome_driver, (False,), {"lightweight": True})
+        assert windowed.driver_pool.reset is clear_session
+
+
+# ── Session export/import ───────────────────────────────────────────────────
+
+class TestSessionState:
+
+    def test_import_restores_cookies_and_storage(self):
+        from unittest.mock import MagicMock
+        from backend.utils.browser import import_session
+
+        driver = MagicMock()
+        state = {
+            "cookies": [{"name": "li_at", "value": "t", "expiry": 1.7e9, "sameSite": "no_restriction"}],
+            "local_storage": {"k": "v"},
+        }
+        import_session(driver, state, "https://www.linkedin.com/")
+
+        driver.get.assert_called_once_with("https://www.linkedin.com/")
+        driver.add_cookie.assert_called_once_with({"name": "li_at", "value": "t", "expiry": 1700000000})
+        assert driver.execute_script.call_args.args[1] == {"k": "v"}
+
+    def test_clear_session_wipes_storage_and_cookies(self):
+        from unittest.mock import MagicMock
+        from backend.utils.browser import clear_session
+
+        driver = MagicMock()
+        driver.execute_script.return_value = "https://www.linkedin.com"
+        clear_session(driver)
+
+        driver.execute_cdp_cmd.assert_called_once_with(
+            "Storage.clearDataForOrigin", {"origin": "https://www.linkedin.com", "storageTypes": "all"}
+        )
+        driver.delete_all_cookies.assert_called_once()
+        driver.get.assert_called_once_with("about:blank")
+
+    def test_clear_session_without_devtools(self):
+        from unittest.mock import MagicMock
+        from selenium.common.exceptions import WebDriverException
+        from backend.utils.browser import clear_session
+
+        driver = MagicMock()
+        driver.execute_script.return_value = "https://www.linkedin.com"
+        driver.execute_cdp_cmd.side_effect = WebDriverException("no devtools")
+        clear_session(driver)
+
+        assert "localStorage.clear()" in driver.execute_script.call_args.args[0]
@@ -90,6 +90,20 @@ class TestRankCandidates:
         assert ranked[2]["rank"] == 3
 
 
+    @pytest.mark.asyncio
+    async def test_on_scored_reports_progress(self, sample_candidates, sample_job_requirements):
+        agent = _make_ranker()
+        progress = []
+
+        with patch.object(agent, "score_candidate", new_callable=AsyncMock, return_value=MOCK_SCORING):
+            await agent.rank_candidates(
+                sample_candidates, sample_job_requirements,
+                on_scored=lambda candidate, scored, total: progress.append((candidate["name"], scored, total))
+            )
+
+        assert progress == [(c["name"], i + 1, 3) for i, c in enumerate(sample_candidates)]
+
+
 # ── execute ──────────────────────────────────────────────────────────────────
 
 class TestExecute:
@@ -0,0 +1,112 @@
+"""
+Tests for candidate identity and deduplication (backend/utils/candidates.py)
+"""
+
+import pytest
+from backend.utils.candidates import (
+    candidate_key,
+    normalize_phone,
+    normalize_url,
+    blocking_keys,
+    merge_candidates,
+    deduplicate_candidates,
+)
+
+
+# ── Normalization ────────────────────────────────────────────────────────────
+
+class TestNormalization:
+
+    def test_phone_keeps_last_ten_digits(self):
+        assert normalize_phone("+1 (555) 123-4567") == "5551234567"
+        assert normalize_phone("123") is None
+
+    def test_url_strips_noise(self):
+        assert normalize_url("https://www.LinkedIn.com/in/jane/?trk=x") == "linkedin.com/in/jane"
+
+    def test_candidate_key_prefers_email(self):
+        a = {"email": "Jane@Example.com", "name": "Jane"}
+        b = {"email": "jane@example.com ", "name": "J. Doe"}
+        assert candidate_key(a) == candidate_key(b)
+
+    def test_blocking_keys(self):
+        exact, fuzzy = blocking_keys({
+            "name": "José Álvarez", "location": "Austin, TX", "phone": "512-555-0100"
+        })
+        assert "phone:5125550100" in exact
+        assert fuzzy == "name:alvarez|j|austin"
+
+
+# ── Merge ────────────────────────────────────────────────────────────────────
+
+class TestMerge:
+
+    def test_resume_fields_win_and_lists_union(self):
+        merged = merge_candidates([
+            {"name": "Jane Doe", "headline": "Engineer", "skills": ["Go"], "source": "LinkedIn"},
+            {"name": "Jane A. Doe", "email": "jane@x.com", "skills": ["Python", "Go"],
+             "source": "uploaded_resume"},
+        ])
+        assert merged["name"] == "Jane A. Doe"
+        assert merged["headline"] == "Engineer"
+        assert merged["skills"] == ["Python", "Go"]
+        assert merged["source"] == "uploaded_resume"
+        assert merged["sources"] == ["uploaded_resume", "LinkedIn"]
+        assert merged["merged_records"] == 2
+
+
+# ── Deduplication ────────────────────────────────────────────────────────────
+
+class TestDeduplicate:
+
+    def test_merges_resume_and_linkedin_by_name_and_location(self):
+        candidates = [
+            {"name": "Jane Doe", "location": "New York, NY", "email": "jane@x.com",
+             "source": "uploaded_resume"},
+            {"name": "Jane  Doe", "location": "New York City Area", "source": "LinkedIn"},
+        ]
+        # "new york" vs "new york city area" -> different city keys, not merged
+        result, merged = deduplicate_candidates(candidates)
+        assert merged == 0
+
+        candidates[1]["location"] = "New York, United States"
+        result, merged = deduplicate_candidates(candidates)
+        assert merged == 1
+        assert result[0]["email"] == "jane@x.com"
+
+    def test_fuzzy_name_within_block(self):
+        candidates = [
+            {"name": "Jonathan Smith", "location": "Boston, MA", "source": "LinkedIn"},
+            {"name": "Jonathon Smith", "location": "Boston", "source": "uploaded_resume"},
+            {"name": "Jeremy Smith", "location": "Boston", "source": "LinkedIn"},
+        ]
+        result, merged = deduplicate_candidates(candidates)
+        assert merged == 1
+        assert len(result) == 2
+
+    def test_exact_keys_are_transitive(self):
+        candidates = [
+            {"name": "A", "email": "a@x.com", "source": "uploaded_resume"},
+            {"name": "A", "email": "a@x.com", "phone": "555-111-2222", "source": "LinkedIn"},
+            {"name": "A", "phone": "(555) 111 2222", "source": "Indeed"},
+        ]
+        result, merged = deduplicate_candidates(candidates)
+        assert merged == 2
+        assert result[0]["merged_records"] == 3
+
+    def test_distinct_people_untouched(self, sample_candidates):
+        result, merged = deduplicate_candidates(sample_candidates)
+        assert merged == 0
+        assert [c["name"] for c in result] == [c["name"] for c in sample_candidates]
+        assert all("candidate_id" in c for c in result)
+
+    def test_large_pool_stays_linear(self):
+        candidates = [
+            {"name": f"Person {i}", "email": f"p{i}@x.com", "location": "Remote",
+             "source": "LinkedIn"}
+            for i in range(20000)
+        ]
+        candidates.append({"name": "Person 7", "email": "P7@x.com", "source": "uploaded_resume"})
+        result, merged = deduplicate_candidates(candidates)
+        assert merged == 1
+        assert len(result) == 20000
@@ -0,0 +1,99 @@
+"""
+Tests for bounded result history (backend/utils/history.py)
+"""
+
+import threading
+import pytest
+from backend.utils.history import BoundedHistory, flush_histories
+
+
+# ── Ring buffer ──────────────────────────────────────────────────────────────
+
+class TestRingBuffer:
+
+    def test_evicts_oldest_over_item_budget(self):
+        history = BoundedHistory(max_items=3)
+        for i in range(5):
+            history.append({"i": i})
+        assert [e["i"] for e in history] == [2, 3, 4]
+        assert history.total_count == 5
+        assert history.evicted_count == 2
+
+    def test_evicts_over_byte_budget(self):
+        history = BoundedHistory(max_items=100, max_bytes=200)
+        for i in range(10):
+            history.append({"i": i, "payload": "x" * 50})
+        assert len(history) < 10
+        assert history.size_bytes <= 200
+
+    def test_keeps_single_oversized_entry(self):
+        history = BoundedHistory(max_bytes=10)
+        history.append({"payload": "x" * 100})
+        assert len(history) == 1
+
+    def test_list_like_access(self):
+        history = BoundedHistory()
+        assert history == []
+        history.append({"a": 1})
+        assert history[0] == {"a": 1}
+        assert history[-1] == {"a": 1}
+        assert history == [{"a": 1}]
+
+
+# ── Pagination ───────────────────────────────────────────────────────────────
+
+class TestPagination:
+
+    def test_page_newest_first(self):
+        history = BoundedHistory()
+        for i in range(5):
+            history.append({"i": i})
+        assert [e["i"] for e in history.page(0, 2)] == [4, 3]
+        assert [e["i"] for e in history.page(2, 2)] == [2, 1]
+        assert history.page(10, 2) == []
+
+
+# ── Spill to disk ────────────────────────────────────────────────────────────
+
+class TestSpill:
+
+    def test_evicted_entries_spill_to_gzip_jsonl(self, tmp_path):
+        spill = tmp_path / "results" / "agent-results.jsonl.gz"
+        history = BoundedHistory(max_items=2, spill_path=spill, spill_batch=2)
+        for i in range(5):
+            history.append({"i": i})
+
+        assert [e["i"] for e in history.read_spilled()] == [0, 1, 2]
+        assert spill.exists()
+        assert history.stats()["spilled"] == 3
+
+    def test_full_batches_written_off_the_calling_thread(self, tmp_path, monkeypatch):
+        history = BoundedHistory(max_items=1, spill_path=tmp_path / "h.jsonl.gz", spill_batch=2)
+        caller = threading.get_ident()
+        threads = []
+        write = history._write
+        monkeypatch.setattr(history, "_write", lambda batch: threads.append(threading.get_ident()) or write(batch))
+
+        for i in range(3):
+            history.append({"i": i})
+        history.flush()
+
+        assert len(threads) == 1 and caller not in threads
+        assert [e["i"] for e in history.read_spilled()] == [0, 1]
+
+    def test_flush_histories_writes_partial_batches(self, tmp_path):
+        spill = tmp_path / "h.jsonl.gz"
+        history = BoundedHistory(max_items=1, spill_path=spill, spill_batch=20)
+        history.append({"i": 0})
+        history.append({"i": 1})
+        assert not spill.exists()
+
+        flush_histories()
+        assert spill.exists()
+        assert [e["i"] for e in history.read_spilled()] == [0]
+
+    def test_no_spill_without_path(self, tmp_path):
+        history = BoundedHistory(max_items=1)
+        history.append({"i": 0})
+        history.append({"i": 1})
+        assert list(history.read_spilled()) == []
@@ -0,0 +1,223 @@
+"""
+Tests for IndeedScraperAgent HTTP-first scraping (backend/agents/indeed_scraper.py)
+"""
+
+import threading
+import pytest
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+from backend.agents.indeed_scraper import IndeedScraperAgent
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _make_scraper(**overrides):
+    config = {"headless": True, "scrape_delay": 0, "max_candidates": 10, **overrides}
+    return IndeedScraperAgent(agent_id="indeed-test", config=config)
+
+
+def _fixture(name):
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+# ── HTML parsing ─────────────────────────────────────────────────────────────
+
+class TestParseSearchPage:
+
+    def test_extracts_cards_from_saved_page(self):
+        results = _make_scraper().parse_search_page(_fixture("indeed_search.html"))
+
+        assert [r["title"] for r in results] == ["Senior Python Developer", "Backend Engineer (Django)"]
+        first = results[0]
+        assert first["company"] == "Acme Analytics"
+        assert first["location"] == "New York, NY 10001"
+        assert first["salary"] == "$150,000 - $180,000 a year"
+        assert first["url"].startswith("https://www.indeed.com/rc/clk?jk=a1b2c3d4e5f60718")
+        assert first["date_posted"] == "Posted 3 days ago"
+        assert first["source"] == "Indeed"
+        assert first["type"] == "job_posting"
+        assert results[1]["salary"] is None
+
+    def test_respects_max_results(self):
+        results = _make_scraper(max_candidates=1).parse_search_page(_fixture("indeed_search.html"))
+        assert len(results) == 1
+
+    def test_blocked_page_has_no_results(self):
+        assert _make_scraper().parse_search_page(_fixture("indeed_blocked.html")) == []
+
+    def test_job_details(self):
+        details = _make_scraper().parse_job_details(_fixture("indeed_job.html"))
+        assert "build our data platform" in details["full_description"]
+        assert details["requirements"] == ["5+ years of Python", "Experience with AWS and Docker"]
+
+
+# ── HTTP-first with WebDriver fallback ──────────────────────────────────────
+
+class TestHttpFirst:
+
+    @pytest.mark.asyncio
+    async def test_http_results_skip_browser(self):
+        scraper = _make_scraper()
+        with patch("backend.agents.indeed_scraper.fetch_html", return_value=_fixture("indeed_search.html")):
+            with patch.object(scraper, "search_with_driver", new_callable=AsyncMock) as driver_path:
+                results = await scraper.search_resumes("Python Developer", "New York")
+
+        assert len(results) == 2
+        driver_path.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_html_has_no_results(self):
+        scraper = _make_scraper()
+        with patch("backend.agents.indeed_scraper.fetch_html", return_value=_fixture("indeed_blocked.html")):
+            with patch.object(
+                scraper, "search_with_driver", new_callable=AsyncMock, return_value=[{"title": "X"}]
+            ) as driver_path:
+                results = await scraper.search_resumes("Python Developer")
+
+        assert results == [{"title": "X"}]
+        driver_path.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_http_first_can_be_disabled(self):
+        scraper = _make_scraper(http_first=False)
+        with patch("backend.agents.indeed_scraper.fetch_html") as fetch:
+            with patch.object(scraper, "search_with_driver", new_callable=AsyncMock, return_value=[]):
+                await scraper.search_resumes("Python Developer")
+        fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_never_checks_out_driver_on_http_success(self):
+        scraper = _make_scraper()
+        with patch("backend.agents.indeed_scraper.fetch_html", return_value=_fixture("indeed_search.html")):
+            with patch.object(scraper.driver_pool, "acquire", new_callable=AsyncMock) as acquire:
+                result = await scraper.execute(job_title="Python Developer")
+
+        assert result["results_found"] == 2
+        acquire.assert_not_awaited()
+
+
+# ── Concurrent detail fetching ──────────────────────────────────────────────
+
+class TestFetchJobDetails:
+
+    @pytest.mark.asyncio
+    async def test_details_fetched_concurrently_with_cap(self):
+        import asyncio
+
+        scraper = _make_scraper(detail_concurrency=3)
+        in_flight = 0
+        peak = 0
+
+        async def fake_details(url):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return {"full_description": f"desc {url}"}
+
+        jobs = [{"url": f"https://www.indeed.com/viewjob?jk={i}"} for i in range(8)]
+        with patch.object(scraper, "get_job_details", side_effect=fake_details):
+            enriched = await scraper.fetch_job_details(jobs, limit=6)
+
+        assert enriched == 6
+        assert peak == 3
+        assert all("full_description" in j for j in jobs[:6])
+        assert "full_description" not in jobs[6]
+
+    @pytest.mark.asyncio
+    async def test_slow_url_times_out_without_blocking_others(self):
+        import asyncio
+
+        scraper = _make_scraper(detail_timeout=0.05)
+
+        async def fake_details(url):
+            if url.endswith("slow"):
+                await asyncio.sleep(1)
+            return {"full_description": "ok"}
+
+        jobs = [{"url": "https://x/slow"}, {"url": "https://x/fast"}]
+        with patch.object(scraper, "get_job_details", side_effect=fake_details):
+            enriched = await scraper.fetch_job_details(jobs)
+
+        assert enriched == 1
+        assert "full_description" not in jobs[0]
+
+    @pytest.mark.asyncio
+    async def test_http_details_use_saved_page(self):
+        scraper = _make_scraper()
+        with patch("backend.agents.indeed_scraper.fetch_html", return_value=_fixture("indeed_job.html")):
+            details = await scraper.get_job_details("https://www.indeed.com/viewjob?jk=1")
+        assert details["requirements"][0] == "5+ years of Python"
+
+    @pytest.mark.asyncio
+    async def test_details_share_the_search_rate_limiter(self):
+        # One per-domain budget: detail pages wait on the SCRAPE_DELAY limiter
+        scraper = _make_scraper(scrape_delay=3)
+        url = "https://www.indeed.com/viewjob?jk=1"
+        with patch.object(scraper.rate_limiter, "wait", new=AsyncMock()) as wait, \
+                patch("backend.agents.indeed_scraper.fetch_html", return_value=_fixture("indeed_job.html")):
+            await scraper.get_job_details(url)
+        wait.assert_awaited_once_with(url)
+        assert scraper.rate_limiter.min_interval == 3
+
+    @pytest.mark.asyncio
+    async def test_http_pages_parsed_off_the_event_loop(self):
+        scraper = _make_scraper()
+        loop_thread = threading.get_ident()
+        threads = []
+        parse_search, parse_details = scraper.parse_search_page, scraper.parse_job_details
+
+        def record(parse):
+            return lambda html: threads.append(threading.get_ident()) or parse(html)
+
+        with patch.object(scraper, "parse_search_page", side_effect=record(parse_search)), \
+                patch.object(scraper, "parse_job_details", side_effect=record(parse_details)):
+            with patch("backend.agents.indeed_scraper.fetch_html", return_value=_fixture("indeed_search.html")):
+                await scraper.fetch_search_page("https://www.indeed.com/jobs?q=python")
+            with patch("backend.agents.indeed_scraper.fetch_html", return_value=_fixture("indeed_job.html")):
+                await scraper.get_job_details("https://www.indeed.com/viewjob?jk=1")
+
+        assert len(threads) == 2 and loop_thread not in threads
+
+
+# ── Paginated search ────────────────────────────────────────────────────────
+
+class TestPaginatedSearch:
+
+    def test_page_urls(self):
+        assert IndeedScraperAgent.build_search_url("SWE", "NYC").endswith("?q=SWE&l=NYC")
+        assert IndeedScraperAgent.build_search_url("SWE", "NYC", page=3).endswith("&start=20")
+
+    @pytest.mark.asyncio
+    async def test_http_pages_until_max_results(self):
+        scraper = _make_scraper(max_candidates=3, max_pages=4, page_workers=1)
+        page_html = _fixture("indeed_search.html")
+
+        def fake_fetch(url, timeout):
+            # Make every page's job keys unique
+            page = url.split("start=")[1] if "start=" in url else "0"
+            return page_html.replace("jk=", f"p{page}jk=")
+
+        with patch("backend.agents.indeed_scraper.fetch_html", side_effect=fake_fetch) as fetch:
+            results = await scraper.search_resumes("SWE", "NYC")
+
+        assert len(results) == 3
+        assert fetch.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_pages_are_reported(self):
+        scraper = _make_scraper(max_candidates=5, max_pages=3, page_workers=1)
+        page_html = _fixture("indeed_search.html")
+
+        def fake_fetch(url, timeout):
+            if "start=10" in url:
+                raise TimeoutError("read timed out")
+            page = url.split("start=")[1] if "start=" in url else "0"
+            return page_html.replace("jk=", f"p{page}jk=")
+
+        with patch("backend.agents.indeed_scraper.fetch_html", side_effect=fake_fetch):
+            result = await scraper.execute(job_title="SWE")
+
+        assert result["results_found"] == 4
+        assert result["skipped_pages"] == [2]
@@ -0,0 +1,170 @@
+"""
+Tests for LinkedInScraperAgent search paging (backend/agents/linkedin_scraper.py)
+"""
+
+import threading
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+from backend.agents.linkedin_scraper import LinkedInScraperAgent
+from backend.utils.seen import seen_key
+
+
+def _make_scraper(**overrides):
+    config = {"headless": True, "scrape_delay": 0, "max_candidates": 3, **overrides}
+    return LinkedInScraperAgent(agent_id="linkedin-test", config=config)
+
+
+def _profiles(*names):
+    return [f"https://www.linkedin.com/in/{name}/" for name in names]
+
+
+# ── URLs ─────────────────────────────────────────────────────────────────────
+
+class TestBuildSearchUrl:
+
+    def test_first_page_has_no_page_param(self):
+        url = LinkedInScraperAgent.build_search_url("Python Developer", "New York", ["AWS"])
+        assert url == ("https://www.linkedin.com/search/results/people/"
+                       "?keywords=Python%20Developer%20AWS&location=New%20York")
+
+    def test_later_pages(self):
+        assert LinkedInScraperAgent.build_search_url("SWE", page=2).endswith("&page=2")
+
+
+# ── Paging ───────────────────────────────────────────────────────────────────
+
+@asynccontextmanager
+async def _fake_lease(timeout=None):
+    yield MagicMock()
+
+
+def _pages(*pages):
+    """load_results_page stand-in returning fixed profile URLs per page number."""
+    async def load(search_url, driver=None):
+        page = int(search_url.split("&page=")[1]) if "&page=" in search_url else 1
+        return pages[page - 1] if page <= len(pages) else []
+    return load
+
+
+class TestPaging:
+
+    @pytest.mark.asyncio
+    async def test_reads_further_pages_until_max_candidates(self):
+        scraper = _make_scraper(max_candidates=4, page_workers=2)
+        load = AsyncMock(side_effect=_pages(_profiles("a", "b"), _profiles("c", "d"), _profiles("e"), _profiles("f")))
+
+        with patch.object(scraper, "load_results_page", load), \
+                patch.object(scraper.driver_pool, "lease", _fake_lease), \
+                patch.object(scraper, "extract_candidate_info", side_effect=lambda url: {"profile_url": url}):
+            candidates = await scraper.search_candidates("SWE")
+
+        assert [c["profile_url"] for c in candidates] == _profiles("a", "b", "c", "d")
+        # Page 1 alone, then at most two workers; page 4 is never requested
+        requested = [call.args[0] for call in load.await_args_list]
+        assert requested[0].endswith("keywords=SWE")
+        assert not any("&page=4" in url for url in requested)
+
+    @pytest.mark.asyncio
+    async def test_full_first_page_stops_early(self):
+        scraper = _make_scraper(max_candidates=2)
+        load = AsyncMock(side_effect=_pages(_profiles("a", "b", "c"), _profiles("d")))
+
+        with patch.object(scraper, "load_results_page", load), \
+                patch.object(scraper, "extract_candidate_info", side_effect=lambda url: {"profile_url": url}):
+            candidates = await scraper.search_candidates("SWE")
+
+        assert len(candidates) == 2
+        assert load.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cards_and_login_read_off_the_event_loop(self):
+        scraper = _make_scraper()
+        scraper.driver = MagicMock(current_url="https://www.linkedin.com/feed/")
+        loop_thread = threading.get_ident()
+        threads = []
+
+        def extract(item):
+            threads.append(threading.get_ident())
+            return {"profile_url": item}
+
+        scraper.driver.find_element.side_effect = lambda *a: threads.append(threading.get_ident()) or MagicMock()
+        with patch.object(scraper, "load_results_page", AsyncMock(return_value=_profiles("a", "b"))), \
+                patch.object(scraper, "extract_candidate_info", side_effect=extract), \
+                patch("backend.agents.linkedin_scraper.wait_for_any"), \
+                patch("backend.agents.linkedin_scraper.wait_for_url"):
+            await scraper.search_page("https://www.linkedin.com/search/results/people/")
+            assert await scraper.login_to_linkedin("jane@example.com", "pw") is True
+
+        assert len(threads) == 5 and loop_thread not in threads
+
+    @pytest.mark.asyncio
+    async def test_later_pages_reuse_first_page_driver(self):
+        # The agent already holds the pool's only driver: no worker waits for another
+        scraper = _make_scraper(max_candidates=4, page_workers=2)
+        scraper.driver = MagicMock()
+        load = AsyncMock(side_effect=_pages(_profiles("a"), _profiles("b"), _profiles("c"), _profiles("d")))
+        lease = MagicMock(side_effect=AssertionError("leased a second driver"))
+
+        with patch.object(scraper, "load_results_page", load), \
+                patch.object(scraper.driver_pool, "lease", lease), \
+                patch.object(scraper.driver_pool, "available", return_value=0), \
+                patch.object(scraper, "extract_candidate_info", side_effect=lambda url: {"profile_url": url}):
+            candidates = await scraper.search_candidates("SWE")
+
+        assert len(candidates) == 4
+        assert all(call.args[1] is scraper.driver for call in load.await_args_list[1:])
+        assert scraper.skipped_pages == []
+
+    @pytest.mark.asyncio
+    async def test_failed_pages_are_reported(self):
+        scraper = _make_scraper(max_candidates=4, max_pages=3, page_workers=1)
+        scraper.driver = MagicMock()
+
+        async def load(search_url, driver=None):
+            if "&page=2" in search_url:
+                raise TimeoutError("page timed out")
+            return _profiles("a") if "&page=" not in search_url else _profiles("c")
+
+        with patch.object(scraper, "load_results_page", side_effect=load), \
+                patch.object(scraper, "extract_candidate_info", side_effect=lambda url: {"profile_url": url}):
+            candidates = await scraper.search_candidates("SWE")
+
+        assert [c["profile_url"] for c in candidates] == _profiles("a", "c")
+        assert scraper.skipped_pages == [2]
+
+
+# ── Incremental search ──────────────────────────────────────────────────────
+
+class TestSkipSeen:
+
+    @pytest.mark.asyncio
+    async def test_skips_known_profiles_and_pages_deeper(self):
+        scraper = _make_scraper(page_workers=1)
+        scraper.seen_profiles.add(seen_key("SWE"), _profiles("a", "b"))
+        load = AsyncMock(side_effect=_pages(_profiles("a", "b", "c"), _profiles("d", "e"), _profiles("f")))
+
+        with patch.object(scraper, "load_results_page", load), \
+                patch.object(scraper.driver_pool, "lease", _fake_lease), \
+                patch.object(scraper, "profile_url_of", side_effect=lambda url: url), \
+                patch.object(scraper, "extract_candidate_info", side_effect=lambda url: {"profile_url": url}):
+            candidates = await scraper.search_candidates("SWE", skip_seen=True)
+
+        assert [c["profile_url"] for c in candidates] == _profiles("c", "d", "e")
+        assert scraper.skipped_seen == 2
+        assert load.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_fully_seen_first_page_is_not_the_end(self):
+        scraper = _make_scraper(page_workers=1)
+        scraper.seen_profiles.add(seen_key("SWE"), _profiles("a", "b", "c"))
+        load = AsyncMock(side_effect=_pages(_profiles("a", "b", "c"), _profiles("d", "e")))
+
+        with patch.object(scraper, "load_results_page", load), \
+                patch.object(scraper.driver_pool, "lease", _fake_lease), \
+                patch.object(scraper, "profile_url_of", side_effect=lambda url: url), \
+                patch.object(scraper, "extract_candidate_info", side_effect=lambda url: {"profile_url": url}):
+            candidates = await scraper.search_candidates("SWE", skip_seen=True)
+
+        assert [c["profile_url"] for c in candidates] == _profiles("d", "e")
+        assert scraper.skipped_seen == 3
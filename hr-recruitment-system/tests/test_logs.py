@@ -0,0 +1,121 @@
+"""
+Tests for the logging pipeline (backend/utils/logs.py)
+"""
+
+import json
+import logging
+import queue
+import sys
+import pytest
+
+from backend.utils import logs
+from backend.utils.logs import JSONFormatter, NonBlockingQueueHandler, SamplingFilter, TextFormatter
+
+
+def _record(message="hello", level=logging.INFO, **extra):
+    record = logging.LogRecord("test", level, __file__, 1, message, None, None)
+    record.__dict__.update(extra)
+    return record
+
+
+# ── Sampling ────────────────────────────────────────────────────────────────
+
+class TestSamplingFilter:
+
+    def test_limits_records_per_key(self):
+        sampler = SamplingFilter(rate=3, window=60)
+        kept = [sampler.filter(_record(sample_key="rank")) for _ in range(10)]
+        assert kept == [True] * 3 + [False] * 7
+        # Other keys have their own budget
+        assert sampler.filter(_record(sample_key="found"))
+
+    def test_unkeyed_and_warnings_always_pass(self):
+        sampler = SamplingFilter(rate=1, window=60)
+        assert all(sampler.filter(_record()) for _ in range(5))
+        sampler.filter(_record(sample_key="k"))
+        assert sampler.filter(_record(level=logging.WARNING, sample_key="k"))
+
+    def test_next_window_reports_suppressed(self):
+        sampler = SamplingFilter(rate=1, window=60)
+        sampler.filter(_record(sample_key="k"))
+        for _ in range(4):
+            sampler.filter(_record(sample_key="k"))
+        sampler.window = 0  # start a new window
+        record = _record(sample_key="k")
+        assert sampler.filter(record)
+        assert record.suppressed == 4
+
+
+# ── Formatting ──────────────────────────────────────────────────────────────
+
+class TestFormatters:
+
+    def test_json_includes_extra_fields(self):
+        line = JSONFormatter().format(_record("Scoring 1/2", agent_id="ranker:1", sample_key="rank"))
+        entry = json.loads(line)
+        assert entry["message"] == "Scoring 1/2"
+        assert entry["level"] == "INFO"
+        assert entry["agent_id"] == "ranker:1"
+        assert entry["sample_key"] == "rank"
+
+    def test_text_shows_agent_id(self):
+        record = _record(agent_id="ranker:1")
+        assert "test[ranker:1] - INFO - hello" in TextFormatter().format(record)
+        assert record.name == "test"
+
+
+# ── Queue handler ───────────────────────────────────────────────────────────
+
+class TestQueueHandler:
+
+    def test_records_are_rendered_before_queueing(self):
+        handler = NonBlockingQueueHandler(queue.Queue())
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord("test", logging.ERROR, __file__, 1, "failed %s", ("x",), sys.exc_info())
+        handler.handle(record)
+
+        queued = handler.queue.get_nowait()
+        assert queued.msg == "failed x" and queued.args is None
+        assert queued.exc_info is None and "ValueError: boom" in queued.exc_text
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+        handler.handle(_record("a"))
+        handler.handle(_record("b"))
+        assert handler.dropped == 1
+
+
+# ── Pipeline ────────────────────────────────────────────────────────────────
+
+class TestSetupLogging:
+
+    @pytest.fixture
+    def pipeline(self, monkeypatch):
+        # Run against a fresh pipeline, then restore the one the app installed
+        existing = logs._listener
+        existing_handlers = list(logging.getLogger().handlers)
+        existing_level = logging.getLogger().level
+        monkeypatch.setattr(logs, "_listener", None)
+        yield
+        logs.shutdown_logging()
+        root = logging.getLogger()
+        root.handlers[:] = existing_handlers
+        root.setLevel(existing_level)
+        logs._listener = existing
+
+    def test_writes_sampled_json_lines(self, pipeline, tmp_path):
+        log_file = tmp_path / "app.log"
+        listener = logs.setup_logging("INFO", log_file=str(log_file), sample_rate=2)
+        assert logs.setup_logging() is listener
+
+        logger = logging.getLogger("pipeline-test")
+        for i in range(5):
+            logger.info("item %d", i, extra={"sample_key": "item"})
+        logger.warning("done")
+        logs.shutdown_logging()
+
+        entries = [json.loads(line) for line in log_file.read_text().splitlines()]
+        assert [e["message"] for e in entries] == ["item 0", "item 1", "done"]
+        assert entries[-1]["level"] == "WARNING"
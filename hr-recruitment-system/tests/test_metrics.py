@@ -0,0 +1,123 @@
+"""
+Tests for metrics (backend/utils/metrics.py)
+"""
+
+import asyncio
+import time
+import pytest
+from types import SimpleNamespace
+
+from backend.utils import metrics
+from backend.utils.metrics import MetricsRegistry, observe_llm
+
+
+# ── Registry and rendering ──────────────────────────────────────────────────
+
+class TestRegistry:
+
+    def test_counter_and_gauge_render(self):
+        registry = MetricsRegistry()
+        requests = registry.counter("t_requests_total", "Requests", ["route"])
+        depth = registry.gauge("t_depth", "Depth")
+
+        requests.inc(route="/a")
+        requests.inc(2, route='/b"x')
+        depth.set(3)
+
+        text = registry.render()
+        assert "# TYPE t_requests_total counter" in text
+        assert 't_requests_total{route="/a"} 1' in text
+        assert 't_requests_total{route="/b\\"x"} 2' in text
+        assert "t_depth 3" in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        latency = registry.histogram("t_seconds", "Latency", ["stage"], buckets=(0.1, 1))
+        for value in (0.05, 0.1, 0.5, 5):
+            latency.observe(value, stage="x")
+
+        text = registry.render()
+        assert 't_seconds_bucket{stage="x",le="0.1"} 2' in text
+        assert 't_seconds_bucket{stage="x",le="1"} 3' in text
+        assert 't_seconds_bucket{stage="x",le="+Inf"} 4' in text
+        assert 't_seconds_count{stage="x"} 4' in text
+        assert 't_seconds_sum{stage="x"} 5.65' in text
+
+    def test_labels_must_match(self):
+        counter = MetricsRegistry().counter("t_total", "x", ["a"])
+        with pytest.raises(ValueError):
+            counter.inc(b="1")
+        with pytest.raises(ValueError):
+            counter.inc(-1, a="1")
+
+    def test_collectors_run_before_render(self):
+        registry = MetricsRegistry()
+        gauge = registry.gauge("t_live", "Live value")
+        registry.add_collector("live", lambda: gauge.set(42))
+        assert "t_live 42" in registry.render()
+
+    def test_pool_collector(self):
+        from backend.utils.pools import get_pool
+
+        get_pool("metrics-test", lambda: object(), max_size=3)
+        text = metrics.REGISTRY.render()
+        assert 'hr_pool_resources{pool="metrics-test",state="max"} 3' in text
+        assert 'hr_pool_waiting{pool="metrics-test"} 0' in text
+
+
+# ── LLM calls ───────────────────────────────────────────────────────────────
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class TestObserveLlm:
+
+    @pytest.mark.asyncio
+    async def test_counts_tokens_by_model(self):
+        async def call():
+            return SimpleNamespace(usage=SimpleNamespace(input_tokens=120, output_tokens=30))
+
+        before = metrics.LLM_TOKENS.get(model="m-test", direction="input")
+        await observe_llm("m-test", call())
+
+        assert metrics.LLM_TOKENS.get(model="m-test", direction="input") == before + 120
+        assert metrics.LLM_TOKENS.get(model="m-test", direction="output") >= 30
+        assert metrics.LLM_REQUESTS.get(model="m-test", outcome="ok") >= 1
+
+    @pytest.mark.asyncio
+    async def test_openai_usage_fields(self):
+        async def call():
+            return SimpleNamespace(usage=SimpleNamespace(prompt_tokens=7, completion_tokens=3))
+
+        before = metrics.LLM_TOKENS.get(model="m-openai", direction="output")
+        await observe_llm("m-openai", call())
+        assert metrics.LLM_TOKENS.get(model="m-openai", direction="output") == before + 3
+
+    @pytest.mark.asyncio
+    async def test_rate_limits_are_counted_and_raised(self):
+        async def call():
+            raise RateLimitError("slow down")
+
+        before = metrics.LLM_REQUESTS.get(model="m-429", outcome="rate_limited")
+        with pytest.raises(RateLimitError):
+            await observe_llm("m-429", call())
+        assert metrics.LLM_REQUESTS.get(model="m-429", outcome="rate_limited") == before + 1
+
+
+# ── Event loop lag ──────────────────────────────────────────────────────────
+
+class TestLoopLag:
+
+    @pytest.mark.asyncio
+    async def test_blocking_call_shows_up_as_lag(self):
+        monitor = asyncio.create_task(metrics.monitor_event_loop(0.01))
+        await asyncio.sleep(0.02)
+        time.sleep(0.1)  # block the loop
+        await asyncio.sleep(0.03)
+        monitor.cancel()
+
+        text = metrics.REGISTRY.render()
+        assert "hr_event_loop_lag_seconds_count" in text
+        assert metrics.EVENT_LOOP_LAG_LAST.get() < 0.1  # later samples recover
+        assert metrics.EVENT_LOOP_LAG.count() >= 2
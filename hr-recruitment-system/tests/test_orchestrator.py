@@ -2,6 +2,8 @@
 Tests for AgentOrchestrator (backend/agents/orchestrator.py)
 """
 
+import subprocess
+import sys
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from backend.agents.orchestrator import AgentOrchestrator
@@ -35,6 +37,27 @@ class TestInit:
         assert orch.agent_id == "orchestrator"
         assert orch.resume_parser.agent_id == "resume_parser_1"
 
+    def test_agents_load_on_first_use(self):
+        orch = _make_orchestrator()
+        assert orch.loaded_agents() == {}
+        ranker = orch.candidate_ranker
+        assert orch.candidate_ranker is ranker
+        assert list(orch.loaded_agents()) == ["candidate_ranker"]
+
+    def test_warm_up_loads_requested_agents(self):
+        orch = _make_orchestrator()
+        assert orch.warm_up(["candidate_ranker", "indeed_scraper"]) == ["candidate_ranker", "indeed_scraper"]
+        assert set(orch.loaded_agents()) == {"candidate_ranker", "indeed_scraper"}
+        with pytest.raises(ValueError):
+            orch.warm_up(["payroll"])
+
+    def test_package_import_skips_heavy_dependencies(self):
+        # Fresh interpreter: this one has already imported every agent
+        code = ("import sys, backend.agents, backend.agents.orchestrator; "
+                "print(sorted(m for m in ('selenium', 'pdfplumber', 'anthropic') if m in sys.modules))")
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == "[]"
+
 
 # ── get_agents_status ────────────────────────────────────────────────────────
 
@@ -58,6 +81,43 @@ class TestGetAgentsStatus:
             assert "status" in agent_summary
             assert "results_count" in agent_summary
 
+    def test_merge_combines_worker_reports(self):
+        orch = _make_orchestrator()
+        reports = [
+            {"candidate_ranker": {"status": "completed", "created_at": "2024-01-02T00:00:00",
+                                  "last_run": "2024-01-02T10:00:00", "results_count": 3, "errors_count": 0}},
+            {"candidate_ranker": {"status": "failed", "created_at": "2024-01-01T00:00:00",
+                                  "last_run": "2024-01-02T11:00:00", "results_count": 2, "errors_count": 1}},
+        ]
+        status = orch.merge_agents_status(orch.get_agents_status(), reports)
+        ranker = status["candidate_ranker"]
+        assert (ranker["results_count"], ranker["errors_count"]) == (5, 1)
+        assert ranker["status"] == "failed"
+        assert ranker["last_run"] == "2024-01-02T11:00:00"
+        assert ranker["created_at"] == "2024-01-01T00:00:00"
+        assert status["orchestrator"]["workers"] == 2
+
+    def test_merge_reports_running_anywhere(self):
+        orch = _make_orchestrator()
+        reports = [
+            {"linkedin_scraper": {"status": "running", "last_run": None, "results_count": 0}},
+            {"linkedin_scraper": {"status": "completed", "last_run": "2024-01-02T10:00:00", "results_count": 1}},
+        ]
+        status = orch.merge_agents_status(orch.get_agents_status(), reports)
+        assert status["linkedin_scraper"]["status"] == "running"
+
+    def test_status_report_is_compact(self):
+        report = _make_orchestrator().status_report()
+        assert set(report) == {"orchestrator", *AgentOrchestrator.AGENT_NAMES}
+        assert all(set(entry) == set(AgentOrchestrator.STATUS_FIELDS) for entry in report.values())
+
+    def test_unused_agents_are_not_loaded(self):
+        orch = _make_orchestrator()
+        status = orch.get_agents_status()
+        assert status["linkedin_scraper"]["status"] == "initialized"
+        assert status["linkedin_scraper"]["agent_id"] == "linkedin_scraper_1"
+        assert orch.loaded_agents() == {}
+
 
 # ── parse_resumes ────────────────────────────────────────────────────────────
 
@@ -175,6 +235,112 @@ class TestSearchCandidates:
 
         assert candidates == []
 
+    @pytest.mark.asyncio
+    async def test_repeated_search_served_from_cache(self):
+        orch = _make_orchestrator()
+
+        indeed_result = {
+            "success": True,
+            "data": {"results": [{"name": "I1", "source": "Indeed"}]},
+        }
+
+        with patch.object(
+            orch.indeed_scraper, "run", new_callable=AsyncMock, return_value=indeed_result
+        ) as mock_run:
+            first = await orch.search_candidates(job_title="SWE", search_linkedin=False)
+            second = await orch.spawn().search_candidates(job_title="swe", search_linkedin=False)
+
+        assert first == second
+        assert mock_run.await_count == 1
+        assert orch.get_summary()["scrape_cache"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_logged_in_search_bypasses_cache(self):
+        orch = _make_orchestrator()
+        result = {"success": True, "data": {"candidates": [{"name": "L1", "source": "LinkedIn"}]}}
+
+        with patch.object(
+            orch.linkedin_scraper, "run", new_callable=AsyncMock, return_value=result
+        ) as mock_run:
+            for email in ("a@example.com", "b@example.com"):
+                await orch.search_candidates(job_title="SWE", search_indeed=False,
+                                             linkedin_credentials={"email": email, "password": "pw"})
+
+        assert mock_run.await_count == 2
+        assert orch.get_summary()["scrape_cache"]["entries"] == 0
+
+
+# ── Incremental search ──────────────────────────────────────────────────────
+
+class TestIncrementalSearch:
+
+    @pytest.mark.asyncio
+    async def test_only_new_candidates_passed_downstream(self):
+        orch = _make_orchestrator()
+        first_batch = [
+            {"name": "A", "source": "LinkedIn", "profile_url": "https://www.linkedin.com/in/a/"},
+            {"name": "B", "source": "LinkedIn", "profile_url": "https://www.linkedin.com/in/b/"},
+        ]
+        second_batch = first_batch + [
+            {"name": "C", "source": "LinkedIn", "profile_url": "https://www.linkedin.com/in/c/"},
+        ]
+
+        with patch.object(orch, "search_candidates", new_callable=AsyncMock,
+                          side_effect=[first_batch, second_batch]) as mock_search:
+            first = await orch.execute(mode="search_only", job_title="SWE", only_new=True)
+            second = await orch.execute(mode="search_only", job_title="swe", only_new=True)
+
+        assert [c["name"] for c in first["candidates"]] == ["A", "B"]
+        assert [c["name"] for c in second["candidates"]] == ["C"]
+        assert second["previously_seen"] == 2
+        assert mock_search.call_args.kwargs["skip_seen"] is True
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        orch = _make_orchestrator()
+        batch = [{"name": "A", "source": "LinkedIn", "profile_url": "https://www.linkedin.com/in/a/"}]
+
+        with patch.object(orch, "search_candidates", new_callable=AsyncMock, return_value=batch):
+            await orch.execute(mode="search_only", job_title="SWE")
+            second = await orch.execute(mode="search_only", job_title="SWE")
+
+        assert len(second["candidates"]) == 1
+        assert second["previously_seen"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_ranking_leaves_candidates_unseen(self):
+        orch = _make_orchestrator()
+        batch = [{"name": "A", "source": "LinkedIn", "profile_url": "https://www.linkedin.com/in/a/"}]
+        failed = {"success": False, "error": "LLM down"}
+
+        with patch.object(orch, "search_candidates", new_callable=AsyncMock, return_value=batch), \
+                patch.object(orch.candidate_ranker, "run", new_callable=AsyncMock, return_value=failed):
+            await orch.execute(mode="search_only", job_title="SWE", job_requirements={"title": "SWE"},
+                               only_new=True)
+            second = await orch.execute(mode="search_only", job_title="SWE", only_new=True)
+
+        assert [c["name"] for c in second["candidates"]] == ["A"]
+
+    @pytest.mark.asyncio
+    async def test_repeat_reads_past_cached_pages(self):
+        orch = _make_orchestrator()
+        result = {"success": True, "data": {"candidates": []}}
+
+        with patch.object(
+            orch.linkedin_scraper, "run", new_callable=AsyncMock, return_value=result
+        ) as mock_run:
+            for _ in range(2):
+                await orch.execute(mode="search_only", job_title="SWE", search_indeed=False, only_new=True)
+
+        assert mock_run.await_count == 2
+
+    def test_store_opened_only_when_used(self, tmp_path):
+        path = tmp_path / "seen.db"
+        orch = AgentOrchestrator(config={"seen_profiles_path": str(path)})
+        assert not path.exists()
+        orch.seen_profiles.add("q", ["https://x/in/a"])
+        assert path.exists()
+
 
 # ── execute (full workflow) ──────────────────────────────────────────────────
 
@@ -278,3 +444,116 @@ class TestExecute:
         assert result["sources"]["uploaded_resumes"] == 1
         assert result["sources"]["linkedin"] == 2
         assert result["sources"]["indeed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_duplicates_merged_before_ranking(self, sample_job_requirements):
+        orch = _make_orchestrator()
+
+        with patch.object(
+            orch, "parse_resumes", new_callable=AsyncMock,
+            return_value=[{"name": "Jane Doe", "email": "jane@x.com", "source": "uploaded_resume"}],
+        ):
+            with patch.object(
+                orch, "search_candidates", new_callable=AsyncMock,
+                return_value=[{"name": "Jane Doe", "email": "JANE@x.com", "source": "LinkedIn"}],
+            ):
+                ranking_result = {"success": True, "data": {"ranked_candidates": [], "top_score": 0}}
+                with patch.object(
+                    orch.candidate_ranker, "run", new_callable=AsyncMock, return_value=ranking_result
+                ) as mock_rank:
+                    result = await orch.execute(
+                        mode="full_search",
+                        job_title="SWE",
+                        resume_files=["/r.pdf"],
+                        job_requirements=sample_job_requirements,
+                    )
+
+        assert result["duplicates_merged"] == 1
+        assert result["total_candidates_found"] == 1
+        assert len(mock_rank.call_args.kwargs["candidates"]) == 1
+
+
+# ── Per-request execution contexts ──────────────────────────────────────────
+
+class TestRunIsolated:
+
+    def test_spawn_creates_independent_agents(self):
+        orch = _make_orchestrator()
+        a = orch.spawn()
+        b = orch.spawn()
+        assert a.agent_id != b.agent_id
+        assert a.linkedin_scraper is not b.linkedin_scraper
+        assert a.resume_parser is not orch.resume_parser
+
+    def test_spawned_agents_share_pooled_resources(self):
+        orch = _make_orchestrator()
+        child = orch.spawn()
+        assert child.resume_parser.client is orch.resume_parser.client
+        assert child.linkedin_scraper.driver_pool is orch.linkedin_scraper.driver_pool
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_do_not_share_state(self):
+        orch = _make_orchestrator()
+        seen = []
+
+        async def fake_search(self, **kwargs):
+            seen.append(self.agent_id)
+            return [{"name": kwargs["job_title"], "source": "LinkedIn"}]
+
+        with patch.object(AgentOrchestrator, "search_candidates", fake_search):
+            import asyncio
+            results = await asyncio.gather(
+                orch.run_isolated(mode="search_only", job_title="A", rank_candidates=False),
+                orch.run_isolated(mode="search_only", job_title="B", rank_candidates=False),
+            )
+
+        assert [r["data"]["candidates"][0]["name"] for r in results] == ["A", "B"]
+        assert len(set(seen)) == 2
+        assert orch.active_runs == {}
+        assert orch.completed_runs == 2
+        assert orch.status == "idle"
+        # Per-run results are folded into the long-lived template's history
+        assert len(orch.results) == 2
+
+    @pytest.mark.asyncio
+    async def test_run_isolated_single_agent(self, sample_job_requirements):
+        orch = _make_orchestrator()
+        ranking_result = {"success": True, "data": {"ranked_candidates": []}}
+
+        with patch(
+            "backend.agents.candidate_ranker.CandidateRankerAgent.run",
+            new_callable=AsyncMock,
+            return_value=ranking_result,
+        ) as mock_run:
+            result = await orch.run_isolated(
+                agent="candidate_ranker",
+                candidates=[{"name": "A"}],
+                job_requirements=sample_job_requirements,
+            )
+
+        assert result == ranking_result
+        mock_run.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_run_isolated_attaches_trace(self):
+        orch = _make_orchestrator()
+        orch.config["tracing"] = True
+
+        async def fake_search(self, **kwargs):
+            return {"candidates": [{"name": "A"}]}
+
+        with patch.object(AgentOrchestrator, "search_candidates", fake_search):
+            result = await orch.run_isolated(mode="search_only", job_title="A", rank_candidates=False)
+
+        (root,) = result["trace"]["spans"]
+        assert root["name"] == "AgentOrchestrator.run"
+        assert root["category"] == "agent"
+        assert "search" in [child["name"] for child in root["children"]]
+
+    def test_summary_reports_active_runs(self):
+        orch = _make_orchestrator()
+        child = orch.spawn()
+        orch.active_runs[child.agent_id] = child
+        summary = orch.get_summary()
+        assert child.agent_id in summary["active_runs"]
+        assert "pools" in summary
@@ -0,0 +1,73 @@
+"""
+Tests for paginated scraping (backend/utils/pagination.py)
+"""
+
+import asyncio
+import pytest
+from backend.utils.pagination import paginate
+
+
+def _site(pages, delay=0.0):
+    """Fake fetch_page over fixed pages, tracking calls and concurrency."""
+    state = {"calls": [], "in_flight": 0, "peak": 0}
+
+    async def fetch_page(page):
+        state["calls"].append(page)
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        await asyncio.sleep(delay)
+        state["in_flight"] -= 1
+        item = pages.get(page)
+        if isinstance(item, Exception):
+            raise item
+        return list(item or [])
+
+    return fetch_page, state
+
+
+# ── paginate ─────────────────────────────────────────────────────────────────
+
+class TestPaginate:
+
+    @pytest.mark.asyncio
+    async def test_first_page_enough(self):
+        fetch, state = _site({1: [1, 2, 3], 2: [4]})
+        assert await paginate(fetch, max_items=2) == [1, 2]
+        assert state["calls"] == [1]
+
+    @pytest.mark.asyncio
+    async def test_collects_in_page_order_and_dedupes(self):
+        fetch, _ = _site({1: [1, 2], 2: [2, 3], 3: [4, 5], 4: [6]}, delay=0.01)
+        assert await paginate(fetch, max_items=5, max_pages=4, workers=3) == [1, 2, 3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_worker_bound_and_end_of_results(self):
+        fetch, state = _site({1: [1], 2: [2], 3: [3]}, delay=0.01)
+        result = await paginate(fetch, max_items=50, max_pages=10, workers=2)
+
+        assert result == [1, 2, 3]
+        assert state["peak"] <= 2
+        # Stops handing out pages shortly after the first empty one
+        assert max(state["calls"]) <= 5
+
+    @pytest.mark.asyncio
+    async def test_is_end_overrides_empty_page(self):
+        # Pages 1 and 2 had results that were all filtered out; page 4 is past the end
+        fetch, state = _site({3: [3]})
+        result = await paginate(fetch, max_items=5, max_pages=6, workers=1,
+                                is_end=lambda page, items: page >= 4)
+        assert result == [3]
+        assert state["calls"] == [1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_failed_later_page_is_skipped(self):
+        fetch, _ = _site({1: [1], 2: RuntimeError("boom"), 3: [3]})
+        skipped = []
+        assert await paginate(fetch, max_items=3, max_pages=3, workers=1, skipped=skipped) == [1, 3]
+        assert skipped == [2]
+
+    @pytest.mark.asyncio
+    async def test_failed_first_page_raises(self):
+        fetch, _ = _site({1: RuntimeError("blocked")})
+        with pytest.raises(RuntimeError):
+            await paginate(fetch, max_items=3)
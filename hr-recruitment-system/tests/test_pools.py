@@ -0,0 +1,99 @@
+"""
+Tests for shared resource pools (backend/utils/pools.py)
+"""
+
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+from backend.utils.pools import ResourcePool, get_pool, get_llm_client
+
+
+def _counting_factory():
+    counter = {"n": 0}
+
+    def factory():
+        counter["n"] += 1
+        return f"resource-{counter['n']}"
+
+    return factory, counter
+
+
+# ── ResourcePool ────────────────────────────────────────────────────────────
+
+class TestResourcePool:
+
+    @pytest.mark.asyncio
+    async def test_reuses_released_resource(self):
+        factory, counter = _counting_factory()
+        pool = ResourcePool("t1", factory, max_size=2)
+
+        first = await pool.acquire()
+        await pool.release(first)
+        second = await pool.acquire()
+
+        assert first == second
+        assert counter["n"] == 1
+
+    @pytest.mark.asyncio
+    async def test_bounded_size_waits_for_release(self):
+        factory, counter = _counting_factory()
+        pool = ResourcePool("t2", factory, max_size=1, poll_interval=0.01)
+
+        held = await pool.acquire()
+        waiter = asyncio.ensure_future(pool.acquire())
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+        assert pool.stats()["waiting"] == 1
+
+        await pool.release(held)
+        assert await asyncio.wait_for(waiter, 1) == held
+        assert counter["n"] == 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_timeout(self):
+        factory, _ = _counting_factory()
+        pool = ResourcePool("t3", factory, max_size=1, poll_interval=0.01)
+        await pool.acquire()
+        with pytest.raises(TimeoutError):
+            await pool.acquire(timeout=0.05)
+
+    @pytest.mark.asyncio
+    async def test_lease_discards_on_error(self):
+        factory, counter = _counting_factory()
+        dispose = MagicMock()
+        pool = ResourcePool("t4", factory, max_size=1, dispose=dispose)
+
+        with pytest.raises(RuntimeError):
+            async with pool.lease():
+                raise RuntimeError("driver crashed")
+
+        dispose.assert_called_once_with("resource-1")
+        async with pool.lease() as resource:
+            assert resource == "resource-2"
+        assert pool.stats()["in_use"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_reset_discards_resource(self):
+        factory, _ = _counting_factory()
+        pool = ResourcePool("t5", factory, reset=MagicMock(side_effect=Exception("dead")))
+        resource = await pool.acquire()
+        await pool.release(resource)
+        assert pool.stats()["idle"] == 0
+
+
+# ── Registries ──────────────────────────────────────────────────────────────
+
+class TestRegistries:
+
+    def test_get_pool_returns_same_instance(self):
+        factory, _ = _counting_factory()
+        assert get_pool("shared-test", factory) is get_pool("shared-test", factory)
+
+    def test_llm_client_shared_per_key(self, _mock_ai_clients):
+        mock_anthropic_cls, _ = _mock_ai_clients
+        mock_anthropic_cls.side_effect = lambda **kwargs: MagicMock()
+
+        a = get_llm_client("claude", "key-a")
+        assert get_llm_client("claude", "key-a") is a
+        assert get_llm_client("claude", "key-b") is not a
+        assert mock_anthropic_cls.call_count == 2
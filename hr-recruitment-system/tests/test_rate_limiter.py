@@ -0,0 +1,56 @@
+"""
+Tests for the per-domain rate limiter (backend/utils/rate_limiter.py)
+"""
+
+import time
+import pytest
+from backend.utils.rate_limiter import DomainRateLimiter, get_rate_limiter
+
+
+# ── Scheduling ───────────────────────────────────────────────────────────────
+
+class TestScheduling:
+
+    def test_first_request_is_immediate(self):
+        limiter = DomainRateLimiter(min_interval=5)
+        assert limiter.reserve("https://www.linkedin.com/search") == 0
+
+    def test_same_domain_is_spaced(self):
+        limiter = DomainRateLimiter(min_interval=5)
+        limiter.reserve("https://www.linkedin.com/a")
+        delay = limiter.reserve("https://linkedin.com/b")
+        assert 4.9 < delay <= 5
+
+    def test_domains_are_independent(self):
+        limiter = DomainRateLimiter(min_interval=5)
+        limiter.reserve("https://www.linkedin.com/a")
+        assert limiter.reserve("https://www.indeed.com/jobs") == 0
+
+    @pytest.mark.asyncio
+    async def test_wait_sleeps_only_when_needed(self):
+        limiter = DomainRateLimiter(min_interval=0.05)
+        start = time.monotonic()
+        await limiter.wait("https://example.com/1")
+        await limiter.wait("https://example.com/2")
+        assert time.monotonic() - start >= 0.04
+
+
+# ── Adaptive pacing ─────────────────────────────────────────────────────────
+
+class TestAdaptive:
+
+    def test_backs_off_and_recovers(self):
+        limiter = DomainRateLimiter(min_interval=1, max_interval=8)
+        url = "https://www.indeed.com/jobs"
+        limiter.record(url, ok=False)
+        assert limiter.interval(url) == 2
+        for _ in range(5):
+            limiter.record(url, ok=False)
+        assert limiter.interval(url) == 8
+        for _ in range(50):
+            limiter.record(url, ok=True)
+        assert limiter.interval(url) == 1
+
+    def test_shared_instance_per_floor(self):
+        assert get_rate_limiter(3) is get_rate_limiter(3)
+        assert get_rate_limiter(3) is not get_rate_limiter(4)
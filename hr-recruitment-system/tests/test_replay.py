@@ -0,0 +1,107 @@
+"""
+Tests for the record/replay harness (backend/utils/replay.py)
+"""
+
+import pytest
+import requests
+from pathlib import Path
+from unittest.mock import patch
+from backend.agents.indeed_scraper import IndeedScraperAgent
+from backend.utils.replay import ReplayServer, SnapshotStore, rewrite_url, snapshot_key
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+SEARCH_URL = IndeedScraperAgent.build_search_url("Python Developer", "New York, NY")
+JOB_URLS = [
+    "https://www.indeed.com/rc/clk?jk=a1b2c3d4e5f60718&from=serp",
+    "https://www.indeed.com/viewjob?jk=0f1e2d3c4b5a6978",
+]
+
+
+def _fixture(name):
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+@pytest.fixture
+def indeed_snapshots(tmp_path):
+    """Snapshot store holding one Indeed search and its two job pages."""
+    store = SnapshotStore(tmp_path / "snapshots")
+    store.record(SEARCH_URL, _fixture("indeed_search.html"))
+    for url in JOB_URLS:
+        store.record(url, _fixture("indeed_job.html"))
+    return store
+
+
+# ── URL handling ─────────────────────────────────────────────────────────────
+
+class TestUrls:
+
+    def test_snapshot_key_ignores_encoding_and_order(self):
+        a = snapshot_key("https://www.indeed.com/jobs?q=python+developer&l=NYC")
+        b = snapshot_key("http://www.indeed.com/jobs?l=NYC&q=python%20developer")
+        assert a == b
+
+    def test_rewrite_url_keeps_host_path_and_query(self):
+        rewritten = rewrite_url("https://www.indeed.com/jobs?q=x", "http://127.0.0.1:9000/")
+        assert rewritten == "http://127.0.0.1:9000/www.indeed.com/jobs?q=x"
+
+
+# ── SnapshotStore ────────────────────────────────────────────────────────────
+
+class TestSnapshotStore:
+
+    def test_record_and_load(self, tmp_path):
+        store = SnapshotStore(tmp_path)
+        path = store.record("https://www.linkedin.com/search/results/people/?keywords=a%20b", "<html>1</html>")
+
+        assert path.exists()
+        assert store.load("https://www.linkedin.com/search/results/people/?keywords=a+b") == "<html>1</html>"
+        assert store.load("https://www.linkedin.com/other") is None
+
+    def test_index_survives_reopen(self, tmp_path):
+        SnapshotStore(tmp_path).record("https://x.com/a", "<html>a</html>")
+        reopened = SnapshotStore(tmp_path)
+
+        assert len(reopened) == 1
+        assert reopened.urls() == ["https://x.com/a"]
+        assert reopened.load("https://x.com/a") == "<html>a</html>"
+
+
+# ── ReplayServer ─────────────────────────────────────────────────────────────
+
+class TestReplayServer:
+
+    def test_serves_recorded_pages(self, indeed_snapshots):
+        with ReplayServer(indeed_snapshots) as server:
+            ok = requests.get(rewrite_url(SEARCH_URL, server.url), timeout=5)
+            missing = requests.get(rewrite_url("https://www.indeed.com/nope", server.url), timeout=5)
+
+        assert ok.status_code == 200
+        assert "Senior Python Developer" in ok.text
+        assert missing.status_code == 404
+        assert (server.hits, server.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_indeed_agent_replays_search_and_details(self, indeed_snapshots):
+        with ReplayServer(indeed_snapshots) as server:
+            agent = IndeedScraperAgent(config={
+                "scrape_delay": 0, "max_pages": 1, "replay_url": server.url
+            })
+            result = await agent.execute(job_title="Python Developer", location="New York, NY",
+                                         get_details=True)
+
+        titles = [r["title"] for r in result["results"]]
+        assert titles == ["Senior Python Developer", "Backend Engineer (Django)"]
+        assert all(r["full_description"] for r in result["results"])
+        # Extracted links still point at the live site
+        assert result["results"][1]["url"] == JOB_URLS[1]
+        assert server.misses == 0
+
+    @pytest.mark.asyncio
+    async def test_agent_records_fetched_pages(self, tmp_path):
+        agent = IndeedScraperAgent(config={"scrape_delay": 0, "record_dir": str(tmp_path)})
+
+        with patch("backend.agents.indeed_scraper.fetch_html", return_value=_fixture("indeed_search.html")):
+            await agent.search_resumes("Python Developer", "New York, NY")
+
+        assert SnapshotStore(tmp_path).load(SEARCH_URL) == _fixture("indeed_search.html")
@@ -0,0 +1,96 @@
+"""
+Tests for fast JSON responses and compression (backend/utils/responses.py)
+"""
+
+import json
+from datetime import datetime
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from backend.models.schemas import OrchestrationResponse
+from backend.utils.responses import (
+    CompressionMiddleware,
+    FastJSONResponse,
+    choose_encoding,
+    dumps,
+    with_defaults,
+)
+
+
+def _app():
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+    @app.get("/big")
+    async def big():
+        return {"items": [{"name": f"Candidate {i}", "skills": ["Python", "SQL"]} for i in range(50)]}
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/text")
+    async def text():
+        return PlainTextResponse("x" * 500, media_type="image/svg+xml")
+
+    @app.get("/stream")
+    async def stream():
+        async def events():
+            for i in range(3):
+                yield f"data: {'x' * 200}{i}\n\n"
+        return StreamingResponse(events(), media_type="application/json")
+
+    return TestClient(app)
+
+
+# ── Encoding ────────────────────────────────────────────────────────────────
+
+class TestEncoding:
+
+    def test_dumps_handles_common_types(self):
+        encoded = json.loads(dumps({"when": datetime(2024, 1, 2, 3, 4, 5), "tags": {"a"}, 1: "one"}))
+        assert encoded["when"].startswith("2024-01-02T03:04:05")
+        assert encoded["tags"] == ["a"]
+        assert encoded["1"] == "one"
+
+    def test_with_defaults_fills_optional_fields_only(self):
+        filled = with_defaults(OrchestrationResponse, {"mode": "search_only", "candidates": [{"x": object}]})
+        assert filled["duplicates_merged"] == 0
+        assert filled["next_cursor"] is None
+        assert "timestamp" in filled
+        assert "sources" not in filled  # required fields are not invented
+
+
+# ── Compression ─────────────────────────────────────────────────────────────
+
+class TestCompression:
+
+    def test_negotiation(self):
+        assert choose_encoding("gzip, deflate", ["br", "gzip"]) == "gzip"
+        assert choose_encoding("gzip;q=0.5, br", ["br", "gzip"]) == "br"
+        assert choose_encoding("br;q=0, *;q=0.1", ["br", "gzip"]) == "gzip"
+        assert choose_encoding("identity", ["br", "gzip"]) is None
+        assert choose_encoding("", ["gzip"]) is None
+
+    def test_large_json_is_gzipped(self):
+        resp = _app().get("/big", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in resp.headers["vary"]
+        assert int(resp.headers["content-length"]) < len(resp.content)
+        assert len(resp.json()["items"]) == 50
+
+    def test_small_and_non_text_bodies_untouched(self):
+        client = _app()
+        assert "content-encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+        assert "content-encoding" not in client.get("/text", headers={"Accept-Encoding": "gzip"}).headers
+
+    def test_streamed_responses_pass_through(self):
+        resp = _app().get("/stream", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in resp.headers
+        assert resp.text.count("data:") == 3
+
+    def test_no_accept_encoding(self):
+        resp = _app().get("/big", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in resp.headers
@@ -0,0 +1,160 @@
+"""
+Tests for the scrape result cache (backend/utils/scrape_cache.py)
+"""
+
+import asyncio
+import time
+import pytest
+from backend.utils.scrape_cache import ScrapeCache, scrape_key, get_scrape_cache
+from backend.utils.shared_state import SharedState
+
+
+def _counter(results=None):
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return results if results is not None else [{"name": f"call {len(calls)}"}]
+
+    return fetch, calls
+
+
+# ── scrape_key ───────────────────────────────────────────────────────────────
+
+class TestScrapeKey:
+
+    def test_normalizes_query(self):
+        a = scrape_key("linkedin", "Python Developer", "NYC", ["AWS", "django"])
+        b = scrape_key("linkedin", " python  developer", "nyc", ["Django", "aws"])
+        assert a == b
+
+    def test_source_and_location_are_part_of_key(self):
+        base = scrape_key("linkedin", "SWE", "NYC")
+        assert base != scrape_key("indeed", "SWE", "NYC")
+        assert base != scrape_key("linkedin", "SWE", "Boston")
+
+
+# ── ScrapeCache ──────────────────────────────────────────────────────────────
+
+class TestScrapeCache:
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_is_served_from_cache(self):
+        cache = ScrapeCache(ttl=60)
+        fetch, calls = _counter()
+
+        first, state1 = await cache.get_or_fetch("k", fetch)
+        second, state2 = await cache.get_or_fetch("k", fetch)
+
+        assert (state1, state2) == ("miss", "hit")
+        assert first == second
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_results_are_copies(self):
+        cache = ScrapeCache(ttl=60)
+        fetch, _ = _counter()
+
+        first, _ = await cache.get_or_fetch("k", fetch)
+        first[0]["name"] = "mutated"
+        second, _ = await cache.get_or_fetch("k", fetch)
+
+        assert second[0]["name"] == "call 1"
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_while_refreshing(self):
+        cache = ScrapeCache(ttl=0.05, stale_ttl=60)
+        fetch, calls = _counter()
+
+        await cache.get_or_fetch("k", fetch)
+        await asyncio.sleep(0.06)
+
+        stale, state = await cache.get_or_fetch("k", fetch)
+        assert state == "stale"
+        assert stale[0]["name"] == "call 1"
+        # Only one background refresh per key
+        await cache.get_or_fetch("k", fetch)
+        await asyncio.sleep(0.01)
+
+        fresh, state = await cache.get_or_fetch("k", fetch)
+        assert state == "hit"
+        assert fresh[0]["name"] == "call 2"
+        assert len(calls) == 2
+        assert cache.stats()["refreshes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refetched(self):
+        cache = ScrapeCache(ttl=0.02, stale_ttl=0.02)
+        fetch, calls = _counter()
+
+        await cache.get_or_fetch("k", fetch)
+        await asyncio.sleep(0.05)
+        result, state = await cache.get_or_fetch("k", fetch)
+
+        assert state == "miss"
+        assert result[0]["name"] == "call 2"
+
+    @pytest.mark.asyncio
+    async def test_empty_and_failed_results_not_cached(self):
+        cache = ScrapeCache(ttl=60)
+        fetch, calls = _counter(results=[])
+
+        await cache.get_or_fetch("k", fetch)
+        await cache.get_or_fetch("k", fetch)
+        assert len(calls) == 2
+
+        async def boom():
+            raise RuntimeError("blocked")
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_fetch("x", boom)
+        assert cache.stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_scrape(self):
+        cache = ScrapeCache(ttl=60)
+        fetch, calls = _counter()
+
+        results = await asyncio.gather(*(cache.get_or_fetch("k", fetch) for _ in range(5)))
+
+        assert len(calls) == 1
+        assert all(r[0] == results[0][0] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_cache(self):
+        cache = ScrapeCache(ttl=0)
+        fetch, calls = _counter()
+
+        await cache.get_or_fetch("k", fetch)
+        await cache.get_or_fetch("k", fetch)
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_state_serves_other_processes(self):
+        # Two caches on one store stand in for two worker processes
+        shared = SharedState()
+        first, second = ScrapeCache(ttl=60, shared=shared), ScrapeCache(ttl=60, shared=shared)
+        fetch, calls = _counter()
+
+        await first.get_or_fetch("k", fetch)
+        result, state = await second.get_or_fetch("k", fetch)
+
+        assert state == "hit"
+        assert result == [{"name": "call 1"}]
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_entry_keeps_its_age(self):
+        shared = SharedState()
+        shared.put("scrape", "k", {"fetched_at": time.time() - 90, "result": [{"name": "old"}]})
+        cache = ScrapeCache(ttl=60, stale_ttl=600, shared=shared)
+        fetch, _ = _counter()
+
+        result, state = await cache.get_or_fetch("k", fetch)
+        assert state == "stale"
+        assert result == [{"name": "old"}]
+
+    def test_shared_cache_per_configuration(self):
+        assert get_scrape_cache(60, 120) is get_scrape_cache(60, 120)
+        assert get_scrape_cache(60, 120) is not get_scrape_cache(30, 120)
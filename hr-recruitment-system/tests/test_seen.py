@@ -0,0 +1,71 @@
+"""
+Tests for the seen-profile store (backend/utils/seen.py)
+"""
+
+import pytest
+from backend.utils.seen import SeenStore, get_seen_store, profile_hash, seen_key
+
+
+# ── Keys ─────────────────────────────────────────────────────────────────────
+
+class TestKeys:
+
+    def test_seen_key_normalizes_query(self):
+        assert seen_key("Python Developer", "NYC", ["AWS"]) == seen_key(" python developer", "nyc", ["aws"])
+        assert seen_key("Python Developer", "NYC") != seen_key("Python Developer", "Boston")
+
+    def test_profile_hash_ignores_tracking_params(self):
+        a = profile_hash("https://www.linkedin.com/in/jane-smith/?miniProfileUrn=abc")
+        b = profile_hash("https://www.linkedin.com/in/jane-smith")
+        assert a == b
+        assert len(a) == 16
+
+
+# ── SeenStore ────────────────────────────────────────────────────────────────
+
+class TestSeenStore:
+
+    def test_unseen_and_add(self):
+        store = SeenStore()
+        urls = ["https://x/in/a", "https://x/in/b"]
+
+        assert store.unseen("q", urls) == set(urls)
+        store.add("q", urls[:1])
+        assert store.unseen("q", urls + [None]) == {"https://x/in/b"}
+        # Seen-sets are per query
+        assert store.unseen("other", urls) == set(urls)
+        assert store.count("q") == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "seen.db")
+        first = SeenStore(path)
+        first.add("q", ["https://x/in/a"])
+        first.close()
+
+        assert SeenStore(path).unseen("q", ["https://x/in/a"]) == set()
+
+    def test_old_entries_expire(self):
+        store = SeenStore(max_age_days=1)
+        store.add("q", ["https://x/in/a"])
+        store._conn.execute("UPDATE seen SET seen_at = seen_at - 2 * 86400")
+
+        assert store.unseen("q", ["https://x/in/a"]) == {"https://x/in/a"}
+
+    def test_large_batches(self):
+        store = SeenStore()
+        urls = [f"https://x/in/{i}" for i in range(1200)]
+        store.add("q", urls[:700])
+
+        assert len(store.unseen("q", urls)) == 500
+
+    def test_clear(self):
+        store = SeenStore()
+        store.add("q", ["https://x/in/a"])
+        store.add("r", ["https://x/in/a"])
+        store.clear("q")
+        assert store.count() == 1
+        store.clear()
+        assert store.count() == 0
+
+    def test_shared_store_per_path(self):
+        assert get_seen_store() is get_seen_store(None)
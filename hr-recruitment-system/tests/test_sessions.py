@@ -0,0 +1,108 @@
+"""
+Tests for encrypted browser session storage (backend/utils/sessions.py)
+"""
+
+import os
+import stat
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from backend.utils.sessions import SessionStore
+
+STATE = {"cookies": [{"name": "li_at", "value": "token", "domain": ".linkedin.com"}],
+         "local_storage": {"voyager": "1"}}
+
+
+@pytest.fixture(autouse=True)
+def _fast_kdf(monkeypatch):
+    monkeypatch.setattr(SessionStore, "KDF_ITERATIONS", 1000)
+
+
+# ── SessionStore ─────────────────────────────────────────────────────────────
+
+class TestSessionStore:
+
+    def test_round_trip(self, tmp_path):
+        store = SessionStore(tmp_path, secret="s3cret")
+        store.save("linkedin", "Jane@Example.com", "pw", STATE)
+
+        assert store.load("linkedin", "jane@example.com", "pw") == STATE
+
+    def test_encrypted_and_private_on_disk(self, tmp_path):
+        store = SessionStore(tmp_path, secret="s3cret")
+        store.save("linkedin", "jane@example.com", "pw", STATE)
+
+        [path] = tmp_path.glob("*.session")
+        assert b"li_at" not in path.read_bytes()
+        assert "jane" not in path.name
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+    def test_wrong_password_or_secret_gets_nothing(self, tmp_path):
+        SessionStore(tmp_path, secret="s3cret").save("linkedin", "jane@example.com", "pw", STATE)
+
+        assert SessionStore(tmp_path, secret="s3cret").load("linkedin", "jane@example.com", "other") is None
+        assert SessionStore(tmp_path, secret="different").load("linkedin", "jane@example.com", "pw") is None
+
+    def test_generated_secret_is_reused(self, tmp_path):
+        SessionStore(tmp_path).save("linkedin", "jane@example.com", "pw", STATE)
+
+        assert (tmp_path / ".secret").exists()
+        assert SessionStore(tmp_path).load("linkedin", "jane@example.com", "pw") == STATE
+
+    def test_expired_sessions_are_dropped(self, tmp_path):
+        store = SessionStore(tmp_path, secret="s3cret", max_age_days=1)
+        with patch("backend.utils.sessions.time.time", return_value=0):
+            store.save("linkedin", "jane@example.com", "pw", STATE)
+
+        assert store.load("linkedin", "jane@example.com", "pw") is None
+        assert list(tmp_path.glob("*.session")) == []
+
+
+# ── LinkedIn login reuse ────────────────────────────────────────────────────
+
+class TestEnsureLoggedIn:
+
+    def _make_scraper(self, tmp_path):
+        from backend.agents.linkedin_scraper import LinkedInScraperAgent
+
+        scraper = LinkedInScraperAgent(config={
+            "scrape_delay": 0, "linkedin_session_dir": str(tmp_path), "session_secret": "s3cret"
+        })
+        scraper.driver = MagicMock()
+        return scraper
+
+    @pytest.mark.asyncio
+    async def test_saved_session_skips_login(self, tmp_path):
+        scraper = self._make_scraper(tmp_path)
+        scraper.sessions.save("linkedin", "jane@example.com", "pw", STATE)
+
+        with patch.object(scraper, "session_valid", new_callable=AsyncMock, return_value=True), \
+                patch.object(scraper, "login_to_linkedin", new_callable=AsyncMock) as login, \
+                patch("backend.agents.linkedin_scraper.import_session") as restore:
+            assert await scraper.ensure_logged_in("jane@example.com", "pw") is True
+
+        login.assert_not_awaited()
+        assert restore.call_args.args[1] == STATE
+
+    @pytest.mark.asyncio
+    async def test_invalid_session_logs_in_and_saves(self, tmp_path):
+        scraper = self._make_scraper(tmp_path)
+        scraper.sessions.save("linkedin", "jane@example.com", "pw", {"cookies": []})
+        fresh = {"cookies": [{"name": "li_at", "value": "new"}], "local_storage": {}}
+
+        with patch.object(scraper, "session_valid", new_callable=AsyncMock, return_value=False), \
+                patch.object(scraper, "login_to_linkedin", new_callable=AsyncMock, return_value=True) as login, \
+                patch("backend.agents.linkedin_scraper.import_session"), \
+                patch("backend.agents.linkedin_scraper.export_session", return_value=fresh):
+            assert await scraper.ensure_logged_in("jane@example.com", "pw") is True
+
+        login.assert_awaited_once()
+        assert scraper.sessions.load("linkedin", "jane@example.com", "pw") == fresh
+
+    @pytest.mark.asyncio
+    async def test_failed_login_is_not_saved(self, tmp_path):
+        scraper = self._make_scraper(tmp_path)
+
+        with patch.object(scraper, "login_to_linkedin", new_callable=AsyncMock, return_value=False):
+            assert await scraper.ensure_logged_in("jane@example.com", "pw") is False
+
+        assert scraper.sessions.load("linkedin", "jane@example.com", "pw") is None
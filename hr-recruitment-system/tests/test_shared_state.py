@@ -0,0 +1,55 @@
+"""
+Tests for the cross-process state store (backend/utils/shared_state.py)
+"""
+
+import time
+import pytest
+
+from backend.utils.shared_state import SharedState, get_shared_state
+
+
+# ── SharedState ──────────────────────────────────────────────────────────────
+
+class TestSharedState:
+
+    def test_put_and_get(self):
+        state = SharedState()
+        state.put("coalesce", "k", {"ranked": [1, 2], "top": 0.9})
+        assert state.get("coalesce", "k") == {"ranked": [1, 2], "top": 0.9}
+        assert state.get("coalesce", "other") is None
+        assert state.get("scrape", "k") is None
+
+    def test_expired_values_are_hidden_and_purged(self):
+        state = SharedState()
+        state.put("ns", "old", 1, ttl=0.01)
+        state.put("ns", "new", 2, ttl=60)
+        time.sleep(0.02)
+        assert state.get("ns", "old") is None
+        assert state.items("ns") == {"new": 2}
+        assert state.purge_expired() == 1
+
+    def test_delete_key_or_namespace(self):
+        state = SharedState()
+        for key in ("a", "b"):
+            state.put("ns", key, key)
+        state.put("other", "a", "kept")
+        state.delete("ns", "a")
+        assert state.items("ns") == {"b": "b"}
+        state.delete("ns")
+        assert state.items("ns") == {}
+        assert state.get("other", "a") == "kept"
+
+    def test_processes_share_the_file(self, tmp_path):
+        # Each worker process opens its own connection to the same file
+        path = str(tmp_path / "state.db")
+        first, second = SharedState(path), SharedState(path)
+        first.put("agent_status", "101", {"candidate_ranker": {"results_count": 3}})
+        assert second.items("agent_status") == {"101": {"candidate_ranker": {"results_count": 3}}}
+        assert second._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        first.close()
+        second.close()
+
+    def test_shared_store_per_path(self, tmp_path):
+        path = str(tmp_path / "state.db")
+        assert get_shared_state(path) is get_shared_state(path)
+        assert get_shared_state(None) is not get_shared_state(path)
@@ -0,0 +1,131 @@
+"""
+Tests for request coalescing (backend/utils/singleflight.py)
+"""
+
+import asyncio
+import pytest
+from backend.utils.shared_state import SharedState
+from backend.utils.singleflight import SingleFlight, request_key
+
+
+# ── request_key ──────────────────────────────────────────────────────────────
+
+class TestRequestKey:
+
+    def test_normalizes_case_whitespace_and_order(self):
+        a = request_key("search", job_title="Python  Developer", keywords=["AWS", "django"])
+        b = request_key("search", job_title=" python developer", keywords=["Django", "aws"])
+        assert a == b
+
+    def test_ignores_passwords(self):
+        a = request_key("search", job_title="x", linkedin_password="one")
+        b = request_key("search", job_title="x", linkedin_password="two")
+        assert a == b
+
+    def test_kind_is_part_of_key(self):
+        assert request_key("search", job_title="x") != request_key("rank", job_title="x")
+
+
+# ── SingleFlight ─────────────────────────────────────────────────────────────
+
+class TestSingleFlight:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_execution(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"value": 42}
+
+        results = await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+        assert calls == 1
+        assert all(r == {"value": 42} for r in results)
+        assert flight.stats()["coalesced"] == 4
+
+    @pytest.mark.asyncio
+    async def test_ttl_cache(self):
+        flight = SingleFlight(ttl=60)
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await flight.do("k", work) == 1
+        assert await flight.do("k", work) == 1
+        assert flight.stats()["hits"] == 1
+
+        flight.invalidate("k")
+        assert await flight.do("k", work) == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_cache_serves_other_processes(self):
+        # Two coalescers on one store stand in for two worker processes
+        shared = SharedState()
+        first, second = SingleFlight(ttl=60, shared=shared), SingleFlight(ttl=60, shared=shared)
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            return {"ranked": calls}
+
+        assert await first.do("k", work) == {"ranked": 1}
+        assert await second.do("k", work) == {"ranked": 1}
+        assert calls == 1
+        assert second.stats()["hits"] == 1
+
+        second.invalidate("k")
+        assert shared.get("coalesce", "k") is None
+
+    @pytest.mark.asyncio
+    async def test_no_cache_without_ttl(self):
+        flight = SingleFlight(ttl=0)
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        await flight.do("k", work)
+        await flight.do("k", work)
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_and_are_not_cached(self):
+        flight = SingleFlight(ttl=60)
+        attempts = 0
+
+        async def work():
+            nonlocal attempts
+            attempts += 1
+            await asyncio.sleep(0.01)
+            if attempts == 1:
+                raise RuntimeError("scrape failed")
+            return "ok"
+
+        results = await asyncio.gather(
+            flight.do("k", work), flight.do("k", work), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert await flight.do("k", work) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_work(self):
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        first = asyncio.ensure_future(flight.do("k", work))
+        second = asyncio.ensure_future(flight.do("k", work))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        assert await second == "done"
@@ -0,0 +1,141 @@
+"""
+Tests for run persistence (backend/utils/storage.py)
+"""
+
+import pytest
+from sqlalchemy import inspect
+from backend.utils.storage import RunStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = RunStore(f"sqlite:///{tmp_path / 'runs.db'}")
+    yield s
+    s.engine.dispose()
+
+
+def _orchestration_result():
+    candidates = [
+        {"name": "Alice", "email": "alice@example.com", "source": "uploaded_resume",
+         "source_file": "/r/alice.pdf", "skills": ["Python"]},
+        {"name": "Bob", "profile_url": "https://linkedin.com/in/bob", "source": "LinkedIn"},
+    ]
+    ranked = [
+        {**candidates[1], "overall_score": 91, "rank": 1,
+         "scoring": {"overall_score": 91, "match_quality": "Excellent"}},
+        {**candidates[0], "overall_score": 72, "rank": 2,
+         "scoring": {"overall_score": 72, "match_quality": "Good"}},
+    ]
+    return {
+        "mode": "full_search",
+        "total_candidates_found": 2,
+        "candidates": candidates,
+        "ranked_results": {
+            "total_candidates": 2,
+            "ranked_candidates": ranked,
+            "top_score": 91,
+            "average_score": 81.5,
+            "shortlist": {"shortlist_size": 2},
+        },
+        "sources": {"uploaded_resumes": 1, "linkedin": 1, "indeed": 0},
+    }
+
+
+# ── Schema ───────────────────────────────────────────────────────────────────
+
+class TestSchema:
+
+    def test_tables_and_indexes_created(self, store):
+        inspector = inspect(store.engine)
+        assert {"runs", "candidates", "parsed_resumes", "scores"} <= set(inspector.get_table_names())
+        score_indexes = {ix["name"] for ix in inspector.get_indexes("scores")}
+        assert "ix_scores_job_score" in score_indexes
+        candidate_indexes = {ix["name"] for ix in inspector.get_indexes("candidates")}
+        assert "ix_candidates_source" in candidate_indexes
+
+    def test_file_database_uses_wal(self, store):
+        # Worker processes read while another one writes
+        with store.engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+
+
+# ── save / load ──────────────────────────────────────────────────────────────
+
+class TestSaveAndLoad:
+
+    def test_round_trip(self, store):
+        run_id = store.save_run(_orchestration_result(), {"job_title": "SWE", "linkedin_password": "x"})
+        run = store.get_run(run_id)
+
+        assert run["mode"] == "full_search"
+        assert run["total_candidates_found"] == 2
+        assert [c["name"] for c in run["candidates"]] == ["Alice", "Bob"]
+        ranked = run["ranked_results"]["ranked_candidates"]
+        assert [c["name"] for c in ranked] == ["Bob", "Alice"]
+        assert ranked[0]["overall_score"] == 91
+        assert run["ranked_results"]["shortlist"] == {"shortlist_size": 2}
+
+    def test_password_not_stored(self, store):
+        store.save_run(_orchestration_result(), {"job_title": "SWE", "linkedin_password": "secret"})
+        with store.engine.connect() as conn:
+            stored = conn.exec_driver_sql("SELECT request FROM runs").scalar_one()
+        assert "secret" not in stored
+
+    def test_missing_run(self, store):
+        assert store.get_run("nope") is None
+
+    def test_trace_saved_with_run(self, store):
+        trace = {"name": "run", "span_count": 1, "duration_ms": 5.0, "spans": [{"name": "agent"}]}
+        run_id = store.save_run(_orchestration_result(), {"job_title": "SWE"}, trace=trace)
+        assert store.get_trace(run_id) == trace
+        untraced = store.save_run(_orchestration_result(), {"job_title": "SWE"})
+        assert store.get_trace(untraced) is None
+
+    def test_rank_only_result(self, store):
+        ranked = _orchestration_result()["ranked_results"]
+        run_id = store.save_run(ranked, {"job_requirements": {"title": "SWE"}})
+        run = store.get_run(run_id)
+        assert run["mode"] == "rank_only"
+        assert len(run["ranked_results"]["ranked_candidates"]) == 2
+
+    def test_ranked_pages_by_rank(self, store):
+        run_id = store.save_run(_orchestration_result(), {"job_title": "SWE"})
+
+        first, key = store.get_run_page(run_id, limit=1)
+        assert [c["name"] for c in first["ranked_results"]["ranked_candidates"]] == ["Bob"]
+        assert [c["name"] for c in first["candidates"]] == ["Bob"]
+        assert first["ranked_results"]["total_candidates"] == 2
+
+        second, key = store.get_run_page(run_id, after=key, limit=1)
+        assert [c["rank"] for c in second["ranked_results"]["ranked_candidates"]] == [2]
+        assert key is None
+
+    def test_unranked_pages_by_position(self, store):
+        result = {**_orchestration_result(), "ranked_results": None}
+        run_id = store.save_run(result, {"job_title": "SWE"})
+
+        first, key = store.get_run_page(run_id, limit=1)
+        assert [c["name"] for c in first["candidates"]] == ["Alice"]
+        assert first["ranked_results"] is None
+        second, key = store.get_run_page(run_id, after=key, limit=5)
+        assert [c["name"] for c in second["candidates"]] == ["Bob"] and key is None
+        assert store.get_run_page("nope") is None
+
+
+# ── Queries ──────────────────────────────────────────────────────────────────
+
+class TestQueries:
+
+    def test_list_runs_filter(self, store):
+        store.save_run(_orchestration_result(), {"job_title": "SWE"})
+        store.save_run(_orchestration_result(), {"job_title": "PM"})
+        assert store.count_runs() == 2
+        runs = store.list_runs(job_title="PM")
+        assert len(runs) == 1
+        assert runs[0]["job_title"] == "PM"
+
+    def test_top_candidates(self, store):
+        store.save_run(_orchestration_result(), {"job_title": "SWE"})
+        top = store.top_candidates(job_title="SWE", min_score=80)
+        assert [c["name"] for c in top] == ["Bob"]
+        assert store.top_candidates(source="uploaded_resume")[0]["name"] == "Alice"
@@ -0,0 +1,41 @@
+"""
+Tests for streaming helpers (backend/utils/streaming.py)
+"""
+
+import json
+from backend.utils.streaming import RunningTopN, sse_event
+
+
+# ── sse_event ───────────────────────────────────────────────────────────────
+
+class TestSseEvent:
+
+    def test_encodes_single_data_line(self):
+        raw = sse_event("candidate", {"name": "Ann\nLee"}, event_id="3").decode()
+        lines = raw.split("\n")
+
+        assert raw.endswith("\n\n")
+        assert lines[0] == "id: 3"
+        assert lines[1] == "event: candidate"
+        assert json.loads(lines[2][len("data: "):]) == {"name": "Ann\nLee"}
+
+
+# ── RunningTopN ─────────────────────────────────────────────────────────────
+
+class TestRunningTopN:
+
+    def test_keeps_best_n_in_order(self):
+        top = RunningTopN(3)
+        for i, score in enumerate([50, 90, 10, 70, 95, 60]):
+            top.add({"candidate_id": f"c{i}", "name": f"C{i}", "overall_score": score})
+
+        items = top.items()
+        assert [item["overall_score"] for item in items] == [95, 90, 70]
+        assert [item["position"] for item in items] == [1, 2, 3]
+        assert items[0]["candidate_id"] == "c4"
+
+    def test_ties_keep_first_seen(self):
+        top = RunningTopN(1)
+        assert top.add({"candidate_id": "a", "overall_score": 80})
+        assert not top.add({"candidate_id": "b", "overall_score": 80})
+        assert top.items()[0]["candidate_id"] == "a"
@@ -0,0 +1,168 @@
+"""
+Tests for the durable task queue (backend/utils/task_queue.py)
+"""
+
+import asyncio
+import time
+import pytest
+
+from backend.utils.task_queue import TaskQueue, TaskWorker
+
+
+@pytest.fixture
+def queue(tmp_path):
+    q = TaskQueue(f"sqlite:///{tmp_path / 'tasks.db'}", visibility_timeout=60, max_attempts=2, retry_delay=0)
+    yield q
+    q.engine.dispose()
+
+
+# ── Leasing ──────────────────────────────────────────────────────────────────
+
+class TestLease:
+
+    def test_higher_priority_first_then_fifo(self, queue):
+        low = queue.enqueue("parse", {"n": 1})
+        high = queue.enqueue("rank", {"n": 2}, priority=1)
+        later = queue.enqueue("parse", {"n": 3})
+
+        assert [queue.lease("w")["id"] for _ in range(3)] == [high, low, later]
+        assert queue.lease("w") is None
+
+    def test_leased_task_is_hidden_from_other_workers(self, queue):
+        task_id = queue.enqueue("parse", {"files": ["a.pdf"]})
+        # A second process opens its own queue on the same database
+        other = TaskQueue(queue.engine.url.render_as_string(), visibility_timeout=60)
+
+        task = queue.lease("w1")
+        assert task["id"] == task_id and task["payload"] == {"files": ["a.pdf"]}
+        assert task["attempts"] == 1
+        assert other.lease("w2") is None
+        other.engine.dispose()
+
+    def test_kind_filter(self, queue):
+        queue.enqueue("search", {})
+        rank = queue.enqueue("rank", {})
+        assert queue.lease("w", kinds=["rank", "parse"])["id"] == rank
+        assert queue.lease("w", kinds=["rank", "parse"]) is None
+
+    def test_same_key_joins_unfinished_task(self, queue):
+        first = queue.enqueue("rank", {}, key="k")
+        assert queue.enqueue("rank", {}, key="k") == first
+        queue.complete(queue.lease("w"), {"ok": True})
+        assert queue.enqueue("rank", {}, key="k") != first
+
+
+# ── Outcomes ─────────────────────────────────────────────────────────────────
+
+class TestOutcomes:
+
+    def test_complete_stores_result(self, queue):
+        task_id = queue.enqueue("rank", {})
+        assert queue.complete(queue.lease("w"), {"top_score": 91})
+        task = queue.get(task_id)
+        assert task["status"] == "done" and task["result"] == {"top_score": 91}
+        assert queue.stats() == {"queued": 0, "leased": 0, "done": 1, "failed": 0}
+
+    def test_failures_retry_until_out_of_attempts(self, queue):
+        task_id = queue.enqueue("rank", {})
+        assert queue.fail(queue.lease("w"), "LLM down") == "queued"
+        assert queue.fail(queue.lease("w"), "LLM down") == "failed"
+        task = queue.get(task_id)
+        assert (task["status"], task["attempts"], task["error"]) == ("failed", 2, "LLM down")
+
+    def test_retry_waits_for_backoff(self, queue):
+        queue.retry_delay = 60
+        queue.enqueue("rank", {})
+        queue.fail(queue.lease("w"), "timeout")
+        assert queue.lease("w") is None
+
+    def test_expired_lease_is_handed_out_again(self, queue):
+        # Worker w1 crashed: its lease runs out and w2 takes the task
+        task_id = queue.enqueue("parse", {})
+        queue.visibility_timeout = 0.01
+        stale = queue.lease("w1")
+        time.sleep(0.02)
+
+        task = queue.lease("w2")
+        assert task["id"] == task_id and task["attempts"] == 2
+        # The crashed worker can no longer report on the task
+        assert not queue.complete(stale, {"late": True})
+        assert not queue.heartbeat(stale)
+
+    def test_expired_last_attempt_fails(self, queue):
+        task_id = queue.enqueue("parse", {}, max_attempts=1)
+        queue.visibility_timeout = 0.01
+        queue.lease("w1")
+        time.sleep(0.02)
+
+        assert queue.lease("w2") is None
+        assert queue.get(task_id)["status"] == "failed"
+
+    def test_prune_removes_finished_tasks_past_retention(self, queue):
+        done = queue.enqueue("rank", {})
+        queue.complete(queue.lease("w"), {"top_score": 91})
+        waiting = queue.enqueue("rank", {})
+        assert queue.depth() == 1
+
+        assert queue.prune() == 0  # No retention configured
+        assert queue.prune(older_than=60) == 0
+        assert queue.prune(older_than=0) == 1
+        assert queue.get(done) is None
+        assert queue.get(waiting)["status"] == "queued"
+
+    def test_lease_prunes_with_retention(self, queue):
+        done = queue.enqueue("rank", {})
+        queue.complete(queue.lease("w"), {})
+        queue.retention = 0
+        queue.lease("w")
+        assert queue.get(done) is None
+
+
+# ── Worker ───────────────────────────────────────────────────────────────────
+
+class TestTaskWorker:
+
+    @pytest.mark.asyncio
+    async def test_runs_tasks_and_records_outcomes(self, queue):
+        attempts = {}
+
+        async def handler(task):
+            attempts[task["id"]] = attempts.get(task["id"], 0) + 1
+            if task["payload"].get("flaky") and attempts[task["id"]] == 1:
+                raise RuntimeError("scrape blocked")
+            return {"echo": task["payload"]}
+
+        ok = queue.enqueue("rank", {"n": 1})
+        flaky = queue.enqueue("search", {"flaky": True})
+        worker = TaskWorker(queue, handler, concurrency=2, poll_interval=0.01)
+        stop = asyncio.Event()
+        running = asyncio.create_task(worker.run(stop))
+
+        for _ in range(200):
+            if queue.stats()["done"] == 2:
+                break
+            await asyncio.sleep(0.01)
+        stop.set()
+        await asyncio.wait_for(running, 1)
+
+        assert queue.get(ok)["result"] == {"echo": {"n": 1}}
+        assert queue.get(flaky)["attempts"] == 2
+        assert (worker.completed, worker.failed) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_stop_finishes_running_task(self, queue):
+        started = asyncio.Event()
+
+        async def handler(task):
+            started.set()
+            await asyncio.sleep(0.05)
+            return "done"
+
+        task_id = queue.enqueue("parse", {})
+        stop = asyncio.Event()
+        running = asyncio.create_task(TaskWorker(queue, handler, poll_interval=0.01).run(stop))
+        await started.wait()
+        stop.set()
+        await asyncio.wait_for(running, 1)
+
+        assert queue.get(task_id)["status"] == "done"
@@ -0,0 +1,154 @@
+"""
+Tests for run tracing (backend/utils/tracing.py)
+"""
+
+import asyncio
+import pytest
+
+from backend.utils.tracing import (
+    current_trace, span, span_totals, start_trace, to_chrome_trace, trace_driver, traced
+)
+
+
+def _names(nodes):
+    return [n["name"] for n in nodes]
+
+
+# ── Span trees ──────────────────────────────────────────────────────────────
+
+class TestSpans:
+
+    def test_noop_without_trace(self):
+        with span("outside", "internal") as current:
+            assert current is None
+        assert current_trace() is None
+
+    def test_nesting_and_attributes(self):
+        with start_trace("run") as trace:
+            with span("outer", "agent") as outer:
+                with span("inner", "llm", model="m") as inner:
+                    inner.set(input_tokens=10)
+                outer.set(done=True)
+
+        tree = trace.to_dict()
+        assert tree["span_count"] == 2
+        (root,) = tree["spans"]
+        assert root["name"] == "outer" and root["attributes"]["done"] is True
+        (child,) = root["children"]
+        assert child["category"] == "llm"
+        assert child["attributes"] == {"model": "m", "input_tokens": 10}
+        assert child["start_ms"] >= root["start_ms"]
+
+    def test_error_recorded(self):
+        with start_trace("run") as trace:
+            with pytest.raises(ValueError):
+                with span("failing"):
+                    raise ValueError("boom")
+        assert trace.to_dict()["spans"][0]["error"] == "ValueError: boom"
+
+    @pytest.mark.asyncio
+    async def test_gather_and_threads_nest_under_parent(self):
+        def blocking():
+            with span("read", "file"):
+                return 1
+
+        async def child(name):
+            with span(name, "agent"):
+                await asyncio.sleep(0)
+                await asyncio.to_thread(blocking)
+
+        with start_trace("run") as trace:
+            with span("orchestrate", "stage"):
+                await asyncio.gather(child("a"), child("b"))
+
+        (root,) = trace.to_dict()["spans"]
+        assert sorted(_names(root["children"])) == ["a", "b"]
+        for node in root["children"]:
+            assert _names(node["children"]) == ["read"]
+            # Concurrent children record their own track
+            assert "lane" in node["attributes"]
+
+    def test_max_spans_counts_dropped(self):
+        with start_trace("run", max_spans=2) as trace:
+            for i in range(5):
+                with span(f"s{i}"):
+                    pass
+        tree = trace.to_dict()
+        assert tree["span_count"] == 2
+        assert tree["dropped"] == 3
+
+    @pytest.mark.asyncio
+    async def test_traced_decorator(self):
+        @traced(category="internal")
+        async def work():
+            return 3
+
+        with start_trace("run") as trace:
+            assert await work() == 3
+        assert _names(trace.to_dict()["spans"]) == ["TestSpans.test_traced_decorator.<locals>.work"]
+
+
+# ── Export ──────────────────────────────────────────────────────────────────
+
+class TestExport:
+
+    def _tree(self):
+        return {
+            "name": "run",
+            "spans": [{
+                "id": 1, "name": "agent", "category": "agent", "start_ms": 0.0, "duration_ms": 10.0,
+                "attributes": {"lane": "main"},
+                "children": [
+                    {"id": 2, "name": "get", "category": "webdriver", "start_ms": 1.0, "duration_ms": 4.0,
+                     "attributes": {"url": "u"}, "error": "Timeout",
+                     "children": [{"id": 3, "name": "x", "category": "webdriver", "start_ms": 1.0,
+                                   "duration_ms": 2.0, "attributes": {}, "children": []}]},
+                    {"id": 4, "name": "llm", "category": "llm", "start_ms": 5.0, "duration_ms": 3.0,
+                     "attributes": {"lane": "Task-2"}, "children": []}
+                ]
+            }]
+        }
+
+    def test_span_totals_count_nested_category_once(self):
+        assert span_totals(self._tree()) == {"agent": 10.0, "webdriver": 4.0, "llm": 3.0}
+
+    def test_chrome_trace_events(self):
+        chrome = to_chrome_trace(self._tree())
+        events = [e for e in chrome["traceEvents"] if e["ph"] == "X"]
+        assert [e["name"] for e in events] == ["agent", "get", "x", "llm"]
+        assert events[1]["ts"] == 1000.0 and events[1]["dur"] == 4000.0
+        assert events[1]["args"] == {"url": "u", "error": "Timeout"}
+        assert events[0]["tid"] == events[1]["tid"] != events[3]["tid"]
+        names = {e["args"]["name"] for e in chrome["traceEvents"] if e["ph"] == "M"}
+        assert names == {"main", "Task-2"}
+
+
+# ── WebDriver ───────────────────────────────────────────────────────────────
+
+class _FakeDriver:
+
+    def __init__(self):
+        self.commands = []
+
+    def execute(self, command, params=None):
+        self.commands.append(command)
+        return {"value": None}
+
+
+class TestTraceDriver:
+
+    def test_commands_recorded_as_spans(self):
+        driver = trace_driver(_FakeDriver())
+        with start_trace("run") as trace:
+            driver.execute("get", {"url": "https://example.com"})
+            driver.execute("findElements", {"using": "css selector", "value": "a"})
+
+        spans = trace.to_dict()["spans"]
+        assert _names(spans) == ["get", "findElements"]
+        assert spans[0]["attributes"]["url"] == "https://example.com"
+        assert {s["category"] for s in spans} == {"webdriver"}
+
+    def test_untraced_commands_pass_through(self):
+        driver = trace_driver(_FakeDriver())
+        assert driver.execute("quit") == {"value": None}
+        assert driver.commands == ["quit"]
@@ -0,0 +1,131 @@
+"""
+Tests for compact, projected and paginated response views (backend/utils/views.py)
+"""
+
+import json
+import pytest
+from backend.utils.views import (
+    compact_result,
+    decode_cursor,
+    encode_cursor,
+    page_result,
+    parse_fields,
+    resolve_ranked,
+    shape_result,
+)
+
+
+def _ranked_result(n=5):
+    candidates = [
+        {
+            "candidate_id": f"c{i}",
+            "name": f"Candidate {i}",
+            "skills": ["Python"] * 20,
+            "summary": "x" * 500,
+            "source": "LinkedIn",
+        }
+        for i in range(n)
+    ]
+    ranked = [
+        {**c, "scoring": {"overall_score": 90 - i, "strengths": ["s"] * 10}, "overall_score": 90 - i, "rank": i + 1}
+        for i, c in enumerate(candidates)
+    ]
+    return {
+        "run_id": "run-1",
+        "mode": "full_search",
+        "total_candidates_found": n,
+        "candidates": candidates,
+        "ranked_results": {
+            "total_candidates": n,
+            "ranked_candidates": ranked,
+            "top_score": 90,
+            "average_score": 88,
+            "shortlist": {"shortlist": ranked[:2], "summary": {"summary": "ok"}, "shortlist_size": 2},
+        },
+        "sources": {"linkedin": n},
+    }
+
+
+# ── Compact view ────────────────────────────────────────────────────────────
+
+class TestCompact:
+
+    def test_candidates_listed_once_and_ranked_as_references(self):
+        data = _ranked_result()
+        compact = compact_result(data)
+
+        assert compact["view"] == "compact"
+        assert [c["candidate_id"] for c in compact["candidates"]] == ["c0", "c1", "c2", "c3", "c4"]
+        assert all("scoring" not in c for c in compact["candidates"])
+
+        first = compact["ranked_results"]["ranked_candidates"][0]
+        assert set(first) == {"candidate_id", "rank", "overall_score", "scoring"}
+        assert compact["ranked_results"]["shortlist"]["shortlist"] == [
+            {"candidate_id": "c0", "rank": 1}, {"candidate_id": "c1", "rank": 2}
+        ]
+        assert compact["ranked_results"]["shortlist"]["summary"] == {"summary": "ok"}
+
+        assert len(json.dumps(compact)) < len(json.dumps(data)) / 2
+
+    def test_input_is_not_modified(self):
+        data = _ranked_result()
+        before = json.dumps(data, sort_keys=True)
+        compact_result(data, parse_fields("name"))
+        assert json.dumps(data, sort_keys=True) == before
+
+    def test_field_projection(self):
+        compact = compact_result(_ranked_result(), parse_fields("name, source"))
+
+        assert compact["candidates"][0] == {"candidate_id": "c0", "name": "Candidate 0", "source": "LinkedIn"}
+        # Scoring details are only kept when projected
+        assert "scoring" not in compact["ranked_results"]["ranked_candidates"][0]
+
+    def test_duplicate_records_collapse_by_id(self):
+        data = {"candidates": [{"name": "Ann", "email": "a@x.com"}, {"name": "Ann B", "email": "A@x.com "}]}
+        assert len(compact_result(data)["candidates"]) == 1
+
+    def test_resolve_ranked_restores_full_shape(self):
+        resolved = resolve_ranked(compact_result(_ranked_result()))
+        assert resolved[0]["name"] == "Candidate 0"
+        assert resolved[0]["rank"] == 1
+
+
+# ── Cursor pagination ───────────────────────────────────────────────────────
+
+class TestPaging:
+
+    def test_pages_in_rank_order_until_exhausted(self):
+        compact = compact_result(_ranked_result(5))
+        seen, cursor = [], None
+
+        while True:
+            page = page_result(compact, limit=2, cursor=cursor)
+            refs = page["ranked_results"]["ranked_candidates"]
+            # Each page carries only the records its references need
+            assert {c["candidate_id"] for c in page["candidates"]} == {r["candidate_id"] for r in refs}
+            seen.extend(r["rank"] for r in refs)
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == [1, 2, 3, 4, 5]
+
+    def test_unranked_results_page_candidates(self):
+        data = {"run_id": "r", "candidates": [{"candidate_id": str(i)} for i in range(3)]}
+        page = shape_result(data, limit=2)
+        assert len(page["candidates"]) == 2
+        assert len(shape_result(data, cursor=page["next_cursor"])["candidates"]) == 1
+
+    def test_cursor_is_bound_to_its_run(self):
+        cursor = encode_cursor("run-1", 10)
+        assert decode_cursor(cursor, "run-1") == 10
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, "run-2")
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+    def test_full_view_is_passed_through(self):
+        data = _ranked_result()
+        assert shape_result(data) is data
+        with pytest.raises(ValueError):
+            shape_result(data, view="tiny")
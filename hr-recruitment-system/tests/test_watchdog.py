@@ -0,0 +1,71 @@
+"""
+Tests for the event-loop watchdog (backend/utils/watchdog.py)
+"""
+
+import asyncio
+import logging
+import time
+import traceback
+import pytest
+from pathlib import Path
+
+from backend.utils import metrics
+from backend.utils.watchdog import LoopWatchdog, blocking_location
+
+
+def _blocking_handler():
+    time.sleep(0.3)
+
+
+# ── Blocking location ───────────────────────────────────────────────────────
+
+class TestBlockingLocation:
+
+    def test_prefers_innermost_project_frame(self, tmp_path):
+        frames = [
+            traceback.FrameSummary(str(tmp_path / "backend" / "api" / "main.py"), 10, "upload"),
+            traceback.FrameSummary("/usr/lib/python3/site-packages/pdfplumber/page.py", 5, "extract"),
+        ]
+        assert blocking_location(frames, root=tmp_path) == "backend/api/main.py:upload"
+
+    def test_falls_back_to_innermost_frame(self, tmp_path):
+        frames = [traceback.FrameSummary("/usr/lib/python3/selectors.py", 1, "select")]
+        assert blocking_location(frames, root=tmp_path) == "selectors.py:select"
+        assert blocking_location([], root=tmp_path) == "unknown"
+
+
+# ── Watchdog ────────────────────────────────────────────────────────────────
+
+class TestLoopWatchdog:
+
+    @pytest.mark.asyncio
+    async def test_reports_blocking_call_with_stack(self, caplog):
+        watchdog = LoopWatchdog(threshold=0.1, interval=0.02)
+        before = metrics.EVENT_LOOP_BLOCKS.get(location=f"tests/{Path(__file__).name}:_blocking_handler")
+        watchdog.start()
+        try:
+            await asyncio.sleep(0.05)
+            with caplog.at_level(logging.WARNING, logger="backend.utils.watchdog"):
+                _blocking_handler()
+                await asyncio.sleep(0.05)
+        finally:
+            await watchdog.stop()
+
+        assert len(watchdog.blocks) == 1
+        block = watchdog.blocks[0]
+        assert block["location"] == f"tests/{Path(__file__).name}:_blocking_handler"
+        assert "time.sleep(0.3)" in block["stack"]
+        assert 0.15 < block["duration"] < 1.0
+        assert "Event loop blocked" in caplog.text
+        assert metrics.EVENT_LOOP_BLOCKS.get(location=block["location"]) == before + 1
+
+    @pytest.mark.asyncio
+    async def test_idle_loop_not_reported(self):
+        watchdog = LoopWatchdog(threshold=0.1, interval=0.02)
+        watchdog.start()
+        try:
+            await asyncio.sleep(0.2)
+        finally:
+            await watchdog.stop()
+        assert not watchdog.blocks
+        assert not watchdog.running